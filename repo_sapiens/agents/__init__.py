@@ -4,6 +4,7 @@ This package contains agent implementations for automated task execution.
 """
 
 from repo_sapiens.agents.backends import (
+    ChatChunk,
     ChatResponse,
     LLMBackend,
     OllamaBackend,
@@ -11,6 +12,7 @@ from repo_sapiens.agents.backends import (
     ToolCall,
     create_backend,
 )
+from repo_sapiens.agents.context import ReActContext
 from repo_sapiens.agents.react import (
     ReActAgentProvider,
     ReActConfig,
@@ -24,6 +26,7 @@ __all__ = [
     "ReActAgentProvider",
     "ReActConfig",
     "TrajectoryStep",
+    "ReActContext",
     "run_react_task",
     # Tools
     "ToolRegistry",
@@ -34,6 +37,7 @@ __all__ = [
     "OllamaBackend",
     "OpenAIBackend",
     "ChatResponse",
+    "ChatChunk",
     "ToolCall",
     "create_backend",
 ]
@@ -4,20 +4,25 @@ This module provides a unified interface for different LLM backends,
 allowing the ReAct agent to work with Ollama, OpenAI-compatible APIs,
 or other LLM providers through a consistent interface.
 
-Supports native function calling for models that support it.
+Supports native function calling for models that support it, and streaming
+completions so callers can show progress or stop generation early.
 """
 
 from __future__ import annotations
 
 import json
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
 import structlog
 
 from repo_sapiens.exceptions import AgentError, ProviderConnectionError
+from repo_sapiens.monitoring.tracing import instrument_methods
+from repo_sapiens.monitoring.usage import ollama_usage, openai_usage, record_call
 
 log = structlog.get_logger()
 
@@ -51,20 +56,60 @@ class ChatResponse:
         return len(self.tool_calls) > 0
 
 
+@dataclass
+class ChatChunk:
+    """Incremental piece of a streamed chat completion.
+
+    Attributes:
+        content: Text generated since the previous chunk
+        tool_calls: Tool calls whose arguments finished streaming in this chunk
+        done: True on the final chunk of the stream
+    """
+
+    content: str = ""
+    tool_calls: list[ToolCall] = field(default_factory=list)
+    done: bool = False
+
+
+def _decode_arguments(args: Any) -> dict[str, Any]:
+    """Decode tool call arguments, which backends send as a JSON string or a dict."""
+    if isinstance(args, str):
+        try:
+            args = json.loads(args) if args else {}
+        except json.JSONDecodeError:
+            return {}
+    return args if isinstance(args, dict) else {}
+
+
+def _chat_attributes(
+    self: Any, messages: list[dict[str, Any]], model: str, *args: Any, **kwargs: Any
+) -> dict[str, Any]:
+    """Span attributes for a chat() call."""
+    return {"model": model, "messages": len(messages)}
+
+
 class LLMBackend(ABC):
     """Abstract base class for LLM backends.
 
     Provides a unified interface for interacting with different LLM providers.
     Implementations must handle connection verification, model listing, and
-    chat completions.
+    chat completions. Every implementation's ``chat()`` is traced (see
+    ``monitoring.tracing``) with the model as an attribute.
 
     Example usage:
         backend = OllamaBackend()
         await backend.connect()
         models = await backend.list_models()
         response = await backend.chat(messages, model="qwen3:latest")
+
+        async for chunk in backend.chat_stream(messages, model="qwen3:latest"):
+            print(chunk.content, end="")
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls, ["chat"], _chat_attributes)
+
     @abstractmethod
     async def connect(self) -> None:
         """Verify connection to the backend server.
@@ -110,6 +155,39 @@ class LLMBackend(ABC):
             AgentError: On backend-specific errors.
         """
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        model: str,
+        temperature: float = 0.7,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> AsyncGenerator[ChatChunk, None]:
+        """Send chat messages and yield the response as it is generated.
+
+        Closing the iterator early (e.g. ``break`` inside
+        ``contextlib.aclosing``) closes the underlying request, which stops
+        generation on the server.
+
+        The default implementation waits for chat() and yields a single
+        chunk; backends that support streaming override it.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys.
+            model: The model identifier to use.
+            temperature: Sampling temperature (0.0 to 1.0).
+            tools: Optional list of tool definitions in OpenAI format.
+
+        Yields:
+            ChatChunk with content deltas and completed tool calls; the last
+            chunk has ``done=True``.
+
+        Raises:
+            httpx.HTTPError: On HTTP request failures.
+            AgentError: On backend-specific errors.
+        """
+        response = await self.chat(messages, model, temperature=temperature, tools=tools)
+        yield ChatChunk(content=response.content, tool_calls=response.tool_calls, done=True)
+
     @abstractmethod
     async def close(self) -> None:
         """Close any open connections.
@@ -127,6 +205,9 @@ class OllamaBackend(LLMBackend):
     Attributes:
         base_url: The Ollama API base URL.
         timeout: Request timeout in seconds.
+        keep_alive: How long Ollama keeps the model loaded after a request
+            (e.g. "30m"); None uses the server default. A loaded model
+            reuses its KV cache for a repeated prompt prefix.
 
     Example:
         backend = OllamaBackend(base_url="http://localhost:11434")
@@ -141,15 +222,19 @@ class OllamaBackend(LLMBackend):
         self,
         base_url: str = "http://localhost:11434",
         timeout: int = 300,
+        keep_alive: str | int | None = None,
     ):
         """Initialize the Ollama backend.
 
         Args:
             base_url: Ollama API base URL (default: http://localhost:11434).
             timeout: Request timeout in seconds (default: 300).
+            keep_alive: Model keep-alive duration sent with chat requests
+                (default: None, the server default).
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.keep_alive = keep_alive
         self._client: httpx.AsyncClient | None = None
 
     @property
@@ -235,13 +320,17 @@ class OllamaBackend(LLMBackend):
             # Add tools if provided (Ollama supports OpenAI-compatible tool format)
             if tools:
                 request_body["tools"] = tools
+            if self.keep_alive is not None:
+                request_body["keep_alive"] = self.keep_alive
 
+            started = time.perf_counter()
             response = await self.client.post(
                 f"{self.base_url}/api/chat",
                 json=request_body,
             )
             response.raise_for_status()
             result = response.json()
+            record_call(model, "ollama", time.perf_counter() - started, **ollama_usage(result))
 
             message = result.get("message", {})
             content = message.get("content", "")
@@ -250,22 +339,7 @@ class OllamaBackend(LLMBackend):
             tool_calls: list[ToolCall] = []
             if raw_tool_calls := message.get("tool_calls"):
                 for i, tc in enumerate(raw_tool_calls):
-                    func = tc.get("function", {})
-                    # Parse arguments - Ollama may return string or dict
-                    args = func.get("arguments", {})
-                    if isinstance(args, str):
-                        try:
-                            args = json.loads(args)
-                        except json.JSONDecodeError:
-                            args = {}
-
-                    tool_calls.append(
-                        ToolCall(
-                            id=tc.get("id", f"call_{i}"),
-                            name=func.get("name", ""),
-                            arguments=args,
-                        )
-                    )
+                    tool_calls.append(self._parse_tool_call(tc, i))
 
             return ChatResponse(content=content, tool_calls=tool_calls, raw=result)
 
@@ -273,6 +347,101 @@ class OllamaBackend(LLMBackend):
             log.error("ollama_chat_failed", error=str(e), model=model)
             raise
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        model: str,
+        temperature: float = 0.7,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> AsyncGenerator[ChatChunk, None]:
+        """Stream a chat completion from Ollama.
+
+        Ollama streams newline-delimited JSON objects, each carrying a
+        content delta; tool calls arrive complete in a single object.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys.
+            model: The Ollama model to use (e.g., "qwen3:latest").
+            temperature: Sampling temperature (0.0 to 1.0).
+            tools: Optional list of tool definitions in OpenAI format.
+
+        Yields:
+            ChatChunk per streamed object; the last has ``done=True``.
+
+        Raises:
+            httpx.HTTPError: On HTTP request failures.
+            AgentError: If Ollama reports an error mid-stream.
+        """
+        request_body: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+            },
+        }
+        if tools:
+            request_body["tools"] = tools
+        if self.keep_alive is not None:
+            request_body["keep_alive"] = self.keep_alive
+
+        calls_seen = 0
+        # Usage is recorded however the stream ends, including a caller stopping early
+        started = time.perf_counter()
+        first_token: float | None = None
+        chunks = 0
+        final: dict[str, Any] = {}
+        try:
+            async with self.client.stream("POST", f"{self.base_url}/api/chat", json=request_body) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    event = json.loads(line)
+                    if "error" in event:
+                        raise AgentError(f"Ollama error: {event['error']}", agent_type="ollama")
+
+                    message = event.get("message", {})
+                    tool_calls: list[ToolCall] = []
+                    for tc in message.get("tool_calls") or []:
+                        tool_calls.append(self._parse_tool_call(tc, calls_seen))
+                        calls_seen += 1
+
+                    done = bool(event.get("done"))
+                    content = message.get("content", "")
+                    if content or tool_calls:
+                        chunks += 1
+                        if first_token is None:
+                            first_token = time.perf_counter() - started
+                    if done:
+                        final = event
+                    yield ChatChunk(content=content, tool_calls=tool_calls, done=done)
+                    if done:
+                        return
+
+        except AgentError:
+            raise
+        except Exception as e:
+            log.error("ollama_chat_stream_failed", error=str(e), model=model)
+            raise
+        finally:
+            if first_token is not None or final:
+                # Without the final statistics, each streamed chunk is about one token
+                usage: dict[str, Any] = ollama_usage(final) if final else {"completion_tokens": chunks}
+                usage["time_to_first_token"] = first_token
+                record_call(model, "ollama", time.perf_counter() - started, **usage)
+
+    @staticmethod
+    def _parse_tool_call(tc: dict[str, Any], index: int) -> ToolCall:
+        """Build a ToolCall from an Ollama tool call object."""
+        func = tc.get("function", {})
+        return ToolCall(
+            id=tc.get("id", f"call_{index}"),
+            name=func.get("name", ""),
+            # Ollama may return arguments as a string or a dict
+            arguments=_decode_arguments(func.get("arguments", {})),
+        )
+
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client is not None:
@@ -292,6 +461,7 @@ class OpenAIBackend(LLMBackend):
         base_url: The API base URL.
         api_key: Optional API key for authentication.
         timeout: Request timeout in seconds.
+        stream_usage: Ask streamed completions for a final token usage event.
 
     Example:
         # Local server without authentication
@@ -314,6 +484,7 @@ class OpenAIBackend(LLMBackend):
         base_url: str = "http://localhost:8000/v1",
         api_key: str | None = None,
         timeout: int = 300,
+        stream_usage: bool = False,
     ):
         """Initialize the OpenAI-compatible backend.
 
@@ -321,10 +492,14 @@ class OpenAIBackend(LLMBackend):
             base_url: API base URL (default: http://localhost:8000/v1).
             api_key: Optional API key for authentication.
             timeout: Request timeout in seconds (default: 300).
+            stream_usage: Send ``stream_options.include_usage`` with streamed
+                completions. Some servers reject the field with a 400, so it
+                is off by default and streamed token counts are estimated.
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        self.stream_usage = stream_usage
         self._client: httpx.AsyncClient | None = None
 
     @property
@@ -436,6 +611,7 @@ class OpenAIBackend(LLMBackend):
                 request_body["tools"] = tools
                 request_body["tool_choice"] = "auto"
 
+            started = time.perf_counter()
             response = await self.client.post(
                 f"{self.base_url}/chat/completions",
                 headers=self._get_headers(),
@@ -449,6 +625,7 @@ class OpenAIBackend(LLMBackend):
                 error_msg = result["error"].get("message", "Unknown error")
                 log.error("openai_chat_error", error=error_msg, model=model)
                 raise AgentError(f"OpenAI API error: {error_msg}", agent_type="openai")
+            record_call(model, "openai", time.perf_counter() - started, **openai_usage(result))
 
             message = result["choices"][0]["message"]
             content = message.get("content") or ""
@@ -458,19 +635,12 @@ class OpenAIBackend(LLMBackend):
             if raw_tool_calls := message.get("tool_calls"):
                 for tc in raw_tool_calls:
                     func = tc.get("function", {})
-                    # Parse arguments - OpenAI returns string
-                    args = func.get("arguments", "{}")
-                    if isinstance(args, str):
-                        try:
-                            args = json.loads(args)
-                        except json.JSONDecodeError:
-                            args = {}
-
                     tool_calls.append(
                         ToolCall(
                             id=tc.get("id", ""),
                             name=func.get("name", ""),
-                            arguments=args,
+                            # OpenAI returns arguments as a JSON string
+                            arguments=_decode_arguments(func.get("arguments", "{}")),
                         )
                     )
 
@@ -483,6 +653,111 @@ class OpenAIBackend(LLMBackend):
             log.error("openai_chat_failed", error=str(e), model=model)
             raise
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        model: str,
+        temperature: float = 0.7,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> AsyncGenerator[ChatChunk, None]:
+        """Stream a chat completion from the OpenAI-compatible server.
+
+        Reads the server-sent event stream. Content deltas are yielded as
+        they arrive; tool call names and argument fragments are assembled
+        per call index and yielded, parsed, on the final chunk.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys.
+                For tool results, include 'tool_call_id' and 'name' keys.
+            model: The model ID to use.
+            temperature: Sampling temperature (0.0 to 1.0).
+            tools: Optional list of tool definitions in OpenAI format.
+
+        Yields:
+            ChatChunk per content delta, then a final chunk with ``done=True``
+            carrying any tool calls.
+
+        Raises:
+            httpx.HTTPError: On HTTP request failures.
+            AgentError: On OpenAI API errors.
+        """
+        request_body: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "stream": True,
+        }
+        if self.stream_usage:
+            # Ask for a final event with the token usage
+            request_body["stream_options"] = {"include_usage": True}
+        if tools:
+            request_body["tools"] = tools
+            request_body["tool_choice"] = "auto"
+
+        # Partial tool calls keyed by their index in the response
+        partial_calls: dict[int, dict[str, str]] = {}
+        # Usage is recorded however the stream ends, including a caller stopping early
+        started = time.perf_counter()
+        first_token: float | None = None
+        chunks = 0
+        usage: dict[str, Any] = {}
+        try:
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}/chat/completions",
+                headers=self._get_headers(),
+                json=request_body,
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:") :].strip()
+                    if data == "[DONE]":
+                        break
+
+                    event = json.loads(data)
+                    if "error" in event:
+                        error_msg = event["error"].get("message", "Unknown error")
+                        log.error("openai_chat_error", error=error_msg, model=model)
+                        raise AgentError(f"OpenAI API error: {error_msg}", agent_type="openai")
+
+                    if event.get("usage"):
+                        usage = openai_usage(event)
+                    if not event.get("choices"):
+                        continue
+                    delta = event["choices"][0].get("delta") or {}
+                    if first_token is None and (delta.get("content") or delta.get("tool_calls")):
+                        first_token = time.perf_counter() - started
+
+                    for tc in delta.get("tool_calls") or []:
+                        call = partial_calls.setdefault(tc.get("index", 0), {"id": "", "name": "", "arguments": ""})
+                        call["id"] = tc.get("id") or call["id"]
+                        func = tc.get("function") or {}
+                        call["name"] += func.get("name") or ""
+                        call["arguments"] += func.get("arguments") or ""
+
+                    if content := delta.get("content"):
+                        chunks += 1
+                        yield ChatChunk(content=content)
+
+            tool_calls = [
+                ToolCall(id=call["id"], name=call["name"], arguments=_decode_arguments(call["arguments"]))
+                for _, call in sorted(partial_calls.items())
+            ]
+            yield ChatChunk(tool_calls=tool_calls, done=True)
+
+        except AgentError:
+            raise
+        except Exception as e:
+            log.error("openai_chat_stream_failed", error=str(e), model=model)
+            raise
+        finally:
+            if first_token is not None or usage:
+                # Without a usage event, each streamed delta is about one token
+                usage = usage or {"completion_tokens": chunks}
+                record_call(model, "openai", time.perf_counter() - started, time_to_first_token=first_token, **usage)
+
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client is not None:
@@ -495,6 +770,8 @@ def create_backend(
     base_url: str | None = None,
     api_key: str | None = None,
     timeout: int = 300,
+    keep_alive: str | int | None = None,
+    stream_usage: bool = False,
 ) -> LLMBackend:
     """Create an LLM backend based on the specified type.
 
@@ -510,6 +787,9 @@ def create_backend(
             for each backend type.
         api_key: Optional API key (only used for OpenAI backend).
         timeout: Request timeout in seconds (default: 300).
+        keep_alive: Model keep-alive duration (only used for Ollama backend).
+        stream_usage: Request token usage in streamed completions (only
+            used for OpenAI backend).
 
     Returns:
         An LLMBackend instance of the appropriate type.
@@ -534,12 +814,14 @@ def create_backend(
         return OllamaBackend(
             base_url=base_url or "http://localhost:11434",
             timeout=timeout,
+            keep_alive=keep_alive,
         )
     elif backend_type_lower == "openai":
         return OpenAIBackend(
             base_url=base_url or "http://localhost:8000/v1",
             api_key=api_key,
             timeout=timeout,
+            stream_usage=stream_usage,
         )
     else:
         raise ValueError(f"Unknown backend type: {backend_type}. " f"Supported types: 'ollama', 'openai'")
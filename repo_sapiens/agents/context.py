@@ -0,0 +1,154 @@
+"""Prompt context management for the ReAct loop.
+
+Each ReAct iteration sends the system prompt, the task and the whole
+trajectory so far. Rebuilding that list from scratch every time has two
+costs: the prompt grows with every full observation (a large ``read_file``
+output is re-sent on every later iteration), and any change to earlier
+messages defeats the prefix caches of the inference servers (Ollama's KV
+cache reuse, OpenAI-compatible prompt caching).
+
+``ReActContext`` keeps the rendered messages between iterations and only
+ever appends to them. When the estimated prompt size exceeds the token
+budget, every observation older than the most recent few is truncated in
+one pass, so the prefix changes once per compaction rather than on every
+iteration.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from repo_sapiens.agents.react import TrajectoryStep
+
+log = structlog.get_logger()
+
+# Rough average for English text and code; good enough for budgeting
+CHARS_PER_TOKEN = 4
+
+
+class ReActContext:
+    """Append-only message history for one ReAct task with a token budget.
+
+    Attributes:
+        max_tokens: Estimated prompt size above which old observations are compacted
+        keep_recent: Number of most recent observations never compacted
+        compacted_observation_chars: Characters kept from a compacted observation
+
+    Example:
+        >>> context = ReActContext(system_prompt, "Task: Fix the bug", max_tokens=8000)
+        >>> context.add_step(step)
+        >>> messages = context.messages()
+        >>> context.prompt_tokens
+        1532
+    """
+
+    def __init__(
+        self,
+        system_prompt: str,
+        task_prompt: str,
+        max_tokens: int = 8000,
+        keep_recent: int = 2,
+        compacted_observation_chars: int = 500,
+    ) -> None:
+        """Initialize the context with the fixed prompt prefix.
+
+        Args:
+            system_prompt: Fully rendered system prompt
+            task_prompt: Task description sent as the first user message
+            max_tokens: Estimated prompt size above which old observations are compacted
+            keep_recent: Number of most recent observations never compacted
+            compacted_observation_chars: Characters kept from a compacted observation
+        """
+        self.system_prompt = system_prompt
+        self.task_prompt = task_prompt
+        self.max_tokens = max_tokens
+        self.keep_recent = keep_recent
+        self.compacted_observation_chars = compacted_observation_chars
+
+        self._messages: list[dict[str, Any]] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": task_prompt},
+        ]
+        self._chars = len(system_prompt) + len(task_prompt)
+        # Each step's observation and its message index, and how many are already compacted
+        self._observations: list[tuple[str, int]] = []
+        self._compacted = 0
+
+    @property
+    def step_count(self) -> int:
+        """Number of trajectory steps added."""
+        return len(self._observations)
+
+    @property
+    def prompt_tokens(self) -> int:
+        """Estimated size of the prompt returned by messages()."""
+        return (self._chars + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+    def add_step(self, step: TrajectoryStep) -> None:
+        """Append a trajectory step as an assistant turn and its observation.
+
+        Args:
+            step: Completed trajectory step
+        """
+        actions = [(step.action, step.action_input), *step.extra_actions]
+        assistant = f"THOUGHT: {step.thought}\n" + "\n".join(
+            f"ACTION: {action}\nACTION_INPUT: {json.dumps(action_input)}" for action, action_input in actions
+        )
+        observation = self._observation_message(step.observation)
+        self._messages.append({"role": "assistant", "content": assistant})
+        self._messages.append({"role": "user", "content": observation})
+        self._observations.append((step.observation, len(self._messages) - 1))
+        self._chars += len(assistant) + len(observation)
+
+    def messages(self) -> list[dict[str, Any]]:
+        """Get the messages for the next request, compacting first if over budget.
+
+        Returns:
+            Copy of the message list
+        """
+        if self.prompt_tokens > self.max_tokens:
+            self._compact()
+        return [dict(message) for message in self._messages]
+
+    def _compact(self) -> None:
+        """Truncate every observation except the most recent keep_recent.
+
+        Once the budget can't be met, each later call compacts only the
+        observation that just left the recent window, so the prefix before
+        it stays cacheable.
+        """
+        end = max(self._compacted, self.step_count - self.keep_recent)
+        saved = 0
+        for observation, index in self._observations[self._compacted : end]:
+            shortened = self._truncate(observation)
+            if len(shortened) < len(observation):
+                self._messages[index]["content"] = self._observation_message(shortened)
+                saved += len(observation) - len(shortened)
+        self._compacted = end
+        self._chars -= saved
+
+        if saved:
+            log.debug(
+                "react_context_compacted",
+                steps=end,
+                tokens_saved=saved // CHARS_PER_TOKEN,
+                prompt_tokens=self.prompt_tokens,
+            )
+
+    def _truncate(self, observation: str) -> str:
+        limit = self.compacted_observation_chars
+        if len(observation) <= limit:
+            return observation
+        omitted = len(observation) - limit
+        return (
+            f"{observation[:limit]}\n"
+            f"[... {omitted} characters of this earlier observation omitted; repeat the action if you need them]"
+        )
+
+    @staticmethod
+    def _observation_message(observation: str) -> str:
+        return f"OBSERVATION: {observation}\n\nContinue with the next step."
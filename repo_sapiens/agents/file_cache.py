@@ -0,0 +1,231 @@
+"""Read-through file content cache for the ReAct agent's file tools.
+
+Within one trajectory an agent reads the same handful of files again and
+again, usually after editing them. ``FileCache`` keeps decoded contents
+keyed by path and validates every hit against the file's ``st_mtime_ns``
+and ``st_size``, so a change made behind its back (by ``run_command``, an
+editor, a git checkout) is picked up on the next read. Writes that go
+through the cache store the new content directly, so reading a file
+straight after editing it doesn't touch the disk.
+
+Files above ``MMAP_THRESHOLD_BYTES`` are never cached. They are mapped
+with mmap and only the part a caller asks for (a prefix, or a line range)
+is decoded.
+
+Every method does blocking I/O and is meant to be called from a worker
+thread; concurrent callers are safe.
+"""
+
+from __future__ import annotations
+
+import codecs
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+# Files at least this large are mapped and decoded piecemeal instead of cached
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# Upper bound on UTF-8 bytes per character, for sizing prefix reads
+_MAX_UTF8_BYTES = 4
+
+# Newlines are counted a chunk at a time when seeking to a line
+_SCAN_CHUNK_BYTES = 1024 * 1024
+
+
+class FileCache:
+    """Size-bounded LRU of decoded text files, validated by mtime and size.
+
+    Text is decoded as UTF-8 with universal newlines, matching
+    ``Path.read_text``. Decoding errors propagate as UnicodeDecodeError.
+
+    Attributes:
+        max_bytes: Upper bound on cached characters
+        hits: Reads answered from the cache
+        misses: Reads that went to disk
+
+    Example:
+        >>> cache = FileCache(max_bytes=32 * 1024 * 1024)
+        >>> text = cache.read_text(Path("/work/repo/app.py"))
+        >>> cache.write_text(Path("/work/repo/app.py"), text.replace("foo", "bar"))
+        >>> cache.read_lines(Path("/work/repo/app.py"), 10, 20)
+        ['def handler(event):', ...]
+        >>> cache.stats()
+        {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Upper bound on cached characters
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        # Absolute path -> (st_mtime_ns, st_size, text)
+        self._entries: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        self._cached_bytes = 0
+
+    def read_text(self, path: Path, limit: int | None = None) -> str:
+        """Read a file's text.
+
+        Args:
+            path: Absolute file path
+            limit: Characters the caller needs; a large file is only decoded this far
+
+        Returns:
+            The file's text, or at least its first ``limit`` characters
+
+        Raises:
+            OSError: If the file can't be read (FileNotFoundError, IsADirectoryError, ...)
+            UnicodeDecodeError: If the file isn't valid UTF-8
+        """
+        stat = os.stat(path)
+        cached = self._lookup(path, stat)
+        if cached is not None:
+            return cached
+
+        if stat.st_size < MMAP_THRESHOLD_BYTES:
+            with open(path, "rb") as f:
+                text = _decode(f.read())
+            # Keyed by the stat taken before reading: a concurrent change only causes a later miss
+            self._store(path, stat, text)
+            return text
+
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if limit is None:
+                return _decode(mapped[:])
+            # Decode one character past the limit so callers can tell the file was longer
+            size = (limit + 1) * _MAX_UTF8_BYTES
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            text = decoder.decode(mapped[:size], final=size >= len(mapped))
+            return _normalize_newlines(text)[: limit + 1]
+
+    def read_lines(self, path: Path, start: int, end: int | None = None) -> list[str]:
+        """Read a range of lines without decoding the rest of a large file.
+
+        Args:
+            path: Absolute file path
+            start: First line, 1-based
+            end: Last line, inclusive (None for the end of the file)
+
+        Returns:
+            The lines, without line endings; empty if the file is shorter than ``start``
+
+        Raises:
+            OSError: If the file can't be read
+            UnicodeDecodeError: If the requested lines aren't valid UTF-8
+        """
+        if os.stat(path).st_size < MMAP_THRESHOLD_BYTES:
+            return _split_lines(self.read_text(path))[start - 1 : end]
+
+        with self._lock:
+            self.misses += 1
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            begin = _line_offset(mapped, start - 1, 0)
+            if begin is None:
+                return []
+            stop = None if end is None else _line_offset(mapped, end - start + 1, begin)
+            return _split_lines(_decode(mapped[begin:stop]))
+
+    def write_text(self, path: Path, content: str) -> None:
+        """Write a file and cache what was written.
+
+        Args:
+            path: Absolute file path
+            content: Text to write as UTF-8
+
+        Raises:
+            OSError: If the file can't be written
+        """
+        path.write_text(content, encoding="utf-8")
+        self._store(path, os.stat(path), _normalize_newlines(content))
+
+    def stats(self) -> dict[str, Any]:
+        """Hit and miss counts since the last reset_stats()."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
+
+    def reset_stats(self) -> None:
+        """Zero the hit and miss counters; cached contents are kept."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def clear(self) -> None:
+        """Drop every cached file."""
+        with self._lock:
+            self._entries.clear()
+            self._cached_bytes = 0
+
+    def _lookup(self, path: Path, stat: os.stat_result) -> str | None:
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            return None
+
+    def _store(self, path: Path, stat: os.stat_result, text: str) -> None:
+        key = str(path)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._cached_bytes -= len(previous[2])
+            if stat.st_size >= MMAP_THRESHOLD_BYTES or len(text) > self.max_bytes:
+                return
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, text)
+            self._cached_bytes += len(text)
+            while self._cached_bytes > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._cached_bytes -= len(evicted)
+
+
+def _decode(data: bytes) -> str:
+    return _normalize_newlines(data.decode("utf-8"))
+
+
+def _normalize_newlines(text: str) -> str:
+    """Translate \\r\\n and \\r to \\n, as text-mode reads do."""
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _split_lines(text: str) -> list[str]:
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def _line_offset(mapped: mmap.mmap, lines: int, offset: int) -> int | None:
+    """Byte offset just past ``lines`` newlines from ``offset``; None if the file ends first."""
+    while lines:
+        chunk = mapped[offset : offset + _SCAN_CHUNK_BYTES]
+        if not chunk:
+            return None
+        count = chunk.count(b"\n")
+        if count < lines:
+            lines -= count
+            offset += len(chunk)
+            continue
+        position = -1
+        for _ in range(lines):
+            position = chunk.index(b"\n", position + 1)
+        return offset + position + 1
+    return offset
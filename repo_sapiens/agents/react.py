@@ -12,29 +12,55 @@ from __future__ import annotations
 import json
 import os
 import re
-from dataclasses import dataclass
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
 import structlog
 
-from repo_sapiens.agents.backends import ChatResponse, LLMBackend, create_backend
+from repo_sapiens.agents.backends import ChatResponse, LLMBackend, ToolCall, create_backend
+from repo_sapiens.agents.context import ReActContext
 from repo_sapiens.agents.tools import ToolRegistry
 from repo_sapiens.models.domain import Issue, Plan, Review, Task, TaskResult
+from repo_sapiens.monitoring.tracing import span
 from repo_sapiens.providers.base import AgentProvider
 
 log = structlog.get_logger()
 
+_ACTION_INPUT_RE = re.compile(r"ACTION_INPUT:\s*(?=\{)", re.IGNORECASE)
+_json_decoder = json.JSONDecoder()
+
+
+def _has_complete_action_input(text: str) -> bool:
+    """Check whether text contains an ACTION_INPUT followed by a complete JSON object."""
+    match = _ACTION_INPUT_RE.search(text)
+    if match is None:
+        return False
+    try:
+        _json_decoder.raw_decode(text, match.end())
+    except json.JSONDecodeError:
+        return False
+    return True
+
 
 @dataclass
 class TrajectoryStep:
-    """A single step in the ReAct trajectory."""
+    """A single step in the ReAct trajectory.
+
+    ``prompt_tokens`` is the estimated size of the prompt that produced
+    this step. When the model issued several native tool calls at once,
+    the first is ``action``/``action_input``, the rest are in
+    ``extra_actions``, and ``observation`` holds every result.
+    """
 
     iteration: int
     thought: str
     action: str
     action_input: dict[str, Any]
     observation: str
+    prompt_tokens: int = 0
+    extra_actions: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
 
 
 @dataclass
@@ -50,6 +76,13 @@ class ReActConfig:
         temperature: Sampling temperature (0.0 to 1.0)
         timeout: Request timeout in seconds
         use_native_tools: Use native function calling when available
+        stream: Stream completions and stop generating once a complete
+            ACTION_INPUT object has been produced
+        max_context_tokens: Estimated prompt size above which older
+            observations are truncated
+        keep_alive: Ollama model keep-alive (e.g. "30m"), None for the server default
+        stream_usage: Ask an OpenAI-compatible server for token usage in
+            streamed completions (off by default; some servers reject it)
     """
 
     model: str = "qwen3:latest"
@@ -60,6 +93,10 @@ class ReActConfig:
     temperature: float = 0.7
     timeout: int = 300
     use_native_tools: bool = True
+    stream: bool = True
+    max_context_tokens: int = 8000
+    keep_alive: str | None = None
+    stream_usage: bool = False
 
     @property
     def ollama_url(self) -> str:
@@ -164,11 +201,19 @@ ACTION_INPUT: {{"answer": "\\n".join(files)}}  <- NO! Don't use code
             base_url=self.config.base_url,
             api_key=self.config.api_key,
             timeout=self.config.timeout,
+            keep_alive=self.config.keep_alive,
+            stream_usage=self.config.stream_usage,
         )
 
         self._trajectory: list[TrajectoryStep] = []
         self.system_prompt = system_prompt or self.SYSTEM_PROMPT
 
+        # Rendered once per system prompt; stable across iterations so prefix caches hit
+        self._rendered_system_prompt: tuple[str, str] | None = None
+        self._tools_schema: list[dict[str, Any]] | None = None
+        self._context: ReActContext | None = None
+        self._last_prompt_tokens = 0
+
     async def __aenter__(self) -> ReActAgentProvider:
         """Async context manager entry."""
         return self
@@ -210,6 +255,8 @@ ACTION_INPUT: {{"answer": "\\n".join(files)}}  <- NO! Don't use code
             TaskResult with execution details
         """
         self._trajectory = []
+        self._context = None
+        self._last_prompt_tokens = 0
         self.tools.reset()
 
         log.info(
@@ -229,6 +276,12 @@ ACTION_INPUT: {{"answer": "\\n".join(files)}}  <- NO! Don't use code
             # Generate next step from LLM
             response = await self._generate_step(task_prompt)
 
+            if isinstance(response, ChatResponse) and len(response.tool_calls) > 1:
+                # Several native tool calls - run them together as one step
+                step = await self._execute_tool_calls(iteration + 1, response)
+                self._trajectory.append(step)
+                continue
+
             # Handle native tool calls vs text-based parsing
             if isinstance(response, ChatResponse) and response.has_tool_calls:
                 # Native function calling - extract tool call directly
@@ -259,6 +312,7 @@ ACTION_INPUT: {{"answer": "\\n".join(files)}}  <- NO! Don't use code
                         action=action,
                         action_input={},
                         observation=observation,
+                        prompt_tokens=self._last_prompt_tokens,
                     )
                     self._trajectory.append(step)
                     continue  # Retry - trajectory will be included in next call
@@ -273,6 +327,7 @@ ACTION_INPUT: {{"answer": "\\n".join(files)}}  <- NO! Don't use code
                     files_changed=self.tools.get_files_written(),
                     execution_time=0.0,
                     output=answer,
+                    metadata=self._result_metadata(),
                 )
 
             # Execute the tool
@@ -285,6 +340,7 @@ ACTION_INPUT: {{"answer": "\\n".join(files)}}  <- NO! Don't use code
                 action=action,
                 action_input=action_input,
                 observation=observation,
+                prompt_tokens=self._last_prompt_tokens,
             )
             self._trajectory.append(step)
 
@@ -293,6 +349,7 @@ ACTION_INPUT: {{"answer": "\\n".join(files)}}  <- NO! Don't use code
                 iteration=iteration + 1,
                 action=action,
                 observation_len=len(observation),
+                prompt_tokens=self._last_prompt_tokens,
             )
 
         log.warning("react_max_iterations", max=self.config.max_iterations)
@@ -300,6 +357,48 @@ ACTION_INPUT: {{"answer": "\\n".join(files)}}  <- NO! Don't use code
             success=False,
             error=f"Max iterations ({self.config.max_iterations}) reached",
             files_changed=self.tools.get_files_written(),
+            metadata=self._result_metadata(),
+        )
+
+    def _result_metadata(self) -> dict[str, Any]:
+        """Execution details reported with the TaskResult."""
+        return {"file_cache": self.tools.file_cache.stats()}
+
+    async def _execute_tool_calls(self, iteration: int, response: ChatResponse) -> TrajectoryStep:
+        """Execute every tool call from one response concurrently.
+
+        A 'finish' issued alongside other calls is not honoured: its answer
+        was written before the model saw the other calls' results.
+
+        Args:
+            iteration: 1-based iteration number
+            response: Response with more than one tool call
+
+        Returns:
+            Trajectory step holding all calls and their combined observations
+        """
+        calls = [(tool_call.name, tool_call.arguments) for tool_call in response.tool_calls]
+        runnable = [(name, args) for name, args in calls if name != "finish"]
+        results = iter(await self.tools.execute_many(runnable))
+
+        observations = []
+        for number, (name, _) in enumerate(calls, 1):
+            if name == "finish":
+                result = "Not finished: call 'finish' on its own after reviewing these results."
+            else:
+                result = next(results)
+            observations.append(f"[{number}] {name}: {result}")
+
+        log.debug("react_parallel_tool_calls", iteration=iteration, tools=[name for name, _ in calls])
+
+        return TrajectoryStep(
+            iteration=iteration,
+            thought=response.content or "",
+            action=calls[0][0],
+            action_input=calls[0][1],
+            observation="\n\n".join(observations),
+            prompt_tokens=self._last_prompt_tokens,
+            extra_actions=calls[1:],
         )
 
     async def _generate_step(self, task_prompt: str) -> ChatResponse | str:
@@ -311,48 +410,27 @@ ACTION_INPUT: {{"answer": "\\n".join(files)}}  <- NO! Don't use code
         Returns:
             ChatResponse with tool_calls (native mode) or raw string (text mode)
         """
-        # Build the full prompt
-        # If custom system prompt contains {tool_descriptions}, replace it
-        # Otherwise, use it as-is
-        try:
-            system = self.system_prompt.format(tool_descriptions=self.tools.get_tool_descriptions())
-        except KeyError:
-            # System prompt doesn't use {tool_descriptions} placeholder
-            system = self.system_prompt
-
-        messages = [
-            {"role": "system", "content": system},
-            {"role": "user", "content": task_prompt},
-        ]
-
-        # Add trajectory as conversation history
-        for step in self._trajectory:
-            # Assistant's previous response
-            assistant_msg = (
-                f"THOUGHT: {step.thought}\n" f"ACTION: {step.action}\n" f"ACTION_INPUT: {json.dumps(step.action_input)}"
-            )
-            messages.append({"role": "assistant", "content": assistant_msg})
-
-            # Observation as user message
-            messages.append(
-                {
-                    "role": "user",
-                    "content": f"OBSERVATION: {step.observation}\n\nContinue with the next step.",
-                }
-            )
+        context = self._sync_context(task_prompt)
+        messages = context.messages()
+        self._last_prompt_tokens = context.prompt_tokens
 
         # Determine if we should use native tool calling
         tools = None
         if self.config.use_native_tools:
-            tools = self.tools.to_openai_format()
+            if self._tools_schema is None:
+                self._tools_schema = self.tools.to_openai_format()
+            tools = self._tools_schema
 
         try:
-            response = await self.backend.chat(
-                messages=messages,
-                model=self.config.model,
-                temperature=self.config.temperature,
-                tools=tools,
-            )
+            if self.config.stream:
+                response = await self._stream_step(messages, tools)
+            else:
+                response = await self.backend.chat(
+                    messages=messages,
+                    model=self.config.model,
+                    temperature=self.config.temperature,
+                    tools=tools,
+                )
 
             # If we got tool calls back, return the full response for native handling
             if response.has_tool_calls:
@@ -370,6 +448,88 @@ ACTION_INPUT: {{"answer": "\\n".join(files)}}  <- NO! Don't use code
             log.error("backend_request_failed", error=str(e))
             raise
 
+    def _system_prompt_text(self) -> str:
+        """Get the system prompt with tool descriptions, rendered once per prompt."""
+        if self._rendered_system_prompt is None or self._rendered_system_prompt[0] != self.system_prompt:
+            # If custom system prompt contains {tool_descriptions}, replace it
+            # Otherwise, use it as-is
+            try:
+                rendered = self.system_prompt.format(tool_descriptions=self.tools.get_tool_descriptions())
+            except KeyError:
+                # System prompt doesn't use {tool_descriptions} placeholder
+                rendered = self.system_prompt
+            self._rendered_system_prompt = (self.system_prompt, rendered)
+        return self._rendered_system_prompt[1]
+
+    def _sync_context(self, task_prompt: str) -> ReActContext:
+        """Bring the prompt context up to date with the trajectory.
+
+        The context is reused across iterations of a task and only new
+        steps are appended, keeping earlier messages byte-identical. It is
+        rebuilt when the task, system prompt or trajectory was replaced.
+
+        Args:
+            task_prompt: The task description
+
+        Returns:
+            Context holding every step of the current trajectory
+        """
+        system = self._system_prompt_text()
+        context = self._context
+        if (
+            context is None
+            or context.task_prompt != task_prompt
+            or context.system_prompt != system
+            or context.step_count > len(self._trajectory)
+        ):
+            context = ReActContext(system, task_prompt, max_tokens=self.config.max_context_tokens)
+            self._context = context
+
+        for step in self._trajectory[context.step_count :]:
+            context.add_step(step)
+        return context
+
+    async def _stream_step(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> ChatResponse:
+        """Stream one ReAct step, cutting generation at the end of the action.
+
+        Anything the model writes after a complete ACTION_INPUT object is
+        discarded by the parser anyway, so closing the stream there saves
+        the output tokens and time it would take to generate it.
+
+        Args:
+            messages: Conversation so far
+            tools: Tool definitions for native function calling, if enabled
+
+        Returns:
+            ChatResponse assembled from the streamed chunks
+        """
+        parts: list[str] = []
+        tool_calls: list[ToolCall] = []
+
+        stream = self.backend.chat_stream(
+            messages=messages,
+            model=self.config.model,
+            temperature=self.config.temperature,
+            tools=tools,
+        )
+        with span(f"{type(self.backend).__name__}.chat_stream", model=self.config.model, messages=len(messages)):
+            async with aclosing(stream):
+                async for chunk in stream:
+                    tool_calls.extend(chunk.tool_calls)
+                    if not chunk.content:
+                        continue
+                    parts.append(chunk.content)
+                    # The object can only have just completed if this delta closed a brace
+                    if "}" in chunk.content and _has_complete_action_input("".join(parts)):
+                        log.debug("react_stream_cut", chars=sum(len(part) for part in parts))
+                        break
+
+        return ChatResponse(content="".join(parts), tool_calls=tool_calls, raw={})
+
     def _parse_response(self, response: str) -> tuple[str, str, dict[str, Any]]:
         """Parse the ReAct response into thought, action, and input.
 
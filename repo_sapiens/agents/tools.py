@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-import subprocess
+import itertools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import structlog
 
+from repo_sapiens.agents.file_cache import FileCache
+from repo_sapiens.agents.workspace_index import WorkspaceIndex
+from repo_sapiens.monitoring.tracing import traced
+
 log = structlog.get_logger()
 
 
@@ -33,13 +37,25 @@ class ToolRegistry:
 
     Provides file operations and shell command execution within
     a sandboxed working directory.
+
+    All filesystem work happens in worker threads, so several read-only
+    tools can run concurrently through execute_many(). read_file and
+    edit_file go through a FileCache that is kept current by the tools' own
+    writes; search_files and find_files answer from a WorkspaceIndex of the
+    working directory that is built on first use.
     """
 
+    READ_ONLY_TOOLS: frozenset[str] = frozenset({"read_file", "list_directory", "search_files", "find_files", "tree"})
+
     TOOLS: dict[str, ToolDefinition] = {
         "read_file": ToolDefinition(
             name="read_file",
-            description="Read the contents of a file. Returns the file content as a string.",
-            parameters={"path": "Path to the file to read (relative to working directory)"},
+            description="Read the contents of a file, or a range of its lines. Returns the file content as a string.",
+            parameters={
+                "path": "Path to the file to read (relative to working directory)",
+                "start_line": "First line to read, 1-based (optional, default: start of file)",
+                "end_line": "Last line to read, inclusive (optional, default: end of file)",
+            },
         ),
         "write_file": ToolDefinition(
             name="write_file",
@@ -108,6 +124,7 @@ class ToolRegistry:
         working_dir: str | Path,
         allowed_commands: list[str] | None = None,
         command_timeout: int = 60,
+        trigram_index: bool = False,
     ):
         """Initialize the tool registry.
 
@@ -115,11 +132,14 @@ class ToolRegistry:
             working_dir: Base directory for file operations
             allowed_commands: Optional whitelist of allowed command prefixes
             command_timeout: Timeout for shell commands in seconds
+            trigram_index: Prefilter searches with trigram signatures (for large checkouts)
         """
         self.working_dir = Path(working_dir).resolve()
         self.allowed_commands = allowed_commands
         self.command_timeout = command_timeout
         self.files_written: list[str] = []
+        self.index = WorkspaceIndex(self.working_dir, trigrams=trigram_index)
+        self.file_cache = FileCache()
 
     def get_tool_descriptions(self) -> str:
         """Get formatted tool descriptions for the prompt."""
@@ -179,6 +199,7 @@ class ToolRegistry:
             )
         return resolved
 
+    @traced("tool.{tool}", attributes=lambda self, tool_name, args: {"tool": tool_name})
     async def execute(self, tool_name: str, args: dict[str, Any]) -> str:
         """Execute a tool and return the observation.
 
@@ -199,7 +220,11 @@ class ToolRegistry:
 
         try:
             if tool_name == "read_file":
-                return await self._read_file(args.get("path", ""))
+                return await self._read_file(
+                    args.get("path", ""),
+                    args.get("start_line"),
+                    args.get("end_line"),
+                )
             elif tool_name == "write_file":
                 return await self._write_file(
                     args.get("path", ""),
@@ -242,26 +267,120 @@ class ToolRegistry:
             log.error("tool_unexpected_error", tool=tool_name, error=str(e))
             return f"Error: Unexpected error - {e}"
 
-    async def _read_file(self, path: str) -> str:
-        """Read contents of a file."""
+    async def execute_many(self, calls: list[tuple[str, dict[str, Any]]]) -> list[str]:
+        """Execute several tool calls from one model response concurrently.
+
+        Read-only tools run in parallel. Calls that touch the same file
+        (read_file, write_file, edit_file) run in the order they were
+        issued. Directory-level readers (list_directory, search_files,
+        find_files, tree) start after every earlier write_file or edit_file,
+        and those writes start after every earlier directory-level reader,
+        so each sees the tree as of its place in the response. A run_command
+        call is a barrier, since a command may touch any file: it starts
+        once every earlier call has finished, and every later call waits
+        for it.
+
+        Args:
+            calls: (tool_name, args) pairs in the order the model issued them
+
+        Returns:
+            Observations in the same order as calls
+        """
+        previous: dict[str, asyncio.Task[str]] = {}
+        # Writes and directory scans issued since the last barrier
+        writes: list[asyncio.Task[str]] = []
+        scans: list[asyncio.Task[str]] = []
+        barrier: asyncio.Task[str] | None = None
+        tasks: list[asyncio.Task[str]] = []
+        for tool_name, args in calls:
+            scan = write = False
+            if tool_name == "run_command":
+                after = list(tasks)
+            else:
+                key = self._ordering_key(tool_name, args)
+                scan = key is None and tool_name in self.READ_ONLY_TOOLS
+                write = key is not None and tool_name not in self.READ_ONLY_TOOLS
+                after = [t for t in (barrier, previous.get(key) if key else None) if t is not None]
+                if scan:
+                    after += writes
+                elif write:
+                    after += scans
+            task = asyncio.create_task(self._execute_after(after, tool_name, args))
+            if tool_name == "run_command":
+                # Everything issued earlier finishes before the barrier does
+                barrier = task
+                previous.clear()
+                writes.clear()
+                scans.clear()
+            else:
+                if key:
+                    previous[key] = task
+                if scan:
+                    scans.append(task)
+                elif write:
+                    writes.append(task)
+            tasks.append(task)
+
+        return list(await asyncio.gather(*tasks))
+
+    async def _execute_after(self, after: list[asyncio.Task[str]], tool_name: str, args: dict[str, Any]) -> str:
+        if after:
+            await asyncio.wait(after)
+        return await self.execute(tool_name, args)
+
+    def _ordering_key(self, tool_name: str, args: dict[str, Any]) -> str | None:
+        """Get the key whose calls must not overlap, or None if the call can run freely.
+
+        run_command calls are ordered against every call by execute_many()
+        instead.
+        """
+        if tool_name in ("read_file", "write_file", "edit_file"):
+            try:
+                return str(self._resolve_path(str(args.get("path", ""))))
+            except ToolExecutionError:
+                # execute() reports the error; nothing to order against
+                return None
+        return None
+
+    async def _read_file(self, path: str, start_line: Any = None, end_line: Any = None) -> str:
+        """Read contents of a file, or the lines from start_line to end_line."""
         if not path:
             return "Error: 'path' parameter is required"
 
         resolved = self._resolve_path(path)
 
-        if not resolved.exists():
-            return f"Error: File '{path}' does not exist"
-
-        if not resolved.is_file():
-            return f"Error: '{path}' is not a file"
-
         try:
-            content = resolved.read_text(encoding="utf-8")
+            first = int(start_line) if start_line not in (None, "") else None
+            last = int(end_line) if end_line not in (None, "") else None
+        except (TypeError, ValueError):
+            return "Error: 'start_line' and 'end_line' must be line numbers"
+        if (first is not None and first < 1) or (first is not None and last is not None and last < first):
+            return "Error: Invalid line range"
+
+        max_size = 50000
+
+        def read() -> str:
+            kind = _path_kind(resolved)
+            if kind is None:
+                return f"Error: File '{path}' does not exist"
+            if kind != "file":
+                return f"Error: '{path}' is not a file"
+
+            if first is None and last is None:
+                content = self.file_cache.read_text(resolved, limit=max_size)
+            else:
+                lines = self.file_cache.read_lines(resolved, first or 1, last)
+                if not lines:
+                    return f"Error: '{path}' has fewer than {first} lines"
+                content = "\n".join(lines)
+
             # Truncate very large files
-            max_size = 50000
             if len(content) > max_size:
                 content = content[:max_size] + f"\n\n[Truncated - file exceeds {max_size} chars]"
             return content
+
+        try:
+            return await asyncio.to_thread(read)
         except UnicodeDecodeError:
             return f"Error: File '{path}' is not a text file"
 
@@ -274,33 +393,43 @@ class ToolRegistry:
 
         resolved = self._resolve_path(path)
 
-        # Create parent directories if needed
-        resolved.parent.mkdir(parents=True, exist_ok=True)
+        def write() -> None:
+            # Create parent directories if needed
+            resolved.parent.mkdir(parents=True, exist_ok=True)
+            self.file_cache.write_text(resolved, content)
 
         try:
-            resolved.write_text(content, encoding="utf-8")
-            self.files_written.append(str(resolved.relative_to(self.working_dir)))
-            return f"Successfully wrote {len(content)} bytes to '{path}'"
+            await asyncio.to_thread(write)
         except OSError as e:
             raise ToolExecutionError(f"Failed to write file: {e}") from e
 
+        rel_path = str(resolved.relative_to(self.working_dir))
+        self.files_written.append(rel_path)
+        self.index.update([rel_path])
+        return f"Successfully wrote {len(content)} bytes to '{path}'"
+
     async def _list_directory(self, path: str) -> str:
         """List contents of a directory."""
         resolved = self._resolve_path(path)
 
-        if not resolved.exists():
+        kind = await asyncio.to_thread(_path_kind, resolved)
+        if kind is None:
             return f"Error: Directory '{path}' does not exist"
 
-        if not resolved.is_dir():
+        if kind != "dir":
             return f"Error: '{path}' is not a directory"
 
-        try:
+        def list_entries() -> list[str]:
             entries = []
             for entry in sorted(resolved.iterdir()):
                 if entry.name.startswith("."):
                     continue  # Skip hidden files
                 prefix = "d " if entry.is_dir() else "f "
                 entries.append(f"{prefix}{entry.name}")
+            return entries
+
+        try:
+            entries = await asyncio.to_thread(list_entries)
 
             if not entries:
                 return f"Directory '{path}' is empty"
@@ -354,74 +483,47 @@ class ToolRegistry:
 
         except Exception as e:
             return f"Error running command: {e}"
+        finally:
+            # The command may have changed any file; re-walk the tree on the next search
+            self.index.invalidate()
 
     async def _search_files(self, pattern: str, path: str = ".", file_pattern: str = "*") -> str:
-        """Search for a pattern in file contents using grep."""
+        """Search for a pattern in file contents, grep-style, using the workspace index."""
         if not pattern:
             return "Error: 'pattern' parameter is required"
 
         resolved = self._resolve_path(path)
 
-        if not resolved.exists():
+        kind = await asyncio.to_thread(_path_kind, resolved)
+        if kind is None:
             return f"Error: Path '{path}' does not exist"
 
-        if not resolved.is_dir():
+        if kind != "dir":
             return f"Error: '{path}' is not a directory"
 
-        try:
-            # Build grep command with line numbers
-            # Use --include for file pattern filtering
-            cmd = [
-                "grep",
-                "-rn",  # recursive with line numbers
-                "--include",
-                file_pattern,
-                pattern,
-                str(resolved),
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=str(self.working_dir),
-            )
+        rel_dir = str(resolved.relative_to(self.working_dir))
+        prefix_len = 0 if rel_dir == "." else len(Path(rel_dir).as_posix()) + 1
+        max_matches = 50
+
+        def collect_matches() -> list[tuple[str, int, str]]:
+            # One past the cap tells us whether to add the truncation note
+            return list(itertools.islice(self.index.search(pattern, rel_dir, file_pattern), max_matches + 1))
 
-            if result.returncode == 1:
-                # grep returns 1 when no matches found
-                return f"No matches found for pattern '{pattern}'"
-
-            if result.returncode != 0 and result.stderr:
-                return f"Error: {result.stderr.strip()}"
-
-            output = result.stdout.strip()
-            if not output:
-                return f"No matches found for pattern '{pattern}'"
-
-            # Limit results to prevent token explosion
-            lines = output.split("\n")
-            max_matches = 50
-            if len(lines) > max_matches:
-                lines = lines[:max_matches]
-                lines.append(f"\n[Truncated - showing first {max_matches} of {len(output.split(chr(10)))} matches]")
-
-            # Convert absolute paths to relative paths
-            formatted_lines = []
-            for line in lines:
-                if line.startswith(str(resolved)):
-                    line = line[len(str(resolved)) + 1 :]  # +1 for the slash
-                formatted_lines.append(line)
-
-            return "\n".join(formatted_lines)
-
-        except subprocess.TimeoutExpired:
-            return "Error: Search timed out after 30 seconds"
-        except FileNotFoundError:
-            return "Error: grep command not found on this system"
+        try:
+            matches = await asyncio.to_thread(collect_matches)
         except Exception as e:
             return f"Error: {e}"
 
+        if not matches:
+            return f"No matches found for pattern '{pattern}'"
+
+        # Paths are shown relative to the searched directory
+        lines = [f"{match_path[prefix_len:]}:{number}:{line}" for match_path, number, line in matches[:max_matches]]
+        if len(matches) > max_matches:
+            lines.append(f"\n[Truncated - showing first {max_matches} matches]")
+
+        return "\n".join(lines)
+
     async def _find_files(self, pattern: str, path: str = ".") -> str:
         """Find files matching a glob pattern within a directory."""
         if not pattern:
@@ -432,24 +534,13 @@ class ToolRegistry:
             search_dir = (self.working_dir / path).resolve()
             if not search_dir.is_relative_to(self.working_dir):
                 return f"Error: Path '{path}' is outside the working directory"
-            if not search_dir.exists():
+            kind = await asyncio.to_thread(_path_kind, search_dir)
+            if kind is None:
                 return f"Error: Directory '{path}' does not exist"
-            if not search_dir.is_dir():
+            if kind != "dir":
                 return f"Error: '{path}' is not a directory"
 
-            matches = []
-            for match in search_dir.glob(pattern):
-                # Skip hidden files and directories
-                if any(part.startswith(".") for part in match.parts):
-                    continue
-
-                # Security check: ensure match is within working directory
-                try:
-                    relative = match.relative_to(self.working_dir)
-                    if match.is_file():
-                        matches.append(str(relative))
-                except ValueError:
-                    continue  # Path is outside working directory
+            matches = await asyncio.to_thread(self.index.find, pattern, str(search_dir.relative_to(self.working_dir)))
 
             if not matches:
                 return f"No files found matching pattern '{pattern}' in '{path}'"
@@ -478,46 +569,53 @@ class ToolRegistry:
 
         resolved = self._resolve_path(path)
 
-        if not resolved.exists():
-            return f"Error: File '{path}' does not exist"
+        def edit() -> str | None:
+            """Apply the edit; returns an error observation, or None on success."""
+            kind = _path_kind(resolved)
+            if kind is None:
+                return f"Error: File '{path}' does not exist"
+            if kind != "file":
+                return f"Error: '{path}' is not a file"
 
-        if not resolved.is_file():
-            return f"Error: '{path}' is not a file"
-
-        try:
-            content = resolved.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            return f"Error: File '{path}' is not a text file"
-
-        # Count occurrences of old_text
-        count = content.count(old_text)
-
-        if count == 0:
-            return f"Error: Text not found in '{path}'. The old_text does not exist in the file."
-
-        if count > 1:
-            return f"Error: Text appears {count} times in '{path}'. The old_text must be unique. Please provide more context to make it unique."
-
-        # Perform the replacement
-        new_content = content.replace(old_text, new_text, 1)
+            try:
+                content = self.file_cache.read_text(resolved)
+            except UnicodeDecodeError:
+                return f"Error: File '{path}' is not a text file"
+
+            # old_text must occur exactly once; stop scanning at the second occurrence
+            start = content.find(old_text)
+            if start == -1:
+                return f"Error: Text not found in '{path}'. The old_text does not exist in the file."
+            end = start + len(old_text)
+            if content.find(old_text, end) != -1:
+                count = content.count(old_text)
+                return f"Error: Text appears {count} times in '{path}'. The old_text must be unique. Please provide more context to make it unique."
+
+            self.file_cache.write_text(resolved, content[:start] + new_text + content[end:])
+            return None
 
         try:
-            resolved.write_text(new_content, encoding="utf-8")
-            rel_path = str(resolved.relative_to(self.working_dir))
-            if rel_path not in self.files_written:
-                self.files_written.append(rel_path)
-            return f"Successfully edited '{path}': replaced {len(old_text)} chars with {len(new_text)} chars"
+            error = await asyncio.to_thread(edit)
         except OSError as e:
             raise ToolExecutionError(f"Failed to write file: {e}") from e
+        if error is not None:
+            return error
+
+        rel_path = str(resolved.relative_to(self.working_dir))
+        if rel_path not in self.files_written:
+            self.files_written.append(rel_path)
+        self.index.update([rel_path])
+        return f"Successfully edited '{path}': replaced {len(old_text)} chars with {len(new_text)} chars"
 
     async def _tree(self, path: str = ".", max_depth: int = 3) -> str:
         """Display directory structure as a tree."""
         resolved = self._resolve_path(path)
 
-        if not resolved.exists():
+        kind = await asyncio.to_thread(_path_kind, resolved)
+        if kind is None:
             return f"Error: Directory '{path}' does not exist"
 
-        if not resolved.is_dir():
+        if kind != "dir":
             return f"Error: '{path}' is not a directory"
 
         def build_tree(dir_path: Path, prefix: str = "", depth: int = 1) -> list[str]:
@@ -553,7 +651,7 @@ class ToolRegistry:
         except ValueError:
             header = f"{resolved.name}/"
 
-        tree_lines = [header] + build_tree(resolved, "", 1)
+        tree_lines = [header] + await asyncio.to_thread(build_tree, resolved, "", 1)
 
         # Limit output size
         max_lines = 200
@@ -570,3 +668,14 @@ class ToolRegistry:
     def reset(self) -> None:
         """Reset the tool registry state."""
         self.files_written = []
+        self.index.invalidate()
+        self.file_cache.reset_stats()
+
+
+def _path_kind(path: Path) -> str | None:
+    """Get "dir", "file" or "other" for an existing path, None if it doesn't exist."""
+    if path.is_dir():
+        return "dir"
+    if path.is_file():
+        return "file"
+    return "other" if path.exists() else None
@@ -0,0 +1,361 @@
+"""In-process file index for the ReAct agent's search tools.
+
+An agent calls ``search_files`` and ``find_files`` many times per task over
+a workspace that barely changes between calls. ``WorkspaceIndex`` walks the
+tree once, remembers every file with its modification time, and keeps
+decoded file contents in a size-bounded LRU so repeated searches scan
+memory instead of the disk. The ToolRegistry tells the index which files
+its own tools wrote, and asks for a full re-scan after shell commands,
+which may touch anything.
+
+With ``trigrams=True`` each file read also records a trigram signature
+(a fixed-size bitmap of hashed trigrams). Searches for a literal, or a
+regex with a literal run of three or more characters, skip files whose
+signature cannot contain it without reading them. This pays off on
+checkouts larger than the content cache; for smaller ones the cached scan
+is already fast.
+
+Every method does blocking I/O and is meant to be called from a worker
+thread; concurrent callers are safe.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import posixpath
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import structlog
+
+log = structlog.get_logger()
+
+# Files larger than this are treated like binaries and skipped by search
+MAX_SEARCH_FILE_BYTES = 5 * 1024 * 1024
+
+_SIGNATURE_BITS = 8192
+_REGEX_META = set(".^$*+?{}[]()|")
+_OPTIONAL_QUANTIFIERS = set("?*{")
+
+
+class WorkspaceIndex:
+    """Cached file list and contents for one working directory.
+
+    Attributes:
+        root: Directory being indexed
+        max_cached_bytes: Upper bound on decoded file contents kept in memory
+        trigrams: Whether to keep trigram signatures for search prefiltering
+
+    Example:
+        >>> index = WorkspaceIndex(Path("/work/repo"))
+        >>> index.find("**/*.py", under="src")
+        ['src/app.py', 'src/util/io.py']
+        >>> list(itertools.islice(index.search(r"def \\w+_handler", under="src"), 50))
+        [('src/app.py', 12, 'def issue_handler(event):'), ...]
+    """
+
+    def __init__(self, root: Path, max_cached_bytes: int = 64 * 1024 * 1024, trigrams: bool = False) -> None:
+        """Initialize an empty index; the tree is walked on first use.
+
+        Args:
+            root: Directory to index
+            max_cached_bytes: Upper bound on decoded file contents kept in memory
+            trigrams: Keep trigram signatures for search prefiltering
+        """
+        self.root = root
+        self.max_cached_bytes = max_cached_bytes
+        self.trigrams = trigrams
+
+        self._lock = threading.RLock()
+        self._scanned = False
+        # Relative posix path -> st_mtime_ns, for every non-hidden file
+        self._files: dict[str, int] = {}
+        self._stale: set[str] = set()
+        # Relative path -> (mtime the content was read at, content)
+        self._contents: OrderedDict[str, tuple[int, str]] = OrderedDict()
+        self._cached_bytes = 0
+        # Relative path -> (mtime, trigram signature)
+        self._signatures: dict[str, tuple[int, int]] = {}
+
+    def invalidate(self) -> None:
+        """Re-walk the tree on next use; unchanged files keep their cached content."""
+        with self._lock:
+            self._scanned = False
+
+    def update(self, paths: Iterable[str]) -> None:
+        """Re-check specific files on next use.
+
+        Args:
+            paths: Paths relative to the root that were created, changed or deleted
+        """
+        with self._lock:
+            self._stale.update(Path(path).as_posix() for path in paths)
+
+    def files(self, under: str = "") -> list[str]:
+        """List indexed files, sorted.
+
+        Args:
+            under: Relative directory to restrict to ("" for the whole tree)
+
+        Returns:
+            Relative posix paths of non-hidden files
+        """
+        prefix = _directory_prefix(under)
+        with self._lock:
+            self._ensure_current()
+            return sorted(path for path in self._files if path.startswith(prefix))
+
+    def find(self, pattern: str, under: str = "") -> list[str]:
+        """Find files matching a glob pattern, with Path.glob semantics.
+
+        Args:
+            pattern: Glob relative to ``under``; ``**`` matches any number of directories
+            under: Relative directory the pattern is anchored at
+
+        Returns:
+            Matching relative paths, sorted
+        """
+        prefix = _directory_prefix(under)
+        regex = _glob_regex(pattern.removeprefix("./"))
+        return [path for path in self.files(under) if regex.match(path, len(prefix))]
+
+    def search(self, pattern: str, under: str = "", file_pattern: str = "*") -> Iterator[tuple[str, int, str]]:
+        """Yield lines matching a pattern, file by file in sorted order.
+
+        The pattern is a Python regular expression; if it doesn't compile it
+        is matched literally. ``^`` and ``$`` anchor at line boundaries.
+        Matching stops as soon as the caller stops iterating.
+
+        Args:
+            pattern: Regex or literal text to find
+            under: Relative directory to search
+            file_pattern: Glob the file's base name must match
+
+        Yields:
+            (relative path, 1-based line number, line text)
+        """
+        try:
+            regex = re.compile(pattern, re.MULTILINE)
+            literals = _required_literals(pattern)
+        except re.error:
+            regex = re.compile(re.escape(pattern), re.MULTILINE)
+            literals = [pattern]
+        query = _signature(_trigrams_of(literals)) if self.trigrams and literals else 0
+
+        for path in self.files(under):
+            if not fnmatch.fnmatchcase(posixpath.basename(path), file_pattern):
+                continue
+            if query and not self._may_contain(path, query):
+                continue
+            text = self._read(path)
+            if text is not None:
+                yield from _matching_lines(regex, text, path)
+
+    def _ensure_current(self) -> None:
+        if not self._scanned:
+            self._scan()
+        elif self._stale:
+            for path in self._stale:
+                # Drop cached content even if the mtime didn't tick over
+                cached = self._contents.pop(path, None)
+                if cached is not None:
+                    self._cached_bytes -= len(cached[1])
+                self._signatures.pop(path, None)
+                try:
+                    stat = (self.root / path).stat()
+                except OSError:
+                    self._files.pop(path, None)
+                    continue
+                if not _is_hidden(path):
+                    self._files[path] = stat.st_mtime_ns
+        self._stale.clear()
+
+    def _scan(self) -> None:
+        files: dict[str, int] = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+            base = Path(dirpath).relative_to(self.root)
+            for name in filenames:
+                if name.startswith("."):
+                    continue
+                path = (base / name).as_posix()
+                try:
+                    files[path] = os.stat(os.path.join(dirpath, name)).st_mtime_ns
+                except OSError:
+                    continue
+
+        self._files = files
+        self._scanned = True
+        # Cached content is checked against mtime on read; just drop deleted files
+        for path in [path for path in self._contents if path not in files]:
+            self._cached_bytes -= len(self._contents.pop(path)[1])
+        log.debug("workspace_index_scanned", root=str(self.root), files=len(files))
+
+    def _may_contain(self, path: str, query: int) -> bool:
+        with self._lock:
+            mtime = self._files.get(path)
+            entry = self._signatures.get(path)
+        if entry is None or entry[0] != mtime:
+            # Unknown: read the file, which records its signature
+            return True
+        return entry[1] & query == query
+
+    def _read(self, path: str) -> str | None:
+        """Get a file's text from the cache or disk; None for binary or unreadable files."""
+        with self._lock:
+            mtime = self._files.get(path)
+            cached = self._contents.get(path)
+            if cached is not None and cached[0] == mtime:
+                self._contents.move_to_end(path)
+                return cached[1]
+
+        try:
+            with open(self.root / path, "rb") as f:
+                data = f.read(MAX_SEARCH_FILE_BYTES + 1)
+        except OSError:
+            return None
+        if len(data) > MAX_SEARCH_FILE_BYTES or b"\0" in data[:8192]:
+            return None
+        text = data.decode("utf-8", errors="replace")
+
+        with self._lock:
+            if mtime is None:
+                return text
+            if self.trigrams:
+                self._signatures[path] = (mtime, _signature(_trigrams_of([text])))
+            previous = self._contents.pop(path, None)
+            if previous is not None:
+                self._cached_bytes -= len(previous[1])
+            if len(text) <= self.max_cached_bytes:
+                self._contents[path] = (mtime, text)
+                self._cached_bytes += len(text)
+                while self._cached_bytes > self.max_cached_bytes:
+                    _, (_, evicted) = self._contents.popitem(last=False)
+                    self._cached_bytes -= len(evicted)
+        return text
+
+
+def _directory_prefix(under: str) -> str:
+    under = Path(under).as_posix().strip("/")
+    return "" if under in ("", ".") else under + "/"
+
+
+def _is_hidden(path: str) -> bool:
+    return any(part.startswith(".") for part in path.split("/"))
+
+
+def _matching_lines(regex: re.Pattern[str], text: str, path: str) -> Iterator[tuple[str, int, str]]:
+    """Yield each line containing a match once, grep-style."""
+    line_number = 1
+    counted_to = 0
+    position = 0
+    while (match := regex.search(text, position)) is not None:
+        start = text.rfind("\n", 0, match.start()) + 1
+        end = text.find("\n", match.start())
+        if end == -1:
+            end = len(text)
+        line_number += text.count("\n", counted_to, start)
+        counted_to = start
+        yield path, line_number, text[start:end]
+        if end >= len(text):
+            return
+        position = end + 1
+
+
+def _glob_regex(pattern: str) -> re.Pattern[str]:
+    """Translate a Path.glob pattern into a regex over relative posix paths."""
+    parts = []
+    segments = pattern.split("/")
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == "**":
+            parts.append(".*" if last else "(?:[^/]+/)*")
+        else:
+            parts.append(_segment_regex(segment) + ("" if last else "/"))
+    return re.compile("".join(parts) + r"\Z")
+
+
+def _segment_regex(segment: str) -> str:
+    out = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[" and (close := segment.find("]", i + 2)) != -1:
+            body = segment[i + 1 : close]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = close
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+def _required_literals(pattern: str) -> list[str]:
+    """Extract literal runs every match must contain (empty if none can be proven).
+
+    Conservative: patterns with alternation or inline flags yield nothing,
+    and a character followed by an optional quantifier is not counted as
+    required.
+    """
+    if "|" in pattern or "(?" in pattern:
+        return []
+
+    runs: list[str] = []
+    current: list[str] = []
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        literal: str | None = None
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            i += 1
+            # \w, \d, \n... are classes or specials; escaped punctuation is literal
+            literal = escaped if not escaped.isalnum() else None
+        elif char in "[{":
+            close = pattern.find("]" if char == "[" else "}", i + 1)
+            i = close if close != -1 else len(pattern)
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char not in _REGEX_META:
+            literal = char
+
+        following = pattern[i + 1] if i + 1 < len(pattern) else ""
+        if literal is not None and depth == 0 and following not in _OPTIONAL_QUANTIFIERS:
+            current.append(literal)
+        else:
+            if len(current) >= 3:
+                runs.append("".join(current))
+            current = []
+        i += 1
+
+    if len(current) >= 3:
+        runs.append("".join(current))
+    return runs
+
+
+def _trigrams_of(texts: list[str]) -> set[str]:
+    trigrams: set[str] = set()
+    for text in texts:
+        trigrams.update(text[i : i + 3] for i in range(len(text) - 2))
+    return trigrams
+
+
+def _signature(trigrams: set[str]) -> int:
+    bitmap = bytearray(_SIGNATURE_BITS // 8)
+    for trigram in trigrams:
+        bit = hash(trigram) & (_SIGNATURE_BITS - 1)
+        bitmap[bit >> 3] |= 1 << (bit & 7)
+    return int.from_bytes(bitmap, "little")
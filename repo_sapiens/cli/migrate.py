@@ -1,5 +1,6 @@
-"""Migration utilities for daemon to native workflow transition."""
+"""Migration utilities for daemon to native workflow transition and storage backends."""
 
+import asyncio
 from pathlib import Path
 
 import click
@@ -7,6 +8,10 @@ import structlog
 
 from repo_sapiens.config.settings import AutomationSettings
 from repo_sapiens.config.triggers import AutomationConfig
+from repo_sapiens.storage.base import CHECKPOINT_COLLECTION, FEEDBACK_COLLECTION, STATE_COLLECTION
+from repo_sapiens.storage.json_backend import JSONFileBackend
+from repo_sapiens.storage.migration import migrate_collection
+from repo_sapiens.storage.sqlite_backend import SQLiteBackend
 
 log = structlog.get_logger(__name__)
 
@@ -15,7 +20,8 @@ log = structlog.get_logger(__name__)
 def migrate_group():
     """Migration utilities for automation mode transitions.
 
-    Commands for migrating from daemon-based to native CI/CD automation.
+    Commands for migrating from daemon-based to native CI/CD automation,
+    and for moving persisted state between storage backends.
     """
     pass
 
@@ -297,6 +303,76 @@ def validate_setup(ctx: click.Context) -> None:
         click.echo(click.style("Some checks failed. Address the issues above.", fg="yellow"))
 
 
+@migrate_group.command(name="storage")
+@click.option(
+    "--to",
+    "target",
+    type=click.Choice(["sqlite", "json"]),
+    default="sqlite",
+    help="Backend to copy data into",
+)
+@click.option("--db", "db_path", default=None, help="SQLite database path (default: workflow.storage_path)")
+@click.option("--checkpoint-dir", default=".sapiens/checkpoints", help="Checkpoint directory for the JSON backend")
+@click.option("--feedback-dir", default=".sapiens/feedback", help="Feedback directory for the JSON backend")
+@click.pass_context
+def migrate_storage(
+    ctx: click.Context,
+    target: str,
+    db_path: str | None,
+    checkpoint_dir: str,
+    feedback_dir: str,
+) -> None:
+    """Copy state, checkpoints and feedback between JSON files and SQLite.
+
+    The source data is left in place. After migrating, set
+    workflow.storage_backend in your config to the target backend.
+    """
+    settings: AutomationSettings | None = ctx.obj.get("settings")
+    if not settings:
+        click.echo("Error: Configuration required.", err=True)
+        return
+
+    db_path = db_path or settings.workflow.storage_path
+    directories = {
+        STATE_COLLECTION: settings.state_dir,
+        CHECKPOINT_COLLECTION: Path(checkpoint_dir),
+        FEEDBACK_COLLECTION: Path(feedback_dir),
+    }
+
+    counts = asyncio.run(_migrate_storage(directories, db_path, to_sqlite=target == "sqlite"))
+
+    source = "JSON files" if target == "sqlite" else db_path
+    destination = db_path if target == "sqlite" else "JSON files"
+    click.echo(f"Migrated {source} -> {destination}")
+    for collection, count in counts.items():
+        click.echo(f"  {collection}: {count} documents")
+    click.echo("")
+    click.echo(f"Set 'workflow.storage_backend: {target}' in your config to use the migrated data.")
+
+
+async def _migrate_storage(directories: dict[str, Path], db_path: str, to_sqlite: bool) -> dict[str, int]:
+    """Copy every collection between per-directory JSON backends and SQLite.
+
+    Args:
+        directories: Mapping of collection name to its JSON directory
+        db_path: SQLite database path
+        to_sqlite: Copy JSON -> SQLite if True, otherwise SQLite -> JSON
+
+    Returns:
+        Number of documents copied per collection
+    """
+    sqlite = SQLiteBackend(db_path)
+    counts = {}
+    try:
+        for collection, directory in directories.items():
+            json_backend = JSONFileBackend(directory)
+            source, target = (json_backend, sqlite) if to_sqlite else (sqlite, json_backend)
+            counts[collection] = await migrate_collection(source, target, collection)
+    finally:
+        await sqlite.close()
+    return counts
+
+
 def _get_automation_config(settings: AutomationSettings) -> AutomationConfig:
     """Get automation config from settings, handling backward compatibility.
 
@@ -12,12 +12,8 @@ from repo_sapiens.engine.event_classifier import EventClassifier, EventSource
 from repo_sapiens.engine.label_router import LabelRouter
 from repo_sapiens.engine.orchestrator import WorkflowOrchestrator
 from repo_sapiens.engine.state_manager import StateManager
-from repo_sapiens.enums import AgentType, ProviderType
-from repo_sapiens.providers.base import AgentProvider
-from repo_sapiens.providers.copilot import CopilotProvider
-from repo_sapiens.providers.external_agent import ExternalAgentProvider
-from repo_sapiens.providers.factory import create_git_provider
-from repo_sapiens.providers.openai_compatible import OpenAICompatibleProvider
+from repo_sapiens.providers.factory import create_agent_provider, create_git_provider
+from repo_sapiens.storage.factory import create_storage_backend
 
 log = structlog.get_logger(__name__)
 
@@ -198,82 +194,21 @@ async def _process_label_event(
     await git.connect()
 
     # Create agent provider
-    agent = _create_agent_provider(settings)
+    agent = create_agent_provider(settings)
     await agent.connect()
 
-    state = StateManager(settings.state_dir)
+    state = StateManager(
+        settings.state_dir,
+        backend=create_storage_backend(settings, settings.state_dir),
+        flush_interval_ms=settings.workflow.state_flush_interval_ms,
+    )
     orchestrator = WorkflowOrchestrator(settings, git, agent, state)
 
     # Route the event
     router = LabelRouter(settings, git, orchestrator)
-    result = await router.route(classified)
+    try:
+        result = await router.route(classified)
+    finally:
+        await state.close()
 
     return result
-
-
-def _create_agent_provider(settings: AutomationSettings) -> AgentProvider:
-    """Create the appropriate agent provider."""
-    from pathlib import Path
-
-    from repo_sapiens.utils.interactive import InteractiveQAHandler
-
-    # Create a QA handler (non-interactive in CI)
-    qa_handler = InteractiveQAHandler(None, poll_interval=30)
-    provider_type = settings.agent_provider.provider_type
-
-    if provider_type == ProviderType.OLLAMA:
-        from repo_sapiens.providers.ollama import OllamaProvider
-
-        return OllamaProvider(
-            base_url=settings.agent_provider.base_url or "http://localhost:11434",
-            model=settings.agent_provider.model,
-            working_dir=str(Path.cwd()),
-            qa_handler=qa_handler,
-        )
-
-    # Copilot with copilot-api proxy (unofficial)
-    # Note: Settings validator ensures copilot_config is present for COPILOT_LOCAL
-    if provider_type == ProviderType.COPILOT_LOCAL and settings.agent_provider.copilot_config:
-        return CopilotProvider(
-            copilot_config=settings.agent_provider.copilot_config,
-            working_dir=str(Path.cwd()),
-            qa_handler=qa_handler,
-        )
-
-    # OpenAI-compatible API (OpenRouter, vLLM, etc.)
-    if provider_type == ProviderType.OPENAI_COMPATIBLE:
-        api_key = None
-        if settings.agent_provider.api_key:
-            api_key = settings.agent_provider.api_key.get_secret_value()
-        return OpenAICompatibleProvider(
-            base_url=settings.agent_provider.base_url or "http://localhost:8000/v1",
-            model=settings.agent_provider.model,
-            api_key=api_key,
-            working_dir=str(Path.cwd()),
-            qa_handler=qa_handler,
-        )
-
-    # External agent (Claude, Goose, or Copilot)
-    if not provider_type.is_external_cli:
-        raise ValueError(f"Unsupported provider type: {provider_type}")
-
-    agent_type = provider_type.to_agent_type()
-    if agent_type is None:
-        raise ValueError(f"Cannot determine agent type for provider: {provider_type}")
-
-    goose_config = None
-    if agent_type == AgentType.GOOSE and settings.agent_provider.goose_config:
-        goose_config = {
-            "toolkit": settings.agent_provider.goose_config.toolkit,
-            "temperature": settings.agent_provider.goose_config.temperature,
-            "max_tokens": settings.agent_provider.goose_config.max_tokens,
-            "llm_provider": settings.agent_provider.goose_config.llm_provider,
-        }
-
-    return ExternalAgentProvider(
-        agent_type=agent_type,
-        model=settings.agent_provider.model,
-        working_dir=str(Path.cwd()),
-        qa_handler=qa_handler,
-        goose_config=goose_config,
-    )
@@ -0,0 +1,237 @@
+"""Inspect recorded traces: where a workflow run spent its time."""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+import click
+
+from repo_sapiens.monitoring.tracing import Span, read_spans
+
+# Width of the duration bar in characters
+BAR_WIDTH = 30
+_BAR_EIGHTHS = " ▏▎▍▌▋▊▉"
+
+
+@dataclass
+class FlameNode:
+    """Same-named sibling spans merged into one line of the breakdown.
+
+    Attributes:
+        name: Span name
+        spans: The merged spans
+        children: Merged children of all the spans, slowest first
+    """
+
+    name: str
+    spans: list[Span]
+    children: list["FlameNode"] = field(default_factory=list)
+
+    @property
+    def total(self) -> float:
+        """Summed duration of the merged spans."""
+        return sum(span.duration for span in self.spans)
+
+    @property
+    def self_time(self) -> float:
+        """Time not accounted for by children (concurrent children can cover it all)."""
+        return max(0.0, self.total - sum(child.total for child in self.children))
+
+    @property
+    def errors(self) -> int:
+        """How many of the merged spans failed."""
+        return sum(1 for span in self.spans if span.status == "error")
+
+    @property
+    def label(self) -> str:
+        """Name with the span's attributes, or the merge count."""
+        if len(self.spans) > 1:
+            label = f"{self.name} ×{len(self.spans)}"
+        else:
+            details = " ".join(f"{key}={value}" for key, value in self.spans[0].attributes.items())
+            label = f"{self.name} {details}".rstrip()
+        if self.errors:
+            label += f" [{self.errors} failed]"
+        return label
+
+
+@click.group(name="trace")
+def trace_group() -> None:
+    """Inspect recorded traces of workflow runs.
+
+    Runs are traced when the ``tracing`` section of the configuration is
+    enabled (the default); spans are kept under ``.sapiens/traces``.
+    """
+
+
+@trace_group.command(name="list")
+@click.option("--directory", default=".sapiens/traces", show_default=True, help="Trace directory")
+@click.option("--limit", default=20, show_default=True, help="Number of traces to list")
+def list_traces(directory: str, limit: int) -> None:
+    """List the most recent traces."""
+    traces = _load_traces(Path(directory))
+    if not traces:
+        click.echo(f"No traces found in {directory}")
+        return
+
+    for trace_id, spans in list(traces.items())[-limit:][::-1]:
+        roots = _roots(spans)
+        root = roots[0]
+        errors = sum(1 for span in spans if span.status == "error")
+        click.echo(
+            f"{trace_id[:12]}  {_format_time(root.start)}  {_format_duration(max(s.duration for s in roots)):>8}  "
+            f"{FlameNode(root.name, [root]).label}  ({len(spans)} spans" + (f", {errors} failed)" if errors else ")")
+        )
+
+
+@trace_group.command(name="show")
+@click.argument("trace_id", required=False)
+@click.option("--issue", type=int, default=None, help="Show the latest trace for this issue number")
+@click.option("--directory", default=".sapiens/traces", show_default=True, help="Trace directory")
+@click.option(
+    "--min-percent",
+    default=1.0,
+    show_default=True,
+    help="Fold spans taking less than this share of the trace",
+)
+def show_trace(trace_id: str | None, issue: int | None, directory: str, min_percent: float) -> None:
+    """Print a flame-style breakdown of one trace.
+
+    TRACE_ID may be any unique prefix of the trace ID; without it (or
+    --issue) the most recent trace is shown. Same-named sibling spans, such
+    as repeated provider calls, are merged into one line.
+    """
+    traces = _load_traces(Path(directory))
+    if not traces:
+        raise click.ClickException(f"No traces found in {directory}")
+
+    if trace_id:
+        matches = [key for key in traces if key.startswith(trace_id)]
+        if len(matches) != 1:
+            problem = "No trace matches" if not matches else f"{len(matches)} traces match"
+            raise click.ClickException(f"{problem} '{trace_id}'")
+        selected = matches[0]
+    elif issue is not None:
+        candidates = [
+            key for key, spans in traces.items() if any(span.attributes.get("issue") == issue for span in spans)
+        ]
+        if not candidates:
+            raise click.ClickException(f"No trace found for issue #{issue}")
+        selected = candidates[-1]
+    else:
+        selected = next(reversed(traces))
+
+    for line in render_flame(traces[selected], min_percent=min_percent):
+        click.echo(line)
+
+
+def build_flame(spans: list[Span]) -> list[FlameNode]:
+    """Merge a trace's spans into a tree of FlameNodes.
+
+    Spans whose parent was never written (e.g. the process was killed
+    mid-run) are treated as roots.
+
+    Args:
+        spans: All spans of one trace
+
+    Returns:
+        Root nodes, slowest first
+    """
+    children: dict[str | None, list[Span]] = defaultdict(list)
+    ids = {span.span_id for span in spans}
+    for span in spans:
+        children[span.parent_id if span.parent_id in ids else None].append(span)
+
+    def merge(siblings: list[Span]) -> list[FlameNode]:
+        groups: dict[str, list[Span]] = defaultdict(list)
+        for span in sorted(siblings, key=lambda s: s.start):
+            groups[span.name].append(span)
+        nodes = [
+            FlameNode(name, group, merge([child for span in group for child in children[span.span_id]]))
+            for name, group in groups.items()
+        ]
+        return sorted(nodes, key=lambda node: node.total, reverse=True)
+
+    return merge(children[None])
+
+
+def render_flame(spans: list[Span], min_percent: float = 1.0) -> list[str]:
+    """Render a trace as an indented tree with durations, shares and bars.
+
+    Args:
+        spans: All spans of one trace
+        min_percent: Nodes below this share of the trace are folded into
+            a single "more" line per parent
+
+    Returns:
+        Output lines
+    """
+    roots = build_flame(spans)
+    whole = max(node.total for node in roots) or 1e-9
+    first = min(span.start for span in spans)
+    lines = [
+        f"Trace {spans[0].trace_id}  {_format_time(first)}  {_format_duration(whole)}",
+        "",
+        f"{'total':>8} {'%':>6} {'self':>8}  {'':<{BAR_WIDTH}}  span",
+    ]
+
+    def walk(nodes: list[FlameNode], prefix: str, top: bool) -> None:
+        # Nodes are slowest first, so the ones to fold are a suffix
+        shown = [node for node in nodes if 100 * node.total / whole >= min_percent]
+        folded = nodes[len(shown) :]
+        entries: list[FlameNode | None] = [*shown, *([None] if folded else [])]
+        for index, node in enumerate(entries):
+            last = index == len(entries) - 1
+            branch = "" if top else ("└── " if last else "├── ")
+            if node is None:
+                hidden = sum(n.total for n in folded)
+                lines.append(
+                    f"{_format_duration(hidden):>8} {100 * hidden / whole:5.1f}% {'':>8}  {'':<{BAR_WIDTH}}  "
+                    f"{prefix}{branch}… {len(folded)} more"
+                )
+                continue
+            share = node.total / whole
+            lines.append(
+                f"{_format_duration(node.total):>8} {100 * share:5.1f}% {_format_duration(node.self_time):>8}  "
+                f"{_bar(share):<{BAR_WIDTH}}  {prefix}{branch}{node.label}"
+            )
+            walk(node.children, prefix if top else prefix + ("    " if last else "│   "), False)
+
+    walk(roots, "", True)
+    return lines
+
+
+def _load_traces(directory: Path) -> dict[str, list[Span]]:
+    """Spans grouped by trace ID, traces ordered by start time."""
+    traces: dict[str, list[Span]] = defaultdict(list)
+    for span in read_spans(directory):
+        traces[span.trace_id].append(span)
+    return dict(sorted(traces.items(), key=lambda item: min(span.start for span in item[1])))
+
+
+def _roots(spans: list[Span]) -> list[Span]:
+    ids = {span.span_id for span in spans}
+    return sorted((span for span in spans if span.parent_id not in ids), key=lambda s: s.start)
+
+
+def _bar(share: float) -> str:
+    eighths = round(max(0.0, min(1.0, share)) * BAR_WIDTH * 8)
+    full, rest = divmod(eighths, 8)
+    return "█" * full + (_BAR_EIGHTHS[rest] if rest else "")
+
+
+def _format_duration(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    if seconds < 3600:
+        minutes, secs = divmod(int(round(seconds)), 60)
+        return f"{minutes}m{secs:02d}s"
+    hours, minutes = divmod(int(round(seconds)) // 60, 60)
+    return f"{hours}h{minutes:02d}m"
+
+
+def _format_time(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
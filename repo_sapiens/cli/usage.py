@@ -0,0 +1,47 @@
+"""Report recorded LLM usage: tokens, cost and latency per stage, issue, plan or model."""
+
+from pathlib import Path
+
+import click
+
+from repo_sapiens.monitoring.usage import UsageLedger, UsageSummary, read_calls
+
+GROUPINGS = ("stage", "issue", "plan", "task", "model", "provider")
+
+
+@click.command(name="usage")
+@click.option("--by", "by", type=click.Choice(GROUPINGS), default="stage", show_default=True, help="Group calls by")
+@click.option("--issue", type=int, default=None, help="Only count calls made for this issue")
+@click.option("--plan", default=None, help="Only count calls made for this plan")
+@click.option("--directory", default=".sapiens/usage", show_default=True, help="Usage directory")
+def usage_command(by: str, issue: int | None, plan: str | None, directory: str) -> None:
+    """Summarize the recorded LLM calls.
+
+    Calls are recorded when the ``usage`` section of the configuration
+    persists them (the default); they are kept under ``.sapiens/usage``.
+    Local models are reported with tokens and latency but no cost.
+    """
+    where = {key: value for key, value in {"issue": issue, "plan": plan}.items() if value is not None}
+    ledger = UsageLedger()
+    ledger.calls.extend(read_calls(Path(directory)))
+    groups = ledger.summarize(by, **where)
+    if not groups:
+        click.echo(f"No LLM calls recorded in {directory}")
+        return
+
+    click.echo(
+        f"{by:<24} {'calls':>6} {'prompt':>10} {'completion':>10} {'cost':>10} {'latency':>8} {'ttft':>8} {'tok/s':>7}"
+    )
+    for key, summary in sorted(groups.items(), key=lambda item: (item[1].cost, item[1].latency), reverse=True):
+        click.echo(_row("-" if key is None else str(key), summary))
+    click.echo(_row("total", ledger.total(**where)))
+
+
+def _row(name: str, summary: UsageSummary) -> str:
+    ttft = summary.mean_time_to_first_token
+    speed = summary.tokens_per_second
+    return (
+        f"{name[:24]:<24} {summary.calls:>6} {summary.prompt_tokens:>10,} {summary.completion_tokens:>10,} "
+        f"{'$' + format(summary.cost, '.4f'):>10} {summary.mean_latency:>7.2f}s "
+        f"{'-' if ttft is None else format(ttft, '.2f') + 's':>8} {'-' if speed is None else format(speed, '.1f'):>7}"
+    )
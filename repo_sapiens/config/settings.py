@@ -38,6 +38,10 @@ class GitProviderConfig(BaseModel):
     api_token: CredentialSecret = Field(
         ..., description="API token for authentication (supports @keyring:, ${ENV}, @encrypted:)"
     )
+    github_client: Literal["httpx", "pygithub"] = Field(
+        default="httpx",
+        description="GitHub client: native async httpx, or the PyGithub thread-offload fallback",
+    )
 
 
 class RepositoryConfig(BaseModel):
@@ -184,9 +188,47 @@ class WorkflowConfig(BaseModel):
         default="per-agent", description="Branch creation strategy"
     )
     max_concurrent_tasks: int = Field(default=3, ge=1, le=10, description="Maximum concurrent agent tasks")
+    max_concurrent_issues: int = Field(
+        default=1,
+        ge=1,
+        le=20,
+        description=(
+            "Maximum issues processed concurrently per poll cycle (1 = sequential); "
+            "stages using the shared playground checkout still run one at a time"
+        ),
+    )
+    comment_batch_size: int = Field(
+        default=8, ge=1, le=50, description="Review comments classified per AI call when addressing PR feedback"
+    )
+    max_concurrent_comment_batches: int = Field(
+        default=3, ge=1, le=10, description="Maximum comment classification AI calls running at once"
+    )
     review_approval_threshold: float = Field(
         default=0.8, ge=0.0, le=1.0, description="Minimum confidence for auto-approval"
     )
+    storage_backend: Literal["json", "sqlite"] = Field(
+        default="json", description="Storage for workflow state (json files or a sqlite database)"
+    )
+    storage_path: str = Field(default=".sapiens/sapiens.db", description="SQLite database path (sqlite backend only)")
+    state_flush_interval_ms: int = Field(
+        default=0,
+        ge=0,
+        le=60000,
+        description=(
+            "Coalesce state writes in memory and persist at most once per interval (0 = write immediately); "
+            "single-process only, leave at 0 when several processes share the storage backend"
+        ),
+    )
+    disk_cache: bool = Field(
+        default=False, description="Persist API caches under cache_directory so later runs can reuse them"
+    )
+    cache_directory: str = Field(
+        default="~/.cache/repo-sapiens",
+        description="Directory for the persistent cache tier; keep it outside the repository checkout",
+    )
+    disk_cache_max_entries: int = Field(
+        default=10000, ge=100, description="Maximum entries kept in the persistent cache tier"
+    )
 
 
 class TagsConfig(BaseModel):
@@ -202,6 +244,35 @@ class TagsConfig(BaseModel):
     needs_attention: str = Field(default="needs-attention", description="Requires human intervention")
 
 
+class TracingConfig(BaseModel):
+    """Tracing of where workflow runs spend their time."""
+
+    enabled: bool = Field(default=True, description="Record spans for each run (see `sapiens trace show`)")
+    directory: str = Field(default=".sapiens/traces", description="Directory for the daily JSONL span files")
+    retention_days: int = Field(default=7, ge=1, description="Days of span files kept before they are deleted")
+    opentelemetry: bool = Field(
+        default=False, description="Also mirror spans into OpenTelemetry (requires the 'tracing' extra)"
+    )
+
+
+class ModelPricingConfig(BaseModel):
+    """Price of one model in dollars per 1M tokens."""
+
+    input_cost: float = Field(..., ge=0, description="Dollars per 1M prompt tokens")
+    output_cost: float = Field(..., ge=0, description="Dollars per 1M completion tokens")
+
+
+class UsageConfig(BaseModel):
+    """Token and latency accounting of LLM calls."""
+
+    persist: bool = Field(default=True, description="Keep a record of every LLM call (see `sapiens usage`)")
+    directory: str = Field(default=".sapiens/usage", description="Directory for the daily JSONL call files")
+    retention_days: int = Field(default=30, ge=1, description="Days of call files kept before they are deleted")
+    pricing: dict[str, ModelPricingConfig] = Field(
+        default_factory=dict, description="Prices by model name, added to the built-in Claude tier prices"
+    )
+
+
 class AutomationSettings(BaseSettings):
     """Main automation system settings.
 
@@ -222,6 +293,8 @@ class AutomationSettings(BaseSettings):
     tags: TagsConfig = Field(default_factory=TagsConfig)
     automation: AutomationConfig = Field(default_factory=AutomationConfig)
     mcp: MCPConfig = Field(default_factory=MCPConfig, description="MCP server configuration")
+    tracing: TracingConfig = Field(default_factory=TracingConfig)
+    usage: UsageConfig = Field(default_factory=UsageConfig)
 
     @property
     def state_dir(self) -> Path:
@@ -60,6 +60,16 @@ class AutomationModeConfig(BaseModel):
     label_prefix: str = Field(default="sapiens/", description="Prefix for sapiens-managed labels")
 
 
+class WebhookConfig(BaseModel):
+    """Configuration for the webhook server's event queue."""
+
+    queue_size: int = Field(default=100, ge=1, le=10000, description="Maximum events waiting to be processed")
+    workers: int = Field(default=4, ge=1, le=32, description="Number of worker tasks routing queued events")
+    dedupe_window_seconds: float = Field(
+        default=30.0, ge=0.0, description="Window in which repeated (issue, label, action) events are dropped"
+    )
+
+
 class AutomationConfig(BaseModel):
     """Complete automation configuration section.
 
@@ -73,6 +83,7 @@ class AutomationConfig(BaseModel):
     schedule_triggers: list[ScheduleTriggerConfig] = Field(
         default_factory=list, description="Scheduled automation tasks"
     )
+    webhook: WebhookConfig = Field(default_factory=WebhookConfig, description="Webhook server event queue settings")
 
 
 # Provider-specific event mapping
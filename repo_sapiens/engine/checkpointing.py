@@ -4,22 +4,25 @@ Provides save points to resume workflows after failures.
 """
 
 import asyncio
-import json
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import structlog
 
+from repo_sapiens.storage.base import CHECKPOINT_COLLECTION, StorageBackend
+from repo_sapiens.storage.json_backend import JSONFileBackend
+
 log = structlog.get_logger(__name__)
 
 
 class CheckpointManager:
     """Manage workflow checkpoints for recovery."""
 
-    def __init__(self, checkpoint_dir: str = ".sapiens/checkpoints") -> None:
+    def __init__(self, checkpoint_dir: str = ".sapiens/checkpoints", backend: StorageBackend | None = None) -> None:
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self.backend = backend or JSONFileBackend(self.checkpoint_dir)
         self._locks: dict[str, asyncio.Lock] = {}
 
     def _get_lock(self, plan_id: str) -> asyncio.Lock:
@@ -41,34 +44,35 @@ class CheckpointManager:
         }
 
         async with self._get_lock(plan_id):
-            checkpoint_file = self.checkpoint_dir / f"{checkpoint_id}.json"
-            checkpoint_file.write_text(json.dumps(checkpoint, indent=2))
+            await self.backend.put(CHECKPOINT_COLLECTION, checkpoint_id, checkpoint)
 
         log.info("checkpoint_created", checkpoint_id=checkpoint_id, stage=stage)
         return checkpoint_id
 
     async def get_latest_checkpoint(self, plan_id: str, stage: str | None = None) -> dict[str, Any] | None:
         """Get the most recent checkpoint for a plan."""
-        pattern = f"{plan_id}-{stage}-*" if stage else f"{plan_id}-*"
-        checkpoints = sorted(self.checkpoint_dir.glob(f"{pattern}.json"), reverse=True)
+        prefix = f"{plan_id}-{stage}-" if stage else f"{plan_id}-"
+        checkpoints = await self.backend.keys(CHECKPOINT_COLLECTION, prefix)
 
         if not checkpoints:
             return None
 
-        checkpoint_data = json.loads(checkpoints[0].read_text())
+        checkpoint_data = await self.backend.get(CHECKPOINT_COLLECTION, checkpoints[-1])
+        if checkpoint_data is None:
+            return None
         log.info("checkpoint_loaded", checkpoint_id=checkpoint_data["checkpoint_id"])
         return checkpoint_data
 
     async def get_all_checkpoints(self, plan_id: str) -> list[dict[str, Any]]:
         """Get all checkpoints for a plan, ordered by creation time."""
-        checkpoints = sorted(self.checkpoint_dir.glob(f"{plan_id}-*.json"), reverse=True)
-        return [json.loads(cp.read_text()) for cp in checkpoints]
+        checkpoints = await self.backend.scan(CHECKPOINT_COLLECTION, f"{plan_id}-")
+        return [checkpoint for _, checkpoint in reversed(checkpoints)]
 
     async def delete_checkpoints(self, plan_id: str) -> None:
         """Delete all checkpoints for a plan."""
         async with self._get_lock(plan_id):
-            for checkpoint_file in self.checkpoint_dir.glob(f"{plan_id}-*.json"):
-                checkpoint_file.unlink()
+            for checkpoint_id in await self.backend.keys(CHECKPOINT_COLLECTION, f"{plan_id}-"):
+                await self.backend.delete(CHECKPOINT_COLLECTION, checkpoint_id)
         log.info("checkpoints_deleted", plan_id=plan_id)
 
     async def cleanup_old_checkpoints(self, max_age_days: int = 30) -> int:
@@ -79,16 +83,15 @@ class CheckpointManager:
         cutoff = datetime.now(UTC).timestamp() - (max_age_days * 24 * 3600)
         deleted = 0
 
-        for checkpoint_file in self.checkpoint_dir.glob("*.json"):
+        for checkpoint_id, checkpoint in await self.backend.scan(CHECKPOINT_COLLECTION):
             try:
-                checkpoint = json.loads(checkpoint_file.read_text())
                 created_at = datetime.fromisoformat(checkpoint["created_at"])
 
                 if created_at.timestamp() < cutoff:
-                    checkpoint_file.unlink()
+                    await self.backend.delete(CHECKPOINT_COLLECTION, checkpoint_id)
                     deleted += 1
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                log.warning("invalid_checkpoint_file", file=str(checkpoint_file), error=str(e))
+            except (KeyError, TypeError, ValueError) as e:
+                log.warning("invalid_checkpoint", checkpoint_id=checkpoint_id, error=str(e))
                 continue
 
         if deleted > 0:
@@ -0,0 +1,160 @@
+"""
+In-process work queue for webhook-driven events.
+
+Decouples webhook delivery from agent work: classified events are queued and
+acknowledged immediately, then routed by a fixed pool of worker tasks.
+Duplicate deliveries (the same label action on the same issue) arriving within
+a short window are dropped so provider retries do not trigger duplicate runs.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+
+from repo_sapiens.engine.event_classifier import ClassifiedEvent
+
+log = structlog.get_logger(__name__)
+
+EventKey = tuple[int | None, str | None, str | None]
+
+
+class EventQueue:
+    """Bounded asyncio queue with deduplication and a worker pool.
+
+    Example:
+        >>> queue = EventQueue(router.route, max_size=100, workers=4)
+        >>> await queue.start()
+        >>> queue.submit(classified_event)
+        True
+        >>> await queue.stop()
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[ClassifiedEvent], Awaitable[Any]],
+        max_size: int = 100,
+        workers: int = 4,
+        dedupe_window: float = 30.0,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            handler: Async callable invoked for each queued event
+            max_size: Maximum number of events waiting to be processed
+            workers: Number of worker tasks consuming the queue
+            dedupe_window: Seconds during which a repeated event key is dropped
+        """
+        self.handler = handler
+        self.max_size = max_size
+        self.workers = workers
+        self.dedupe_window = dedupe_window
+
+        self._queue: asyncio.Queue[ClassifiedEvent] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._recent: dict[EventKey, float] = {}
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker pool has been started."""
+        return bool(self._tasks)
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting to be processed."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """Create the queue and start the worker pool."""
+        if self.running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._tasks = [asyncio.create_task(self._worker(worker_id, self._queue)) for worker_id in range(self.workers)]
+        log.info("event_queue_started", workers=self.workers, max_size=self.max_size)
+
+    async def stop(self) -> None:
+        """Cancel the worker pool, dropping any events still queued."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        dropped = self.depth
+        self._tasks = []
+        self._queue = None
+        self._recent.clear()
+        log.info("event_queue_stopped", dropped=dropped)
+
+    async def join(self) -> None:
+        """Wait until every queued event has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def submit(self, event: ClassifiedEvent) -> bool:
+        """Enqueue an event without waiting for it to be processed.
+
+        Args:
+            event: Classified event to route
+
+        Returns:
+            True if the event was queued, False if it duplicated a recent event
+
+        Raises:
+            RuntimeError: If the queue has not been started
+            asyncio.QueueFull: If the queue is at capacity
+        """
+        if self._queue is None:
+            raise RuntimeError("EventQueue.start() must be called before submit()")
+
+        now = time.monotonic()
+        self._prune(now)
+
+        key = self.event_key(event)
+        if key in self._recent:
+            log.info("event_deduplicated", issue=key[0], label=key[1], action=key[2])
+            return False
+
+        self._queue.put_nowait(event)
+        self._recent[key] = now
+        log.debug("event_queued", issue=key[0], label=key[1], action=key[2], depth=self.depth)
+        return True
+
+    @staticmethod
+    def event_key(event: ClassifiedEvent) -> EventKey:
+        """Build the deduplication key for an event.
+
+        Args:
+            event: Classified event
+
+        Returns:
+            Tuple of (issue or PR number, label, action)
+        """
+        action = event.raw_event.get("action") or event.trigger_type.value
+        return (event.issue_number or event.pr_number, event.label, action)
+
+    def _prune(self, now: float) -> None:
+        """Forget event keys older than the dedupe window."""
+        cutoff = now - self.dedupe_window
+        expired = [key for key, seen in self._recent.items() if seen <= cutoff]
+        for key in expired:
+            del self._recent[key]
+
+    async def _worker(self, worker_id: int, queue: asyncio.Queue[ClassifiedEvent]) -> None:
+        """Consume events until cancelled."""
+        while True:
+            event = await queue.get()
+            try:
+                await self.handler(event)
+            except Exception as e:
+                log.error(
+                    "event_handler_failed",
+                    worker=worker_id,
+                    handler=event.handler,
+                    issue=event.issue_number,
+                    error=str(e),
+                    exc_info=True,
+                )
+            finally:
+                queue.task_done()
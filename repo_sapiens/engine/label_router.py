@@ -13,6 +13,7 @@ from repo_sapiens.config.triggers import LabelTriggerConfig
 from repo_sapiens.engine.event_classifier import ClassifiedEvent
 from repo_sapiens.engine.orchestrator import WorkflowOrchestrator
 from repo_sapiens.models.domain import Issue
+from repo_sapiens.monitoring.usage import usage_scope
 from repo_sapiens.providers.base import GitProvider
 
 log = structlog.get_logger(__name__)
@@ -152,7 +153,8 @@ class LabelRouter:
         if stage_name and stage_name in self.orchestrator.stages:
             # Use existing workflow stage
             stage = self.orchestrator.stages[stage_name]
-            await stage.execute(issue)
+            with usage_scope(issue=issue.number, stage=stage_name):
+                await stage.execute(issue)
             return {"success": True, "stage": stage_name}
 
         # Handler is a custom task - use AI agent
@@ -29,6 +29,11 @@ Example:
 """
 
 import asyncio
+import heapq
+import re
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 
 import structlog
 
@@ -48,11 +53,90 @@ from repo_sapiens.engine.stages.qa import QAStage
 from repo_sapiens.engine.state_manager import StateManager
 from repo_sapiens.engine.types import StageState, WorkflowState
 from repo_sapiens.models.domain import Issue, Task
+from repo_sapiens.monitoring.tracing import traced
+from repo_sapiens.monitoring.usage import usage_scope
 from repo_sapiens.processors.dependency_tracker import DependencyTracker
 from repo_sapiens.providers.base import AgentProvider, GitProvider
 
+try:
+    from repo_sapiens.monitoring.metrics import MetricsCollector
+
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
 log = structlog.get_logger(__name__)
 
+# Labels tying a task issue to its plan (e.g. "plan-42", not "plan-implementation")
+PLAN_LABEL_PATTERN = re.compile(r"^plan-\d+$")
+
+# Stages that check out branches in the shared playground repo and point the
+# agent's working directory at it; only one of them may run at a time
+PLAYGROUND_STAGES = frozenset({"task_execution", "fix_execution", "pr_fix"})
+
+
+@dataclass
+class IssueCycleStats:
+    """Throughput and queue statistics for one ``process_all_issues`` cycle.
+
+    Attributes:
+        issues_found: Issues returned by the provider.
+        issues_processed: Issues routed without raising.
+        issues_failed: Issues whose stage raised an exception.
+        max_queue_depth: Largest number of issues waiting for a free slot.
+        duration_seconds: Wall-clock duration of the cycle.
+    """
+
+    issues_found: int = 0
+    issues_processed: int = 0
+    issues_failed: int = 0
+    max_queue_depth: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Issues completed (successfully or not) per second."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return (self.issues_processed + self.issues_failed) / self.duration_seconds
+
+
+@dataclass
+class TaskPoolStats:
+    """Slot usage for one ``execute_parallel_tasks`` run.
+
+    Attributes:
+        slots: Worker slots available (``max_concurrent_tasks``).
+        tasks_completed: Tasks that finished without raising.
+        tasks_failed: Tasks whose execution raised.
+        slot_busy_seconds: Time each slot spent running a task.
+        duration_seconds: Wall-clock duration of the run.
+    """
+
+    slots: int
+    tasks_completed: int = 0
+    tasks_failed: int = 0
+    slot_busy_seconds: list[float] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.slot_busy_seconds:
+            self.slot_busy_seconds = [0.0] * self.slots
+
+    @property
+    def parallelism(self) -> float:
+        """Average number of tasks running at once (the speedup over running them serially)."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return sum(self.slot_busy_seconds) / self.duration_seconds
+
+    @property
+    def slot_utilization(self) -> list[float]:
+        """Share of the run each slot spent busy, by slot."""
+        if self.duration_seconds <= 0:
+            return [0.0] * self.slots
+        return [busy / self.duration_seconds for busy in self.slot_busy_seconds]
+
 
 class WorkflowOrchestrator:
     """Orchestrate the complete automation workflow.
@@ -133,6 +217,10 @@ class WorkflowOrchestrator:
         self.agent = agent
         self.state = state
         self.custom_system_prompt: str | None = None
+        self.last_cycle_stats: IssueCycleStats | None = None
+        self.last_task_pool_stats: TaskPoolStats | None = None
+        # Serializes PLAYGROUND_STAGES across concurrently processed issues
+        self._playground_lock = asyncio.Lock()
 
         # Initialize stages
         self.stages = {
@@ -155,14 +243,24 @@ class WorkflowOrchestrator:
     async def process_all_issues(self, tag: str | None = None) -> None:
         """Process all open issues, optionally filtered by tag.
 
-        Fetches all open issues from the git provider, optionally filtering
-        by a specific label/tag. Issues are processed in ascending order by
+        Fetches open issues from the git provider, optionally filtering by
+        a specific label/tag. Issues are processed in ascending order by
         issue number to ensure deterministic behavior and respect for issue
-        creation order.
+        creation order. When the provider lists issues oldest first, each
+        page is processed while the next one is still being fetched;
+        otherwise every page is collected and sorted first.
 
         Each issue is processed independently with its own error handling,
         allowing the workflow to continue even if individual issues fail.
 
+        When ``workflow.max_concurrent_issues`` is greater than 1, independent
+        issues run concurrently up to that limit. Issues belonging to the same
+        plan (``plan-N`` label) are still processed one at a time in ascending
+        order. Stages that work in the shared playground checkout
+        (``PLAYGROUND_STAGES``) never overlap, whatever plan their issues
+        belong to. Cycle throughput and queue depth are logged and kept in
+        ``last_cycle_stats``.
+
         Args:
             tag: Optional label to filter issues. When provided, only issues
                 with this label will be processed. When None, all open issues
@@ -187,30 +285,127 @@ class WorkflowOrchestrator:
         """
         log.info("processing_all_issues", tag=tag)
 
-        # Get open issues
-        issues = await self.git.get_issues(
+        stats = IssueCycleStats()
+        started = time.monotonic()
+        max_concurrent = self.settings.workflow.max_concurrent_issues
+
+        if max_concurrent > 1:
+            await self._process_issues_concurrently(tag, max_concurrent, stats)
+        else:
+            await self._process_issues_sequentially(tag, stats)
+
+        stats.duration_seconds = time.monotonic() - started
+        self.last_cycle_stats = stats
+
+        log.info("found_issues", count=stats.issues_found)
+        log.info(
+            "issue_cycle_completed",
+            processed=stats.issues_processed,
+            failed=stats.issues_failed,
+            max_concurrent=max_concurrent,
+            max_queue_depth=stats.max_queue_depth,
+            duration=round(stats.duration_seconds, 3),
+            throughput=round(stats.throughput, 3),
+        )
+
+    async def _iter_ordered_issues(self, tag: str | None) -> AsyncIterator[list[Issue]]:
+        """Yield open issues in batches, ascending by number across batches.
+
+        Pages are passed on as they arrive when the provider lists issues
+        oldest first. Otherwise a page-local sort would still run newer
+        pages before older ones, so every page is collected and yielded as
+        a single sorted batch.
+        """
+        pages = self.git.iter_issue_pages(
             labels=[tag] if tag else None,
             state="open",
         )
 
-        log.info("found_issues", count=len(issues))
-
-        # Sort issues by number in ascending order
+        # Sort by number in ascending order
         # (so tasks are processed 1, 2, 3... not 9, 8, 7...)
-        issues.sort(key=lambda issue: issue.number)
-
-        # Process each issue
-        for issue in issues:
-            try:
-                await self.process_issue(issue)
-            except Exception as e:
-                log.error(
-                    "issue_processing_failed",
-                    issue=issue.number,
-                    error=str(e),
-                    exc_info=True,
-                )
+        if self.git.issues_oldest_first:
+            async for page in pages:
+                yield sorted(page, key=lambda issue: issue.number)
+        else:
+            issues = [issue async for page in pages for issue in page]
+            yield sorted(issues, key=lambda issue: issue.number)
+
+    async def _process_issues_sequentially(self, tag: str | None, stats: IssueCycleStats) -> None:
+        """Route issues one at a time in ascending order."""
+        async for ordered in self._iter_ordered_issues(tag):
+            stats.issues_found += len(ordered)
+
+            for position, issue in enumerate(ordered):
+                stats.max_queue_depth = max(stats.max_queue_depth, len(ordered) - position - 1)
+                await self._process_issue_safely(issue, stats)
+
+    async def _process_issues_concurrently(self, tag: str | None, max_concurrent: int, stats: IssueCycleStats) -> None:
+        """Route independent issues concurrently under a semaphore.
+
+        Issues without a ``plan-N`` label are dispatched as soon as their batch
+        arrives. Issues sharing a plan label are collected until the listing
+        is complete and then run one after another in ascending issue order,
+        so the tasks of one plan never race each other.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        running: list[asyncio.Task[None]] = []
+        plan_issues: dict[str, list[Issue]] = {}
+        waiting = 0
+
+        async def run_chain(chain: list[Issue]) -> None:
+            nonlocal waiting
+            for issue in chain:
+                async with semaphore:
+                    waiting -= 1
+                    await self._process_issue_safely(issue, stats)
+
+        def dispatch(chain: list[Issue]) -> None:
+            nonlocal waiting
+            waiting += len(chain)
+            stats.max_queue_depth = max(stats.max_queue_depth, waiting)
+            running.append(asyncio.create_task(run_chain(chain)))
+
+        try:
+            async for ordered in self._iter_ordered_issues(tag):
+                stats.issues_found += len(ordered)
 
+                for issue in ordered:
+                    plan_label = self._plan_label(issue)
+                    if plan_label:
+                        plan_issues.setdefault(plan_label, []).append(issue)
+                    else:
+                        dispatch([issue])
+
+            for chain in plan_issues.values():
+                dispatch(sorted(chain, key=lambda issue: issue.number))
+        finally:
+            # Let already dispatched issues finish even if listing failed
+            if running:
+                await asyncio.gather(*running)
+
+    async def _process_issue_safely(self, issue: Issue, stats: IssueCycleStats) -> None:
+        """Process one issue, logging and counting failures instead of raising."""
+        try:
+            await self.process_issue(issue)
+            stats.issues_processed += 1
+        except Exception as e:
+            stats.issues_failed += 1
+            log.error(
+                "issue_processing_failed",
+                issue=issue.number,
+                error=str(e),
+                exc_info=True,
+            )
+
+    @staticmethod
+    def _plan_label(issue: Issue) -> str | None:
+        """Return the ``plan-N`` label of a task issue, if any."""
+        for label in issue.labels:
+            if PLAN_LABEL_PATTERN.match(label):
+                return label
+        return None
+
+    @traced("process_issue", attributes=lambda self, issue: {"issue": issue.number})
     async def process_issue(self, issue: Issue) -> None:
         """Process a single issue through the workflow pipeline.
 
@@ -253,7 +448,12 @@ class WorkflowOrchestrator:
         log.info("executing_stage", issue=issue.number, stage=stage)
 
         try:
-            await self.stages[stage].execute(issue)
+            with usage_scope(issue=issue.number, stage=stage):
+                if stage in PLAYGROUND_STAGES:
+                    async with self._playground_lock:
+                        await self.stages[stage].execute(issue)
+                else:
+                    await self.stages[stage].execute(issue)
         except Exception as e:
             log.error(
                 "stage_execution_failed",
@@ -264,6 +464,7 @@ class WorkflowOrchestrator:
             )
             raise
 
+    @traced("process_plan", attributes=lambda self, plan_id: {"plan": plan_id})
     async def process_plan(self, plan_id: str) -> None:
         """Process an entire plan end-to-end with parallel task execution.
 
@@ -345,11 +546,15 @@ class WorkflowOrchestrator:
         Execution Algorithm:
             1. Add all tasks to the dependency tracker
             2. Validate the dependency graph (detect cycles, missing deps)
-            3. While tasks remain:
-               a. Get all tasks ready for execution (dependencies satisfied)
-               b. Execute ready tasks in batches up to max_concurrent_tasks
-               c. Mark completed/failed tasks in tracker
-               d. Repeat until no pending tasks
+            3. Start ready tasks (dependencies satisfied) into free slots, up
+               to max_concurrent_tasks
+            4. Whenever any task finishes, mark it completed/failed in the
+               tracker and refill its slot from the tasks that became ready
+            5. Stop once nothing is running and nothing is ready
+
+        There is no barrier between tasks: one slow task only occupies its
+        own slot. Per-slot busy time and the achieved parallelism are logged
+        and kept in ``last_task_pool_stats``.
 
         Error Handling:
             - If a task fails, dependent tasks are blocked and marked as
@@ -396,64 +601,81 @@ class WorkflowOrchestrator:
             log.error("dependency_validation_failed", plan_id=plan_id, error=str(e))
             raise
 
-        # Execute tasks as dependencies complete
-        while tracker.has_pending_tasks():
-            ready_tasks = tracker.get_ready_tasks()
-
-            if not ready_tasks:
-                # Check for blocked tasks
-                blocked = tracker.get_blocked_tasks()
-                if blocked:
-                    log.error(
-                        "tasks_blocked_by_failures",
-                        plan_id=plan_id,
-                        blocked=[t.id for t in blocked],
-                    )
-                    break
+        max_concurrent = self.settings.workflow.max_concurrent_tasks
+        stats = TaskPoolStats(slots=max_concurrent)
+        free_slots = list(range(max_concurrent))
+        # Running asyncio task -> (plan task, slot, start time)
+        running: dict[asyncio.Task[None], tuple[Task, int, float]] = {}
+        started = time.monotonic()
 
-                # No ready tasks but still pending - shouldn't happen after validation
-                raise RuntimeError(f"Deadlock detected in task execution for plan {plan_id}")
-
-            # Execute ready tasks in parallel (up to max_concurrent_tasks)
-            max_concurrent = self.settings.workflow.max_concurrent_tasks
-
-            for i in range(0, len(ready_tasks), max_concurrent):
-                batch = ready_tasks[i : i + max_concurrent]
-
-                log.info(
-                    "executing_task_batch",
-                    plan_id=plan_id,
-                    batch_size=len(batch),
-                    tasks=[t.id for t in batch],
-                )
-
-                # Mark tasks as in progress
-                for task in batch:
+        try:
+            while True:
+                # Fill every free slot before waiting
+                for task in tracker.get_ready_tasks()[: len(free_slots)]:
                     tracker.mark_in_progress(task.id)
+                    slot = heapq.heappop(free_slots)
+                    runner = asyncio.create_task(self._execute_single_task(task, plan_id))
+                    running[runner] = (task, slot, time.monotonic())
+                    log.info("task_started", plan_id=plan_id, task_id=task.id, slot=slot, running=len(running))
+
+                if not running:
+                    break
 
-                # Execute batch
-                results = await asyncio.gather(
-                    *[self._execute_single_task(task, plan_id) for task in batch],
-                    return_exceptions=True,
-                )
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for runner in done:
+                    task, slot, task_started = running.pop(runner)
+                    stats.slot_busy_seconds[slot] += time.monotonic() - task_started
+                    heapq.heappush(free_slots, slot)
 
-                # Update tracker based on results
-                for task, result in zip(batch, results, strict=False):
-                    if isinstance(result, Exception):
+                    error = runner.exception()
+                    if error is not None:
+                        stats.tasks_failed += 1
                         tracker.mark_failed(task.id)
                         log.error(
                             "task_execution_failed",
                             task_id=task.id,
-                            error=str(result),
+                            error=str(error),
                         )
                     else:
+                        stats.tasks_completed += 1
                         tracker.mark_complete(task.id)
                         log.info("task_completed", task_id=task.id)
+        finally:
+            # Only reached with tasks running if we were cancelled
+            for runner in running:
+                runner.cancel()
+
+        stats.duration_seconds = time.monotonic() - started
+        self.last_task_pool_stats = stats
+
+        if tracker.has_pending_tasks():
+            blocked = tracker.get_blocked_tasks()
+            if not blocked:
+                # Nothing ready or running but tasks pending - shouldn't happen after validation
+                raise RuntimeError(f"Deadlock detected in task execution for plan {plan_id}")
+            log.error(
+                "tasks_blocked_by_failures",
+                plan_id=plan_id,
+                blocked=[t.id for t in blocked],
+            )
+
+        # Persist coalesced task updates at the end of the batch run
+        await self.state.flush(plan_id)
 
         # Log final summary
         summary = tracker.get_summary()
-        log.info("parallel_execution_completed", plan_id=plan_id, summary=summary)
+        log.info(
+            "parallel_execution_completed",
+            plan_id=plan_id,
+            summary=summary,
+            duration=round(stats.duration_seconds, 3),
+            parallelism=round(stats.parallelism, 2),
+            slot_utilization=[round(u, 2) for u in stats.slot_utilization],
+        )
+        if METRICS_AVAILABLE:
+            MetricsCollector.record_task_parallelism(stats.parallelism, stats.slot_utilization)
 
+    @traced("execute_task", attributes=lambda self, task, plan_id: {"task": task.id, "plan": plan_id})
     async def _execute_single_task(self, task: Task, plan_id: str) -> None:
         """Execute a single task through implementation and code review stages.
 
@@ -461,8 +683,8 @@ class WorkflowOrchestrator:
         issue, executing the implementation stage, waiting for state updates,
         and then running the code review stage.
 
-        This method is designed to be called concurrently via asyncio.gather()
-        and handles its own error propagation. Errors are not caught here;
+        This method is designed to run concurrently as one task per worker
+        slot and handles its own error propagation. Errors are not caught here;
         they propagate to the caller (execute_parallel_tasks) for handling.
 
         Execution Flow:
@@ -500,14 +722,17 @@ class WorkflowOrchestrator:
         # Get task issue
         issue = await self.git.get_issue(task.prompt_issue_id)
 
-        # Execute implementation stage
-        await self.stages["implementation"].execute(issue)
+        with usage_scope(issue=issue.number, plan=plan_id, task=task.id):
+            # Execute implementation stage
+            with usage_scope(stage="implementation"):
+                await self.stages["implementation"].execute(issue)
 
-        # Wait a bit for state to update
-        await asyncio.sleep(1)
+            # Wait a bit for state to update
+            await asyncio.sleep(1)
 
-        # Execute code review stage
-        await self.stages["code_review"].execute(issue)
+            # Execute code review stage
+            with usage_scope(stage="code_review"):
+                await self.stages["code_review"].execute(issue)
 
     def _determine_stage(self, issue: Issue) -> str | None:
         """Determine which workflow stage should handle this issue.
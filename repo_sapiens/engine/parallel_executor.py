@@ -21,14 +21,19 @@ Architecture:
        semaphore-based concurrency control and dependency tracking.
 
     3. TaskScheduler: Higher-level scheduler that optimizes execution order
-       using critical path analysis.
+       using a duration-weighted critical path (CPM) schedule.
 
 Execution Flow:
     1. Tasks are submitted to the executor with dependencies specified
-    2. Executor identifies tasks with satisfied dependencies
-    3. Ready tasks are sorted by priority and executed up to max_workers
-    4. As tasks complete, dependent tasks become ready
-    5. Process continues until all tasks complete or are blocked by failures
+    2. Executor counts each task's unfinished dependencies (its indegree)
+    3. Tasks with no unfinished dependencies enter a ready heap ordered by
+       priority, then by critical-path height (or, given a CPM schedule,
+       by estimated remaining time)
+    4. Ready tasks are started up to max_workers; every task reports to a
+       single completion queue
+    5. Each completion decrements its dependents' counters and pushes newly
+       ready tasks, so scheduling is linear in tasks plus dependencies
+    6. Process continues until all tasks complete or are blocked by failures
 
 Error Handling:
     - Individual task failures don't stop other independent tasks
@@ -48,7 +53,8 @@ Example:
 """
 
 import asyncio
-from collections.abc import Callable
+import heapq
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -152,6 +158,130 @@ class TaskResult:
     execution_time: float = 0.0
 
 
+def _topological_order(dependencies: Mapping[str, set[str]]) -> tuple[list[str], dict[str, list[str]]]:
+    """Order tasks so every task comes after the tasks it depends on.
+
+    Runs in linear time over tasks and dependencies (Kahn's algorithm).
+    Dependencies on unknown task IDs are ignored; tasks on a cycle, and
+    tasks depending on one, are left out of the order.
+
+    Args:
+        dependencies: Mapping of task ID to the IDs it depends on.
+
+    Returns:
+        Tuple of (order, dependents), where dependents maps each task ID
+        to the IDs that depend on it.
+    """
+    dependents: dict[str, list[str]] = {task_id: [] for task_id in dependencies}
+    indegree: dict[str, int] = {}
+    for task_id, deps in dependencies.items():
+        known = [dep for dep in deps if dep in dependents]
+        indegree[task_id] = len(known)
+        for dep in known:
+            dependents[dep].append(task_id)
+
+    # The list grows while it is iterated, yielding a topological order
+    order = [task_id for task_id, count in indegree.items() if count == 0]
+    for task_id in order:
+        for child in dependents[task_id]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                order.append(child)
+
+    return order, dependents
+
+
+@dataclass
+class CriticalPathSchedule:
+    """Critical Path Method (CPM) schedule of a task graph.
+
+    Times are in seconds from the start of the run, assuming unlimited
+    workers and that every task takes its estimated duration.
+
+    Attributes:
+        durations: Estimated duration of each task.
+        earliest_start: Earliest time each task can start, once every
+            dependency has finished.
+        latest_start: Latest time each task can start without delaying
+            the whole run.
+        slack: latest_start - earliest_start; how long a task can be
+            delayed for free. Tasks without slack are critical.
+        remaining: Longest path from each task's start to the end of the
+            run, including the task itself. Dispatching the ready task
+            with the most remaining work first keeps the critical path
+            moving when workers are scarce.
+        makespan: Length of the longest path, the shortest possible run.
+
+    Example:
+        >>> schedule = compute_schedule(
+        ...     {"a": set(), "b": {"a"}, "c": {"a"}}, {"a": 2.0, "b": 5.0, "c": 1.0}
+        ... )
+        >>> schedule.makespan, schedule.slack["c"]
+        (7.0, 4.0)
+        >>> schedule.critical
+        {'a', 'b'}
+    """
+
+    durations: dict[str, float]
+    earliest_start: dict[str, float]
+    latest_start: dict[str, float]
+    slack: dict[str, float]
+    remaining: dict[str, float]
+    makespan: float
+
+    @property
+    def critical(self) -> set[str]:
+        """IDs of the tasks with no slack."""
+        tolerance = 1e-9 * max(self.makespan, 1.0)
+        return {task_id for task_id, slack in self.slack.items() if slack <= tolerance}
+
+
+def compute_schedule(
+    dependencies: Mapping[str, set[str]],
+    durations: Mapping[str, float],
+    default_duration: float = 1.0,
+) -> CriticalPathSchedule:
+    """Compute a CPM schedule in linear time over tasks and dependencies.
+
+    A forward pass in topological order gives each task's earliest start,
+    and a backward pass its longest remaining path; the latest start is
+    the makespan minus the remaining path. Dependencies on unknown task
+    IDs are ignored; tasks on a cycle get the times of their acyclic prefix.
+
+    Args:
+        dependencies: Mapping of task ID to the IDs it depends on.
+        durations: Estimated duration of each task, in seconds.
+        default_duration: Duration of tasks missing from durations.
+
+    Returns:
+        The schedule of every task in dependencies.
+    """
+    order, dependents = _topological_order(dependencies)
+
+    duration = {task_id: max(durations.get(task_id, default_duration), 0.0) for task_id in dependencies}
+    earliest = dict.fromkeys(dependencies, 0.0)
+    remaining = dict(duration)
+    for task_id in order:
+        finish = earliest[task_id] + duration[task_id]
+        for child in dependents[task_id]:
+            earliest[child] = max(earliest[child], finish)
+    for task_id in reversed(order):
+        for child in dependents[task_id]:
+            remaining[task_id] = max(remaining[task_id], duration[task_id] + remaining[child])
+
+    makespan = max((earliest[task_id] + remaining[task_id] for task_id in dependencies), default=0.0)
+    latest = {task_id: makespan - remaining[task_id] for task_id in dependencies}
+
+    return CriticalPathSchedule(
+        durations=duration,
+        earliest_start=earliest,
+        latest_start=latest,
+        slack={task_id: latest[task_id] - earliest[task_id] for task_id in dependencies},
+        remaining=remaining,
+        makespan=makespan,
+    )
+
+
 class ParallelExecutor:
     """Execute tasks in parallel with dependency management and concurrency control.
 
@@ -159,9 +289,13 @@ class ParallelExecutor:
     dependency relationships between them and limiting concurrency to avoid
     resource exhaustion.
 
-    Execution proceeds in rounds: in each round, all tasks with satisfied
-    dependencies are identified, sorted by priority, and executed up to
-    the concurrency limit. As tasks complete, new tasks become ready.
+    Scheduling is event driven: each task keeps a count of unfinished
+    dependencies, ready tasks wait in a heap ordered by priority and then
+    by critical-path height (the longest chain of tasks waiting on them),
+    and every running task reports to one completion queue. A completion
+    immediately unblocks its dependents and refills the free worker slot,
+    so no time is lost polling and a plan of n tasks with e dependencies
+    is scheduled in O((n + e) log n).
 
     Attributes:
         max_workers: Maximum number of tasks that can execute concurrently.
@@ -184,19 +318,26 @@ class ParallelExecutor:
         self.max_workers = max_workers
         self.semaphore = asyncio.Semaphore(max_workers)
 
-    async def execute_tasks(self, tasks: list[ExecutionTask]) -> dict[str, TaskResult]:
+    async def execute_tasks(
+        self, tasks: list[ExecutionTask], schedule: CriticalPathSchedule | None = None
+    ) -> dict[str, TaskResult]:
         """Execute all tasks in parallel, respecting dependencies and limits.
 
         Manages the complete execution lifecycle for a set of tasks:
-            1. Tracks pending, in-progress, completed, and failed tasks
-            2. Identifies ready tasks (dependencies satisfied)
-            3. Executes ready tasks in priority order up to max_workers
-            4. Handles task completion and failure propagation
-            5. Detects deadlocks and dependency failures
+            1. Counts unfinished dependencies for every task
+            2. Pushes tasks with none onto the ready heap
+            3. Starts ready tasks in priority order up to max_workers
+            4. On each completion, unblocks dependents (or fails them if the
+               task failed) and starts the next ready tasks
+            5. Detects deadlocks once nothing is ready or running
 
         Args:
             tasks: List of ExecutionTask objects to execute. Each task
                 specifies its dependencies, priority, and timeout.
+            schedule: Optional CPM schedule of the tasks. Among ready tasks
+                of equal priority, the one with the longest remaining path
+                (in estimated seconds) starts first; without a schedule,
+                the one with the longest chain of tasks waiting on it.
 
         Returns:
             Dictionary mapping task IDs to their TaskResult objects.
@@ -205,7 +346,8 @@ class ParallelExecutor:
 
         Raises:
             RuntimeError: If a deadlock is detected (tasks remain pending
-                but none can execute, and no tasks are in progress or failed).
+                but none can execute and none are in progress, e.g. because
+                of circular or unknown dependencies).
 
         Side Effects:
             - Logs execution progress, completions, and failures
@@ -224,82 +366,79 @@ class ParallelExecutor:
         pending = {task.id: task for task in tasks}
         completed: set[str] = set()
         failed: set[str] = set()
-        in_progress: set[str] = set()
-
-        log.info("parallel_execution_started", total_tasks=len(tasks), max_workers=self.max_workers)
 
-        while pending or in_progress:
-            # Find ready tasks - those with all dependencies satisfied
-            ready = [task for task in pending.values() if not (task.dependencies - completed)]
+        dependents: dict[str, list[str]] = {task_id: [] for task_id in pending}
+        waiting_on: dict[str, int] = {}
+        for task in pending.values():
+            waiting_on[task.id] = len(task.dependencies)
+            for dep_id in task.dependencies:
+                if dep_id in dependents:
+                    dependents[dep_id].append(task.id)
+
+        remaining: Mapping[str, float]
+        if schedule is not None:
+            remaining = schedule.remaining
+        else:
+            # Unit durations: the remaining path counts the tasks on the longest chain
+            dependencies = {task_id: task.dependencies for task_id, task in pending.items()}
+            remaining = compute_schedule(dependencies, {}).remaining
+        position = {task_id: index for index, task_id in enumerate(pending)}
+        ready: list[tuple[int, float, int, str]] = []
+
+        def push_ready(task_id: str) -> None:
+            # Highest priority first, then the longest remaining chain, then submission order
+            rank = remaining.get(task_id, 0.0)
+            heapq.heappush(ready, (-pending[task_id].priority, -rank, position[task_id], task_id))
+
+        for task_id, count in waiting_on.items():
+            if count == 0:
+                push_ready(task_id)
+
+        finished: asyncio.Queue[TaskResult] = asyncio.Queue()
+        running: dict[str, asyncio.Task[None]] = {}
 
-            if not ready and not in_progress:
-                # No tasks ready and none in progress - check for failures or deadlock
-                remaining_ids = set(pending.keys())
-                blocked_by_failures = any(task.dependencies & failed for task in pending.values())
+        log.info("parallel_execution_started", total_tasks=len(tasks), max_workers=self.max_workers)
 
-                if blocked_by_failures:
-                    # Tasks are blocked by failed dependencies
-                    log.error(
-                        "tasks_blocked_by_failures",
-                        blocked_tasks=list(remaining_ids),
-                        failed_tasks=list(failed),
+        try:
+            while ready or running:
+                # Fill every free slot before waiting
+                while ready and len(running) < self.max_workers:
+                    task_id = heapq.heappop(ready)[3]
+                    running[task_id] = asyncio.create_task(self._run_and_report(pending[task_id], finished))
+
+                result = await finished.get()
+                del running[result.task_id]
+                results[result.task_id] = result
+
+                if result.success:
+                    log.info(
+                        "task_completed",
+                        task_id=result.task_id,
+                        execution_time=result.execution_time,
                     )
-                    # Mark remaining tasks as failed due to dependency failure
-                    for task_id in remaining_ids:
-                        results[task_id] = TaskResult(
-                            task_id=task_id,
-                            success=False,
-                            error=Exception("Dependency failure"),
-                        )
-                    break
+                    completed.add(result.task_id)
+                    for dependent_id in dependents[result.task_id]:
+                        waiting_on[dependent_id] -= 1
+                        if waiting_on[dependent_id] == 0:
+                            push_ready(dependent_id)
                 else:
-                    # True deadlock - circular dependencies or invalid graph
-                    log.error("dependency_deadlock", remaining_tasks=list(remaining_ids))
-                    raise RuntimeError("Dependency deadlock detected")
-
-            # Sort ready tasks by priority (highest first)
-            ready.sort(key=lambda t: t.priority, reverse=True)
-
-            # Execute batch of ready tasks up to available slots
-            available_slots = self.max_workers - len(in_progress)
-            batch = ready[:available_slots]
-
-            if batch:
-                # Create asyncio tasks for the batch
-                batch_tasks = []
-                for task in batch:
-                    batch_tasks.append(asyncio.create_task(self._execute_task(task)))
-                    in_progress.add(task.id)
-                    del pending[task.id]
-
-                # Wait for at least one task to complete before continuing
-                # This allows us to immediately start newly-ready tasks
-                done, _ = await asyncio.wait(batch_tasks, return_when=asyncio.FIRST_COMPLETED)
-
-                # Process completed tasks and update tracking sets
-                for completed_task in done:
-                    result = await completed_task
-                    in_progress.discard(result.task_id)
-
-                    if result.success:
-                        log.info(
-                            "task_completed",
-                            task_id=result.task_id,
-                            execution_time=result.execution_time,
-                        )
-                        completed.add(result.task_id)
-                    else:
-                        log.error(
-                            "task_failed",
-                            task_id=result.task_id,
-                            error=str(result.error),
-                        )
-                        failed.add(result.task_id)
-
-                    results[result.task_id] = result
-            else:
-                # No batch to start, wait briefly for in-progress tasks
-                await asyncio.sleep(0.1)
+                    log.error(
+                        "task_failed",
+                        task_id=result.task_id,
+                        error=str(result.error),
+                    )
+                    failed.add(result.task_id)
+                    self._block_dependents(result.task_id, dependents, results)
+        finally:
+            # Only reached with tasks running if we were cancelled or errored
+            for running_task in running.values():
+                running_task.cancel()
+
+        remaining_ids = [task_id for task_id in pending if task_id not in results]
+        if remaining_ids:
+            # True deadlock - circular dependencies or invalid graph
+            log.error("dependency_deadlock", remaining_tasks=remaining_ids)
+            raise RuntimeError("Dependency deadlock detected")
 
         log.info(
             "parallel_execution_complete",
@@ -310,6 +449,44 @@ class ParallelExecutor:
 
         return results
 
+    def _block_dependents(
+        self,
+        failed_id: str,
+        dependents: Mapping[str, list[str]],
+        results: dict[str, TaskResult],
+    ) -> None:
+        """Fail every task that transitively depends on a failed task.
+
+        Blocked tasks never reach zero unfinished dependencies, so they are
+        never scheduled; recording their results here is enough. Each task
+        is visited at most once across all failures.
+
+        Args:
+            failed_id: ID of the task that failed.
+            dependents: Mapping of task ID to the IDs that depend on it.
+            results: Results so far; blocked tasks are added to it.
+        """
+        blocked: list[str] = []
+        stack = list(dependents[failed_id])
+        while stack:
+            task_id = stack.pop()
+            if task_id in results:
+                continue
+            results[task_id] = TaskResult(
+                task_id=task_id,
+                success=False,
+                error=Exception("Dependency failure"),
+            )
+            blocked.append(task_id)
+            stack.extend(dependents[task_id])
+
+        if blocked:
+            log.error("tasks_blocked_by_failures", blocked_tasks=blocked, failed_task=failed_id)
+
+    async def _run_and_report(self, task: ExecutionTask, finished: asyncio.Queue[TaskResult]) -> None:
+        """Execute a task and post its result to the completion queue."""
+        finished.put_nowait(await self._execute_task(task))
+
     async def _execute_task(self, task: ExecutionTask) -> TaskResult:
         """Execute a single task with semaphore control and timeout.
 
@@ -382,187 +559,145 @@ class TaskScheduler:
     """Intelligent task scheduling with critical path optimization.
 
     The TaskScheduler wraps a ParallelExecutor and adds optimization
-    logic to improve execution time. It analyzes the dependency graph
-    to identify the critical path and boost priority of tasks on that
-    path.
+    logic to improve execution time. It computes a Critical Path Method
+    (CPM) schedule of the dependency graph, weighted by each task's
+    estimated duration, boosts the priority of tasks on the critical
+    path, and dispatches ready tasks longest-remaining-path first.
 
     The critical path is the longest chain of dependent tasks, which
     determines the minimum possible execution time. By prioritizing
     these tasks, we ensure they start as early as possible.
 
+    Durations are estimated from past runs: ``duration_estimates`` seeds
+    them (for example from ``FeedbackLoop.get_duration_estimates()``) and
+    every run through ``execute_with_optimization`` refines them with the
+    observed ``TaskResult.execution_time``. A task's
+    ``metadata["estimated_duration"]`` takes precedence; tasks with no
+    history get the median of the known estimates, or ``default_duration``
+    when nothing is known yet.
+
     Attributes:
         executor: The ParallelExecutor used for actual task execution.
+        default_duration: Estimate in seconds for tasks without history.
+        last_schedule: Schedule computed by the last optimize_execution_order
+            call (None before the first).
 
     Example:
         >>> executor = ParallelExecutor(max_workers=4)
-        >>> scheduler = TaskScheduler(executor)
+        >>> history = await FeedbackLoop().get_duration_estimates()
+        >>> scheduler = TaskScheduler(executor, duration_estimates=history)
         >>> results = await scheduler.execute_with_optimization(tasks)
+        >>> scheduler.last_schedule.makespan
+        42.5
     """
 
-    def __init__(self, executor: ParallelExecutor) -> None:
+    def __init__(
+        self,
+        executor: ParallelExecutor,
+        duration_estimates: Mapping[str, float] | None = None,
+        default_duration: float = 1.0,
+    ) -> None:
         """Initialize the scheduler with an executor.
 
         Args:
             executor: ParallelExecutor instance to use for task execution.
+            duration_estimates: Known task durations in seconds, by task ID.
+            default_duration: Estimate for tasks without history while no
+                durations are known at all.
         """
         self.executor = executor
+        self.default_duration = default_duration
+        self.last_schedule: CriticalPathSchedule | None = None
+        # Task ID -> (total seconds, samples); seeded estimates count as one sample
+        self._history: dict[str, tuple[float, int]] = {
+            task_id: (seconds, 1) for task_id, seconds in (duration_estimates or {}).items() if seconds > 0
+        }
 
-    def optimize_execution_order(self, tasks: list[ExecutionTask]) -> list[ExecutionTask]:
-        """Optimize task execution order for minimum total time.
+    def record_results(self, results: Iterable[TaskResult]) -> None:
+        """Refine duration estimates with observed execution times.
 
-        Analyzes the dependency graph to find the critical path and
-        increases the priority of tasks on that path by 100. This
-        ensures critical path tasks are scheduled first when multiple
-        tasks are ready.
+        Only successful results are used; failures and timeouts stop
+        early or late and say little about how long the task takes.
 
         Args:
-            tasks: List of tasks to optimize. Tasks are modified in place.
-
-        Returns:
-            The same task list with priorities adjusted. Critical path
-            tasks have their priority increased by 100.
-
-        Side Effects:
-            - Modifies task.priority for tasks on the critical path
-            - Logs the critical path length
-
-        Note:
-            This is a simplified implementation that doesn't account for
-            estimated task durations. A full Critical Path Method (CPM)
-            implementation would use duration estimates.
+            results: Results of executed tasks.
         """
-        # Build dependency graph for analysis
-        graph = self._build_dependency_graph(tasks)
-
-        # Calculate critical path through the graph
-        critical_path = self._find_critical_path(graph)
-
-        # Boost priority of critical path tasks
-        for task in tasks:
-            if task.id in critical_path:
-                task.priority += 100
-
-        log.info("execution_order_optimized", critical_path_length=len(critical_path))
+        for result in results:
+            if not result.success or result.execution_time <= 0:
+                continue
+            total, samples = self._history.get(result.task_id, (0.0, 0))
+            self._history[result.task_id] = (total + result.execution_time, samples + 1)
 
-        return tasks
-
-    def _build_dependency_graph(self, tasks: list[ExecutionTask]) -> dict[str, dict[str, Any]]:
-        """Build a bidirectional dependency graph from task list.
-
-        Creates a graph structure with both forward (dependencies) and
-        reverse (dependents) edges for each task.
+    def estimate_durations(self, tasks: list[ExecutionTask]) -> dict[str, float]:
+        """Estimate each task's duration in seconds.
 
         Args:
-            tasks: List of tasks to build graph from.
+            tasks: Tasks to estimate.
 
         Returns:
-            Dictionary mapping task IDs to node data containing:
-                - task: The ExecutionTask object
-                - dependencies: Set of task IDs this task depends on
-                - dependents: Set of task IDs that depend on this task
-
-        Example:
-            >>> graph = scheduler._build_dependency_graph(tasks)
-            >>> graph["task-1"]["dependents"]
-            {'task-2', 'task-3'}
+            Dictionary mapping task IDs to estimated durations.
         """
-        graph: dict[str, dict[str, Any]] = {}
+        known = sorted(total / samples for total, samples in self._history.values())
+        fallback = known[len(known) // 2] if known else self.default_duration
 
-        # Build initial nodes with forward edges
+        durations: dict[str, float] = {}
         for task in tasks:
-            graph[task.id] = {
-                "task": task,
-                "dependencies": task.dependencies,
-                "dependents": set(),
-            }
-
-        # Add reverse edges (dependents) by traversing dependencies
-        for task_id, node in graph.items():
-            for dep_id in node["dependencies"]:
-                if dep_id in graph:
-                    graph[dep_id]["dependents"].add(task_id)
-
-        return graph
-
-    def _find_critical_path(self, graph: dict[str, dict[str, Any]]) -> set[str]:
-        """Find the critical path through the task graph.
+            if "estimated_duration" in task.metadata:
+                durations[task.id] = float(task.metadata["estimated_duration"])
+            elif task.id in self._history:
+                total, samples = self._history[task.id]
+                durations[task.id] = total / samples
+            else:
+                durations[task.id] = fallback
+        return durations
 
-        Uses a simplified Critical Path Method (CPM) to identify tasks
-        on the longest dependency chain. The critical path determines
-        the minimum execution time regardless of parallelism.
+    def optimize_execution_order(self, tasks: list[ExecutionTask]) -> list[ExecutionTask]:
+        """Optimize task execution order for minimum total time.
 
-        Algorithm:
-            1. Find all leaf nodes (tasks with no dependents)
-            2. For each leaf, trace back through dependencies
-            3. Find the longest path from any leaf to a root
-            4. Mark all tasks on paths of maximum length
+        Computes a duration-weighted CPM schedule, increases the priority
+        of tasks on the critical path by 100, and orders the tasks by
+        longest remaining path first. The schedule is kept in
+        last_schedule so execute_with_optimization can hand it to the
+        executor, which uses the same order among ready tasks.
 
         Args:
-            graph: Dependency graph from _build_dependency_graph().
+            tasks: List of tasks to optimize. Priorities are modified in place.
 
         Returns:
-            Set of task IDs that are on the critical path.
+            The tasks sorted by remaining path, longest first. Critical
+            path tasks have their priority increased by 100.
 
-        Note:
-            This simplified implementation treats all tasks as having
-            equal duration. A full CPM would use estimated durations
-            for more accurate critical path calculation.
+        Side Effects:
+            - Modifies task.priority for tasks on the critical path
+            - Sets last_schedule
+            - Logs the critical path length and estimated makespan
         """
-        critical_tasks: set[str] = set()
-
-        # Find leaf nodes (tasks with no dependents - end of chains)
-        leaves = [tid for tid, node in graph.items() if not node["dependents"]]
-
-        def find_longest_path(task_id: str, visited: set[str]) -> int:
-            """Recursively find the longest path from task_id to a root."""
-            if task_id in visited:
-                return 0
-
-            visited.add(task_id)
-            node = graph[task_id]
-
-            # Root node (no dependencies) has depth 1
-            if not node["dependencies"]:
-                return 1
-
-            # Find max depth among all dependencies
-            max_depth = 0
-            for dep_id in node["dependencies"]:
-                if dep_id in graph:
-                    depth = find_longest_path(dep_id, visited.copy())
-                    max_depth = max(max_depth, depth)
-
-            return max_depth + 1
-
-        # Find the maximum depth across all leaves
-        max_depth = 0
-        for leaf_id in leaves:
-            depth = find_longest_path(leaf_id, set())
-            if depth > max_depth:
-                max_depth = depth
-
-        def mark_critical(task_id: str, target_depth: int, current_depth: int) -> None:
-            """Mark tasks that are on paths of the target depth."""
-            if current_depth == target_depth:
-                critical_tasks.add(task_id)
-                return
+        schedule = compute_schedule(
+            {task.id: task.dependencies for task in tasks},
+            self.estimate_durations(tasks),
+        )
+        self.last_schedule = schedule
 
-            node = graph[task_id]
-            for dep_id in node["dependencies"]:
-                if dep_id in graph:
-                    mark_critical(dep_id, target_depth, current_depth + 1)
+        # Boost priority of critical path tasks
+        critical_path = schedule.critical
+        for task in tasks:
+            if task.id in critical_path:
+                task.priority += 100
 
-        # Mark tasks on critical paths (those at maximum depth)
-        for leaf_id in leaves:
-            mark_critical(leaf_id, max_depth, 1)
+        log.info(
+            "execution_order_optimized",
+            critical_path_length=len(critical_path),
+            estimated_makespan=round(schedule.makespan, 3),
+        )
 
-        return critical_tasks
+        return sorted(tasks, key=lambda task: -schedule.remaining[task.id])
 
     async def execute_with_optimization(self, tasks: list[ExecutionTask]) -> dict[str, TaskResult]:
         """Execute tasks with critical path optimization.
 
         Optimizes the execution order first, then delegates to the
-        ParallelExecutor for actual execution.
+        ParallelExecutor for actual execution and records the observed
+        execution times for the next run's estimates.
 
         Args:
             tasks: List of tasks to execute.
@@ -573,6 +708,9 @@ class TaskScheduler:
         Side Effects:
             - Modifies task priorities (via optimize_execution_order)
             - Executes all task callables
+            - Updates the duration estimates
         """
         optimized_tasks = self.optimize_execution_order(tasks)
-        return await self.executor.execute_tasks(optimized_tasks)
+        results = await self.executor.execute_tasks(optimized_tasks, schedule=self.last_schedule)
+        self.record_results(results.values())
+        return results
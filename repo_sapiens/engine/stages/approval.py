@@ -22,6 +22,8 @@ class ApprovalStage(WorkflowStage):
 
     APPROVAL_KEYWORDS = ["ok", "approve", "approved", "lgtm", "looks good"]
 
+    comment_mark_stage = "approval"
+
     async def execute(self, issue: Issue) -> None:
         """Execute approval stage.
 
@@ -35,8 +37,8 @@ class ApprovalStage(WorkflowStage):
             log.debug("already_processed", issue=issue.number)
             return
 
-        # Get comments on the proposal
-        comments = await self.git.get_comments(issue.number)
+        # Get comments posted since the last poll
+        comments = await self._get_new_comments(issue.number)
 
         # Check for approval via label OR comment
         approved = False
@@ -63,6 +65,7 @@ class ApprovalStage(WorkflowStage):
 
         if not approved:
             log.debug("not_yet_approved", issue=issue.number)
+            await self._mark_comments_seen(issue.number, comments)
             return
 
         log.info("approval_detected", issue=issue.number, approver=approver)
@@ -96,7 +99,8 @@ class ApprovalStage(WorkflowStage):
                 f"🤖 Posted by Builder Automation",
             )
 
-            # Create task issues
+            # Create task issues, resolving their shared labels once up front
+            await self.git.ensure_labels(self._task_issue_labels(original_issue))
             task_issues = []
             for i, task in enumerate(tasks, 1):
                 task_issue = await self._create_task_issue(
@@ -298,7 +302,12 @@ class ApprovalStage(WorkflowStage):
         issue = await self.git.create_issue(
             title=title,
             body="\n".join(body_parts),
-            labels=["task", "ready", f"plan-{original_issue.number}"],
+            labels=self._task_issue_labels(original_issue),
         )
 
         return issue
+
+    @staticmethod
+    def _task_issue_labels(original_issue: Issue) -> list[str]:
+        """Labels applied to every task issue created for a plan."""
+        return ["task", "ready", f"plan-{original_issue.number}"]
@@ -51,8 +51,9 @@ from abc import ABC, abstractmethod
 import structlog
 
 from repo_sapiens.config.settings import AutomationSettings
-from repo_sapiens.engine.state_manager import StateManager
-from repo_sapiens.models.domain import Issue
+from repo_sapiens.engine.state_manager import CommentMarkKind, StateManager
+from repo_sapiens.models.domain import Comment, Issue
+from repo_sapiens.monitoring.tracing import instrument_methods
 from repo_sapiens.providers.base import AgentProvider, GitProvider
 
 log = structlog.get_logger(__name__)
@@ -97,6 +98,16 @@ class WorkflowStage(ABC):
         ...             raise
     """
 
+    # Name under which _mark_comments_seen() records processed comments,
+    # and whether the stage reads comments on issues or on pull requests
+    comment_mark_stage: str = ""
+    comment_mark_kind: CommentMarkKind = "issue"
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each stage run is a span (see monitoring.tracing)
+        instrument_methods(cls, ["execute"], lambda self, issue, *args, **kwargs: {"issue": issue.number})
+
     def __init__(
         self,
         git: GitProvider,
@@ -167,6 +178,47 @@ class WorkflowStage(ABC):
         """
         pass
 
+    async def _get_new_comments(self, issue_number: int) -> list[Comment]:
+        """Fetch the comments this stage hasn't processed yet.
+
+        Uses the high-water mark recorded by ``_mark_comments_seen()`` so
+        the provider only returns comments created since the last run.
+        Without a mark every comment is fetched.
+
+        Args:
+            issue_number: Issue or pull request number.
+
+        Returns:
+            Unprocessed comments, oldest first.
+        """
+        mark = await self.state.get_comment_mark(issue_number, self._comment_mark_stage(), self.comment_mark_kind)
+        if mark is None:
+            return await self.git.get_comments(issue_number)
+
+        last_id, last_created_at = mark
+        comments = await self.git.get_comments(issue_number, since=last_created_at)
+        # since is inclusive, and comments sharing the mark's timestamp may be new
+        new_comments = [c for c in comments if c.id > last_id]
+        log.debug("new_comments_fetched", issue=issue_number, fetched=len(comments), new=len(new_comments))
+        return new_comments
+
+    async def _mark_comments_seen(self, issue_number: int, comments: list[Comment]) -> None:
+        """Advance the issue's high-water mark past the given comments.
+
+        Args:
+            issue_number: Issue or pull request number.
+            comments: Comments that have been fully processed.
+        """
+        if not comments:
+            return
+        newest = max(comments, key=lambda c: c.id)
+        await self.state.set_comment_mark(
+            issue_number, self._comment_mark_stage(), newest.id, newest.created_at, self.comment_mark_kind
+        )
+
+    def _comment_mark_stage(self) -> str:
+        return self.comment_mark_stage or type(self).__name__
+
     async def _handle_stage_error(self, issue: Issue, error: Exception) -> None:
         """Handle errors consistently across all stages.
 
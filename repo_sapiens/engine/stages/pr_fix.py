@@ -19,7 +19,7 @@ class PRFixStage(WorkflowStage):
 
     New dynamic workflow:
     1. Detects PRs with 'needs-fix' label
-    2. Reads ALL comments from reviewers/maintainers
+    2. Reads comments posted since the last run from reviewers/maintainers
     3. AI analyzes each comment (simple fix / controversial / question / info)
     4. Replies to each comment with planned action
     5. Batch executes simple fixes immediately
@@ -27,6 +27,9 @@ class PRFixStage(WorkflowStage):
     7. Removes 'needs-fix' label when done
     """
 
+    comment_mark_stage = "pr_fix"
+    comment_mark_kind = "pr"
+
     async def execute(self, issue: Issue) -> None:
         """Execute dynamic review comment response.
 
@@ -48,15 +51,15 @@ class PRFixStage(WorkflowStage):
             updated_labels.append("fixes-in-progress")
             await self.git.update_issue(issue.number, labels=updated_labels)
 
-            # Get all comments
-            comments = await self.git.get_comments(issue.number)
+            # Get comments not handled by a previous run
+            comments = await self._get_new_comments(issue.number)
 
             if not comments:
                 log.warning("no_comments_found", issue=issue.number)
                 await self.git.add_comment(
                     issue.number,
                     "⚠️ **No Review Comments Found**\n\n"
-                    "I couldn't find any review comments to address.\n"
+                    "I couldn't find any new review comments to address.\n"
                     "Add comments to this PR and re-add the `needs-fix` label.\n\n"
                     "🤖 Posted by Sapiens Automation",
                 )
@@ -66,7 +69,12 @@ class PRFixStage(WorkflowStage):
                 return
 
             # Analyze all comments with AI
-            analyzer = CommentAnalyzer(self.git, self.agent)
+            analyzer = CommentAnalyzer(
+                self.git,
+                self.agent,
+                batch_size=self.settings.workflow.comment_batch_size,
+                max_concurrent_batches=self.settings.workflow.max_concurrent_comment_batches,
+            )
             analysis = await analyzer.analyze_comments(issue.number, comments)
 
             log.info(
@@ -90,6 +98,9 @@ class PRFixStage(WorkflowStage):
             # Update labels based on results
             await self._update_labels_after_fixes(issue.number, analysis)
 
+            # Only a completed run advances the mark, so a failed run is retried in full
+            await self._mark_comments_seen(issue.number, comments)
+
             log.info("pr_fix_complete", issue=issue.number)
 
         except Exception as e:
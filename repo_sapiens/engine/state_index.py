@@ -0,0 +1,210 @@
+"""
+Plan status index for the state directory.
+
+Keeps a compact summary of every plan (status, last update, task counts) in a
+single append-only JSON Lines file next to the per-plan state files, so plans
+can be listed and filtered without opening each state file.
+
+Each write appends one line; on load the log is replayed (last line per plan
+wins) and compacted when it has grown well beyond the number of plans. Lines
+appended by other processes are picked up incrementally by reading from the
+last known offset. Appends and rewrites hold a cross-process file lock so a
+compaction in one process never drops a line another process just appended.
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import aiofiles
+import structlog
+
+from repo_sapiens.engine.types import PlanSummary, WorkflowState
+from repo_sapiens.storage.locking import file_lock
+
+log = structlog.get_logger(__name__)
+
+INDEX_FILENAME = "_index.jsonl"
+
+# Plan statuses that are no longer active
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
+# Compact once the log holds this many times more lines than plans
+_COMPACT_RATIO = 4
+_COMPACT_MIN_LINES = 256
+
+
+def summarize_state(state: WorkflowState) -> PlanSummary:
+    """Build the index summary for a workflow state.
+
+    Args:
+        state: Workflow state to summarize
+
+    Returns:
+        PlanSummary for the state
+    """
+    task_statuses = [task.get("status") for task in state.get("tasks", {}).values()]
+    return {
+        "plan_id": state["plan_id"],
+        "status": state.get("status", "pending"),
+        "updated_at": state.get("updated_at", ""),
+        "task_count": len(task_statuses),
+        "tasks_completed": task_statuses.count("completed"),
+        "tasks_failed": task_statuses.count("failed"),
+    }
+
+
+class PlanIndex:
+    """In-memory plan index backed by an append-only JSON Lines file.
+
+    Active plans are tracked separately so listing them costs O(active)
+    regardless of how many finished plans the directory holds.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the index.
+
+        Args:
+            path: Path of the index file
+        """
+        self.path = path
+        self.lock_path = path.with_name(path.name + ".lock")
+        self._entries: dict[str, PlanSummary] = {}
+        self._active: set[str] = set()
+        self._offset = 0
+        self._inode: int | None = None
+        self._lines = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def exists(self) -> bool:
+        """Whether the index file exists on disk."""
+        return self.path.exists()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, plan_id: str) -> PlanSummary | None:
+        """Get the indexed summary for a plan, if any."""
+        return self._entries.get(plan_id)
+
+    def entries(self, status: str | None = None, active_only: bool = False) -> list[PlanSummary]:
+        """List indexed plans ordered by plan ID.
+
+        Args:
+            status: Only include plans with this status
+            active_only: Only include plans that are not completed or failed
+
+        Returns:
+            Matching plan summaries
+        """
+        plan_ids = self._active if active_only else self._entries.keys()
+        summaries = [self._entries[plan_id] for plan_id in plan_ids]
+        if status is not None:
+            summaries = [summary for summary in summaries if summary["status"] == status]
+        return sorted(summaries, key=lambda summary: summary["plan_id"])
+
+    async def refresh(self) -> None:
+        """Read index lines appended since the last refresh.
+
+        Re-reads the whole file if it was replaced (compacted or rebuilt)
+        since it was last read, and compacts it when the log has grown
+        far beyond the number of plans.
+        """
+        async with self._lock:
+            await self._read_new()
+            if self._lines > _COMPACT_MIN_LINES and self._lines > _COMPACT_RATIO * len(self._entries):
+                async with file_lock(self.lock_path):
+                    # Pick up lines appended since the read above before rewriting
+                    await self._read_new()
+                    await self._write_all()
+
+    async def record(self, summary: PlanSummary) -> None:
+        """Update a plan's summary in memory and append it to the index file.
+
+        Args:
+            summary: New summary for the plan
+        """
+        async with self._lock:
+            self._apply(summary)
+            async with file_lock(self.lock_path), aiofiles.open(self.path, "a") as f:
+                await f.write(json.dumps(summary, separators=(",", ":")) + "\n")
+
+    async def replace(self, summaries: list[PlanSummary]) -> None:
+        """Replace the whole index, e.g. after rebuilding it from state files.
+
+        Args:
+            summaries: Summaries for every plan
+        """
+        async with self._lock:
+            self._reset()
+            for summary in summaries:
+                self._apply(summary)
+            async with file_lock(self.lock_path):
+                await self._write_all()
+
+    async def _read_new(self) -> None:
+        """Apply lines appended to the index file since the last read."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._reset()
+            self._inode = stat.st_ino
+
+        if stat.st_size == self._offset:
+            return
+
+        async with aiofiles.open(self.path, "rb") as f:
+            await f.seek(self._offset)
+            data = await f.read()
+
+        # Ignore a trailing partial line from a concurrent writer
+        complete = data[: data.rfind(b"\n") + 1]
+        self._offset += len(complete)
+        for line in complete.splitlines():
+            if line.strip():
+                self._apply_line(line)
+
+    def _reset(self) -> None:
+        self._entries.clear()
+        self._active.clear()
+        self._offset = 0
+        self._lines = 0
+
+    def _apply(self, summary: PlanSummary) -> None:
+        plan_id = summary["plan_id"]
+        self._entries[plan_id] = summary
+        if summary["status"] in TERMINAL_STATUSES:
+            self._active.discard(plan_id)
+        else:
+            self._active.add(plan_id)
+
+    def _apply_line(self, line: bytes) -> None:
+        self._lines += 1
+        try:
+            self._apply(json.loads(line))
+        except (ValueError, KeyError, TypeError) as e:
+            log.warning("state_index_line_invalid", path=str(self.path), error=str(e))
+
+    async def _write_all(self) -> None:
+        """Atomically rewrite the index with one line per plan.
+
+        Callers must hold the index file lock.
+        """
+        lines = [json.dumps(summary, separators=(",", ":")) + "\n" for summary in self._entries.values()]
+        content = "".join(lines)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+
+        async with aiofiles.open(tmp_path, "w") as f:
+            await f.write(content)
+        tmp_path.replace(self.path)
+
+        stat = os.stat(self.path)
+        self._inode = stat.st_ino
+        self._offset = stat.st_size
+        self._lines = len(lines)
+        log.debug("state_index_compacted", path=str(self.path), plans=len(lines))
@@ -9,6 +9,11 @@ ensures data integrity through:
 - Per-plan locking to prevent concurrent modification
 - Automatic status calculation based on stage states
 
+Storage is delegated to a pluggable ``StorageBackend``. The default
+``JSONFileBackend`` keeps the layout described below; a ``SQLiteBackend``
+stores each plan as a row in a shared WAL-mode database and adds
+cross-process locking so several workers can share one ``.sapiens`` directory.
+
 State File Structure:
     State is persisted as JSON files in a configurable directory. Each plan
     gets its own file named ``{plan_id}.json`` with the following structure::
@@ -37,10 +42,44 @@ Transaction Support:
             state["metadata"]["key"] = "value"
             # Changes are saved atomically on context exit
 
+Plan Index:
+    Every state write also updates a compact plan index (``_index.jsonl``)
+    holding each plan's status, ``updated_at`` and task counts. Listing and
+    filtering plans (``list_plans()``, ``get_active_plans()``) is served from
+    the index without opening individual state files. A missing index is
+    rebuilt from the state files on first use.
+
+Comment High-Water Marks:
+    Stages that poll issue comments record the newest comment they have
+    processed (``set_comment_mark()``), so the next run only asks the
+    provider for comments created since then. Marks are kept per kind
+    (issue or pull request, whose numbers overlap on GitLab) and per stage,
+    so one stage never skips comments another has handled. With the JSON
+    backend the marks live in a ``comment_marks/`` subdirectory, apart from
+    plan files.
+
+Write-Back Mode:
+    With ``flush_interval_ms > 0`` the manager keeps each plan's state in
+    memory. ``load_state()`` is served from the cache, saves only update the
+    cache, and dirty plans are persisted in one batched write at most once
+    per interval, whenever a stage completes, and on ``flush()``. Bursts of
+    task status updates then cost one write per plan per interval instead of
+    one full rewrite per update. The plan index is updated when a plan is
+    flushed, under the same plan and document locks as a direct save. Call
+    ``close()``, which flushes, before shutdown.
+
+    Write-back assumes this process is the only writer of its plans: loads
+    are answered from the cache without consulting the backend, so updates
+    another process makes are never seen and are overwritten by the next
+    flush. Leave it disabled when several processes (e.g. the webhook
+    server and CLI runs) share a SQLite storage backend.
+
 Concurrency Model:
     Each plan has its own asyncio lock to prevent concurrent modifications.
     Multiple plans can be accessed concurrently, but each individual plan
-    is accessed serially.
+    is accessed serially. Within the asyncio lock the backend's document
+    lock is also held, which serializes access across processes for
+    backends that support it.
 
 Example:
     >>> state = StateManager(".sapiens/state")
@@ -50,20 +89,25 @@ Example:
 """
 
 import asyncio
-import json
+import copy
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Literal, cast
 
-import aiofiles
 import structlog
 
-from repo_sapiens.engine.types import StagesDict, StageState, TaskState, WorkflowState
+from repo_sapiens.engine.state_index import INDEX_FILENAME, PlanIndex, summarize_state
+from repo_sapiens.engine.types import PlanSummary, StagesDict, StageState, TaskState, WorkflowState
+from repo_sapiens.storage.base import COMMENT_MARK_COLLECTION, STATE_COLLECTION, StorageBackend
+from repo_sapiens.storage.json_backend import JSONFileBackend
 
 log = structlog.get_logger(__name__)
 
+# Issues and pull requests are numbered separately on GitLab, so marks record which one they belong to
+CommentMarkKind = Literal["issue", "pr"]
+
 
 class StateManager:
     """Manage workflow state with atomic file operations.
@@ -73,7 +117,8 @@ class StateManager:
     State is stored as JSON files, one per plan.
 
     Attributes:
-        state_dir: Directory where state files are stored.
+        state_dir: Directory where state files (and the plan index) are stored.
+        backend: Storage backend holding the state documents.
 
     Thread Safety:
         This class is designed for single-threaded asyncio usage. Each plan
@@ -87,7 +132,12 @@ class StateManager:
         >>> await manager.save_state("plan-1", state)
     """
 
-    def __init__(self, state_dir: str | Path) -> None:
+    def __init__(
+        self,
+        state_dir: str | Path,
+        backend: StorageBackend | None = None,
+        flush_interval_ms: int = 0,
+    ) -> None:
         """Initialize the state manager with a storage directory.
 
         Creates the state directory if it does not exist. The directory
@@ -97,6 +147,12 @@ class StateManager:
             state_dir: Path to the directory for storing state files.
                 Can be a string or Path object. Will be created if it
                 does not exist, including any necessary parent directories.
+            backend: Storage backend for state documents. Defaults to a
+                JSONFileBackend on ``state_dir``.
+            flush_interval_ms: Enables write-back mode when greater than 0:
+                saves are coalesced in memory and persisted at most once
+                per this many milliseconds. 0 writes every save through.
+                Only for a backend no other process writes to.
 
         Side Effects:
             Creates the state directory and any parent directories if
@@ -108,10 +164,27 @@ class StateManager:
         """
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.backend = backend or JSONFileBackend(self.state_dir)
         # Per-plan locks to prevent concurrent modification of the same plan
         self._locks: dict[str, asyncio.Lock] = {}
         # Meta-lock for thread-safe lock creation
         self._locks_lock = asyncio.Lock()
+        # Plan status index, loaded (or rebuilt) on first use
+        self._index = PlanIndex(self.state_dir / INDEX_FILENAME)
+        self._index_ready = False
+        # Write-back cache: canonical in-memory state and plans not yet persisted
+        self.flush_interval_ms = flush_interval_ms
+        self._cache: dict[str, WorkflowState] = {}
+        self._dirty: set[str] = set()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+        # Comment high-water marks; created on first use
+        self._mark_backend: StorageBackend | None = None
+
+    @property
+    def write_back(self) -> bool:
+        """Whether saves are coalesced in memory before being persisted."""
+        return self.flush_interval_ms > 0
 
     async def _get_lock(self, plan_id: str) -> asyncio.Lock:
         """Get or create an asyncio lock for the specified plan.
@@ -139,21 +212,6 @@ class StateManager:
                 self._locks[plan_id] = asyncio.Lock()
             return self._locks[plan_id]
 
-    def _get_state_path(self, plan_id: str) -> Path:
-        """Compute the filesystem path for a plan's state file.
-
-        Args:
-            plan_id: Unique identifier for the plan.
-
-        Returns:
-            Path to the JSON state file for this plan.
-
-        Example:
-            >>> manager._get_state_path("plan-42")
-            Path(".sapiens/state/plan-42.json")
-        """
-        return self.state_dir / f"{plan_id}.json"
-
     async def _load_state_internal(self, plan_id: str) -> WorkflowState:
         """Load state from disk without acquiring the plan lock.
 
@@ -177,17 +235,23 @@ class StateManager:
             Caller MUST hold the plan lock before calling this method.
             Failure to do so may result in race conditions.
         """
-        state_path = self._get_state_path(plan_id)
+        if self.write_back and plan_id in self._cache:
+            # Callers mutate what they load; never hand out the cached copy
+            return copy.deepcopy(self._cache[plan_id])
+
+        document = await self.backend.get(STATE_COLLECTION, plan_id)
 
-        if not state_path.exists():
+        if document is None:
             # Create initial state for new plans
             state = self._create_initial_state(plan_id)
-            await self._write_state(state_path, state)
-            return state
+            await self.backend.put(STATE_COLLECTION, plan_id, cast(dict[str, Any], state))
+            await self._update_index(state)
+        else:
+            state = cast(WorkflowState, document)
 
-        async with aiofiles.open(state_path) as f:
-            content = await f.read()
-            return cast(WorkflowState, json.loads(content))
+        if self.write_back:
+            self._cache[plan_id] = copy.deepcopy(state)
+        return state
 
     async def _save_state_internal(self, plan_id: str, state: WorkflowState) -> None:
         """Save state to disk without acquiring the plan lock.
@@ -208,15 +272,24 @@ class StateManager:
         Side Effects:
             - Updates ``state["updated_at"]`` to current UTC time
             - Updates ``state["status"]`` based on stage statuses
-            - Writes state to disk atomically
+            - Writes state to disk atomically (or, in write-back mode,
+              caches it and schedules a flush)
+            - Updates the plan's entry in the plan index
 
         Warning:
             Caller MUST hold the plan lock before calling this method.
         """
-        state_path = self._get_state_path(plan_id)
         state["updated_at"] = datetime.now(UTC).isoformat()
         state["status"] = self._calculate_overall_status(state)
-        await self._write_state(state_path, state)
+
+        if self.write_back:
+            self._cache[plan_id] = copy.deepcopy(state)
+            self._dirty.add(plan_id)
+            self._schedule_flush()
+            return
+
+        await self.backend.put(STATE_COLLECTION, plan_id, cast(dict[str, Any], state))
+        await self._update_index(state)
 
     async def load_state(self, plan_id: str) -> WorkflowState:
         """Load the current state for a plan, creating initial state if needed.
@@ -242,7 +315,7 @@ class StateManager:
             'pending'
         """
         lock = await self._get_lock(plan_id)
-        async with lock:
+        async with lock, self.backend.lock(STATE_COLLECTION, plan_id):
             return await self._load_state_internal(plan_id)
 
     async def save_state(self, plan_id: str, state: WorkflowState) -> None:
@@ -273,35 +346,151 @@ class StateManager:
             >>> await manager.save_state("plan-42", state)
         """
         lock = await self._get_lock(plan_id)
-        async with lock:
+        async with lock, self.backend.lock(STATE_COLLECTION, plan_id):
             await self._save_state_internal(plan_id, state)
 
-    async def _write_state(self, path: Path, state: WorkflowState) -> None:
-        """Write state to disk atomically using a temporary file.
+    def _schedule_flush(self) -> None:
+        """Start the debounce timer unless a flush is already scheduled."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
 
-        The atomic write pattern prevents partial writes from corrupting
-        the state file. State is written to a .tmp file first, then
-        renamed to the target path. On POSIX systems, rename is atomic
-        when source and destination are on the same filesystem.
+    async def _delayed_flush(self) -> None:
+        """Flush dirty plans once the write-back interval has elapsed."""
+        await asyncio.sleep(self.flush_interval_ms / 1000)
+        # Saves arriving during the flush below schedule the next one
+        self._flush_task = None
+        try:
+            await self._flush_dirty(None)
+        except Exception as e:
+            log.error("state_flush_failed", error=str(e), exc_info=True)
+
+    async def _flush_dirty(self, plan_ids: set[str] | None) -> int:
+        """Persist dirty cached plans in a single batched write.
 
         Args:
-            path: Target path for the state file.
-            state: WorkflowState dictionary to write.
+            plan_ids: Plans to flush, or None for every dirty plan.
 
-        Raises:
-            IOError: If writing or renaming fails.
+        Returns:
+            Number of plans written.
+        """
+        async with self._flush_lock, AsyncExitStack() as held:
+            targets = set(self._dirty) if plan_ids is None else self._dirty & plan_ids
+            if not targets:
+                return 0
+
+            # Hold each plan's lock, then its document lock, like any other
+            # writer. Sorted order keeps concurrent flushes deadlock-free.
+            ordered = sorted(targets)
+            for plan_id in ordered:
+                await held.enter_async_context(await self._get_lock(plan_id))
+            for plan_id in ordered:
+                await held.enter_async_context(self.backend.lock(STATE_COLLECTION, plan_id))
+
+            # Cached states are replaced on save, never mutated, so no copy is needed
+            documents = {plan_id: cast(dict[str, Any], self._cache[plan_id]) for plan_id in ordered}
+            self._dirty -= targets
+            try:
+                await self.backend.put_many(STATE_COLLECTION, documents)
+            except Exception:
+                self._dirty |= targets
+                raise
 
-        Note:
-            The temporary file is created in the same directory as the
-            target to ensure they are on the same filesystem.
+            for plan_id in ordered:
+                state = self._cache[plan_id]
+                await self._update_index(state)
+                # Finished plans are rarely touched again; stop caching them
+                if state["status"] in ("completed", "failed") and plan_id not in self._dirty:
+                    del self._cache[plan_id]
+
+        log.debug("state_flushed", plans=len(targets))
+        return len(targets)
+
+    async def flush(self, plan_id: str | None = None) -> int:
+        """Persist state held in the write-back cache.
+
+        Called automatically at stage boundaries; call it explicitly before
+        shutdown so no coalesced updates are lost. A no-op when write-back
+        mode is disabled.
+
+        Args:
+            plan_id: Only flush this plan. Flushes every dirty plan if None.
+
+        Returns:
+            Number of plans written.
+
+        Example:
+            >>> try:
+            ...     await orchestrator.process_all_issues()
+            ... finally:
+            ...     await state_manager.flush()
+        """
+        if plan_id is None and self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        return await self._flush_dirty(None if plan_id is None else {plan_id})
+
+    async def close(self) -> None:
+        """Flush pending write-back state and close the storage backend.
+
+        Call once when the manager is no longer needed, e.g. on shutdown.
+        The manager must not be used afterwards.
+
+        Example:
+            >>> try:
+            ...     await orchestrator.process_all_issues()
+            ... finally:
+            ...     await state_manager.close()
         """
-        tmp_path = path.with_suffix(".tmp")
+        await self.flush()
+        if self._mark_backend is not None and self._mark_backend is not self.backend:
+            await self._mark_backend.close()
+        await self.backend.close()
+
+    async def _ensure_index(self) -> None:
+        """Load the plan index, rebuilding it if it does not exist yet.
 
-        async with aiofiles.open(tmp_path, "w") as f:
-            await f.write(json.dumps(state, indent=2))
+        Once loaded, picks up index entries appended by other processes.
+        """
+        if not self._index_ready:
+            if self._index.exists:
+                await self._index.refresh()
+            else:
+                await self.rebuild_index()
+            self._index_ready = True
+        else:
+            await self._index.refresh()
 
-        # Atomic rename - safe on POSIX when same filesystem
-        tmp_path.replace(path)
+    async def _update_index(self, state: WorkflowState) -> None:
+        """Record the state's summary in the plan index.
+
+        Args:
+            state: WorkflowState that was just written.
+        """
+        await self._ensure_index()
+        await self._index.record(summarize_state(state))
+
+    async def rebuild_index(self) -> int:
+        """Rebuild the plan index by scanning every stored plan.
+
+        Used automatically when no index exists (e.g. state directories
+        created before the index was introduced), and can be called
+        explicitly if state files were modified outside this class.
+
+        Returns:
+            Number of plans indexed.
+        """
+        summaries: list[PlanSummary] = []
+        for plan_id, document in await self.backend.scan(STATE_COLLECTION):
+            try:
+                document.setdefault("plan_id", plan_id)
+                summaries.append(summarize_state(cast(WorkflowState, document)))
+            except (ValueError, AttributeError) as e:
+                log.warning("state_index_skip_plan", plan_id=plan_id, error=str(e))
+
+        await self._index.replace(summaries)
+        self._index_ready = True
+        log.info("state_index_rebuilt", plans=len(summaries))
+        return len(summaries)
 
     @asynccontextmanager
     async def transaction(self, plan_id: str) -> AsyncIterator[WorkflowState]:
@@ -336,7 +525,7 @@ class StateManager:
             Keep transactions short to avoid blocking other operations.
         """
         lock = await self._get_lock(plan_id)
-        async with lock:
+        async with lock, self.backend.lock(STATE_COLLECTION, plan_id):
             state = await self._load_state_internal(plan_id)
             try:
                 yield state
@@ -442,6 +631,7 @@ class StateManager:
             - Updates stage status to "completed"
             - Sets ``completed_at`` timestamp on the stage
             - Stores provided data in stage's ``data`` field
+            - Flushes the plan if write-back mode is enabled
             - Logs completion event
 
         Example:
@@ -458,6 +648,9 @@ class StateManager:
                 if data:
                     state["stages"][stage]["data"] = data
 
+        # Stage boundaries are persisted immediately in write-back mode
+        await self.flush(plan_id)
+
         log.info("stage_completed", plan_id=plan_id, stage=stage)
 
     async def mark_task_status(
@@ -511,29 +704,103 @@ class StateManager:
 
         log.info("task_status_updated", plan_id=plan_id, task_id=task_id, status=status)
 
+    async def list_plans(self, status: str | None = None, active_only: bool = False) -> list[PlanSummary]:
+        """List plan summaries from the plan index.
+
+        Does not open individual state files; listing active plans costs
+        O(active plans) however many finished plans the directory holds.
+
+        Args:
+            status: Only include plans with this overall status.
+            active_only: Only include plans that are not completed or failed.
+
+        Returns:
+            PlanSummary dictionaries ordered by plan ID.
+
+        Example:
+            >>> for plan in await manager.list_plans(active_only=True):
+            ...     print(plan["plan_id"], plan["status"], plan["task_count"])
+            plan-42 in_progress 5
+        """
+        await self._ensure_index()
+        return self._index.entries(status=status, active_only=active_only)
+
     async def get_active_plans(self) -> list[str]:
         """Get a list of all plans that are still in progress.
 
-        Scans the state directory for all plan state files and returns
-        the IDs of plans that are not yet completed or failed.
-
         Returns:
             List of plan IDs that have status other than "completed"
             or "failed". Returns an empty list if no active plans exist.
 
-        Note:
-            This method loads each plan's state to check its status,
-            which could be slow for directories with many plans.
-
         Example:
             >>> active = await manager.get_active_plans()
             >>> print(active)
             ['plan-42', 'plan-55']
         """
-        active = []
-        for state_file in self.state_dir.glob("*.json"):
-            plan_id = state_file.stem
-            state = await self.load_state(plan_id)
-            if state["status"] not in ["completed", "failed"]:
-                active.append(plan_id)
-        return active
+        return [summary["plan_id"] for summary in await self.list_plans(active_only=True)]
+
+    def _comment_marks(self) -> StorageBackend:
+        if self._mark_backend is None:
+            # JSONFileBackend ignores collections; keep marks out of the plan directory
+            if isinstance(self.backend, JSONFileBackend):
+                self._mark_backend = JSONFileBackend(self.state_dir / COMMENT_MARK_COLLECTION)
+            else:
+                self._mark_backend = self.backend
+        return self._mark_backend
+
+    async def get_comment_mark(
+        self, issue_number: int, stage: str, kind: CommentMarkKind = "issue"
+    ) -> tuple[int, datetime] | None:
+        """Get the newest comment a stage has processed on an issue or pull request.
+
+        Args:
+            issue_number: Issue or pull request number.
+            stage: Name of the stage that processed the comments.
+            kind: ``"issue"`` or ``"pr"``.
+
+        Returns:
+            Tuple of (comment ID, comment creation time), or None if the
+            stage hasn't processed a comment there yet.
+
+        Example:
+            >>> mark = await manager.get_comment_mark(42, "approval")
+            >>> if mark:
+            ...     comments = await git.get_comments(42, since=mark[1])
+        """
+        document = await self._comment_marks().get(COMMENT_MARK_COLLECTION, _comment_mark_id(issue_number, stage, kind))
+        if document is None:
+            return None
+        return document["comment_id"], datetime.fromisoformat(document["created_at"])
+
+    async def set_comment_mark(
+        self,
+        issue_number: int,
+        stage: str,
+        comment_id: int,
+        created_at: datetime,
+        kind: CommentMarkKind = "issue",
+    ) -> None:
+        """Record the newest comment a stage has processed on an issue or pull request.
+
+        Args:
+            issue_number: Issue or pull request number.
+            stage: Name of the stage that processed the comments.
+            comment_id: ID of the newest processed comment.
+            created_at: Creation time of that comment.
+            kind: ``"issue"`` or ``"pr"``.
+        """
+        document = {
+            "issue_number": issue_number,
+            "kind": kind,
+            "stage": stage,
+            "comment_id": comment_id,
+            "created_at": created_at.isoformat(),
+            "updated_at": datetime.now(UTC).isoformat(),
+        }
+        await self._comment_marks().put(COMMENT_MARK_COLLECTION, _comment_mark_id(issue_number, stage, kind), document)
+        log.debug("comment_mark_updated", issue_number=issue_number, kind=kind, stage=stage, comment_id=comment_id)
+
+
+def _comment_mark_id(issue_number: int, stage: str, kind: CommentMarkKind) -> str:
+    """Storage key of a comment mark, e.g. ``pr-12-pr_fix``."""
+    return f"{kind}-{issue_number}-{stage}"
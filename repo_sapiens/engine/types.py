@@ -342,6 +342,31 @@ class WorkflowState(TypedDict):
     """
 
 
+class PlanSummary(TypedDict):
+    """Compact per-plan record kept in the state index.
+
+    Holds just enough to list and filter plans without opening their
+    state files. Maintained by StateManager on every state write.
+
+    Example:
+        summary: PlanSummary = {
+            "plan_id": "plan-42",
+            "status": "in_progress",
+            "updated_at": "2024-01-15T11:45:00+00:00",
+            "task_count": 5,
+            "tasks_completed": 2,
+            "tasks_failed": 0,
+        }
+    """
+
+    plan_id: str
+    status: str
+    updated_at: str
+    task_count: int
+    tasks_completed: int
+    tasks_failed: int
+
+
 # Type aliases for common patterns
 #
 # TasksDict: Type alias for the tasks dictionary. Maps task IDs (strings
@@ -365,6 +390,7 @@ __all__ = [
     "TaskState",
     "StagesDict",
     "WorkflowState",
+    "PlanSummary",
     "TasksDict",
     "KNOWN_STAGE_NAMES",
 ]
@@ -17,6 +17,7 @@ Exception Hierarchy:
     ├── WorkflowError
     │   └── TaskExecutionError
     ├── ExternalServiceError
+    ├── StorageError
     └── AgentError
         ├── AgentTimeoutError
         ├── AgentContextError
@@ -244,6 +245,19 @@ class ExternalServiceError(RepoSapiensError):
 # =============================================================================
 
 
+class StorageError(RepoSapiensError):
+    """Persistent storage backend errors.
+
+    Raised when a storage backend cannot read, write or lock a document,
+    e.g. when a cross-process lock cannot be acquired in time.
+
+    Example:
+        >>> raise StorageError("Timed out waiting for lock on state/plan-42")
+    """
+
+    pass
+
+
 class AgentError(RepoSapiensError):
     """Base exception for agent execution errors.
 
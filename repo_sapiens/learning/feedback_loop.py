@@ -4,22 +4,25 @@ Learns from past executions to improve prompts and task selection.
 """
 
 import asyncio
-import json
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import structlog
 
+from repo_sapiens.storage.base import FEEDBACK_COLLECTION, StorageBackend
+from repo_sapiens.storage.json_backend import JSONFileBackend
+
 log = structlog.get_logger(__name__)
 
 
 class FeedbackLoop:
     """Learn from past executions to improve prompts and strategies."""
 
-    def __init__(self, feedback_dir: str = ".sapiens/feedback") -> None:
+    def __init__(self, feedback_dir: str = ".sapiens/feedback", backend: StorageBackend | None = None) -> None:
         self.feedback_dir = Path(feedback_dir)
         self.feedback_dir.mkdir(parents=True, exist_ok=True)
+        self.backend = backend or JSONFileBackend(self.feedback_dir)
         self._lock = asyncio.Lock()
 
     async def record_execution(
@@ -52,8 +55,7 @@ class FeedbackLoop:
         }
 
         async with self._lock:
-            feedback_file = self.feedback_dir / f"{task_id}.json"
-            feedback_file.write_text(json.dumps(feedback, indent=2))
+            await self.backend.put(FEEDBACK_COLLECTION, task_id, feedback)
 
         log.info("feedback_recorded", task_id=task_id, success=feedback["success"])
 
@@ -97,10 +99,8 @@ class FeedbackLoop:
         """Find similar historical tasks."""
         similar: list[dict[str, Any]] = []
 
-        for feedback_file in self.feedback_dir.glob("*.json"):
+        for task_id, feedback in await self.backend.scan(FEEDBACK_COLLECTION):
             try:
-                feedback = json.loads(feedback_file.read_text())
-
                 # Calculate similarity based on task characteristics
                 similarity = self._calculate_similarity(task, feedback)
 
@@ -108,8 +108,8 @@ class FeedbackLoop:
                     feedback["similarity"] = similarity
                     similar.append(feedback)
 
-            except (json.JSONDecodeError, KeyError) as e:
-                log.warning("invalid_feedback_file", file=str(feedback_file), error=str(e))
+            except (KeyError, AttributeError) as e:
+                log.warning("invalid_feedback", task_id=task_id, error=str(e))
                 continue
 
         # Sort by similarity (descending) and recency
@@ -238,9 +238,8 @@ Please implement this task following these learned best practices.
         average_review_score = 0.0
         total_review_score = 0.0
 
-        for feedback_file in self.feedback_dir.glob("*.json"):
+        for _, feedback in await self.backend.scan(FEEDBACK_COLLECTION):
             try:
-                feedback = json.loads(feedback_file.read_text())
                 total_executions += 1
 
                 if feedback.get("success"):
@@ -249,7 +248,7 @@ Please implement this task following these learned best practices.
                 review_score = feedback.get("review_score", 0.0)
                 total_review_score += review_score
 
-            except (json.JSONDecodeError, KeyError):
+            except (KeyError, TypeError):
                 continue
 
         if total_executions > 0:
@@ -262,6 +261,28 @@ Please implement this task following these learned best practices.
             "average_review_score": average_review_score,
         }
 
+    async def get_duration_estimates(self) -> dict[str, float]:
+        """
+        Get the recorded execution time of each successfully executed task.
+
+        Suitable as ``duration_estimates`` for ``TaskScheduler``.
+
+        Returns:
+            Mapping of task ID to execution time in seconds
+        """
+        estimates: dict[str, float] = {}
+
+        for task_id, feedback in await self.backend.scan(FEEDBACK_COLLECTION):
+            try:
+                execution_time = float(feedback["execution_time"])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            if feedback.get("success") and execution_time > 0:
+                estimates[feedback.get("task_id", task_id)] = execution_time
+
+        return estimates
+
     async def cleanup_old_feedback(self, max_age_days: int = 90) -> int:
         """
         Clean up feedback older than max_age_days.
@@ -276,16 +297,15 @@ Please implement this task following these learned best practices.
         deleted = 0
 
         async with self._lock:
-            for feedback_file in self.feedback_dir.glob("*.json"):
+            for task_id, feedback in await self.backend.scan(FEEDBACK_COLLECTION):
                 try:
-                    feedback = json.loads(feedback_file.read_text())
                     timestamp = datetime.fromisoformat(feedback["timestamp"])
 
                     if timestamp.timestamp() < cutoff:
-                        feedback_file.unlink()
+                        await self.backend.delete(FEEDBACK_COLLECTION, task_id)
                         deleted += 1
 
-                except (json.JSONDecodeError, KeyError, ValueError):
+                except (KeyError, TypeError, ValueError):
                     continue
 
         if deleted > 0:
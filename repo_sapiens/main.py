@@ -11,16 +11,22 @@ from repo_sapiens.cli.credentials import credentials_group
 from repo_sapiens.cli.health import health_check
 from repo_sapiens.cli.init import init_command
 from repo_sapiens.cli.mcp import mcp_group
+from repo_sapiens.cli.migrate import migrate_group
 from repo_sapiens.cli.process_label import process_label_command
+from repo_sapiens.cli.trace import trace_group
 from repo_sapiens.cli.update import update_command
+from repo_sapiens.cli.usage import usage_command
 from repo_sapiens.config.settings import AutomationSettings
 from repo_sapiens.engine.orchestrator import WorkflowOrchestrator
 from repo_sapiens.engine.state_manager import StateManager
 from repo_sapiens.enums import AgentType, ProviderType
 from repo_sapiens.exceptions import ConfigurationError, RepoSapiensError
+from repo_sapiens.monitoring.tracing import configure_from_settings, configure_tracing
+from repo_sapiens.monitoring.usage import configure_usage_from_settings
 from repo_sapiens.providers.base import AgentProvider
 from repo_sapiens.providers.external_agent import ExternalAgentProvider
 from repo_sapiens.providers.factory import create_git_provider
+from repo_sapiens.storage.factory import create_storage_backend
 from repo_sapiens.utils.interactive import InteractiveQAHandler
 from repo_sapiens.utils.logging_config import configure_logging
 
@@ -43,7 +49,7 @@ def cli(ctx: click.Context, config: str, log_level: str) -> None:
     # Skip config loading for commands that don't need it
     # (init creates the config, credentials manages credentials, update checks templates,
     # health-check handles its own config loading)
-    commands_without_config = ["init", "credentials", "update", "health-check", "mcp"]
+    commands_without_config = ["init", "credentials", "update", "health-check", "mcp", "trace", "usage"]
     if ctx.invoked_subcommand in commands_without_config:
         ctx.obj = {"settings": None}
         return
@@ -55,6 +61,7 @@ def cli(ctx: click.Context, config: str, log_level: str) -> None:
             try:
                 settings = AutomationSettings.from_yaml(str(config_path))
                 ctx.obj = {"settings": settings}
+                _configure_monitoring(ctx, settings)
                 return
             except Exception as e:
                 click.echo(
@@ -90,6 +97,14 @@ def cli(ctx: click.Context, config: str, log_level: str) -> None:
         sys.exit(1)
 
     ctx.obj = {"settings": settings}
+    _configure_monitoring(ctx, settings)
+
+
+def _configure_monitoring(ctx: click.Context, settings: AutomationSettings) -> None:
+    """Start recording spans and LLM usage as configured; spans are flushed when the command ends."""
+    configure_usage_from_settings(settings.usage)
+    if configure_from_settings(settings.tracing).enabled:
+        ctx.call_on_close(lambda: configure_tracing([]))
 
 
 @cli.command()
@@ -699,6 +714,15 @@ cli.add_command(update_command)
 # Add process-label command
 cli.add_command(process_label_command)
 
+# Add migrate command group
+cli.add_command(migrate_group)
+
+# Add trace command group
+cli.add_command(trace_group)
+
+# Add usage command
+cli.add_command(usage_command)
+
 
 async def _create_orchestrator(settings: AutomationSettings) -> WorkflowOrchestrator:
     """Create and initialize orchestrator.
@@ -764,7 +788,11 @@ async def _create_orchestrator(settings: AutomationSettings) -> WorkflowOrchestr
     else:
         raise ValueError(f"Unsupported provider type: {provider_type}")
 
-    state = StateManager(settings.state_dir)
+    state = StateManager(
+        settings.state_dir,
+        backend=create_storage_backend(settings, settings.state_dir),
+        flush_interval_ms=settings.workflow.state_flush_interval_ms,
+    )
 
     # Connect providers
     await git.connect()  # type: ignore[attr-defined]
@@ -811,7 +839,10 @@ async def _process_single_issue(
         # Inject custom system prompt into the issue context
         orchestrator.custom_system_prompt = custom_system_prompt
 
-    await orchestrator.process_issue(issue)
+    try:
+        await orchestrator.process_issue(issue)
+    finally:
+        await orchestrator.state.close()
 
     click.echo(f"✅ Issue #{issue_number} processed successfully")
 
@@ -830,7 +861,10 @@ async def _process_all_issues(
 
     orchestrator = await _create_orchestrator(settings)
 
-    await orchestrator.process_all_issues(tag)
+    try:
+        await orchestrator.process_all_issues(tag)
+    finally:
+        await orchestrator.state.close()
 
     click.echo("✅ All issues processed")
 
@@ -846,7 +880,10 @@ async def _process_plan(settings: AutomationSettings, plan_id: str) -> None:
 
     orchestrator = await _create_orchestrator(settings)
 
-    await orchestrator.process_plan(plan_id)
+    try:
+        await orchestrator.process_plan(plan_id)
+    finally:
+        await orchestrator.state.close()
 
     click.echo(f"✅ Plan {plan_id} processed successfully")
 
@@ -863,25 +900,28 @@ async def _daemon_mode(settings: AutomationSettings, interval: int) -> None:
 
     orchestrator = await _create_orchestrator(settings)
 
-    while True:
-        try:
-            click.echo("Polling for issues...")
-            await orchestrator.process_all_issues()
-            click.echo(f"Poll complete. Waiting {interval}s...")
+    try:
+        while True:
+            try:
+                click.echo("Polling for issues...")
+                await orchestrator.process_all_issues()
+                click.echo(f"Poll complete. Waiting {interval}s...")
 
-        except KeyboardInterrupt:
-            click.echo("\nShutting down daemon...")
-            break
+            except KeyboardInterrupt:
+                click.echo("\nShutting down daemon...")
+                break
 
-        except RepoSapiensError as e:
-            log.error("daemon_error", error=e.message, exc_info=True)
-            click.echo(f"Error: {e.message}", err=True)
+            except RepoSapiensError as e:
+                log.error("daemon_error", error=e.message, exc_info=True)
+                click.echo(f"Error: {e.message}", err=True)
 
-        except Exception as e:
-            log.error("daemon_error_unexpected", error=str(e), exc_info=True)
-            click.echo(f"Unexpected error: {e}", err=True)
+            except Exception as e:
+                log.error("daemon_error_unexpected", error=str(e), exc_info=True)
+                click.echo(f"Unexpected error: {e}", err=True)
 
-        await asyncio.sleep(interval)
+            await asyncio.sleep(interval)
+    finally:
+        await orchestrator.state.close()
 
 
 async def _list_active_plans(settings: AutomationSettings) -> None:
@@ -890,8 +930,11 @@ async def _list_active_plans(settings: AutomationSettings) -> None:
     Args:
         settings: Automation settings
     """
-    state = StateManager(settings.state_dir)
-    active_plans = await state.get_active_plans()
+    state = StateManager(settings.state_dir, backend=create_storage_backend(settings, settings.state_dir))
+    try:
+        active_plans = await state.list_plans(active_only=True)
+    finally:
+        await state.close()
 
     if not active_plans:
         click.echo("No active plans found.")
@@ -899,10 +942,11 @@ async def _list_active_plans(settings: AutomationSettings) -> None:
 
     click.echo(f"Active Plans ({len(active_plans)}):\n")
 
-    for plan_id in active_plans:
-        state_data = await state.load_state(plan_id)
-        status = state_data.get("status", "unknown")
-        click.echo(f"  • Plan {plan_id}: {status}")
+    for plan in active_plans:
+        tasks = f"{plan['tasks_completed']}/{plan['task_count']} tasks done"
+        if plan["tasks_failed"]:
+            tasks += f", {plan['tasks_failed']} failed"
+        click.echo(f"  • Plan {plan['plan_id']}: {plan['status']} ({tasks})")
 
 
 async def _show_plan_status(settings: AutomationSettings, plan_id: str) -> None:
@@ -912,13 +956,15 @@ async def _show_plan_status(settings: AutomationSettings, plan_id: str) -> None:
         settings: Automation settings
         plan_id: Plan identifier
     """
-    state = StateManager(settings.state_dir)
+    state = StateManager(settings.state_dir, backend=create_storage_backend(settings, settings.state_dir))
 
     try:
         state_data = await state.load_state(plan_id)
     except FileNotFoundError:
         click.echo(f"Plan {plan_id} not found.", err=True)
         return
+    finally:
+        await state.close()
 
     click.echo(f"\n📋 Plan {plan_id} Status\n")
     click.echo(f"Overall Status: {state_data.get('status', 'unknown')}")
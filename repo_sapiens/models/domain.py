@@ -406,6 +406,13 @@ class TaskResult:
     or responses to questions in the task.
     """
 
+    metadata: dict[str, Any] = field(default_factory=dict)
+    """Provider-specific execution details.
+
+    For example, the ReAct agent reports its file cache statistics under
+    ``file_cache``. Empty if the provider records nothing extra.
+    """
+
 
 @dataclass
 class Plan:
@@ -5,12 +5,19 @@ monitoring for the entire automation pipeline.
 
 Key Components:
     - MetricsCollector: Central metrics collection and aggregation
+    - MetricsAggregator: Dashboard views over the metrics registry and state
+      store, with 24 hours of per-minute time series in fixed-size rings
     - Dashboard: REST API and HTML dashboard for visualization
+    - Tracing: Nested spans per workflow run, written as JSONL and
+      optionally mirrored into OpenTelemetry (``sapiens trace show``)
+    - Usage: Tokens, cost and latency of every LLM call, attributed to
+      issue, plan, task and stage (``sapiens usage``)
     - Prometheus Integration: Direct Prometheus metrics export
 
 Metrics Tracked:
     - Workflow execution duration and success rates
     - Task execution times and failure rates
+    - LLM tokens, cost, time to first token and generation speed
     - API call latencies and error rates
     - Resource utilization
 
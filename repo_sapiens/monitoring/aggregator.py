@@ -0,0 +1,472 @@
+"""
+Aggregation of live metrics for the analytics dashboard.
+
+``MetricsAggregator`` answers the dashboard's questions from two sources:
+
+- The ``prometheus_client`` registry that ``monitoring.metrics`` records
+  into: totals come from the counters, averages from histogram sums and
+  counts, and latency percentiles per stage, task type and provider
+  method are interpolated from the histogram buckets, the way
+  Prometheus' ``histogram_quantile`` does.
+- The state store's plan index, for how many plans are in each status
+  and how many of their tasks are unfinished (optional).
+
+Counters only grow, so throughput over time is kept separately:
+``sample()`` adds each counter's increase since the previous sample to a
+``MinuteRing``, a fixed-size ring of per-minute buckets (24 hours by
+default). Memory stays constant however long the process runs, and
+reading a time series never touches more than one ring.
+"""
+
+import math
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+from prometheus_client import REGISTRY, CollectorRegistry
+
+from repo_sapiens.engine.state_manager import StateManager
+
+log = structlog.get_logger(__name__)
+
+# Minutes of history kept per time series
+DEFAULT_WINDOW_MINUTES = 24 * 60
+
+# Quantiles reported for every latency histogram
+PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+# Time series name -> (counter family, label filter)
+TRACKED_COUNTERS: dict[str, tuple[str, dict[str, str]]] = {
+    "workflows": ("automation_workflow_executions", {}),
+    "workflow_failures": ("automation_workflow_executions", {"status": "failed"}),
+    "tasks": ("automation_task_executions", {}),
+    "api_calls": ("automation_api_calls", {}),
+    "api_errors": ("automation_api_calls", {"status": "error"}),
+    "cache_hits": ("automation_cache_hits", {}),
+    "cache_misses": ("automation_cache_misses", {}),
+    "errors": ("automation_errors", {}),
+}
+
+
+class MinuteRing:
+    """Per-minute totals over a fixed window, stored in a ring of buckets.
+
+    Each slot remembers which minute it holds; a slot still holding a
+    minute that has left the window is reset when it is next written and
+    skipped when read.
+
+    Attributes:
+        minutes: Length of the window in minutes
+
+    Example:
+        >>> ring = MinuteRing(minutes=60)
+        >>> ring.add(3)
+        >>> ring.total(minutes=5)
+        3.0
+        >>> ring.series(step_minutes=15)[-1]
+        (1718553600.0, 3.0)
+    """
+
+    def __init__(self, minutes: int = DEFAULT_WINDOW_MINUTES, clock: Callable[[], float] = time.time) -> None:
+        """Initialize an empty ring.
+
+        Args:
+            minutes: Length of the window in minutes
+            clock: Unix time source
+        """
+        self.minutes = minutes
+        self._clock = clock
+        self._slot_minute = [-1] * minutes
+        self._values = [0.0] * minutes
+
+    def add(self, value: float = 1.0) -> None:
+        """Add a value to the current minute's bucket.
+
+        Args:
+            value: Amount to add
+        """
+        minute = int(self._clock() // 60)
+        slot = minute % self.minutes
+        if self._slot_minute[slot] != minute:
+            self._slot_minute[slot] = minute
+            self._values[slot] = 0.0
+        self._values[slot] += value
+
+    def total(self, minutes: int | None = None) -> float:
+        """Sum of the buckets in the last ``minutes`` minutes (the whole window by default)."""
+        return sum(value for _, value in self._buckets(minutes or self.minutes))
+
+    def series(self, step_minutes: int = 60) -> list[tuple[float, float]]:
+        """Totals over the window in steps of ``step_minutes``, oldest first.
+
+        Args:
+            step_minutes: Width of each returned point in minutes
+
+        Returns:
+            List of (step start as Unix time, total) covering the whole
+            window, including empty steps
+        """
+        step_minutes = max(1, step_minutes)
+        now = int(self._clock() // 60)
+        first = (now - self.minutes + 1) // step_minutes * step_minutes
+        totals = dict.fromkeys(range(first, now + 1, step_minutes), 0.0)
+        for minute, value in self._buckets(self.minutes):
+            totals[minute // step_minutes * step_minutes] += value
+        return [(float(start * 60), value) for start, value in totals.items()]
+
+    def _buckets(self, minutes: int) -> Iterable[tuple[int, float]]:
+        now = int(self._clock() // 60)
+        oldest = now - min(minutes, self.minutes) + 1
+        for minute, value in zip(self._slot_minute, self._values, strict=True):
+            if oldest <= minute <= now:
+                yield minute, value
+
+
+class MetricsAggregator:
+    """Dashboard views over the metrics registry, the state store and rolling counters.
+
+    Attributes:
+        registry: Prometheus registry to read
+        state_manager: State store for plan statuses (None to leave them out)
+        series: Time series by name, one MinuteRing each
+
+    Example:
+        >>> aggregator = MetricsAggregator(state_manager=StateManager(".sapiens/state"))
+        >>> aggregator.sample()
+        >>> aggregator.summary()["success_rate"]
+        0.92
+        >>> aggregator.series["api_calls"].total(minutes=60)
+        412.0
+    """
+
+    def __init__(
+        self,
+        registry: CollectorRegistry = REGISTRY,
+        state_manager: StateManager | None = None,
+        window_minutes: int = DEFAULT_WINDOW_MINUTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            registry: Prometheus registry to read
+            state_manager: State store for plan statuses
+            window_minutes: Minutes of history kept per time series
+            clock: Unix time source
+        """
+        self.registry = registry
+        self.state_manager = state_manager
+        self.series = {name: MinuteRing(window_minutes, clock) for name in TRACKED_COUNTERS}
+        # Counter totals seen by the previous sample; None until the first one
+        self._last_totals: dict[str, float] | None = None
+
+    def sample(self) -> None:
+        """Add each tracked counter's increase since the last sample to its time series.
+
+        The first sample only sets the baseline, so counts recorded before
+        the aggregator existed aren't attributed to the current minute.
+        """
+        families = self._collect()
+        totals = {
+            name: _counter_total(families, family, **labels) for name, (family, labels) in TRACKED_COUNTERS.items()
+        }
+        if self._last_totals is not None:
+            for name, total in totals.items():
+                # A registry reset makes counters go down; count from zero again
+                increase = total - self._last_totals[name]
+                self.series[name].add(increase if increase >= 0 else total)
+        self._last_totals = totals
+
+    def summary(self) -> dict[str, Any]:
+        """Headline numbers for the dashboard cards."""
+        families = self._collect()
+        total_workflows = _counter_total(families, "automation_workflow_executions")
+        succeeded = _counter_total(families, "automation_workflow_executions", status="success")
+        hits = _counter_total(families, "automation_cache_hits")
+        misses = _counter_total(families, "automation_cache_misses")
+        duration = _histograms(families, "automation_workflow_duration_seconds", ())[()]
+
+        return {
+            "active_workflows": int(_gauge_value(families, "automation_active_workflows")),
+            "success_rate": _ratio(succeeded, total_workflows),
+            "avg_duration": _ratio(duration.sum, duration.count),
+            "cache_hit_rate": _ratio(hits, hits + misses),
+            "total_workflows": int(total_workflows),
+            "total_tasks": int(_counter_total(families, "automation_task_executions")),
+            "workflows_last_hour": self.series["workflows"].total(minutes=60),
+        }
+
+    async def workflows(self, step_minutes: int = 60) -> dict[str, Any]:
+        """Workflow throughput, outcomes and latency by stage.
+
+        Args:
+            step_minutes: Width of each timeline point in minutes
+        """
+        families = self._collect()
+        by_stage: dict[str, dict[str, int]] = defaultdict(dict)
+        for labels, value in _counter_samples(families, "automation_workflow_executions"):
+            by_stage[labels["stage"]][labels["status"]] = int(value)
+
+        durations = _histograms(families, "automation_workflow_duration_seconds", ("stage",))
+        by_status: dict[str, int] = defaultdict(int)
+        if self.state_manager is not None:
+            for plan in await self.state_manager.list_plans():
+                by_status[plan["status"]] += 1
+
+        return {
+            "timeline": _timeline(self.series["workflows"], step_minutes),
+            "by_stage": dict(by_stage),
+            "by_status": dict(by_status),
+            "average_duration": {stage: _ratio(h.sum, h.count) for (stage,), h in durations.items()},
+            "latency_percentiles": {stage: h.percentiles() for (stage,), h in durations.items()},
+        }
+
+    async def tasks(self) -> dict[str, Any]:
+        """Task outcomes and duration by task type."""
+        families = self._collect()
+        by_type: dict[str, dict[str, Any]] = defaultdict(lambda: {"count": 0})
+        for labels, value in _counter_samples(families, "automation_task_executions"):
+            by_type[labels["task_type"]]["count"] += int(value)
+            by_type[labels["task_type"]][labels["status"]] = int(value)
+        durations = _histograms(families, "automation_task_duration_seconds", ("task_type",))
+        for (task_type,), histogram in durations.items():
+            by_type[task_type]["avg_duration"] = _ratio(histogram.sum, histogram.count)
+            by_type[task_type]["latency_percentiles"] = histogram.percentiles()
+
+        in_progress = 0
+        if self.state_manager is not None:
+            for plan in await self.state_manager.list_plans(active_only=True):
+                in_progress += plan["task_count"] - plan["tasks_completed"] - plan["tasks_failed"]
+
+        overall = _histograms(families, "automation_task_duration_seconds", ())[()]
+        return {
+            "total_tasks": int(_counter_total(families, "automation_task_executions")),
+            "completed": int(_counter_total(families, "automation_task_executions", status="success")),
+            "failed": int(_counter_total(families, "automation_task_executions", status="failed")),
+            "in_progress": in_progress,
+            "average_duration": _ratio(overall.sum, overall.count),
+            "by_type": dict(by_type),
+            "timeline": _timeline(self.series["tasks"], 60),
+        }
+
+    def performance(self) -> dict[str, Any]:
+        """Cache effectiveness, API call latency and parallel execution."""
+        families = self._collect()
+
+        by_cache: dict[str, dict[str, Any]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+        for labels, value in _counter_samples(families, "automation_cache_hits"):
+            by_cache[labels["cache_name"]]["hits"] = int(value)
+        for labels, value in _counter_samples(families, "automation_cache_misses"):
+            by_cache[labels["cache_name"]]["misses"] = int(value)
+        for stats in by_cache.values():
+            stats["hit_rate"] = _ratio(stats["hits"], stats["hits"] + stats["misses"])
+        hits = sum(stats["hits"] for stats in by_cache.values())
+        misses = sum(stats["misses"] for stats in by_cache.values())
+
+        calls = _histograms(families, "automation_api_call_duration_seconds", ("provider", "method"))
+        by_provider: dict[str, dict[str, float]] = defaultdict(lambda: {"count": 0, "total_duration": 0.0})
+        by_method: dict[str, dict[str, Any]] = {}
+        for (provider, method), histogram in calls.items():
+            by_provider[provider]["count"] += histogram.count
+            by_provider[provider]["total_duration"] += histogram.sum
+            by_method[f"{provider}.{method}"] = {
+                "count": int(histogram.count),
+                "avg_duration": _ratio(histogram.sum, histogram.count),
+                "latency_percentiles": histogram.percentiles(),
+            }
+        overall_calls = _histograms(families, "automation_api_call_duration_seconds", ())[()]
+
+        parallelism = _histograms(families, "automation_task_parallelism", ())[()]
+        utilization = _histograms(families, "automation_task_slot_utilization_ratio", ())[()]
+
+        return {
+            "cache_stats": {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": _ratio(hits, hits + misses),
+                "total_requests": hits + misses,
+                "by_cache": dict(by_cache),
+                "hit_rate_last_hour": _ratio(
+                    self.series["cache_hits"].total(60),
+                    self.series["cache_hits"].total(60) + self.series["cache_misses"].total(60),
+                ),
+            },
+            "api_calls": {
+                "total": int(_counter_total(families, "automation_api_calls")),
+                "errors": int(_counter_total(families, "automation_api_calls", status="error")),
+                "average_duration": _ratio(overall_calls.sum, overall_calls.count),
+                "by_provider": {
+                    provider: {
+                        "count": int(stats["count"]),
+                        "avg_duration": _ratio(stats["total_duration"], stats["count"]),
+                    }
+                    for provider, stats in by_provider.items()
+                },
+                "by_method": by_method,
+                "rate_limit_remaining": {
+                    labels["provider"]: int(value)
+                    for labels, value in _samples(
+                        families, "automation_rate_limit_remaining", "automation_rate_limit_remaining"
+                    )
+                },
+            },
+            "parallel_execution": {
+                "runs": int(parallelism.count),
+                "average_concurrency": _ratio(parallelism.sum, parallelism.count),
+                "slot_utilization": _ratio(utilization.sum, utilization.count),
+            },
+        }
+
+    def costs(self) -> dict[str, Any]:
+        """Estimated cost per component and token usage."""
+        families = self._collect()
+        by_component = {
+            labels["component"]: value
+            for labels, value in _samples(
+                families, "automation_estimated_cost_dollars", "automation_estimated_cost_dollars"
+            )
+        }
+        by_operation: dict[str, int] = defaultdict(int)
+        by_model_tokens: dict[str, int] = defaultdict(int)
+        for labels, value in _counter_samples(families, "automation_token_usage"):
+            by_operation[labels["operation"]] += int(value)
+            by_model_tokens[labels["model"]] += int(value)
+        by_kind: dict[str, int] = defaultdict(int)
+        for labels, value in _counter_samples(families, "automation_llm_tokens"):
+            by_kind[labels["kind"]] += int(value)
+
+        # Latency, time to first token and generation speed per model
+        llm: dict[str, dict[str, Any]] = {}
+        for (model,), histogram in _histograms(families, "automation_llm_call_duration_seconds", ("model",)).items():
+            llm[model] = {
+                "calls": int(histogram.count),
+                "avg_latency": _ratio(histogram.sum, histogram.count),
+                "latency_percentiles": histogram.percentiles(),
+                "avg_time_to_first_token": 0.0,
+                "avg_tokens_per_second": 0.0,
+            }
+        for family, key in (
+            ("automation_llm_time_to_first_token_seconds", "avg_time_to_first_token"),
+            ("automation_llm_tokens_per_second", "avg_tokens_per_second"),
+        ):
+            for (model,), histogram in _histograms(families, family, ("model",)).items():
+                if model in llm:
+                    llm[model][key] = _ratio(histogram.sum, histogram.count)
+
+        return {
+            "total_estimated_cost": sum(by_component.values()),
+            "by_component": by_component,
+            # Priced from the tokens each model reported (local models cost nothing)
+            "by_model": {
+                labels["model"]: value for labels, value in _counter_samples(families, "automation_llm_cost_dollars")
+            },
+            "token_usage": {
+                "total_tokens": sum(by_operation.values()),
+                "by_operation": dict(by_operation),
+                "by_model": dict(by_model_tokens),
+                "by_kind": dict(by_kind),
+            },
+            "llm": llm,
+        }
+
+    def timeseries(self, name: str, step_minutes: int = 60) -> list[dict[str, Any]]:
+        """One tracked time series as timeline points.
+
+        Args:
+            name: Series name (a key of TRACKED_COUNTERS)
+            step_minutes: Width of each point in minutes
+
+        Raises:
+            KeyError: If the series isn't tracked
+        """
+        return _timeline(self.series[name], step_minutes)
+
+    def _collect(self) -> dict[str, list[Any]]:
+        """Current samples of every metric family, by family name."""
+        return {family.name: family.samples for family in self.registry.collect()}
+
+
+class _Histogram:
+    """Cumulative bucket counts of one histogram series."""
+
+    def __init__(self) -> None:
+        self.buckets: dict[float, float] = {}
+        self.count = 0.0
+        self.sum = 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside its bucket."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        lower_bound, lower_count = 0.0, 0.0
+        for bound, cumulative in sorted(self.buckets.items()):
+            if cumulative >= rank:
+                if math.isinf(bound):
+                    # Past the largest finite bucket; it's the best estimate available
+                    return lower_bound
+                if cumulative == lower_count:
+                    return bound
+                return lower_bound + (bound - lower_bound) * (rank - lower_count) / (cumulative - lower_count)
+            lower_bound, lower_count = bound, cumulative
+        return lower_bound
+
+    def percentiles(self) -> dict[str, float]:
+        return {name: round(self.quantile(q), 3) for name, q in PERCENTILES.items()}
+
+
+def _samples(families: dict[str, list[Any]], family: str, sample_name: str) -> Iterable[tuple[dict[str, str], float]]:
+    for sample in families.get(family, []):
+        if sample.name == sample_name:
+            yield sample.labels, sample.value
+
+
+def _counter_samples(families: dict[str, list[Any]], family: str) -> Iterable[tuple[dict[str, str], float]]:
+    return _samples(families, family, f"{family}_total")
+
+
+def _counter_total(families: dict[str, list[Any]], family: str, **match: str) -> float:
+    return sum(
+        value
+        for labels, value in _counter_samples(families, family)
+        if all(labels.get(key) == expected for key, expected in match.items())
+    )
+
+
+def _gauge_value(families: dict[str, list[Any]], family: str) -> float:
+    return sum(value for _, value in _samples(families, family, family))
+
+
+def _histograms(families: dict[str, list[Any]], family: str, by: tuple[str, ...]) -> dict[tuple[str, ...], _Histogram]:
+    """Histogram series of a family, merged by the ``by`` labels.
+
+    With ``by=()`` everything is merged into one histogram under the
+    empty key, which is present even when nothing was observed.
+    """
+    series: dict[tuple[str, ...], _Histogram] = defaultdict(_Histogram)
+    for sample in families.get(family, []):
+        key = tuple(sample.labels.get(label, "") for label in by)
+        if sample.name == f"{family}_bucket":
+            bound = float(sample.labels["le"])
+            series[key].buckets[bound] = series[key].buckets.get(bound, 0.0) + sample.value
+        elif sample.name == f"{family}_count":
+            series[key].count += sample.value
+        elif sample.name == f"{family}_sum":
+            series[key].sum += sample.value
+    if not by:
+        series.setdefault((), _Histogram())
+    return dict(series)
+
+
+def _timeline(ring: MinuteRing, step_minutes: int) -> list[dict[str, Any]]:
+    return [
+        {"timestamp": datetime.fromtimestamp(start, UTC).isoformat(), "count": value}
+        for start, value in ring.series(step_minutes)
+    ]
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator else 0.0
@@ -1,21 +1,104 @@
 """
 Analytics dashboard for monitoring automation system.
 Provides REST API and HTML dashboard for metrics visualization.
+
+The API is served by a module-level ``MetricsAggregator`` reading this
+process's metrics registry, so the dashboard is normally mounted in the
+process doing the work: the webhook server serves it under ``/dashboard``.
+``start_dashboard()`` gives the aggregator a StateManager built from the
+automation settings, so plan statuses come from the shared state store,
+and starts sampling the rolling time series once a minute (they are also
+sampled on every request). Run standalone, the app does the same from
+``CONFIG_PATH`` on startup.
 """
 
-from datetime import UTC, datetime, timedelta
+import asyncio
+import contextlib
+from datetime import UTC, datetime
 from typing import Any
 
 import structlog
-from fastapi import FastAPI, Response
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.responses import HTMLResponse
 
+from repo_sapiens.config.settings import AutomationSettings
+from repo_sapiens.engine.state_manager import StateManager
+from repo_sapiens.exceptions import ConfigurationError
+from repo_sapiens.monitoring.aggregator import DEFAULT_WINDOW_MINUTES, MetricsAggregator
 from repo_sapiens.monitoring.metrics import MetricsCollector
+from repo_sapiens.storage.factory import create_storage_backend
 
 log = structlog.get_logger(__name__)
 
 app = FastAPI(title="Automation Analytics Dashboard", version="0.4.0")
 
+aggregator = MetricsAggregator()
+
+# Automation settings read when the dashboard runs standalone
+CONFIG_PATH = "repo_sapiens/config/automation_config.yaml"
+
+# Seconds between background samples of the rolling time series
+SAMPLE_INTERVAL_SECONDS = 60.0
+
+_sampler: asyncio.Task[None] | None = None
+
+
+async def _sample_periodically() -> None:
+    while True:
+        aggregator.sample()
+        await asyncio.sleep(SAMPLE_INTERVAL_SECONDS)
+
+
+async def start_dashboard(settings: AutomationSettings | None = None) -> None:
+    """Attach the state store and start sampling the rolling time series.
+
+    Called by the app's own startup hook when run standalone, and by the
+    webhook server, whose startup hooks are the only ones that run for a
+    mounted app.
+
+    Args:
+        settings: Automation settings locating the state store. Plan
+            statuses are left out if None.
+    """
+    global _sampler
+    if settings is not None and aggregator.state_manager is None:
+        aggregator.state_manager = StateManager(
+            settings.state_dir, backend=create_storage_backend(settings, settings.state_dir)
+        )
+    if _sampler is None:
+        _sampler = asyncio.create_task(_sample_periodically())
+    log.info("dashboard_started", interval=SAMPLE_INTERVAL_SECONDS, plans=aggregator.state_manager is not None)
+
+
+async def stop_dashboard() -> None:
+    """Stop the background sampler and close the state store."""
+    global _sampler
+    if _sampler is not None:
+        _sampler.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _sampler
+        _sampler = None
+    if aggregator.state_manager is not None:
+        await aggregator.state_manager.close()
+        aggregator.state_manager = None
+
+
+@app.on_event("startup")
+async def startup() -> None:
+    """Load the automation settings and start the dashboard."""
+    try:
+        settings = AutomationSettings.from_yaml(CONFIG_PATH)
+    except (ConfigurationError, ValueError) as e:
+        log.warning("dashboard_settings_unavailable", path=CONFIG_PATH, error=str(e))
+        settings = None
+    await start_dashboard(settings)
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """Stop the dashboard."""
+    await stop_dashboard()
+
 
 @app.get("/", response_class=HTMLResponse)
 async def dashboard() -> str:
@@ -125,7 +208,7 @@ async def dashboard() -> str:
             // Fetch and update metrics
             async function updateMetrics() {
                 try {
-                    const response = await fetch('/api/metrics/summary');
+                    const response = await fetch('api/metrics/summary');
                     const data = await response.json();
 
                     document.getElementById('active-workflows').textContent =
@@ -144,7 +227,7 @@ async def dashboard() -> str:
             // Update charts
             async function updateCharts() {
                 try {
-                    const response = await fetch('/api/metrics/workflows');
+                    const response = await fetch('api/metrics/workflows');
                     const data = await response.json();
 
                     // Workflow timeline
@@ -217,129 +300,46 @@ async def dashboard() -> str:
 @app.get("/api/metrics/summary")
 async def metrics_summary() -> dict[str, Any]:
     """Get summary metrics."""
-    # In a real implementation, would fetch from Prometheus or internal state
-    return {
-        "active_workflows": 3,
-        "success_rate": 0.85,
-        "avg_duration": 45.2,
-        "cache_hit_rate": 0.72,
-        "total_workflows": 150,
-        "total_tasks": 450,
-    }
+    aggregator.sample()
+    return aggregator.summary()
 
 
 @app.get("/api/metrics/workflows")
-async def workflow_metrics() -> dict[str, Any]:
+async def workflow_metrics(step_minutes: int = Query(60, ge=1, le=DEFAULT_WINDOW_MINUTES)) -> dict[str, Any]:
     """Get detailed workflow metrics."""
-    # Mock data - in production would query actual metrics
-    now = datetime.now(UTC)
-
-    timeline = [
-        {
-            "timestamp": (now - timedelta(hours=i)).isoformat(),
-            "count": 5 + (i % 3),
-        }
-        for i in range(24, 0, -1)
-    ]
-
-    by_stage = {
-        "planning": {"success": 45, "failed": 3},
-        "implementation": {"success": 42, "failed": 5},
-        "code_review": {"success": 40, "failed": 2},
-        "merge": {"success": 38, "failed": 1},
-    }
-
-    by_status = {
-        "completed": 38,
-        "in_progress": 3,
-        "failed": 6,
-        "pending": 2,
-    }
-
-    average_duration = {
-        "planning": 120.5,
-        "implementation": 450.2,
-        "code_review": 180.3,
-        "merge": 60.1,
-    }
-
-    return {
-        "timeline": timeline,
-        "by_stage": by_stage,
-        "by_status": by_status,
-        "average_duration": average_duration,
-    }
+    aggregator.sample()
+    return await aggregator.workflows(step_minutes=step_minutes)
 
 
 @app.get("/api/metrics/tasks")
 async def task_metrics() -> dict[str, Any]:
     """Get task execution metrics."""
-    return {
-        "total_tasks": 450,
-        "completed": 410,
-        "failed": 25,
-        "in_progress": 15,
-        "average_duration": 380.5,
-        "by_type": {
-            "feature": {"count": 200, "avg_duration": 420.0},
-            "bugfix": {"count": 150, "avg_duration": 280.0},
-            "refactor": {"count": 100, "avg_duration": 450.0},
-        },
-    }
+    aggregator.sample()
+    return await aggregator.tasks()
 
 
 @app.get("/api/metrics/performance")
 async def performance_metrics() -> dict[str, Any]:
     """Get performance metrics."""
-    return {
-        "cache_stats": {
-            "hits": 5420,
-            "misses": 1580,
-            "hit_rate": 0.774,
-            "total_requests": 7000,
-        },
-        "api_calls": {
-            "total": 2500,
-            "average_duration": 1.2,
-            "by_provider": {
-                "gitea": {"count": 1500, "avg_duration": 0.8},
-                "claude": {"count": 1000, "avg_duration": 2.1},
-            },
-        },
-        "parallel_execution": {
-            "max_workers": 3,
-            "average_concurrency": 2.3,
-            "total_task_time": 15000,
-            "wall_clock_time": 6500,
-            "efficiency": 0.769,
-        },
-    }
+    aggregator.sample()
+    return aggregator.performance()
 
 
 @app.get("/api/metrics/costs")
 async def cost_metrics() -> dict[str, Any]:
     """Get cost metrics."""
-    return {
-        "total_estimated_cost": 45.50,
-        "by_component": {
-            "planning": 5.20,
-            "implementation": 35.10,
-            "review": 5.20,
-        },
-        "by_model": {
-            "claude-haiku-3.5": 2.50,
-            "claude-sonnet-4.5": 28.00,
-            "claude-opus-4.5": 15.00,
-        },
-        "token_usage": {
-            "total_tokens": 1500000,
-            "by_operation": {
-                "planning": 200000,
-                "implementation": 1000000,
-                "review": 300000,
-            },
-        },
-    }
+    return aggregator.costs()
+
+
+@app.get("/api/metrics/timeseries/{name}")
+async def timeseries_metrics(
+    name: str, step_minutes: int = Query(60, ge=1, le=DEFAULT_WINDOW_MINUTES)
+) -> dict[str, Any]:
+    """Get one rolling time series (e.g. api_calls, cache_hits)."""
+    if name not in aggregator.series:
+        raise HTTPException(status_code=404, detail=f"Unknown series: {name}")
+    aggregator.sample()
+    return {"name": name, "step_minutes": step_minutes, "points": aggregator.timeseries(name, step_minutes)}
 
 
 @app.get("/api/health")
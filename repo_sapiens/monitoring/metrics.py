@@ -39,6 +39,12 @@ api_call_duration = Histogram(
     buckets=(0.1, 0.5, 1, 2, 5, 10, 30),
 )
 
+rate_limit_remaining = Gauge(
+    "automation_rate_limit_remaining",
+    "Requests left in the provider's current rate-limit window",
+    ["provider"],
+)
+
 # Task metrics
 task_executions = Counter(
     "automation_task_executions_total",
@@ -53,6 +59,18 @@ task_duration = Histogram(
     buckets=(10, 30, 60, 120, 300, 600, 1800, 3600),
 )
 
+task_parallelism = Histogram(
+    "automation_task_parallelism",
+    "Average number of plan tasks running at once during parallel execution",
+    buckets=(1, 1.5, 2, 3, 4, 6, 8, 12, 16),
+)
+
+task_slot_utilization = Histogram(
+    "automation_task_slot_utilization_ratio",
+    "Share of a parallel execution each worker slot spent running a task",
+    buckets=(0.1, 0.25, 0.5, 0.75, 0.9, 1.0),
+)
+
 # Error metrics
 errors_total = Counter("automation_errors_total", "Total errors", ["error_type", "stage"])
 
@@ -72,6 +90,32 @@ estimated_cost = Gauge("automation_estimated_cost_dollars", "Estimated cost in d
 
 token_usage = Counter("automation_token_usage_total", "Total tokens used", ["model", "operation"])
 
+# LLM call metrics (kind is "prompt" or "completion"; operation is the workflow stage)
+llm_tokens = Counter("automation_llm_tokens_total", "LLM tokens by kind", ["model", "operation", "kind"])
+
+llm_call_duration = Histogram(
+    "automation_llm_call_duration_seconds",
+    "LLM call latency",
+    ["model", "operation"],
+    buckets=(0.5, 1, 2, 5, 10, 30, 60, 120, 300, 600),
+)
+
+llm_time_to_first_token = Histogram(
+    "automation_llm_time_to_first_token_seconds",
+    "Seconds until an LLM started generating",
+    ["model"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+
+llm_tokens_per_second = Histogram(
+    "automation_llm_tokens_per_second",
+    "LLM generation speed in completion tokens per second",
+    ["model"],
+    buckets=(5, 10, 20, 40, 80, 160, 320),
+)
+
+llm_cost = Counter("automation_llm_cost_dollars_total", "Priced cost of LLM calls in dollars", ["model"])
+
 # System info
 system_info = Info("automation_system", "Automation system information")
 
@@ -90,11 +134,23 @@ class MetricsCollector:
         """Record API call."""
         api_calls.labels(provider=provider, method=method, status=status).inc()
 
+    @staticmethod
+    def update_rate_limit_remaining(provider: str, remaining: int) -> None:
+        """Update remaining rate-limit budget."""
+        rate_limit_remaining.labels(provider=provider).set(remaining)
+
     @staticmethod
     def record_task_execution(task_type: str, status: str) -> None:
         """Record task execution."""
         task_executions.labels(task_type=task_type, status=status).inc()
 
+    @staticmethod
+    def record_task_parallelism(parallelism: float, slot_utilization: list[float]) -> None:
+        """Record achieved parallelism and per-slot utilization of a task run."""
+        task_parallelism.observe(parallelism)
+        for utilization in slot_utilization:
+            task_slot_utilization.observe(utilization)
+
     @staticmethod
     def record_error(error_type: str, stage: str) -> None:
         """Record error occurrence."""
@@ -131,6 +187,29 @@ class MetricsCollector:
         """Record token usage."""
         token_usage.labels(model=model, operation=operation).inc(tokens)
 
+    @staticmethod
+    def record_llm_call(
+        model: str,
+        operation: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        duration: float,
+        time_to_first_token: float | None = None,
+        tokens_per_second: float | None = None,
+        cost: float = 0.0,
+    ) -> None:
+        """Record the usage and timing of one LLM call."""
+        token_usage.labels(model=model, operation=operation).inc(prompt_tokens + completion_tokens)
+        llm_tokens.labels(model=model, operation=operation, kind="prompt").inc(prompt_tokens)
+        llm_tokens.labels(model=model, operation=operation, kind="completion").inc(completion_tokens)
+        llm_call_duration.labels(model=model, operation=operation).observe(duration)
+        if time_to_first_token is not None:
+            llm_time_to_first_token.labels(model=model).observe(time_to_first_token)
+        if tokens_per_second is not None:
+            llm_tokens_per_second.labels(model=model).observe(tokens_per_second)
+        if cost:
+            llm_cost.labels(model=model).inc(cost)
+
     @staticmethod
     def set_system_info(**kwargs: Any) -> None:
         """Set system information."""
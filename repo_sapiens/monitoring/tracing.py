@@ -0,0 +1,468 @@
+"""
+Lightweight tracing of where workflow runs spend their time.
+
+Aggregate histograms say how long stages take on average; a trace says
+where the time went on one run. ``span()`` opens a timed span nested
+under whichever span is current in the running task, so one issue
+produces a tree::
+
+    process_issue issue=812
+    └── ImplementationStage.execute
+        ├── GitHubAsyncProvider.get_issue
+        ├── ExternalAgentProvider.execute_task
+        │   └── agent.subprocess command=claude
+        └── GitHubAsyncProvider.create_pull_request
+
+Spans are instrumented in a few places that cover everything beneath
+them: ``WorkflowStage``, ``GitProvider``, ``AgentProvider`` and
+``LLMBackend`` wrap their subclasses' methods with ``instrument_methods()``
+when the subclass is defined, and tool executions and agent subprocesses
+open spans directly.
+
+Spans go to exporters. ``JSONLSpanExporter`` appends finished spans to a
+file per day for offline use (``sapiens trace show``);
+``OpenTelemetryExporter`` mirrors them into the OpenTelemetry API when it
+is installed, for whichever SDK and exporter the process has configured.
+With no exporter configured, ``span()`` does nothing beyond a check.
+
+While a span is open its trace and span IDs are bound to structlog's
+context variables, so every log line can be joined to its trace.
+"""
+
+import contextlib
+import functools
+import inspect
+import json
+import secrets
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+import structlog
+
+try:
+    from opentelemetry import trace as otel_trace
+
+    OPENTELEMETRY_AVAILABLE = True
+except ImportError:
+    OPENTELEMETRY_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from repo_sapiens.config.settings import TracingConfig
+
+log = structlog.get_logger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Spans buffered by the JSONL exporter before a write, unless a trace ends first
+_FLUSH_EVERY = 256
+
+_current_span: ContextVar["Span | None"] = ContextVar("repo_sapiens_current_span", default=None)
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace.
+
+    Attributes:
+        name: Operation name, e.g. "GitHubAsyncProvider.get_issue"
+        trace_id: 32 hex digits shared by every span of the trace
+        span_id: 16 hex digits identifying this span
+        parent_id: span_id of the enclosing span (None for a trace's root)
+        start: Unix time the span started
+        end: Unix time the span ended (None while open)
+        attributes: Details such as the issue number or tool name
+        status: "ok", or "error" if the operation raised
+        error: Exception type and message when status is "error"
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start: float
+    end: float | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    error: str | None = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds from start to end (to now while the span is open)."""
+        return (self.end if self.end is not None else time.time()) - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Record a detail learned while the span is open."""
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form, as written by JSONLSpanExporter."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Span":
+        """Rebuild a span from to_dict() output."""
+        return cls(**data)
+
+
+class SpanExporter:
+    """Receives spans as they start and end; the base class ignores both."""
+
+    def on_start(self, span: Span) -> None:
+        """Called when a span opens."""
+
+    def on_end(self, span: Span) -> None:
+        """Called when a span closes."""
+
+    def shutdown(self) -> None:
+        """Flush anything buffered; called when tracing is reconfigured or the process exits."""
+
+
+class JSONLSpanExporter(SpanExporter):
+    """Append finished spans to one JSON Lines file per UTC day.
+
+    Spans are buffered and written when a trace's root span ends (or the
+    buffer fills), so a run costs a handful of appends. Files older than
+    ``retention_days`` are deleted when the exporter is created.
+
+    Attributes:
+        directory: Directory holding the ``YYYY-MM-DD.jsonl`` files
+        retention_days: Days of files kept
+
+    Example:
+        >>> configure_tracing([JSONLSpanExporter(Path(".sapiens/traces"))])
+        >>> with span("process_issue", issue=812):
+        ...     ...
+        >>> read_spans(Path(".sapiens/traces"))[-1].name
+        'process_issue'
+    """
+
+    def __init__(self, directory: Path, retention_days: int = 7) -> None:
+        """Initialize the exporter and prune expired files.
+
+        Args:
+            directory: Directory for the trace files (created on first write)
+            retention_days: Days of files kept
+        """
+        self.directory = Path(directory)
+        self.retention_days = retention_days
+        self._buffer: list[Span] = []
+        self._lock = threading.Lock()
+        self._prune()
+
+    def on_end(self, span: Span) -> None:
+        """Buffer the span; write the buffer if a trace just ended."""
+        with self._lock:
+            self._buffer.append(span)
+            if span.parent_id is None or len(self._buffer) >= _FLUSH_EVERY:
+                self._flush()
+
+    def shutdown(self) -> None:
+        """Write any buffered spans."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        by_day: dict[str, list[str]] = {}
+        for finished in self._buffer:
+            day = datetime.fromtimestamp(finished.end or finished.start, UTC).date().isoformat()
+            by_day.setdefault(day, []).append(json.dumps(finished.to_dict(), default=str))
+        self._buffer.clear()
+        if by_day:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        for day, lines in by_day.items():
+            with open(self.directory / f"{day}.jsonl", "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+    def _prune(self) -> None:
+        cutoff = (datetime.now(UTC) - timedelta(days=self.retention_days)).date().isoformat()
+        for path in self.directory.glob("*.jsonl"):
+            if path.stem < cutoff:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+
+
+class OpenTelemetryExporter(SpanExporter):
+    """Mirror spans into the OpenTelemetry API.
+
+    Each span is started on an OpenTelemetry tracer when it opens, as a
+    child of its parent's mirror, and ended with the same timestamps when
+    it closes. Where the spans go is up to the process's OpenTelemetry
+    SDK configuration; without an SDK the API discards them.
+
+    Raises:
+        ImportError: If opentelemetry-api is not installed
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        """Initialize the exporter.
+
+        Args:
+            tracer: OpenTelemetry tracer (default: the global provider's "repo_sapiens" tracer)
+        """
+        if tracer is None:
+            if not OPENTELEMETRY_AVAILABLE:
+                raise ImportError("OpenTelemetry export requires opentelemetry-api: pip install repo-sapiens[tracing]")
+            tracer = otel_trace.get_tracer("repo_sapiens")
+        self._tracer = tracer
+        # span_id -> open OpenTelemetry span
+        self._open: dict[str, Any] = {}
+
+    def on_start(self, span: Span) -> None:
+        """Start the mirror span under its parent's mirror."""
+        context = None
+        parent = self._open.get(span.parent_id) if span.parent_id else None
+        if parent is not None:
+            context = otel_trace.set_span_in_context(parent)
+        self._open[span.span_id] = self._tracer.start_span(
+            span.name,
+            context=context,
+            start_time=int(span.start * 1e9),
+            attributes=_otel_attributes(span.attributes),
+        )
+
+    def on_end(self, span: Span) -> None:
+        """End the mirror span with the span's final attributes and status."""
+        mirror = self._open.pop(span.span_id, None)
+        if mirror is None:
+            return
+        mirror.set_attributes(_otel_attributes(span.attributes))
+        if span.status == "error":
+            mirror.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, span.error))
+        mirror.end(end_time=int((span.end or time.time()) * 1e9))
+
+
+class Tracer:
+    """Opens spans and hands them to exporters.
+
+    Attributes:
+        exporters: Exporters receiving every span
+    """
+
+    def __init__(self, exporters: Iterable[SpanExporter] = ()) -> None:
+        """Initialize the tracer.
+
+        Args:
+            exporters: Exporters receiving every span
+        """
+        self.exporters = list(exporters)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are being recorded."""
+        return bool(self.exporters)
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | None]:
+        """Time the enclosed block as a span under the current one.
+
+        Args:
+            name: Operation name
+            **attributes: Details recorded on the span
+
+        Yields:
+            The open span, or None when tracing is disabled
+        """
+        if not self.exporters:
+            yield None
+            return
+
+        parent = _current_span.get()
+        current = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start=time.time(),
+            attributes=attributes,
+        )
+        token = _current_span.set(current)
+        log_tokens = structlog.contextvars.bind_contextvars(trace_id=current.trace_id, span_id=current.span_id)
+        self._export("on_start", current)
+        try:
+            yield current
+        except BaseException as e:
+            current.status = "error"
+            current.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            current.end = time.time()
+            structlog.contextvars.reset_contextvars(**log_tokens)
+            _current_span.reset(token)
+            self._export("on_end", current)
+
+    def shutdown(self) -> None:
+        """Shut every exporter down."""
+        for exporter in self.exporters:
+            try:
+                exporter.shutdown()
+            except Exception as e:
+                log.warning("trace_export_failed", exporter=type(exporter).__name__, error=str(e))
+
+    def _export(self, hook: str, current: Span) -> None:
+        # Tracing must never break the traced operation
+        for exporter in self.exporters:
+            try:
+                getattr(exporter, hook)(current)
+            except Exception as e:
+                log.warning("trace_export_failed", exporter=type(exporter).__name__, error=str(e))
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """The process-wide tracer used by span() and traced methods."""
+    return _tracer
+
+
+def configure_tracing(exporters: Iterable[SpanExporter]) -> Tracer:
+    """Replace the process-wide tracer's exporters.
+
+    The previous exporters are shut down. Pass no exporters to disable
+    tracing.
+
+    Args:
+        exporters: Exporters receiving every span from now on
+
+    Returns:
+        The process-wide tracer
+    """
+    _tracer.shutdown()
+    _tracer.exporters = list(exporters)
+    log.debug("tracing_configured", exporters=[type(exporter).__name__ for exporter in _tracer.exporters])
+    return _tracer
+
+
+def configure_from_settings(config: "TracingConfig") -> Tracer:
+    """Configure the process-wide tracer from the ``tracing`` settings section.
+
+    Spans go to a JSONL exporter in the configured directory, and also to
+    OpenTelemetry when that is enabled and installed.
+
+    Args:
+        config: Tracing settings
+
+    Returns:
+        The process-wide tracer
+    """
+    if not config.enabled:
+        return configure_tracing([])
+
+    exporters: list[SpanExporter] = [JSONLSpanExporter(Path(config.directory), config.retention_days)]
+    if config.opentelemetry:
+        if OPENTELEMETRY_AVAILABLE:
+            exporters.append(OpenTelemetryExporter())
+        else:
+            log.warning("opentelemetry_unavailable", hint="pip install repo-sapiens[tracing]")
+    return configure_tracing(exporters)
+
+
+def span(name: str, **attributes: Any) -> contextlib.AbstractContextManager[Span | None]:
+    """Open a span on the process-wide tracer (see Tracer.span)."""
+    return _tracer.span(name, **attributes)
+
+
+def current_span() -> Span | None:
+    """The innermost open span in the running task, if any."""
+    return _current_span.get()
+
+
+def traced(
+    name: str, attributes: Callable[..., dict[str, Any]] | None = None
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorator running an async function inside a span.
+
+    Args:
+        name: Span name; may contain ``{key}`` placeholders filled from the attributes
+        attributes: Called with the function's arguments to produce span attributes.
+            If it raises (e.g. the call's arguments don't match its signature)
+            or the name can't be formatted, the span gets the plain name and
+            no attributes; the call itself is unaffected.
+
+    Example:
+        >>> @traced("tool.{tool}", attributes=lambda self, tool_name, args: {"tool": tool_name})
+        ... async def execute(self, tool_name, args): ...
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not _tracer.exporters:
+                return await func(*args, **kwargs)
+            try:
+                details = attributes(*args, **kwargs) if attributes else {}
+                span_name = name.format(**details) if details else name
+            except Exception as e:
+                log.debug("span_attributes_failed", span=name, error=str(e))
+                details, span_name = {}, name
+            with _tracer.span(span_name, **details):
+                return await func(*args, **kwargs)
+
+        wrapper.__traced__ = True  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def instrument_methods(
+    cls: type, names: Iterable[str], attributes: Callable[..., dict[str, Any]] | None = None
+) -> None:
+    """Trace the named async methods a class defines itself.
+
+    Meant for ``__init_subclass__`` of a base class, so every implementation
+    is traced without touching it. Inherited, synchronous and already traced
+    methods are left alone; spans are named ``ClassName.method``.
+
+    Args:
+        cls: Class whose methods to wrap
+        names: Method names to trace
+        attributes: Called with each method's arguments to produce span attributes
+    """
+    for method_name in names:
+        method = cls.__dict__.get(method_name)
+        if not inspect.iscoroutinefunction(method) or getattr(method, "__traced__", False):
+            continue
+        setattr(cls, method_name, traced(f"{cls.__name__}.{method_name}", attributes)(method))
+
+
+def abstract_methods(cls: type) -> set[str]:
+    """Names of the abstract methods a base class declares."""
+    return {name for name, value in vars(cls).items() if getattr(value, "__isabstractmethod__", False)}
+
+
+def read_spans(directory: Path) -> list[Span]:
+    """Read every span the JSONL exporter has written, oldest file first.
+
+    Unreadable lines are skipped.
+
+    Args:
+        directory: The exporter's directory
+
+    Returns:
+        Spans in file order
+    """
+    spans: list[Span] = []
+    for path in sorted(Path(directory).glob("*.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    spans.append(Span.from_dict(json.loads(line)))
+                except (json.JSONDecodeError, TypeError):
+                    continue
+    return spans
+
+
+def _otel_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
+    """Attributes as OpenTelemetry accepts them (primitives; anything else as str)."""
+    return {
+        key: value if isinstance(value, bool | int | float | str) else str(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
@@ -0,0 +1,502 @@
+"""
+Token and latency accounting for every LLM call.
+
+Each backend and provider that talks to a model turns the usage fields of
+its response into an ``LLMCall``: prompt and completion tokens (Ollama's
+``prompt_eval_count``/``eval_count``, OpenAI's ``usage``), wall-clock
+latency, time to first token and generation speed. A call is attributed
+to the issue, plan, task and workflow stage of the ``usage_scope()`` it
+was made in; the orchestrator opens those scopes.
+
+``record_call()`` hands each call to the process-wide ``UsageLedger``,
+which prices it, keeps it for aggregation (``summarize()``), appends it to
+a JSONL file per day when persistence is configured, and exports it as
+Prometheus metrics when ``prometheus_client`` is installed. The token
+counts are also set on the open tracing span.
+
+``CostOptimizer`` reads the ledger to estimate costs from measured token
+counts and to report what recorded calls actually cost.
+"""
+
+import contextlib
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field, fields
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from repo_sapiens.monitoring.tracing import current_span
+from repo_sapiens.utils.cost_optimizer import MODEL_PRICING, ModelCosts
+
+try:
+    from repo_sapiens.monitoring.metrics import MetricsCollector
+
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from repo_sapiens.config.settings import UsageConfig
+
+log = structlog.get_logger(__name__)
+
+# Labels a usage scope can attribute calls to
+SCOPE_LABELS = ("issue", "plan", "task", "stage")
+
+# Calls kept in memory for aggregation; older ones only live on in the files
+DEFAULT_MAX_CALLS = 100_000
+
+_scope: ContextVar[dict[str, Any] | None] = ContextVar("repo_sapiens_usage_scope", default=None)
+
+
+@dataclass
+class LLMCall:
+    """Usage and timing of one model call.
+
+    Attributes:
+        model: Model that served the call
+        provider: What made the call, e.g. "ollama", "openai" or "copilot"
+        prompt_tokens: Tokens in the prompt
+        completion_tokens: Tokens generated
+        latency: Seconds from sending the request to the end of the response
+        time_to_first_token: Seconds until generation started, when known
+        generation_time: Seconds spent generating the completion, when known
+        issue: Issue number the call was made for
+        plan: Plan ID the call was made for
+        task: Task ID the call was made for
+        stage: Workflow stage that made the call
+        cost: Dollars, priced by the ledger
+        timestamp: Unix time the call finished
+    """
+
+    model: str
+    provider: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0
+    time_to_first_token: float | None = None
+    generation_time: float | None = None
+    issue: int | None = None
+    plan: str | None = None
+    task: str | None = None
+    stage: str | None = None
+    cost: float = 0.0
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt and completion tokens together."""
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Completion tokens per second of generation.
+
+        Uses the server-reported generation time when there is one, and
+        the latency after the first token otherwise.
+        """
+        seconds = self.generation_time
+        if seconds is None:
+            seconds = self.latency - (self.time_to_first_token or 0.0)
+        return self.completion_tokens / seconds if self.completion_tokens and seconds > 0 else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form, as persisted by UsageLedger."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LLMCall":
+        """Rebuild a call from to_dict() output, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+@dataclass
+class UsageSummary:
+    """Totals over a group of LLM calls.
+
+    Attributes:
+        calls: Number of calls
+        prompt_tokens: Summed prompt tokens
+        completion_tokens: Summed completion tokens
+        latency: Summed latency in seconds
+        cost: Summed cost in dollars
+    """
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0
+    cost: float = 0.0
+    _first_token: float = 0.0
+    _first_token_calls: int = 0
+    _generated_tokens: int = 0
+    _generation_time: float = 0.0
+
+    def add(self, call: LLMCall) -> None:
+        """Add one call to the totals."""
+        self.calls += 1
+        self.prompt_tokens += call.prompt_tokens
+        self.completion_tokens += call.completion_tokens
+        self.latency += call.latency
+        self.cost += call.cost
+        if call.time_to_first_token is not None:
+            self._first_token += call.time_to_first_token
+            self._first_token_calls += 1
+        if call.tokens_per_second:
+            self._generated_tokens += call.completion_tokens
+            self._generation_time += call.completion_tokens / call.tokens_per_second
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt and completion tokens together."""
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def mean_latency(self) -> float:
+        """Average seconds per call."""
+        return self.latency / self.calls if self.calls else 0.0
+
+    @property
+    def mean_time_to_first_token(self) -> float | None:
+        """Average seconds until generation started, over the calls that measured it."""
+        return self._first_token / self._first_token_calls if self._first_token_calls else None
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Completion tokens per second of generation across the calls."""
+        return self._generated_tokens / self._generation_time if self._generation_time else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Totals and averages as a plain dict (e.g. for JSON output)."""
+        return {
+            "calls": self.calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "cost": round(self.cost, 6),
+            "mean_latency": round(self.mean_latency, 3),
+            "mean_time_to_first_token": _rounded(self.mean_time_to_first_token),
+            "tokens_per_second": _rounded(self.tokens_per_second),
+        }
+
+
+class UsageLedger:
+    """Prices, keeps and aggregates LLM calls.
+
+    With a directory, every call is also appended to ``YYYY-MM-DD.jsonl``
+    there, and the calls already recorded within ``retention_days`` are
+    loaded when the ledger is created, so aggregates span runs.
+
+    Attributes:
+        pricing: Dollars per 1M tokens by model name; unlisted models
+            (e.g. local ones) cost nothing
+        directory: Directory for the daily JSONL files (None keeps calls in memory only)
+        retention_days: Days of files kept
+        calls: Recorded calls, oldest first
+
+    Example:
+        >>> ledger = UsageLedger(directory=Path(".sapiens/usage"))
+        >>> ledger.record(LLMCall(model="qwen3:8b", provider="ollama", prompt_tokens=900, stage="planning"))
+        >>> ledger.summarize("stage")["planning"].prompt_tokens
+        900
+    """
+
+    def __init__(
+        self,
+        pricing: dict[str, ModelCosts] | None = None,
+        directory: Path | None = None,
+        retention_days: int = 30,
+        max_calls: int = DEFAULT_MAX_CALLS,
+    ) -> None:
+        """Initialize the ledger, loading recorded history when persisting.
+
+        Args:
+            pricing: Dollars per 1M tokens by model (default: MODEL_PRICING by tier name)
+            directory: Directory for the daily JSONL files
+            retention_days: Days of files kept
+            max_calls: Calls kept in memory
+        """
+        self.pricing = dict(pricing) if pricing is not None else default_pricing()
+        self.directory = Path(directory) if directory is not None else None
+        self.retention_days = retention_days
+        self.calls: deque[LLMCall] = deque(maxlen=max_calls)
+        # Cost per stage recorded by this process, exported as a gauge
+        self._stage_costs: dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            self._prune()
+            self.calls.extend(read_calls(self.directory))
+
+    def price(self, call: LLMCall) -> float:
+        """Dollars a call cost under the ledger's pricing."""
+        costs = self.pricing.get(call.model)
+        if costs is None:
+            return 0.0
+        return (call.prompt_tokens * costs.input_cost + call.completion_tokens * costs.output_cost) / 1_000_000
+
+    def record(self, call: LLMCall) -> None:
+        """Price a call, keep it, persist it and export it as metrics."""
+        call.cost = self.price(call)
+        stage = call.stage or "unknown"
+        with self._lock:
+            self.calls.append(call)
+            self._stage_costs[stage] += call.cost
+            stage_cost = self._stage_costs[stage]
+            if self.directory is not None:
+                self._append(call)
+
+        if METRICS_AVAILABLE:
+            MetricsCollector.record_llm_call(
+                model=call.model,
+                operation=stage,
+                prompt_tokens=call.prompt_tokens,
+                completion_tokens=call.completion_tokens,
+                duration=call.latency,
+                time_to_first_token=call.time_to_first_token,
+                tokens_per_second=call.tokens_per_second,
+                cost=call.cost,
+            )
+            MetricsCollector.update_estimated_cost(stage, stage_cost)
+
+        log.debug(
+            "llm_call_recorded",
+            model=call.model,
+            provider=call.provider,
+            stage=call.stage,
+            prompt_tokens=call.prompt_tokens,
+            completion_tokens=call.completion_tokens,
+            latency=round(call.latency, 3),
+            time_to_first_token=_rounded(call.time_to_first_token),
+        )
+
+    def summarize(self, by: str | tuple[str, ...], **where: Any) -> dict[Any, UsageSummary]:
+        """Aggregate the recorded calls in groups.
+
+        Args:
+            by: LLMCall field (or tuple of fields) to group by, e.g. "stage"
+                or ("plan", "stage"); tuple groups are keyed by tuples
+            **where: Only include calls whose fields have these values
+
+        Returns:
+            Summary per group value
+        """
+        keys = (by,) if isinstance(by, str) else by
+        groups: dict[Any, UsageSummary] = defaultdict(UsageSummary)
+        for call in self._matching(where):
+            values = tuple(getattr(call, key) for key in keys)
+            groups[values[0] if isinstance(by, str) else values].add(call)
+        return dict(groups)
+
+    def total(self, **where: Any) -> UsageSummary:
+        """One summary over all recorded calls matching ``where``."""
+        summary = UsageSummary()
+        for call in self._matching(where):
+            summary.add(call)
+        return summary
+
+    def _matching(self, where: dict[str, Any]) -> Iterable[LLMCall]:
+        with self._lock:
+            calls = list(self.calls)
+        return (call for call in calls if all(getattr(call, key) == value for key, value in where.items()))
+
+    def _append(self, call: LLMCall) -> None:
+        assert self.directory is not None
+        day = datetime.fromtimestamp(call.timestamp, UTC).date().isoformat()
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / f"{day}.jsonl", "a", encoding="utf-8") as f:
+                f.write(json.dumps(call.to_dict()) + "\n")
+        except OSError as e:
+            # Accounting must never break the call it accounts for
+            log.warning("usage_persist_failed", directory=str(self.directory), error=str(e))
+
+    def _prune(self) -> None:
+        assert self.directory is not None
+        cutoff = (datetime.now(UTC) - timedelta(days=self.retention_days)).date().isoformat()
+        for path in self.directory.glob("*.jsonl"):
+            if path.stem < cutoff:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+
+
+def read_calls(directory: Path) -> list[LLMCall]:
+    """Read the calls persisted in a usage directory, oldest file first.
+
+    Unreadable lines, and lines that are not JSON objects, are skipped.
+
+    Args:
+        directory: Directory of daily JSONL files
+
+    Returns:
+        Calls as recorded, with their recorded cost
+    """
+    calls: list[LLMCall] = []
+    for path in sorted(Path(directory).glob("*.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                    if isinstance(data, dict):
+                        calls.append(LLMCall.from_dict(data))
+                except (json.JSONDecodeError, TypeError):
+                    continue
+    return calls
+
+
+def default_pricing() -> dict[str, ModelCosts]:
+    """CostOptimizer's static pricing, by model name."""
+    return {tier.value: costs for tier, costs in MODEL_PRICING.items()}
+
+
+_ledger = UsageLedger()
+
+
+def get_usage_ledger() -> UsageLedger:
+    """The process-wide ledger that record_call() records into."""
+    return _ledger
+
+
+def configure_usage(ledger: UsageLedger) -> UsageLedger:
+    """Replace the process-wide ledger.
+
+    Args:
+        ledger: Ledger receiving every call from now on
+
+    Returns:
+        The new ledger
+    """
+    global _ledger
+    _ledger = ledger
+    return ledger
+
+
+def configure_usage_from_settings(config: "UsageConfig") -> UsageLedger:
+    """Configure the process-wide ledger from the ``usage`` settings section.
+
+    Configured prices are added to (or override) the default pricing.
+
+    Args:
+        config: Usage accounting settings
+
+    Returns:
+        The new ledger
+    """
+    pricing = default_pricing()
+    pricing.update(
+        {model: ModelCosts(input_cost=p.input_cost, output_cost=p.output_cost) for model, p in config.pricing.items()}
+    )
+    directory = Path(config.directory) if config.persist else None
+    return configure_usage(UsageLedger(pricing=pricing, directory=directory, retention_days=config.retention_days))
+
+
+@contextlib.contextmanager
+def usage_scope(**labels: Any) -> Iterator[None]:
+    """Attribute LLM calls made in the enclosed block to an issue, plan, task or stage.
+
+    Scopes nest, with inner labels overriding outer ones, and carry over
+    into tasks started inside them.
+
+    Args:
+        **labels: Any of ``issue``, ``plan``, ``task`` and ``stage``; None values are ignored
+
+    Raises:
+        ValueError: If a label isn't one of SCOPE_LABELS
+    """
+    unknown = set(labels) - set(SCOPE_LABELS)
+    if unknown:
+        raise ValueError(f"Unknown usage labels: {sorted(unknown)}")
+    token = _scope.set({**current_scope(), **{key: value for key, value in labels.items() if value is not None}})
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def current_scope() -> dict[str, Any]:
+    """Labels of the innermost usage scope (empty outside any)."""
+    return dict(_scope.get() or {})
+
+
+def record_call(model: str, provider: str, latency: float, **usage: Any) -> LLMCall:
+    """Record an LLM call in the current scope on the process-wide ledger.
+
+    The usage counts are also set as attributes on the open tracing span.
+
+    Args:
+        model: Model that served the call
+        provider: What made the call, e.g. "ollama"
+        latency: Seconds from sending the request to the end of the response
+        **usage: Further LLMCall fields, e.g. from ollama_usage() or openai_usage()
+
+    Returns:
+        The recorded call
+    """
+    call = LLMCall(model=model, provider=provider, latency=latency, **{**current_scope(), **usage})
+    _ledger.record(call)
+
+    span = current_span()
+    if span is not None:
+        span.set_attribute("prompt_tokens", call.prompt_tokens)
+        span.set_attribute("completion_tokens", call.completion_tokens)
+        if call.time_to_first_token is not None:
+            span.set_attribute("time_to_first_token", round(call.time_to_first_token, 3))
+    return call
+
+
+def ollama_usage(result: dict[str, Any]) -> dict[str, Any]:
+    """Usage fields of an Ollama ``/api/chat`` or ``/api/generate`` response.
+
+    Ollama reports durations in nanoseconds. Generation starts once the
+    model is loaded and the prompt evaluated, which gives the time to
+    first token of a non-streamed call.
+
+    Args:
+        result: Response body (the final object of a stream)
+
+    Returns:
+        LLMCall fields for record_call()
+    """
+    usage: dict[str, Any] = {
+        "prompt_tokens": _count(result.get("prompt_eval_count")),
+        "completion_tokens": _count(result.get("eval_count")),
+    }
+    if eval_duration := _count(result.get("eval_duration")):
+        usage["generation_time"] = eval_duration / 1e9
+    if startup := _count(result.get("load_duration")) + _count(result.get("prompt_eval_duration")):
+        usage["time_to_first_token"] = startup / 1e9
+    return usage
+
+
+def openai_usage(result: dict[str, Any]) -> dict[str, Any]:
+    """Usage fields of an OpenAI-compatible chat completion (or its final stream event).
+
+    Args:
+        result: Response body
+
+    Returns:
+        LLMCall fields for record_call()
+    """
+    usage = result.get("usage")
+    if not isinstance(usage, dict):
+        return {}
+    return {
+        "prompt_tokens": _count(usage.get("prompt_tokens")),
+        "completion_tokens": _count(usage.get("completion_tokens")),
+    }
+
+
+def _count(value: Any) -> int:
+    """A reported count as int; anything missing or malformed counts as 0."""
+    return int(value) if isinstance(value, int | float) and not isinstance(value, bool) else 0
+
+
+def _rounded(value: float | None) -> float | None:
+    return round(value, 3) if value is not None else None
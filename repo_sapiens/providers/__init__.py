@@ -8,7 +8,8 @@ Key Components:
     - AgentProvider: Abstract base for AI agent providers
     - GiteaRestProvider: Gitea REST API implementation
     - GiteaProvider: Gitea MCP-based implementation
-    - GitHubRestProvider: GitHub REST API implementation
+    - GitHubAsyncProvider: GitHub REST API implementation using native async httpx
+    - GitHubRestProvider: GitHub implementation using PyGithub (fallback)
     - GitLabRestProvider: GitLab REST API v4 implementation
     - ClaudeLocalProvider: Local Claude Code CLI
     - ExternalAgentProvider: External Claude/Goose CLI
@@ -11,6 +11,7 @@ from typing import Any
 import structlog
 
 from repo_sapiens.models.domain import Issue, Plan, Review, Task, TaskResult
+from repo_sapiens.monitoring.tracing import span
 from repo_sapiens.providers.base import AgentProvider
 from repo_sapiens.utils.helpers import slugify
 
@@ -249,15 +250,18 @@ class ClaudeLocalProvider(AgentProvider):
 
         try:
             # Run Claude Code CLI
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(self.workspace),
-            )
-
-            stdout, stderr = await process.communicate(input=prompt.encode())
+            with span("agent.subprocess", command=cmd[0]) as current:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(self.workspace),
+                )
+
+                stdout, stderr = await process.communicate(input=prompt.encode())
+                if current is not None:
+                    current.set_attribute("exit_code", process.returncode)
 
             if process.returncode != 0:
                 error_msg = stderr.decode()
@@ -6,6 +6,8 @@ for Git operations (Gitea, GitHub) and AI agents (Claude, OpenAI).
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime
 from typing import Any
 
 from repo_sapiens.models.domain import (
@@ -18,6 +20,7 @@ from repo_sapiens.models.domain import (
     Task,
     TaskResult,
 )
+from repo_sapiens.monitoring.tracing import abstract_methods, instrument_methods
 
 
 class GitProvider(ABC):
@@ -34,8 +37,23 @@ class GitProvider(ABC):
     - Authentication header formats (Bearer, token, PRIVATE-TOKEN)
 
     All methods are async to support non-blocking I/O with HTTP clients.
+
+    Every subclass's implementations of the interface methods are traced
+    (see ``monitoring.tracing``), with the issue or PR number as an
+    attribute where the first argument is one.
+
+    Attributes:
+        issues_oldest_first: Whether ``iter_issue_pages()`` lists issues in
+            ascending creation order across pages. Callers that need issues
+            oldest first must collect every page when this is False.
     """
 
+    issues_oldest_first: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls, _TRACED_GIT_METHODS, _number_attribute)
+
     @abstractmethod
     async def get_issues(
         self,
@@ -53,7 +71,9 @@ class GitProvider(ABC):
 
         Returns:
             List of Issue objects sorted by creation date (newest first,
-            though exact ordering may vary by provider).
+            though exact ordering may vary by provider). Providers with
+            paginated APIs return every page; use ``iter_issues()`` to
+            stream results instead.
 
         Raises:
             httpx.HTTPStatusError: If the API request fails (Gitea/GitLab).
@@ -62,6 +82,53 @@ class GitProvider(ABC):
         """
         pass
 
+    async def iter_issue_pages(
+        self,
+        labels: list[str] | None = None,
+        state: str = "open",
+    ) -> AsyncIterator[list[Issue]]:
+        """Stream issues from repository one page at a time.
+
+        Providers with paginated list endpoints override this to follow the
+        API's pagination headers and prefetch the next page while the caller
+        is still working on the current one. The default implementation
+        yields the full ``get_issues()`` result as a single page.
+
+        Args:
+            labels: Filter by labels (intersection, same as ``get_issues``).
+            state: Filter by state ("open", "closed", or "all").
+
+        Yields:
+            Lists of Issue objects, one list per API page, in API order
+            (oldest first across pages if ``issues_oldest_first`` is set).
+
+        Raises:
+            httpx.HTTPStatusError: If a page request fails (Gitea/GitLab).
+            GithubException: If a page request fails (GitHub).
+        """
+        yield await self.get_issues(labels=labels, state=state)
+
+    async def iter_issues(
+        self,
+        labels: list[str] | None = None,
+        state: str = "open",
+    ) -> AsyncIterator[Issue]:
+        """Stream issues from repository incrementally.
+
+        Flattens ``iter_issue_pages()`` so callers can start working on the
+        first issues before the remaining pages have been fetched.
+
+        Args:
+            labels: Filter by labels (intersection, same as ``get_issues``).
+            state: Filter by state ("open", "closed", or "all").
+
+        Yields:
+            Issue objects in API order.
+        """
+        async for page in self.iter_issue_pages(labels=labels, state=state):
+            for issue in page:
+                yield issue
+
     @abstractmethod
     async def get_issue(self, issue_number: int) -> Issue:
         """Get single issue by number.
@@ -167,7 +234,7 @@ class GitProvider(ABC):
         pass
 
     @abstractmethod
-    async def get_comments(self, issue_number: int) -> list[Comment]:
+    async def get_comments(self, issue_number: int, since: datetime | None = None) -> list[Comment]:
         """Retrieve all comments for an issue.
 
         Returns all user-created comments on the specified issue, ordered
@@ -175,6 +242,9 @@ class GitProvider(ABC):
 
         Args:
             issue_number: Issue number.
+            since: Only return comments created at or after this time.
+                Providers apply the API's own filter where it has one, so
+                polling a long-lived issue doesn't transfer its whole history.
 
         Returns:
             List of Comment objects. Empty list if no comments exist.
@@ -496,6 +566,25 @@ class GitProvider(ABC):
         # Default implementation does nothing - providers override as needed
         return {}
 
+    async def ensure_labels(self, label_names: Iterable[str]) -> dict[str, int]:
+        """Make sure labels exist before a batch of issues uses them.
+
+        Providers that address labels by ID (Gitea) resolve and create every
+        missing label in one pass, so a fan-out that creates many issues with
+        the same labels does not look them up per issue.
+
+        Args:
+            label_names: Label names the batch will use.
+
+        Returns:
+            Dict mapping label names to provider-specific IDs, or an empty
+            dict for providers that accept label names directly.
+
+        Note:
+            This is an optional method with a no-op default implementation.
+        """
+        return {}
+
 
 class AgentProvider(ABC):
     """Abstract base class for AI agent implementations.
@@ -515,6 +604,10 @@ class AgentProvider(ABC):
             file operations are relative to this directory.
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls, _TRACED_AGENT_METHODS)
+
     # Working directory for agent operations (can be set by implementations)
     working_dir: str | None = None
 
@@ -689,3 +782,14 @@ class AgentProvider(ABC):
             conflict cannot be resolved automatically.
         """
         pass
+
+
+def _number_attribute(self: Any, *args: Any, **kwargs: Any) -> dict[str, Any]:
+    """Span attributes for a git provider call: the issue or PR number, if that's the first argument."""
+    if args and isinstance(args[0], int) and not isinstance(args[0], bool):
+        return {"number": args[0]}
+    return {}
+
+
+_TRACED_GIT_METHODS = abstract_methods(GitProvider) | {"add_comment_reply", "ensure_labels", "setup_automation_labels"}
+_TRACED_AGENT_METHODS = abstract_methods(AgentProvider)
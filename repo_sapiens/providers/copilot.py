@@ -160,6 +160,7 @@ class CopilotProvider(AgentProvider):
             qa_handler=self.qa_handler,
             timeout=300.0,
         )
+        self._openai_client.usage_provider = "copilot"
 
         await self._openai_client.connect()
 
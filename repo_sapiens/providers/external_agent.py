@@ -10,6 +10,7 @@ import structlog
 
 from repo_sapiens.enums import AgentType
 from repo_sapiens.models.domain import Issue, Plan, Review, Task, TaskResult
+from repo_sapiens.monitoring.tracing import span
 from repo_sapiens.providers.base import AgentProvider
 
 if TYPE_CHECKING:
@@ -151,15 +152,18 @@ class ExternalAgentProvider(AgentProvider):
 
         log.debug("running_claude", cwd=self.working_dir, prompt_length=len(prompt))
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=self.working_dir,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        with span("agent.subprocess", command=cmd[0]) as current:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=self.working_dir,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
 
-        stdout, stderr = await process.communicate(input=prompt.encode("utf-8"))
+            stdout, stderr = await process.communicate(input=prompt.encode("utf-8"))
+            if current is not None:
+                current.set_attribute("exit_code", process.returncode)
 
         success = process.returncode == 0
         output = stdout.decode("utf-8") if stdout else ""
@@ -228,15 +232,18 @@ class ExternalAgentProvider(AgentProvider):
             config=self.goose_config,
         )
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=self.working_dir,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        with span("agent.subprocess", command=cmd[0]) as current:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=self.working_dir,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
 
-        stdout, stderr = await process.communicate(input=prompt.encode("utf-8"))
+            stdout, stderr = await process.communicate(input=prompt.encode("utf-8"))
+            if current is not None:
+                current.set_attribute("exit_code", process.returncode)
 
         success = process.returncode == 0
         output = stdout.decode("utf-8") if stdout else ""
@@ -321,14 +328,17 @@ class ExternalAgentProvider(AgentProvider):
             prompt_length=len(prompt),
         )
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=self.working_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        with span("agent.subprocess", command=cmd[0]) as current:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=self.working_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
 
-        stdout, stderr = await process.communicate()
+            stdout, stderr = await process.communicate()
+            if current is not None:
+                current.set_attribute("exit_code", process.returncode)
 
         success = process.returncode == 0
         output = stdout.decode("utf-8") if stdout else ""
@@ -3,17 +3,31 @@
 import structlog
 
 from repo_sapiens.config.settings import AutomationSettings
-from repo_sapiens.providers.base import GitProvider
+from repo_sapiens.enums import AgentType, ProviderType
+from repo_sapiens.providers.base import AgentProvider, GitProvider
+from repo_sapiens.providers.copilot import CopilotProvider
+from repo_sapiens.providers.external_agent import ExternalAgentProvider
 from repo_sapiens.providers.gitea_rest import GiteaRestProvider
+from repo_sapiens.providers.github_async import GitHubAsyncProvider
 from repo_sapiens.providers.github_rest import GitHubRestProvider
 from repo_sapiens.providers.gitlab_rest import GitLabRestProvider
+from repo_sapiens.providers.openai_compatible import OpenAICompatibleProvider
+from repo_sapiens.utils.caching import configure_disk_cache
 
 log = structlog.get_logger(__name__)
 
+SUPPORTED_PROVIDERS = ("gitea", "github", "gitlab")
+
 
 def create_git_provider(settings: AutomationSettings) -> GitProvider:
     """Create appropriate Git provider based on configuration.
 
+    GitHub uses the native async provider unless ``git_provider.github_client``
+    is ``pygithub``, which selects the PyGithub-based fallback.
+
+    When ``workflow.disk_cache`` is enabled this also attaches the persistent
+    cache tier, so provider caches are shared with earlier invocations.
+
     Args:
         settings: Automation settings containing provider configuration
 
@@ -31,6 +45,9 @@ def create_git_provider(settings: AutomationSettings) -> GitProvider:
     """
     provider_type = settings.git_provider.provider_type
 
+    if provider_type in SUPPORTED_PROVIDERS and settings.workflow.disk_cache:
+        configure_disk_cache(settings.workflow.cache_directory, settings.workflow.disk_cache_max_entries)
+
     if provider_type == "gitea":
         log.info("creating_gitea_provider", base_url=str(settings.git_provider.base_url))
         return GiteaRestProvider(
@@ -41,8 +58,10 @@ def create_git_provider(settings: AutomationSettings) -> GitProvider:
         )
 
     elif provider_type == "github":
-        log.info("creating_github_provider", base_url=str(settings.git_provider.base_url))
-        return GitHubRestProvider(
+        github_client = settings.git_provider.github_client
+        log.info("creating_github_provider", base_url=str(settings.git_provider.base_url), client=github_client)
+        github_class = GitHubAsyncProvider if github_client == "httpx" else GitHubRestProvider
+        return github_class(
             token=settings.git_provider.api_token.get_secret_value(),
             owner=settings.repository.owner,
             repo=settings.repository.name,
@@ -59,10 +78,92 @@ def create_git_provider(settings: AutomationSettings) -> GitProvider:
         )
 
     else:
-        supported = "gitea, github, gitlab"
+        supported = ", ".join(SUPPORTED_PROVIDERS)
         raise ValueError(f"Unsupported Git provider type: {provider_type}. Supported: {supported}")
 
 
+def create_agent_provider(settings: AutomationSettings, git: GitProvider | None = None) -> AgentProvider:
+    """Create the agent provider selected by ``agent_provider.provider_type``.
+
+    Agents work in the current directory. Given a Git provider, agents can
+    ask questions on the issue through an InteractiveQAHandler; without
+    one (e.g. label-triggered CI runs) they run non-interactively.
+
+    Args:
+        settings: Automation settings
+        git: Git provider used to post agent questions, if any
+
+    Returns:
+        AgentProvider instance (not yet connected)
+
+    Raises:
+        ValueError: If the provider type is not supported
+    """
+    from pathlib import Path
+
+    from repo_sapiens.utils.interactive import InteractiveQAHandler
+
+    qa_handler = InteractiveQAHandler(git, poll_interval=30) if git is not None else None
+    provider_type = settings.agent_provider.provider_type
+
+    if provider_type == ProviderType.OLLAMA:
+        from repo_sapiens.providers.ollama import OllamaProvider
+
+        return OllamaProvider(
+            base_url=settings.agent_provider.base_url or "http://localhost:11434",
+            model=settings.agent_provider.model,
+            working_dir=str(Path.cwd()),
+            qa_handler=qa_handler,
+        )
+
+    # Copilot with copilot-api proxy (unofficial)
+    # Note: Settings validator ensures copilot_config is present for COPILOT_LOCAL
+    if provider_type == ProviderType.COPILOT_LOCAL and settings.agent_provider.copilot_config:
+        return CopilotProvider(
+            copilot_config=settings.agent_provider.copilot_config,
+            working_dir=str(Path.cwd()),
+            qa_handler=qa_handler,
+        )
+
+    # OpenAI-compatible API (OpenRouter, vLLM, etc.)
+    if provider_type == ProviderType.OPENAI_COMPATIBLE:
+        api_key = None
+        if settings.agent_provider.api_key:
+            api_key = settings.agent_provider.api_key.get_secret_value()
+        return OpenAICompatibleProvider(
+            base_url=settings.agent_provider.base_url or "http://localhost:8000/v1",
+            model=settings.agent_provider.model,
+            api_key=api_key,
+            working_dir=str(Path.cwd()),
+            qa_handler=qa_handler,
+        )
+
+    # External agent (Claude, Goose, or Copilot)
+    if not provider_type.is_external_cli:
+        raise ValueError(f"Unsupported provider type: {provider_type}")
+
+    agent_type = provider_type.to_agent_type()
+    if agent_type is None:
+        raise ValueError(f"Cannot determine agent type for provider: {provider_type}")
+
+    goose_config = None
+    if agent_type == AgentType.GOOSE and settings.agent_provider.goose_config:
+        goose_config = {
+            "toolkit": settings.agent_provider.goose_config.toolkit,
+            "temperature": settings.agent_provider.goose_config.temperature,
+            "max_tokens": settings.agent_provider.goose_config.max_tokens,
+            "llm_provider": settings.agent_provider.goose_config.llm_provider,
+        }
+
+    return ExternalAgentProvider(
+        agent_type=agent_type,
+        model=settings.agent_provider.model,
+        working_dir=str(Path.cwd()),
+        qa_handler=qa_handler,
+        goose_config=goose_config,
+    )
+
+
 def detect_provider_from_url(url: str) -> str:
     """Detect provider type from Git remote URL.
 
@@ -146,8 +146,11 @@ class GiteaProvider(GitProvider):
         return self._parse_comment(result)
 
     @async_retry(max_attempts=3, backoff_factor=2.0)
-    async def get_comments(self, issue_number: int) -> list[Comment]:
-        """Retrieve all comments for an issue."""
+    async def get_comments(self, issue_number: int, since: datetime | None = None) -> list[Comment]:
+        """Retrieve all comments for an issue, or those created since a time.
+
+        The MCP tool has no time filter, so ``since`` is applied to the result.
+        """
         log.info("get_comments", issue_number=issue_number)
 
         result = await self.mcp.call_tool(
@@ -157,8 +160,10 @@ class GiteaProvider(GitProvider):
             number=issue_number,
         )
 
-        comments = result.get("comments", [])
-        return [self._parse_comment(c) for c in comments]
+        comments = [self._parse_comment(c) for c in result.get("comments", [])]
+        if since is not None:
+            comments = [c for c in comments if c.created_at >= since]
+        return comments
 
     @async_retry(max_attempts=3, backoff_factor=2.0)
     async def create_branch(self, branch_name: str, from_branch: str) -> Branch:
@@ -1,5 +1,7 @@
 """Gitea provider implementation using direct REST API calls."""
 
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
 from datetime import datetime
 from typing import Any
 
@@ -8,11 +10,30 @@ import structlog
 
 from repo_sapiens.models.domain import Branch, Comment, Issue, IssueState, PullRequest
 from repo_sapiens.providers.base import GitProvider
-from repo_sapiens.utils.connection_pool import HTTPConnectionPool, get_pool
+from repo_sapiens.utils.caching import CacheKeyBuilder, get_disk_cache
+from repo_sapiens.utils.connection_pool import HTTPConnectionPool, get_pool, parse_response
+from repo_sapiens.utils.pagination import DEFAULT_PAGE_SIZE, next_page_number, prefetch_pages
 from repo_sapiens.utils.retry import async_retry
 
 log = structlog.get_logger(__name__)
 
+# Responses to a request carrying label IDs that suggest a cached ID is stale
+# (label deleted or recreated since it was cached)
+STALE_LABEL_STATUSES = (404, 422)
+
+# Lifetime of label IDs kept in the persistent cache tier
+LABEL_CACHE_TTL_SECONDS = 3600
+
+# Default automation labels with distinct colors
+AUTOMATION_LABEL_COLORS = {
+    "needs-planning": "5319e7",  # Purple - needs attention
+    "awaiting-approval": "fbca04",  # Yellow - waiting
+    "approved": "0e8a16",  # Green - ready to go
+    "in-progress": "1d76db",  # Blue - working on it
+    "done": "0e8a16",  # Green - complete
+    "proposed": "c5def5",  # Light blue - proposal
+}
+
 
 class GiteaRestProvider(GitProvider):
     """Gitea implementation using direct REST API calls."""
@@ -38,6 +59,10 @@ class GiteaRestProvider(GitProvider):
         self.owner = owner
         self.repo = repo
         self._pool: HTTPConnectionPool | None = None
+        # Label name -> ID, loaded on first use (None = not loaded yet)
+        self._label_ids: dict[str, int] | None = None
+        self._label_lock = asyncio.Lock()
+        self._label_cache_key = CacheKeyBuilder.build_namespaced_key("gitea_labels", self.api_base, owner, repo)
 
     async def connect(self) -> None:
         """Initialize connection pool and verify connectivity."""
@@ -68,24 +93,51 @@ class GiteaRestProvider(GitProvider):
         """Async context manager exit."""
         await self.disconnect()
 
-    @async_retry(max_attempts=3, backoff_factor=2.0)
     async def get_issues(
         self,
         labels: list[str] | None = None,
         state: str = "open",
     ) -> list[Issue]:
-        """Retrieve issues via REST API."""
+        """Retrieve issues via REST API, following pagination."""
         log.info("get_issues", labels=labels, state=state)
 
-        params: dict[str, str] = {"state": state}
+        return [issue async for issue in self.iter_issues(labels=labels, state=state)]
+
+    async def iter_issue_pages(
+        self,
+        labels: list[str] | None = None,
+        state: str = "open",
+    ) -> AsyncIterator[list[Issue]]:
+        """Stream issues page by page, prefetching the next page.
+
+        Follows the ``Link`` header Gitea returns on list endpoints. Gitea's
+        issue listing has no sort parameter and returns newest first, so
+        ``issues_oldest_first`` stays False. Each page request is retried
+        independently.
+        """
+        params: dict[str, str] = {"state": state, "limit": str(DEFAULT_PAGE_SIZE)}
         if labels:
             params["labels"] = ",".join(labels)
 
-        response = await self._pool.get(f"/repos/{self.owner}/{self.repo}/issues", params=params)
+        async def fetch(page: int) -> tuple[httpx.Response, list[Issue]]:
+            return await self._get_issues_page(params, page)
+
+        def following(page: int, result: tuple[httpx.Response, list[Issue]]) -> int | None:
+            response, issues = result
+            return next_page_number(response, issues, page, DEFAULT_PAGE_SIZE)
+
+        async for _response, issues in prefetch_pages(fetch, following):
+            yield issues
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def _get_issues_page(self, params: dict[str, str], page: int) -> tuple[httpx.Response, list[Issue]]:
+        """Fetch and parse a single page of issues."""
+        log.debug("get_issues_page", page=page)
+
+        response = await self._pool.get(f"/repos/{self.owner}/{self.repo}/issues", params={**params, "page": str(page)})
         response.raise_for_status()
 
-        issues_data = response.json()
-        return [self._parse_issue(issue_data) for issue_data in issues_data]
+        return response, parse_response(response, lambda data: [self._parse_issue(d) for d in data])
 
     @async_retry(max_attempts=3, backoff_factor=2.0)
     async def get_issue(self, issue_number: int) -> Issue:
@@ -95,7 +147,7 @@ class GiteaRestProvider(GitProvider):
         response = await self._pool.get(f"/repos/{self.owner}/{self.repo}/issues/{issue_number}")
         response.raise_for_status()
 
-        return self._parse_issue(response.json())
+        return parse_response(response, self._parse_issue)
 
     @async_retry(max_attempts=3, backoff_factor=2.0)
     async def create_issue(
@@ -112,12 +164,15 @@ class GiteaRestProvider(GitProvider):
             "body": body,
         }
 
+        issues_path = f"/repos/{self.owner}/{self.repo}/issues"
+
         # Convert label names to IDs if labels provided
         if labels:
-            label_ids = await self._get_or_create_label_ids(labels)
-            data["labels"] = label_ids
-
-        response = await self._pool.post(f"/repos/{self.owner}/{self.repo}/issues", json=data)
+            response = await self._send_with_label_ids(
+                labels, lambda label_ids: self._pool.post(issues_path, json={**data, "labels": label_ids})
+            )
+        else:
+            response = await self._pool.post(issues_path, json=data)
         response.raise_for_status()
 
         return self._parse_issue(response.json())
@@ -136,10 +191,9 @@ class GiteaRestProvider(GitProvider):
 
         # Update labels separately if provided (Gitea requires PUT to labels endpoint)
         if labels is not None:
-            label_ids = await self._get_or_create_label_ids(labels)
-            labels_response = await self._pool.put(
-                f"/repos/{self.owner}/{self.repo}/issues/{issue_number}/labels",
-                json={"labels": label_ids},
+            labels_path = f"/repos/{self.owner}/{self.repo}/issues/{issue_number}/labels"
+            labels_response = await self._send_with_label_ids(
+                labels, lambda label_ids: self._pool.put(labels_path, json={"labels": label_ids})
             )
             labels_response.raise_for_status()
 
@@ -194,15 +248,22 @@ class GiteaRestProvider(GitProvider):
         return base64.b64decode(content_data["content"]).decode("utf-8")
 
     @async_retry(max_attempts=3, backoff_factor=2.0)
-    async def get_comments(self, issue_number: int) -> list[Comment]:
-        """Get all comments for an issue."""
-        log.info("get_comments", issue_number=issue_number)
-
-        response = await self._pool.get(f"/repos/{self.owner}/{self.repo}/issues/{issue_number}/comments")
+    async def get_comments(self, issue_number: int, since: datetime | None = None) -> list[Comment]:
+        """Get all comments for an issue, or those created since a time."""
+        log.info("get_comments", issue_number=issue_number, since=since.isoformat() if since else None)
+
+        path = f"/repos/{self.owner}/{self.repo}/issues/{issue_number}/comments"
+        if since is None:
+            response = await self._pool.get(path)
+        else:
+            # Gitea's filter is on updated_at; edited older comments are dropped below
+            response = await self._pool.get(path, params={"since": since.isoformat()})
         response.raise_for_status()
 
-        comments_data = response.json()
-        return [self._parse_comment(comment_data) for comment_data in comments_data]
+        comments = parse_response(response, lambda data: [self._parse_comment(c) for c in data])
+        if since is not None:
+            comments = [c for c in comments if c.created_at >= since]
+        return comments
 
     @async_retry(max_attempts=3, backoff_factor=2.0)
     async def get_branch(self, branch_name: str) -> Branch | None:
@@ -387,10 +448,11 @@ class GiteaRestProvider(GitProvider):
 
         if labels:
             # Convert label names to IDs
-            label_ids = await self._get_or_create_label_ids(labels)
-            data["labels"] = label_ids
-
-        response = await self._pool.post(pulls_path, json=data)
+            response = await self._send_with_label_ids(
+                labels, lambda label_ids: self._pool.post(pulls_path, json={**data, "labels": label_ids})
+            )
+        else:
+            response = await self._pool.post(pulls_path, json=data)
         response.raise_for_status()
 
         pr_data = response.json()
@@ -411,8 +473,7 @@ class GiteaRestProvider(GitProvider):
         try:
             response = await self._pool.get(f"/repos/{self.owner}/{self.repo}/pulls/{pr_number}")
             response.raise_for_status()
-            pr_data = response.json()
-            return self._parse_pull_request(pr_data)
+            return parse_response(response, self._parse_pull_request)
         except Exception as e:
             log.debug("pr_not_found", pr=pr_number, error=str(e))
             return None
@@ -421,15 +482,8 @@ class GiteaRestProvider(GitProvider):
         """Get or create labels and return their numeric IDs.
 
         Gitea requires label IDs (not names) when creating or updating issues.
-        This method resolves label names to IDs, creating any labels that
-        don't already exist in the repository.
-
-        The workflow:
-            1. Fetch all existing labels from the repository
-            2. Build a name->ID mapping for quick lookup
-            3. For each requested label name:
-               - If exists: use existing ID
-               - If missing: create with default gray color, get new ID
+        This method resolves label names to IDs through the provider's label
+        cache, creating any labels that don't already exist in the repository.
 
         Args:
             label_names: List of label names to resolve. Order is preserved
@@ -446,37 +500,146 @@ class GiteaRestProvider(GitProvider):
             description indicating they were auto-created. This differs from
             setup_automation_labels which uses distinct colors per label type.
         """
-        labels_path = f"/repos/{self.owner}/{self.repo}/labels"
+        label_map = await self.ensure_labels(label_names)
+        return [label_map[name] for name in label_names]
 
-        # Get existing labels
-        response = await self._pool.get(labels_path)
-        response.raise_for_status()
+    async def ensure_labels(
+        self,
+        label_names: Iterable[str],
+        colors: Mapping[str, str] | None = None,
+        description: str = "Auto-created label: {name}",
+    ) -> dict[str, int]:
+        """Resolve label names to IDs, creating any that are missing.
+
+        The repository's labels are listed once per provider and cached by
+        name, so resolving labels for many issues (e.g. one issue per plan
+        task) costs a single listing plus one request per label that has to
+        be created. Pass the union of every batch's labels to create them
+        all up front.
 
-        existing_labels = response.json()
-        label_map = {label["name"]: label["id"] for label in existing_labels}
-
-        label_ids = []
-        for name in label_names:
-            if name in label_map:
-                # Label exists, use its ID
-                label_ids.append(label_map[name])
-            else:
-                # Create new label
-                log.info("creating_label", name=name)
+        When the persistent cache tier is configured the name->ID map is
+        also stored there, so later processes skip the listing too.
+
+        The workflow:
+            1. Load the name->ID cache if it is empty (from the persistent
+               tier, else one paginated listing)
+            2. Create each requested label missing from the cache
+            3. If creation reports the label already exists (another process
+               created it), reload the cache once and use the existing ID
+
+        Args:
+            label_names: Label names to resolve; duplicates are ignored.
+            colors: Optional hex colors (without #) by label name for labels
+                that have to be created. Defaults to gray (ededed).
+            description: Description for created labels; ``{name}`` is
+                replaced with the label name.
+
+        Returns:
+            Dict mapping each requested label name to its ID.
+
+        Raises:
+            httpx.HTTPStatusError: If listing or creating labels fails.
+        """
+        names = list(dict.fromkeys(label_names))
+        colors = colors or {}
+
+        async with self._label_lock:
+            if self._label_ids is None:
+                self._label_ids = await self._load_label_ids()
+
+            reloaded = False
+            changed = False
+            for name in names:
+                if name in self._label_ids:
+                    continue
+
+                color = colors.get(name, "ededed")  # Default gray color
+                log.info("creating_label", name=name, color=color)
                 create_response = await self._pool.post(
-                    labels_path,
-                    json={
-                        "name": name,
-                        "color": "ededed",  # Default gray color
-                        "description": f"Auto-created label: {name}",
-                    },
+                    f"/repos/{self.owner}/{self.repo}/labels",
+                    json={"name": name, "color": color, "description": description.format(name=name)},
                 )
+                if create_response.status_code in (409, 422) and not reloaded:
+                    # Created concurrently elsewhere; pick up its ID instead
+                    log.debug("label_already_exists", name=name, status=create_response.status_code)
+                    self._label_ids = await self._list_label_ids()
+                    reloaded = changed = True
+                    if name in self._label_ids:
+                        continue
                 create_response.raise_for_status()
-                new_label = create_response.json()
-                label_ids.append(new_label["id"])
-
+                self._label_ids[name] = create_response.json()["id"]
+                changed = True
+
+            if changed:
+                await self._save_label_ids(self._label_ids)
+            return {name: self._label_ids[name] for name in names}
+
+    async def invalidate_label_cache(self) -> None:
+        """Forget cached label IDs so the next lookup lists labels again."""
+        self._label_ids = None
+        disk = get_disk_cache()
+        if disk is not None:
+            await disk.delete(self._label_cache_key)
+
+    async def _load_label_ids(self) -> dict[str, int]:
+        """Label IDs from the persistent tier, else from a fresh listing."""
+        disk = get_disk_cache()
+        if disk is not None:
+            entry = await disk.get(self._label_cache_key)
+            if entry is not None and isinstance(entry[0], dict):
+                log.debug("label_cache_restored", count=len(entry[0]))
+                return dict(entry[0])
+
+        label_ids = await self._list_label_ids()
+        await self._save_label_ids(label_ids)
         return label_ids
 
+    async def _save_label_ids(self, label_ids: dict[str, int]) -> None:
+        disk = get_disk_cache()
+        if disk is not None:
+            await disk.set(self._label_cache_key, label_ids, LABEL_CACHE_TTL_SECONDS, namespace="gitea_labels")
+
+    async def _list_label_ids(self) -> dict[str, int]:
+        """List every repository label, following pagination."""
+        labels_path = f"/repos/{self.owner}/{self.repo}/labels"
+        label_map: dict[str, int] = {}
+
+        page: int | None = 1
+        while page is not None:
+            response = await self._pool.get(labels_path, params={"limit": str(DEFAULT_PAGE_SIZE), "page": str(page)})
+            response.raise_for_status()
+            labels = response.json()
+            label_map.update({label["name"]: label["id"] for label in labels})
+            page = next_page_number(response, labels, page, DEFAULT_PAGE_SIZE)
+
+        log.debug("label_cache_loaded", count=len(label_map))
+        return label_map
+
+    async def _send_with_label_ids(
+        self,
+        label_names: list[str],
+        send: Callable[[list[int]], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Send a request carrying label IDs, retrying once if they look stale.
+
+        A 404 or 422 can mean a cached label was deleted (or deleted and
+        recreated with a new ID) since it was cached. The cache is then
+        dropped, the names resolved again and the request resent once.
+
+        Args:
+            label_names: Label names to resolve.
+            send: Callable issuing the request for the resolved IDs.
+
+        Returns:
+            The response to the last request sent.
+        """
+        response = await send(await self._get_or_create_label_ids(label_names))
+        if response.status_code in STALE_LABEL_STATUSES:
+            log.info("label_cache_invalidated", status=response.status_code)
+            await self.invalidate_label_cache()
+            response = await send(await self._get_or_create_label_ids(label_names))
+        return response
+
     async def setup_automation_labels(
         self,
         labels: list[str] | None = None,
@@ -484,7 +647,9 @@ class GiteaRestProvider(GitProvider):
         """Set up automation labels in the repository.
 
         Creates the specified labels if they don't exist. Uses distinct colors
-        for each label type to make them visually distinguishable.
+        for each label type to make them visually distinguishable. This also
+        warms the provider's label cache, so later issue creation resolves
+        these labels without listing them again.
 
         Args:
             labels: List of label names. If None, creates default automation labels.
@@ -492,48 +657,10 @@ class GiteaRestProvider(GitProvider):
         Returns:
             Dict mapping label names to their IDs.
         """
-        # Default automation labels with distinct colors
-        default_labels = {
-            "needs-planning": "5319e7",  # Purple - needs attention
-            "awaiting-approval": "fbca04",  # Yellow - waiting
-            "approved": "0e8a16",  # Green - ready to go
-            "in-progress": "1d76db",  # Blue - working on it
-            "done": "0e8a16",  # Green - complete
-            "proposed": "c5def5",  # Light blue - proposal
-        }
-
         if labels is None:
-            labels = list(default_labels.keys())
-
-        labels_path = f"/repos/{self.owner}/{self.repo}/labels"
-
-        # Get existing labels
-        response = await self._pool.get(labels_path)
-        response.raise_for_status()
-        existing_labels = {label["name"]: label["id"] for label in response.json()}
-
-        result: dict[str, int] = {}
-        for name in labels:
-            if name in existing_labels:
-                log.debug("label_exists", name=name)
-                result[name] = existing_labels[name]
-            else:
-                # Create new label with appropriate color
-                color = default_labels.get(name, "ededed")  # Default gray if not in defaults
-                log.info("creating_automation_label", name=name, color=color)
-                create_response = await self._pool.post(
-                    labels_path,
-                    json={
-                        "name": name,
-                        "color": color,
-                        "description": f"Automation label: {name}",
-                    },
-                )
-                create_response.raise_for_status()
-                new_label = create_response.json()
-                result[name] = new_label["id"]
+            labels = list(AUTOMATION_LABEL_COLORS.keys())
 
-        return result
+        return await self.ensure_labels(labels, colors=AUTOMATION_LABEL_COLORS, description="Automation label: {name}")
 
     def _parse_issue(self, data: dict[str, Any]) -> Issue:
         """Parse issue data from Gitea REST API response to internal Issue model.
@@ -0,0 +1,577 @@
+"""GitHub provider implementation using native async REST API calls.
+
+``GitHubRestProvider`` wraps PyGithub, a synchronous library: every call
+is offloaded to a worker thread, most operations take several round trips
+(fetch the issue object, then edit it, then fetch it again) and PyGithub
+spaces writes a second apart. This provider talks to the REST API directly
+through the shared ``HTTPConnectionPool``, which brings HTTP/2 multiplexing,
+ETag revalidation and the rate-limit-aware scheduler, and uses the fewest
+requests each operation allows. ``GitHubRestProvider`` remains available
+as a fallback (``git_provider.github_client: pygithub``) and is still used
+for repository secrets, which need PyNaCl's sealed boxes.
+"""
+
+import base64
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+import httpx
+import structlog
+
+from repo_sapiens.models.domain import Branch, Comment, Issue, IssueState, PullRequest
+from repo_sapiens.providers.base import GitProvider
+from repo_sapiens.providers.gitea_rest import AUTOMATION_LABEL_COLORS
+from repo_sapiens.utils.connection_pool import HTTPConnectionPool, get_pool, parse_response
+from repo_sapiens.utils.pagination import DEFAULT_PAGE_SIZE, next_page_number, prefetch_pages
+from repo_sapiens.utils.retry import async_retry
+
+log = structlog.get_logger(__name__)
+
+# REST API version the requests and parsers are written against
+GITHUB_API_VERSION = "2022-11-28"
+
+# Media type for raw unified diffs from the compare and pulls endpoints
+DIFF_MEDIA_TYPE = "application/vnd.github.diff"
+
+
+class GitHubAsyncProvider(GitProvider):
+    """GitHub implementation using httpx through the shared connection pool."""
+
+    issues_oldest_first = True
+
+    def __init__(
+        self,
+        token: str,
+        owner: str,
+        repo: str,
+        base_url: str = "https://api.github.com",
+    ):
+        """Initialize GitHub provider.
+
+        Args:
+            token: GitHub personal access token or App token
+            owner: Repository owner (user or organization)
+            repo: Repository name
+            base_url: GitHub API base URL (for GitHub Enterprise, e.g.
+                https://ghe.example.com/api/v3)
+        """
+        self.token = token.strip() if token else token
+        self.owner = owner
+        self.repo = repo
+        # Normalize base_url by removing trailing slash (Pydantic HttpUrl adds it)
+        self.base_url = base_url.rstrip("/")
+        self._repo_path = f"/repos/{owner}/{repo}"
+        self._pool: HTTPConnectionPool | None = None
+
+    @property
+    def pool(self) -> HTTPConnectionPool:
+        """Connection pool for API requests.
+
+        Raises:
+            RuntimeError: If connect() has not been called
+        """
+        if self._pool is None:
+            raise RuntimeError("GitHub provider is not connected. Call connect() first.")
+        return self._pool
+
+    async def connect(self) -> None:
+        """Initialize connection pool and verify repository access."""
+        self._pool = await get_pool(
+            name=f"github-{self.base_url}",
+            base_url=self.base_url,
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": GITHUB_API_VERSION,
+            },
+        )
+        # Verify the token can see the repository
+        response = await self.pool.get(self._repo_path)
+        if response.status_code != 200:
+            raise ConnectionError(f"Failed to connect to GitHub: {response.status_code}")
+        log.info("github_connected", base_url=self.base_url, owner=self.owner, repo=self.repo)
+
+    async def disconnect(self) -> None:
+        """Clear pool reference (pool manager handles actual cleanup)."""
+        self._pool = None
+
+    async def __aenter__(self) -> "GitHubAsyncProvider":
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.disconnect()
+
+    async def get_issues(
+        self,
+        labels: list[str] | None = None,
+        state: str = "open",
+    ) -> list[Issue]:
+        """Retrieve issues via REST API, following pagination."""
+        log.info("get_issues", labels=labels, state=state)
+
+        return [issue async for issue in self.iter_issues(labels=labels, state=state)]
+
+    async def iter_issue_pages(
+        self,
+        labels: list[str] | None = None,
+        state: str = "open",
+    ) -> AsyncIterator[list[Issue]]:
+        """Stream issues page by page, prefetching the next page.
+
+        Issues are requested oldest first, so ordering holds across pages.
+        GitHub lists pull requests on the issues endpoint too; they are
+        dropped from each page, so a page may hold fewer issues than
+        requested without being the last one.
+        """
+        params: dict[str, str] = {
+            "state": state,
+            "sort": "created",
+            "direction": "asc",
+            "per_page": str(DEFAULT_PAGE_SIZE),
+        }
+        if labels:
+            params["labels"] = ",".join(labels)
+
+        async def fetch(page: int) -> tuple[httpx.Response, list[dict[str, Any]]]:
+            result: tuple[httpx.Response, list[dict[str, Any]]] = await self._get_issues_page(params, page)
+            return result
+
+        def following(page: int, result: tuple[httpx.Response, list[dict[str, Any]]]) -> int | None:
+            response, items = result
+            return next_page_number(response, items, page, DEFAULT_PAGE_SIZE)
+
+        async for _response, items in prefetch_pages(fetch, following):
+            yield [self._parse_issue(item) for item in items if "pull_request" not in item]
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def _get_issues_page(self, params: dict[str, str], page: int) -> tuple[httpx.Response, list[dict[str, Any]]]:
+        """Fetch a single raw page of issues and pull requests."""
+        log.debug("get_issues_page", page=page)
+
+        response = await self.pool.get(f"{self._repo_path}/issues", params={**params, "page": str(page)})
+        response.raise_for_status()
+
+        return response, parse_response(response, _parse_object_list)
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def get_issue(self, issue_number: int) -> Issue:
+        """Get single issue by number."""
+        log.info("get_issue", number=issue_number)
+
+        response = await self.pool.get(f"{self._repo_path}/issues/{issue_number}")
+        response.raise_for_status()
+
+        return parse_response(response, self._parse_issue)
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def create_issue(
+        self,
+        title: str,
+        body: str,
+        labels: list[str] | None = None,
+    ) -> Issue:
+        """Create a new issue; missing labels are created by GitHub."""
+        log.info("create_issue", title=title, labels=labels)
+
+        response = await self.pool.post(
+            f"{self._repo_path}/issues",
+            json={"title": title, "body": body, "labels": labels or []},
+        )
+        response.raise_for_status()
+
+        return self._parse_issue(response.json())
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def update_issue(
+        self,
+        issue_number: int,
+        title: str | None = None,
+        body: str | None = None,
+        labels: list[str] | None = None,
+        state: str | None = None,
+    ) -> Issue:
+        """Update issue fields in a single request.
+
+        GitHub's PATCH accepts label names and answers with the updated
+        issue, so no follow-up fetch is needed.
+        """
+        log.info("update_issue", number=issue_number)
+
+        data: dict[str, Any] = {}
+        if title is not None:
+            data["title"] = title
+        if body is not None:
+            data["body"] = body
+        if state is not None:
+            data["state"] = state
+        if labels is not None:
+            data["labels"] = labels
+
+        if not data:
+            issue: Issue = await self.get_issue(issue_number)
+            return issue
+
+        response = await self.pool.patch(f"{self._repo_path}/issues/{issue_number}", json=data)
+        response.raise_for_status()
+
+        return self._parse_issue(response.json())
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def add_comment(self, issue_number: int, comment: str) -> Comment:
+        """Add comment to issue."""
+        log.info("add_comment", number=issue_number)
+
+        response = await self.pool.post(
+            f"{self._repo_path}/issues/{issue_number}/comments",
+            json={"body": comment},
+        )
+        response.raise_for_status()
+
+        return self._parse_comment(response.json())
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def get_comments(self, issue_number: int, since: datetime | None = None) -> list[Comment]:
+        """Retrieve all comments for an issue, or those created since a time."""
+        log.info("get_comments", number=issue_number, since=since.isoformat() if since else None)
+
+        path = f"{self._repo_path}/issues/{issue_number}/comments"
+        params: dict[str, str] = {"per_page": str(DEFAULT_PAGE_SIZE)}
+        if since is not None:
+            # GitHub's filter is on updated_at; edited older comments are dropped below
+            params["since"] = since.isoformat()
+
+        comments: list[Comment] = []
+        page: int | None = 1
+        while page is not None:
+            response = await self.pool.get(path, params={**params, "page": str(page)})
+            response.raise_for_status()
+            items = response.json()
+            comments.extend(self._parse_comment(item) for item in items)
+            page = next_page_number(response, items, page, DEFAULT_PAGE_SIZE)
+
+        if since is not None:
+            comments = [c for c in comments if c.created_at >= since]
+        return comments
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def create_branch(self, branch_name: str, from_branch: str = "main") -> Branch:
+        """Create a new branch from the head of another."""
+        log.info("create_branch", branch=branch_name, from_branch=from_branch)
+
+        source = await self.pool.get(f"{self._repo_path}/git/ref/heads/{from_branch}")
+        source.raise_for_status()
+        sha = source.json()["object"]["sha"]
+
+        response = await self.pool.post(
+            f"{self._repo_path}/git/refs",
+            json={"ref": f"refs/heads/{branch_name}", "sha": sha},
+        )
+        if response.status_code == 422:
+            # Reference already exists
+            existing: Branch | None = await self.get_branch(branch_name)
+            if existing is not None:
+                log.info("branch_exists", branch=branch_name)
+                return existing
+        response.raise_for_status()
+
+        return Branch(name=branch_name, sha=response.json()["object"]["sha"])
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def get_branch(self, branch_name: str) -> Branch | None:
+        """Get branch information."""
+        log.info("get_branch", branch=branch_name)
+
+        response = await self.pool.get(f"{self._repo_path}/branches/{branch_name}")
+        if response.status_code == 404:
+            log.debug("github_branch_not_found", branch=branch_name)
+            return None
+        response.raise_for_status()
+
+        return parse_response(response, self._parse_branch)
+
+    async def delete_branch(self, branch_name: str) -> bool:
+        """Delete a branch."""
+        log.info("delete_branch", branch=branch_name)
+
+        response = await self.pool.delete(f"{self._repo_path}/git/refs/heads/{branch_name}")
+        # GitHub answers 422 "Reference does not exist" for unknown refs
+        if response.status_code in (404, 422):
+            log.debug("github_branch_not_found", branch=branch_name)
+            return False
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            log.error("github_delete_branch_failed", branch=branch_name, error=str(e))
+            raise
+        return True
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def get_diff(self, base: str, head: str, pr_number: int | None = None) -> str:
+        """Get diff between two branches or for a PR.
+
+        Args:
+            base: Base branch name
+            head: Head branch name
+            pr_number: Optional PR number to get diff from
+
+        Returns:
+            Unified diff string
+        """
+        log.info("get_diff", base=base, head=head, pr=pr_number)
+
+        if pr_number:
+            path = f"{self._repo_path}/pulls/{pr_number}"
+        else:
+            path = f"{self._repo_path}/compare/{base}...{head}"
+        response = await self.pool.get(path, headers={"Accept": DIFF_MEDIA_TYPE})
+        response.raise_for_status()
+
+        return response.text
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def merge_branches(self, source: str, target: str, message: str) -> None:
+        """Merge source branch into target with a merge commit."""
+        log.info("merge_branches", source=source, target=target)
+
+        response = await self.pool.post(
+            f"{self._repo_path}/merges",
+            json={"base": target, "head": source, "commit_message": message},
+        )
+        # 204 means target already contains source
+        response.raise_for_status()
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def create_pull_request(
+        self,
+        title: str,
+        body: str,
+        head: str,
+        base: str = "main",
+        labels: list[str] | None = None,
+    ) -> PullRequest:
+        """Create a pull request."""
+        log.info("create_pull_request", title=title, head=head, base=base)
+
+        response = await self.pool.post(
+            f"{self._repo_path}/pulls",
+            json={"title": title, "body": body, "head": head, "base": base},
+        )
+        response.raise_for_status()
+        pr = self._parse_pull_request(response.json())
+
+        if labels:
+            # Pull requests take labels through the issues API
+            labels_response = await self.pool.post(
+                f"{self._repo_path}/issues/{pr.number}/labels",
+                json={"labels": labels},
+            )
+            labels_response.raise_for_status()
+
+        return pr
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def get_pull_request(self, pr_number: int) -> PullRequest:
+        """Get pull request by number."""
+        log.info("get_pull_request", number=pr_number)
+
+        response = await self.pool.get(f"{self._repo_path}/pulls/{pr_number}")
+        response.raise_for_status()
+
+        return parse_response(response, self._parse_pull_request)
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def get_file(self, path: str, ref: str = "main") -> str:
+        """Read file contents from repository."""
+        log.info("get_file", path=path, ref=ref)
+
+        response = await self.pool.get(f"{self._repo_path}/contents/{path}", params={"ref": ref})
+        response.raise_for_status()
+
+        content_data = response.json()
+        if isinstance(content_data, list):
+            raise ValueError(f"Path {path} is a directory, not a file")
+        return base64.b64decode(content_data["content"]).decode("utf-8")
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def commit_file(
+        self,
+        path: str,
+        content: str,
+        message: str,
+        branch: str,
+    ) -> str:
+        """Commit file to repository."""
+        log.info("commit_file", path=path, branch=branch)
+
+        contents_path = f"{self._repo_path}/contents/{path}"
+
+        data: dict[str, str] = {
+            "message": message,
+            "content": base64.b64encode(content.encode("utf-8")).decode("utf-8"),
+            "branch": branch,
+        }
+
+        # Updating an existing file requires its blob SHA
+        existing = await self.pool.get(contents_path, params={"ref": branch})
+        if existing.status_code == 200:
+            existing_data = existing.json()
+            if isinstance(existing_data, dict) and existing_data.get("sha"):
+                data["sha"] = existing_data["sha"]
+        elif existing.status_code != 404:
+            existing.raise_for_status()
+
+        response = await self.pool.put(contents_path, json=data)
+        response.raise_for_status()
+
+        return str(response.json()["commit"]["sha"])
+
+    async def setup_automation_labels(
+        self,
+        labels: list[str] | None = None,
+    ) -> dict[str, int]:
+        """Set up automation labels in the repository.
+
+        Creates the specified labels if they don't exist. Uses distinct colors
+        for each label type to make them visually distinguishable.
+
+        Args:
+            labels: List of label names. If None, creates default automation labels.
+
+        Returns:
+            Dict mapping label names to their IDs.
+        """
+        if labels is None:
+            labels = list(AUTOMATION_LABEL_COLORS.keys())
+
+        existing_labels = await self._list_label_ids()
+
+        result: dict[str, int] = {}
+        for name in labels:
+            if name in existing_labels:
+                log.debug("label_exists", name=name)
+                result[name] = existing_labels[name]
+                continue
+
+            color = AUTOMATION_LABEL_COLORS.get(name, "ededed")  # Default gray if not in defaults
+            log.info("creating_automation_label", name=name, color=color)
+            response = await self.pool.post(
+                f"{self._repo_path}/labels",
+                json={"name": name, "color": color, "description": f"Automation label: {name}"},
+            )
+            response.raise_for_status()
+            result[name] = response.json()["id"]
+
+        return result
+
+    async def _list_label_ids(self) -> dict[str, int]:
+        """List every repository label, following pagination."""
+        labels_path = f"{self._repo_path}/labels"
+        label_map: dict[str, int] = {}
+
+        page: int | None = 1
+        while page is not None:
+            response = await self.pool.get(labels_path, params={"per_page": str(DEFAULT_PAGE_SIZE), "page": str(page)})
+            response.raise_for_status()
+            labels = response.json()
+            label_map.update({label["name"]: label["id"] for label in labels})
+            page = next_page_number(response, labels, page, DEFAULT_PAGE_SIZE)
+
+        return label_map
+
+    def _parse_issue(self, data: dict[str, Any]) -> Issue:
+        """Parse issue data from GitHub REST API response to internal Issue model.
+
+        Field mappings match ``GitHubRestProvider._convert_issue``: a null
+        body becomes an empty string, a deleted author ("ghost" user sent as
+        null) becomes "unknown", and unknown states default to OPEN.
+
+        Args:
+            data: Raw JSON dict from GitHub API response.
+
+        Returns:
+            Normalized Issue object for internal use.
+        """
+        user = data.get("user")
+        return Issue(
+            id=data["id"],
+            number=data["number"],
+            title=data["title"],
+            body=data.get("body") or "",
+            state=IssueState.CLOSED if data["state"] == "closed" else IssueState.OPEN,
+            labels=[label["name"] for label in data.get("labels", [])],
+            created_at=_parse_timestamp(data["created_at"]),
+            updated_at=_parse_timestamp(data["updated_at"]),
+            author=user["login"] if user else "unknown",
+            url=data["html_url"],
+        )
+
+    def _parse_comment(self, data: dict[str, Any]) -> Comment:
+        """Parse comment data from GitHub REST API response to internal Comment model.
+
+        Args:
+            data: Raw JSON dict from GitHub API response for a single comment.
+
+        Returns:
+            Normalized Comment object for internal use.
+        """
+        user = data.get("user")
+        return Comment(
+            id=data["id"],
+            body=data.get("body") or "",
+            author=user["login"] if user else "unknown",
+            created_at=_parse_timestamp(data["created_at"]),
+        )
+
+    def _parse_branch(self, data: dict[str, Any]) -> Branch:
+        """Parse branch data from GitHub REST API response to internal Branch model.
+
+        Args:
+            data: Raw JSON dict from GitHub's branches endpoint.
+
+        Returns:
+            Normalized Branch object, including branch protection status.
+        """
+        return Branch(
+            name=data["name"],
+            sha=data["commit"]["sha"],
+            protected=data.get("protected", False),
+        )
+
+    def _parse_pull_request(self, data: dict[str, Any]) -> PullRequest:
+        """Parse pull request data from GitHub REST API response to internal PullRequest model.
+
+        Args:
+            data: Raw JSON dict from GitHub API response for a pull request.
+
+        Returns:
+            Normalized PullRequest object for internal use.
+        """
+        user = data.get("user")
+        return PullRequest(
+            id=data["id"],
+            number=data["number"],
+            title=data["title"],
+            body=data.get("body") or "",
+            state=data["state"],
+            head=data["head"]["ref"],
+            base=data["base"]["ref"],
+            url=data["html_url"],
+            created_at=_parse_timestamp(data["created_at"]),
+            author=user["login"] if user else "",
+        )
+
+
+def _parse_object_list(data: Any) -> list[dict[str, Any]]:
+    """Check that a decoded response body is a JSON array of objects."""
+    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        raise ValueError("Expected a JSON array of objects")
+    return data
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse GitHub's ISO 8601 timestamps ('Z' suffix for UTC)."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -1,11 +1,15 @@
 """GitHub provider implementation using PyGithub and REST API."""
 
 import asyncio
-from collections.abc import Callable
-from typing import TypeVar
+import copy
+import itertools
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from typing import Any, TypeVar
 
 import structlog
-from github import Github, GithubException  # type: ignore[import-not-found]
+from github import Github, GithubException, RateLimitExceededException  # type: ignore[import-not-found]
 from github.Branch import Branch as GHBranch  # type: ignore[import-not-found]
 from github.Issue import Issue as GHIssue  # type: ignore[import-not-found]
 from github.IssueComment import IssueComment as GHComment  # type: ignore[import-not-found]
@@ -14,11 +18,17 @@ from github.Repository import Repository as GHRepository  # type: ignore[import-
 
 from repo_sapiens.models.domain import Branch, Comment, Issue, IssueState, PullRequest
 from repo_sapiens.providers.base import GitProvider
+from repo_sapiens.utils.connection_pool import record_revalidation
+from repo_sapiens.utils.pagination import DEFAULT_PAGE_SIZE, prefetch_pages
+from repo_sapiens.utils.rate_limit import Priority, RateLimitScheduler
 
 log = structlog.get_logger(__name__)
 
 T = TypeVar("T")
 
+# Most objects kept for ETag revalidation (least recently used dropped first)
+MAX_CONDITIONAL_ENTRIES = 1024
+
 
 async def _run_sync(func: Callable[[], T]) -> T:
     """Run a synchronous function in a thread pool.
@@ -32,6 +42,8 @@ async def _run_sync(func: Callable[[], T]) -> T:
 class GitHubRestProvider(GitProvider):
     """GitHub implementation using PyGithub library."""
 
+    issues_oldest_first = True
+
     def __init__(
         self,
         token: str,
@@ -54,6 +66,9 @@ class GitHubRestProvider(GitProvider):
         self.base_url = base_url.rstrip("/")
         self._client: Github | None = None
         self._repo: GHRepository | None = None
+        # PyGithub objects and their converted models, revalidated via ETag
+        self._conditional: OrderedDict[str, tuple[Any, Any]] = OrderedDict()
+        self.rate_limiter = RateLimitScheduler(f"github-{self.base_url}")
 
     async def connect(self) -> None:
         """Initialize GitHub client."""
@@ -71,6 +86,31 @@ class GitHubRestProvider(GitProvider):
             repo=self.repo,
         )
 
+    async def _call(self, func: Callable[[], T], priority: Priority = Priority.NORMAL) -> T:
+        """Run a PyGithub call in the thread pool, paced by the rate limiter.
+
+        One call takes one slot even if PyGithub makes several requests for
+        it; the budget PyGithub parsed from the last response corrects the
+        estimate afterwards.
+        """
+        await self.rate_limiter.acquire(priority)
+        try:
+            return await _run_sync(func)
+        except RateLimitExceededException as e:
+            self.rate_limiter.observe(e.status, e.headers or {})
+            raise
+        finally:
+            self._observe_rate_limit()
+
+    def _observe_rate_limit(self) -> None:
+        """Pass the budget PyGithub parsed from its last response to the rate limiter."""
+        requester = getattr(self._client, "requester", None)
+        budget = getattr(requester, "rate_limiting", None)
+        reset = getattr(requester, "rate_limiting_resettime", None)
+        if isinstance(budget, tuple) and isinstance(reset, int):
+            remaining, limit = budget
+            self.rate_limiter.observe_budget(remaining, limit, reset)
+
     async def disconnect(self) -> None:
         """Close GitHub client."""
         if self._client:
@@ -86,14 +126,41 @@ class GitHubRestProvider(GitProvider):
         """Retrieve issues via GitHub API."""
         log.info("get_issues", labels=labels, state=state)
 
+        return [issue async for issue in self.iter_issues(labels=labels, state=state)]
+
+    async def iter_issue_pages(
+        self,
+        labels: list[str] | None = None,
+        state: str = "open",
+    ) -> AsyncIterator[list[Issue]]:
+        """Stream issues page by page, prefetching the next page.
+
+        PyGithub's PaginatedList fetches pages lazily while it is iterated, so
+        each chunk of DEFAULT_PAGE_SIZE items is pulled in the thread pool
+        instead of materializing the whole list in one blocking call. Issues
+        are requested oldest first, so ordering holds across pages.
+        """
         gh_state = state if state in ("open", "closed", "all") else "open"
 
         try:
-            # Wrap synchronous iteration in thread pool
-            gh_issues = await _run_sync(lambda: list(self._repo.get_issues(state=gh_state, labels=labels or [])))
+            gh_issues = await self._call(
+                lambda: iter(
+                    self._repo.get_issues(state=gh_state, labels=labels or [], sort="created", direction="asc")
+                ),
+                priority=Priority.BULK,
+            )
+
+            async def fetch(_page: int) -> list[GHIssue]:
+                return await self._call(
+                    lambda: list(itertools.islice(gh_issues, DEFAULT_PAGE_SIZE)), priority=Priority.BULK
+                )
 
-            # Convert to our Issue model
-            return [self._convert_issue(gh_issue) for gh_issue in gh_issues]
+            def following(page: int, chunk: list[GHIssue]) -> int | None:
+                return page + 1 if len(chunk) == DEFAULT_PAGE_SIZE else None
+
+            async for chunk in prefetch_pages(fetch, following):
+                # Convert to our Issue model
+                yield [self._convert_issue(gh_issue) for gh_issue in chunk]
 
         except GithubException as e:
             log.error("github_get_issues_failed", error=str(e))
@@ -104,8 +171,11 @@ class GitHubRestProvider(GitProvider):
         log.info("get_issue", number=issue_number)
 
         try:
-            gh_issue = await _run_sync(lambda: self._repo.get_issue(issue_number))
-            return self._convert_issue(gh_issue)
+            return await self._get_conditional(
+                f"issue:{issue_number}",
+                lambda: self._repo.get_issue(issue_number),
+                self._convert_issue,
+            )
 
         except GithubException as e:
             log.error("github_get_issue_failed", number=issue_number, error=str(e))
@@ -121,12 +191,13 @@ class GitHubRestProvider(GitProvider):
         log.info("create_issue", title=title, labels=labels)
 
         try:
-            gh_issue = await _run_sync(
+            gh_issue = await self._call(
                 lambda: self._repo.create_issue(
                     title=title,
                     body=body,
                     labels=labels or [],
-                )
+                ),
+                priority=Priority.INTERACTIVE,
             )
             return self._convert_issue(gh_issue)
 
@@ -163,7 +234,7 @@ class GitHubRestProvider(GitProvider):
                 # Refresh to get updated data
                 return self._repo.get_issue(issue_number)
 
-            gh_issue = await _run_sync(_update)
+            gh_issue = await self._call(_update, priority=Priority.INTERACTIVE)
             return self._convert_issue(gh_issue)
 
         except GithubException as e:
@@ -180,25 +251,31 @@ class GitHubRestProvider(GitProvider):
                 gh_issue = self._repo.get_issue(issue_number)
                 return gh_issue.create_comment(comment)
 
-            gh_comment = await _run_sync(_add_comment)
+            gh_comment = await self._call(_add_comment, priority=Priority.INTERACTIVE)
             return self._convert_comment(gh_comment)
 
         except GithubException as e:
             log.error("github_add_comment_failed", number=issue_number, error=str(e))
             raise
 
-    async def get_comments(self, issue_number: int) -> list[Comment]:
-        """Retrieve all comments for an issue."""
-        log.info("get_comments", number=issue_number)
+    async def get_comments(self, issue_number: int, since: datetime | None = None) -> list[Comment]:
+        """Retrieve all comments for an issue, or those created since a time."""
+        log.info("get_comments", number=issue_number, since=since.isoformat() if since else None)
 
         try:
 
             def _get_comments() -> list[GHComment]:
                 gh_issue = self._repo.get_issue(issue_number)
-                return list(gh_issue.get_comments())
+                if since is None:
+                    return list(gh_issue.get_comments())
+                # GitHub's filter is on updated_at; edited older comments are dropped below
+                return list(gh_issue.get_comments(since=since))
 
-            gh_comments = await _run_sync(_get_comments)
-            return [self._convert_comment(c) for c in gh_comments]
+            gh_comments = await self._call(_get_comments, priority=Priority.INTERACTIVE)
+            comments = [self._convert_comment(c) for c in gh_comments]
+            if since is not None:
+                comments = [c for c in comments if c.created_at >= since]
+            return comments
 
         except GithubException as e:
             log.error("github_get_comments_failed", number=issue_number, error=str(e))
@@ -224,7 +301,7 @@ class GitHubRestProvider(GitProvider):
                 # Get branch details
                 return self._repo.get_branch(branch_name)
 
-            gh_branch = await _run_sync(_create_branch)
+            gh_branch = await self._call(_create_branch, priority=Priority.INTERACTIVE)
             return self._convert_branch(gh_branch)
 
         except GithubException as e:
@@ -241,7 +318,7 @@ class GitHubRestProvider(GitProvider):
         log.info("get_branch", branch=branch_name)
 
         try:
-            gh_branch = await _run_sync(lambda: self._repo.get_branch(branch_name))
+            gh_branch = await self._call(lambda: self._repo.get_branch(branch_name))
             return self._convert_branch(gh_branch)
 
         except GithubException as e:
@@ -263,7 +340,7 @@ class GitHubRestProvider(GitProvider):
                 ref.delete()
                 return True
 
-            return await _run_sync(_delete_branch)
+            return await self._call(_delete_branch, priority=Priority.INTERACTIVE)
 
         except GithubException as e:
             if e.status == 404:
@@ -290,7 +367,7 @@ class GitHubRestProvider(GitProvider):
 
                 return "\n".join(diff_parts)
 
-            return await _run_sync(_get_diff)
+            return await self._call(_get_diff)
 
         except GithubException as e:
             log.error("github_get_diff_failed", base=base, head=head, error=str(e))
@@ -311,12 +388,13 @@ class GitHubRestProvider(GitProvider):
             # Better approach: Use Git API directly
 
             # Create merge commit
-            await _run_sync(
+            await self._call(
                 lambda: self._repo.merge(
                     base=target,
                     head=source,
                     commit_message=message,
-                )
+                ),
+                priority=Priority.INTERACTIVE,
             )
 
         except GithubException as e:
@@ -355,7 +433,7 @@ class GitHubRestProvider(GitProvider):
 
                 return gh_pr
 
-            gh_pr = await _run_sync(_create_pr)
+            gh_pr = await self._call(_create_pr, priority=Priority.INTERACTIVE)
             return self._convert_pull_request(gh_pr)
 
         except GithubException as e:
@@ -367,12 +445,11 @@ class GitHubRestProvider(GitProvider):
         log.info("get_pull_request", number=pr_number)
 
         try:
-
-            def _get_pr() -> GHPullRequest:
-                return self._repo.get_pull(pr_number)
-
-            gh_pr = await _run_sync(_get_pr)
-            return self._convert_pull_request(gh_pr)
+            return await self._get_conditional(
+                f"pull:{pr_number}",
+                lambda: self._repo.get_pull(pr_number),
+                self._convert_pull_request,
+            )
 
         except GithubException as e:
             log.error("github_get_pr_failed", number=pr_number, error=str(e))
@@ -393,7 +470,7 @@ class GitHubRestProvider(GitProvider):
 
                 return contents.decoded_content.decode("utf-8")
 
-            return await _run_sync(_get_file)
+            return await self._call(_get_file)
 
         except GithubException as e:
             log.error("github_get_file_failed", path=path, ref=ref, error=str(e))
@@ -437,7 +514,7 @@ class GitHubRestProvider(GitProvider):
 
                 return result["commit"].sha
 
-            return await _run_sync(_commit_file)
+            return await self._call(_commit_file, priority=Priority.INTERACTIVE)
 
         except GithubException as e:
             log.error("github_commit_file_failed", path=path, branch=branch, error=str(e))
@@ -452,12 +529,13 @@ class GitHubRestProvider(GitProvider):
 
         try:
             # Create or update the secret (PyGithub handles encryption via PyNaCl)
-            await _run_sync(
+            await self._call(
                 lambda: self._repo.create_secret(
                     secret_name=name,
                     unencrypted_value=value,
                     secret_type="actions",  # nosec B106 # Literal constant for GitHub API, not a password
-                )
+                ),
+                priority=Priority.INTERACTIVE,
             )
             log.info("github_secret_set", name=name)
 
@@ -494,7 +572,10 @@ class GitHubRestProvider(GitProvider):
             labels = list(default_labels.keys())
 
         # Get existing labels
-        existing_labels = {label.name: label.id for label in await _run_sync(lambda: list(self._repo.get_labels()))}
+        existing_labels = {
+            label.name: label.id
+            for label in await self._call(lambda: list(self._repo.get_labels()), priority=Priority.INTERACTIVE)
+        }
 
         result: dict[str, int] = {}
         for name in labels:
@@ -505,17 +586,45 @@ class GitHubRestProvider(GitProvider):
                 # Create new label with appropriate color
                 color = default_labels.get(name, "ededed")  # Default gray if not in defaults
                 log.info("creating_automation_label", name=name, color=color)
-                new_label = await _run_sync(
+                new_label = await self._call(
                     lambda n=name, c=color: self._repo.create_label(
                         name=n,
                         color=c,
                         description=f"Automation label: {n}",
-                    )
+                    ),
+                    priority=Priority.INTERACTIVE,
                 )
                 result[name] = new_label.id
 
         return result
 
+    async def _get_conditional(self, key: str, fetch: Callable[[], T], convert: Callable[[T], Any]) -> Any:
+        """Fetch an object, revalidating a previously fetched copy with its ETag.
+
+        The first fetch stores the PyGithub object. Later calls use PyGithub's
+        ``update()``, which sends If-None-Match / If-Modified-Since; on 304 a
+        copy of the previously converted model is returned without converting
+        again. At most MAX_CONDITIONAL_ENTRIES objects are kept.
+        """
+        cached = self._conditional.get(key)
+
+        if cached is not None:
+            gh_obj, converted = cached
+            if not await self._call(gh_obj.update):
+                record_revalidation("github_conditional", hit=True)
+                self._conditional.move_to_end(key)
+                return copy.deepcopy(converted)
+        else:
+            gh_obj = await self._call(fetch)
+
+        record_revalidation("github_conditional", hit=False)
+        converted = convert(gh_obj)
+        self._conditional[key] = (gh_obj, converted)
+        self._conditional.move_to_end(key)
+        while len(self._conditional) > MAX_CONDITIONAL_ENTRIES:
+            self._conditional.popitem(last=False)
+        return copy.deepcopy(converted)
+
     def _convert_issue(self, gh_issue: GHIssue) -> Issue:
         """Convert GitHub Issue object to internal Issue model.
 
@@ -2,6 +2,7 @@
 
 import base64
 import urllib.parse
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
@@ -10,7 +11,8 @@ import structlog
 
 from repo_sapiens.models.domain import Branch, Comment, Issue, IssueState, PullRequest
 from repo_sapiens.providers.base import GitProvider
-from repo_sapiens.utils.connection_pool import HTTPConnectionPool, get_pool
+from repo_sapiens.utils.connection_pool import HTTPConnectionPool, get_pool, parse_response
+from repo_sapiens.utils.pagination import DEFAULT_PAGE_SIZE, next_page_number, prefetch_pages
 from repo_sapiens.utils.retry import async_retry
 
 log = structlog.get_logger(__name__)
@@ -31,6 +33,8 @@ class GitLabRestProvider(GitProvider):
     - Project path must be URL-encoded in API calls
     """
 
+    issues_oldest_first = True
+
     def __init__(
         self,
         base_url: str,
@@ -84,13 +88,12 @@ class GitLabRestProvider(GitProvider):
         """Async context manager exit."""
         await self.disconnect()
 
-    @async_retry(max_attempts=3, backoff_factor=2.0)
     async def get_issues(
         self,
         labels: list[str] | None = None,
         state: str = "open",
     ) -> list[Issue]:
-        """Retrieve issues via REST API.
+        """Retrieve issues via REST API, following pagination.
 
         Args:
             labels: Filter by labels (all labels must match)
@@ -101,18 +104,57 @@ class GitLabRestProvider(GitProvider):
         """
         log.info("get_issues", labels=labels, state=state)
 
+        return [issue async for issue in self.iter_issues(labels=labels, state=state)]
+
+    async def iter_issue_pages(
+        self,
+        labels: list[str] | None = None,
+        state: str = "open",
+    ) -> AsyncIterator[list[Issue]]:
+        """Stream issues page by page, prefetching the next page.
+
+        Follows GitLab's ``X-Next-Page`` header. Issues are requested
+        oldest first, so ordering holds across pages. Each page request is
+        retried independently.
+
+        Args:
+            labels: Filter by labels (all labels must match)
+            state: Filter by state ("open", "closed", or "all")
+
+        Yields:
+            Lists of Issue objects, one per API page
+        """
         # Map state to GitLab format
         gitlab_state = {"open": "opened", "closed": "closed", "all": "all"}.get(state, "opened")
 
-        params: dict[str, str] = {"state": gitlab_state}
+        params: dict[str, str] = {
+            "state": gitlab_state,
+            "order_by": "created_at",
+            "sort": "asc",
+            "per_page": str(DEFAULT_PAGE_SIZE),
+        }
         if labels:
             params["labels"] = ",".join(labels)
 
-        response = await self._pool.get(f"/projects/{self.project_path}/issues", params=params)
+        async def fetch(page: int) -> tuple[httpx.Response, list[Issue]]:
+            return await self._get_issues_page(params, page)
+
+        def following(page: int, result: tuple[httpx.Response, list[Issue]]) -> int | None:
+            response, issues = result
+            return next_page_number(response, issues, page, DEFAULT_PAGE_SIZE)
+
+        async for _response, issues in prefetch_pages(fetch, following):
+            yield issues
+
+    @async_retry(max_attempts=3, backoff_factor=2.0)
+    async def _get_issues_page(self, params: dict[str, str], page: int) -> tuple[httpx.Response, list[Issue]]:
+        """Fetch and parse a single page of issues."""
+        log.debug("get_issues_page", page=page)
+
+        response = await self._pool.get(f"/projects/{self.project_path}/issues", params={**params, "page": str(page)})
         response.raise_for_status()
 
-        issues_data = response.json()
-        return [self._parse_issue(issue_data) for issue_data in issues_data]
+        return response, parse_response(response, lambda data: [self._parse_issue(d) for d in data])
 
     @async_retry(max_attempts=3, backoff_factor=2.0)
     async def get_issue(self, issue_number: int) -> Issue:
@@ -129,7 +171,7 @@ class GitLabRestProvider(GitProvider):
         response = await self._pool.get(f"/projects/{self.project_path}/issues/{issue_number}")
         response.raise_for_status()
 
-        return self._parse_issue(response.json())
+        return parse_response(response, self._parse_issue)
 
     @async_retry(max_attempts=3, backoff_factor=2.0)
     async def create_issue(
@@ -228,27 +270,56 @@ class GitLabRestProvider(GitProvider):
         return self._parse_comment(response.json())
 
     @async_retry(max_attempts=3, backoff_factor=2.0)
-    async def get_comments(self, issue_number: int) -> list[Comment]:
+    async def get_comments(self, issue_number: int, since: datetime | None = None) -> list[Comment]:
         """Get all comments (notes) for an issue.
 
         GitLab includes both user comments and system-generated notes.
         This method filters to return only user comments.
 
+        GitLab's notes API has no time filter. With ``since``, notes are
+        requested newest first and paging stops at the first page reaching
+        back past ``since``, so only recent pages are transferred.
+
         Args:
             issue_number: Issue number
+            since: Only return notes created at or after this time
 
         Returns:
-            List of Comment objects (excludes system notes)
+            List of Comment objects (excludes system notes), oldest first
         """
-        log.info("get_comments", issue_number=issue_number)
+        log.info("get_comments", issue_number=issue_number, since=since.isoformat() if since else None)
 
-        response = await self._pool.get(f"/projects/{self.project_path}/issues/{issue_number}/notes")
-        response.raise_for_status()
+        path = f"/projects/{self.project_path}/issues/{issue_number}/notes"
+        if since is None:
+            response = await self._pool.get(path)
+            response.raise_for_status()
+
+            # Filter to only user notes (exclude system notes)
+            return parse_response(
+                response, lambda notes: [self._parse_comment(n) for n in notes if not n.get("system", False)]
+            )
+
+        cutoff = since
+        params = {"order_by": "created_at", "sort": "desc", "per_page": str(DEFAULT_PAGE_SIZE)}
+
+        async def fetch(page: int) -> tuple[httpx.Response, list[dict[str, Any]]]:
+            response = await self._pool.get(path, params={**params, "page": str(page)})
+            response.raise_for_status()
+            return response, response.json()
+
+        def following(page: int, result: tuple[httpx.Response, list[dict[str, Any]]]) -> int | None:
+            response, notes = result
+            # Newest first: once a page reaches back past since, older pages can't match
+            if notes and datetime.fromisoformat(notes[-1]["created_at"].replace("Z", "+00:00")) < cutoff:
+                return None
+            return next_page_number(response, notes, page, DEFAULT_PAGE_SIZE)
 
-        notes_data = response.json()
-        # Filter to only user notes (exclude system notes)
-        user_notes = [n for n in notes_data if not n.get("system", False)]
-        return [self._parse_comment(note) for note in user_notes]
+        recent: list[Comment] = []
+        async for _response, notes in prefetch_pages(fetch, following):
+            page_comments = (self._parse_comment(n) for n in notes if not n.get("system", False))
+            recent.extend(c for c in page_comments if c.created_at >= cutoff)
+        recent.reverse()
+        return recent
 
     @async_retry(max_attempts=3, backoff_factor=2.0)
     async def get_file(self, path: str, ref: str = "main") -> str:
@@ -550,7 +621,7 @@ class GitLabRestProvider(GitProvider):
         try:
             response = await self._pool.get(f"/projects/{self.project_path}/merge_requests/{mr_number}")
             response.raise_for_status()
-            return self._parse_merge_request(response.json())
+            return parse_response(response, self._parse_merge_request)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 log.debug("mr_not_found", mr=mr_number)
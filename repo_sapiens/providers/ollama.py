@@ -1,6 +1,7 @@
 """Ollama provider for local AI inference."""
 
 import re
+import time
 from pathlib import Path
 from typing import Any
 
@@ -8,6 +9,7 @@ import httpx
 import structlog
 
 from repo_sapiens.models.domain import Issue, Plan, Review, Task, TaskResult
+from repo_sapiens.monitoring.usage import ollama_usage, record_call
 from repo_sapiens.providers.base import AgentProvider
 
 log = structlog.get_logger(__name__)
@@ -88,6 +90,7 @@ class OllamaProvider(AgentProvider):
 
         try:
             # Call Ollama generate API
+            started = time.perf_counter()
             response = await self.client.post(
                 f"{self.base_url}/api/generate",
                 json={
@@ -104,6 +107,7 @@ class OllamaProvider(AgentProvider):
 
             result = response.json()
             output = result.get("response", "")
+            record_call(self.model, "ollama", time.perf_counter() - started, **ollama_usage(result))
 
             log.info(
                 "prompt_executed",
@@ -1,12 +1,14 @@
 """OpenAI-compatible provider for local AI inference (vLLM, LMStudio, etc.)."""
 
 import re
+import time
 from typing import Any
 
 import httpx
 import structlog
 
 from repo_sapiens.models.domain import Issue, Plan, Review, Task, TaskResult
+from repo_sapiens.monitoring.usage import openai_usage, record_call
 from repo_sapiens.providers.base import AgentProvider
 
 log = structlog.get_logger(__name__)
@@ -17,8 +19,13 @@ class OpenAICompatibleProvider(AgentProvider):
 
     Supports vLLM, LMStudio, text-generation-webui, and other servers
     that implement the OpenAI API specification.
+
+    Attributes:
+        usage_provider: Provider name LLM calls are recorded under
     """
 
+    usage_provider = "openai"
+
     def __init__(
         self,
         base_url: str = "http://localhost:8000/v1",
@@ -120,6 +127,7 @@ class OpenAICompatibleProvider(AgentProvider):
 
         try:
             # Call chat completions API
+            started = time.perf_counter()
             response = await self.client.post(
                 f"{self.base_url}/chat/completions",
                 json={
@@ -131,6 +139,7 @@ class OpenAICompatibleProvider(AgentProvider):
             response.raise_for_status()
 
             result = response.json()
+            record_call(self.model, self.usage_provider, time.perf_counter() - started, **openai_usage(result))
             choices = result.get("choices", [])
 
             if not choices:
@@ -0,0 +1,34 @@
+"""Pluggable persistence for workflow state, checkpoints and feedback.
+
+Key Components:
+    - StorageBackend: Abstract document store (get/put/batched put/scan/lock)
+    - JSONFileBackend: One pretty-printed JSON file per document (default)
+    - SQLiteBackend: Single SQLite database in WAL mode with cross-process locks
+
+Example:
+    >>> from repo_sapiens.storage import SQLiteBackend
+    >>> from repo_sapiens.engine.state_manager import StateManager
+    >>> state = StateManager(".sapiens/state", backend=SQLiteBackend(".sapiens/sapiens.db"))
+"""
+
+from repo_sapiens.storage.base import (
+    CHECKPOINT_COLLECTION,
+    COMMENT_MARK_COLLECTION,
+    FEEDBACK_COLLECTION,
+    STATE_COLLECTION,
+    Document,
+    StorageBackend,
+)
+from repo_sapiens.storage.json_backend import JSONFileBackend
+from repo_sapiens.storage.sqlite_backend import SQLiteBackend
+
+__all__ = [
+    "CHECKPOINT_COLLECTION",
+    "COMMENT_MARK_COLLECTION",
+    "FEEDBACK_COLLECTION",
+    "STATE_COLLECTION",
+    "Document",
+    "JSONFileBackend",
+    "SQLiteBackend",
+    "StorageBackend",
+]
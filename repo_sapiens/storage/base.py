@@ -0,0 +1,123 @@
+"""
+Storage backend interface for persisted documents.
+
+State, checkpoints and feedback are all JSON-compatible documents addressed by
+a collection name and a key. Backends implement this small document-store
+interface so the managers that own those documents are agnostic to whether
+they live in per-document JSON files or in a shared SQLite database.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from typing import Any
+
+Document = dict[str, Any]
+
+# Collection names used by the built-in managers
+STATE_COLLECTION = "state"
+CHECKPOINT_COLLECTION = "checkpoints"
+FEEDBACK_COLLECTION = "feedback"
+COMMENT_MARK_COLLECTION = "comment_marks"
+
+
+class StorageBackend(ABC):
+    """Abstract document store used by StateManager, CheckpointManager and FeedbackLoop."""
+
+    @abstractmethod
+    async def get(self, collection: str, key: str) -> Document | None:
+        """Load a document.
+
+        Args:
+            collection: Collection name
+            key: Document key
+
+        Returns:
+            The document, or None if it does not exist
+        """
+        pass
+
+    @abstractmethod
+    async def put(self, collection: str, key: str, document: Document) -> None:
+        """Create or replace a document.
+
+        Args:
+            collection: Collection name
+            key: Document key
+            document: JSON-serializable document
+        """
+        pass
+
+    @abstractmethod
+    async def put_many(self, collection: str, documents: Mapping[str, Document]) -> None:
+        """Create or replace several documents in one batch.
+
+        Backends with transactions commit the whole batch at once.
+
+        Args:
+            collection: Collection name
+            documents: Mapping of key to document
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, collection: str, key: str) -> bool:
+        """Delete a document.
+
+        Args:
+            collection: Collection name
+            key: Document key
+
+        Returns:
+            True if the document existed
+        """
+        pass
+
+    @abstractmethod
+    async def keys(self, collection: str, prefix: str = "") -> list[str]:
+        """List document keys in ascending order.
+
+        Args:
+            collection: Collection name
+            prefix: Only return keys starting with this prefix
+
+        Returns:
+            Sorted list of keys
+        """
+        pass
+
+    async def scan(self, collection: str, prefix: str = "") -> list[tuple[str, Document]]:
+        """Load every document whose key starts with a prefix.
+
+        Documents that cannot be decoded are skipped.
+
+        Args:
+            collection: Collection name
+            prefix: Only return documents whose key starts with this prefix
+
+        Returns:
+            (key, document) pairs sorted by key
+        """
+        results = []
+        for key in await self.keys(collection, prefix):
+            document = await self.get(collection, key)
+            if document is not None:
+                results.append((key, document))
+        return results
+
+    @asynccontextmanager
+    async def lock(self, collection: str, key: str) -> AsyncIterator[None]:
+        """Hold an exclusive lock on a document across processes.
+
+        The default implementation does not lock; callers still serialize
+        access within a process with their own asyncio locks.
+
+        Args:
+            collection: Collection name
+            key: Document key
+        """
+        yield
+
+    async def close(self) -> None:  # noqa: B027 - optional hook, not abstract
+        """Release any resources held by the backend."""
+        pass
@@ -0,0 +1,26 @@
+"""Factory for creating storage backends from configuration."""
+
+from pathlib import Path
+
+from repo_sapiens.config.settings import AutomationSettings
+from repo_sapiens.storage.base import StorageBackend
+from repo_sapiens.storage.json_backend import JSONFileBackend
+from repo_sapiens.storage.sqlite_backend import SQLiteBackend
+
+
+def create_storage_backend(settings: AutomationSettings, directory: str | Path) -> StorageBackend:
+    """Create the configured storage backend for one kind of document.
+
+    Args:
+        settings: Automation settings
+        directory: Directory used by the JSON backend for this kind of
+            document (e.g. the state directory)
+
+    Returns:
+        A SQLiteBackend on ``workflow.storage_path`` when
+        ``workflow.storage_backend`` is "sqlite", otherwise a JSONFileBackend
+        on ``directory``
+    """
+    if settings.workflow.storage_backend == "sqlite":
+        return SQLiteBackend(settings.workflow.storage_path)
+    return JSONFileBackend(directory)
@@ -0,0 +1,92 @@
+"""
+JSON file storage backend (default).
+
+Stores each document as a pretty-printed ``{key}.json`` file in a directory,
+which is the on-disk layout repo-sapiens has always used. Each manager owns
+its own directory, so the collection name does not affect file placement.
+"""
+
+import json
+from collections.abc import Mapping
+from pathlib import Path
+
+import aiofiles
+import structlog
+
+from repo_sapiens.storage.base import Document, StorageBackend
+
+log = structlog.get_logger(__name__)
+
+
+class JSONFileBackend(StorageBackend):
+    """One JSON file per document in a single directory."""
+
+    def __init__(self, directory: str | Path, indent: int | None = 2) -> None:
+        """Initialize the backend, creating the directory if needed.
+
+        Args:
+            directory: Directory holding the document files
+            indent: JSON indentation (None for compact output)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.indent = indent
+
+    def path_for(self, key: str) -> Path:
+        """Get the file path for a document key."""
+        return self.directory / f"{key}.json"
+
+    async def get(self, collection: str, key: str) -> Document | None:
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+
+        async with aiofiles.open(path) as f:
+            document: Document = json.loads(await f.read())
+        return document
+
+    async def put(self, collection: str, key: str, document: Document) -> None:
+        await self.write_file(self.path_for(key), document, self.indent)
+
+    async def put_many(self, collection: str, documents: Mapping[str, Document]) -> None:
+        for key, document in documents.items():
+            await self.put(collection, key, document)
+
+    async def delete(self, collection: str, key: str) -> bool:
+        try:
+            self.path_for(key).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    async def keys(self, collection: str, prefix: str = "") -> list[str]:
+        return sorted(path.stem for path in self.directory.glob(f"{prefix}*.json"))
+
+    async def scan(self, collection: str, prefix: str = "") -> list[tuple[str, Document]]:
+        results = []
+        for key in await self.keys(collection, prefix):
+            try:
+                document = await self.get(collection, key)
+            except (OSError, json.JSONDecodeError) as e:
+                log.warning("invalid_document_file", file=str(self.path_for(key)), error=str(e))
+                continue
+            if isinstance(document, dict):
+                results.append((key, document))
+        return results
+
+    @staticmethod
+    async def write_file(path: Path, document: Document, indent: int | None = 2) -> None:
+        """Write a document atomically via a temporary file and rename.
+
+        Args:
+            path: Target file path
+            document: JSON-serializable document
+            indent: JSON indentation
+        """
+        tmp_path = path.with_suffix(".tmp")
+
+        async with aiofiles.open(tmp_path, "w") as f:
+            await f.write(json.dumps(document, indent=indent))
+
+        # Atomic rename - safe on POSIX when same filesystem
+        tmp_path.replace(path)
@@ -0,0 +1,90 @@
+"""
+Cross-process advisory file locks.
+
+Uses ``fcntl.flock`` so locks are released automatically if the holding
+process dies. On platforms without ``fcntl`` the lock only logs once and
+degrades to no cross-process exclusion.
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import structlog
+
+from repo_sapiens.exceptions import StorageError
+
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:  # pragma: no cover - Windows
+    FCNTL_AVAILABLE = False
+
+log = structlog.get_logger(__name__)
+
+_warned_unavailable = False
+
+
+def lock_path(lock_dir: Path, name: str) -> Path:
+    """Map an arbitrary lock name to a safe file path.
+
+    Args:
+        lock_dir: Directory holding lock files
+        name: Lock name (e.g. "state/plan-42")
+
+    Returns:
+        Path of the lock file for the name
+    """
+    digest = hashlib.sha256(name.encode()).hexdigest()[:24]
+    return lock_dir / f"{digest}.lock"
+
+
+@asynccontextmanager
+async def file_lock(path: Path, timeout: float = 30.0, poll_interval: float = 0.01) -> AsyncIterator[None]:
+    """Hold an exclusive advisory lock on a file.
+
+    Acquisition polls with a non-blocking ``flock`` so waiting never blocks
+    the event loop, backing off up to 100ms between attempts.
+
+    Args:
+        path: Lock file path (created if missing)
+        timeout: Maximum seconds to wait for the lock
+        poll_interval: Initial delay between attempts
+
+    Raises:
+        StorageError: If the lock is not acquired within the timeout
+    """
+    global _warned_unavailable
+    if not FCNTL_AVAILABLE:
+        if not _warned_unavailable:
+            log.warning("file_lock_unavailable", reason="fcntl not supported on this platform")
+            _warned_unavailable = True
+        yield
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        delay = poll_interval
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise StorageError(f"Timed out after {timeout}s waiting for lock {path}") from None
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.1)
+
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
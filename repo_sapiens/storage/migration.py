@@ -0,0 +1,38 @@
+"""Copy documents between storage backends."""
+
+import structlog
+
+from repo_sapiens.storage.base import StorageBackend
+
+log = structlog.get_logger(__name__)
+
+
+async def migrate_collection(
+    source: StorageBackend,
+    target: StorageBackend,
+    collection: str,
+    batch_size: int = 500,
+) -> int:
+    """Copy every document in a collection from one backend to another.
+
+    Documents are written in batches so a SQLite target commits once per
+    batch rather than once per document. Existing target documents with the
+    same key are overwritten; the source is left untouched.
+
+    Args:
+        source: Backend to read from
+        target: Backend to write to
+        collection: Collection name
+        batch_size: Documents per batched write
+
+    Returns:
+        Number of documents copied
+    """
+    documents = await source.scan(collection)
+
+    for start in range(0, len(documents), batch_size):
+        batch = dict(documents[start : start + batch_size])
+        await target.put_many(collection, batch)
+
+    log.info("storage_collection_migrated", collection=collection, documents=len(documents))
+    return len(documents)
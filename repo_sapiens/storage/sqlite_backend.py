@@ -0,0 +1,158 @@
+"""
+SQLite storage backend using write-ahead logging.
+
+Stores every document as one row of compact JSON in a single database file,
+so updating a plan's state or recording feedback touches one row instead of
+rewriting a pretty-printed file. WAL mode lets readers proceed while a writer
+commits, and several processes on one host can share the database. Per-document
+advisory file locks serialize read-modify-write cycles across processes.
+
+All SQLite calls run in a worker thread so the event loop is never blocked on
+disk I/O.
+"""
+
+import asyncio
+import json
+import sqlite3
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from repo_sapiens.storage.base import Document, StorageBackend
+from repo_sapiens.storage.locking import file_lock, lock_path
+
+log = structlog.get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (collection, key)
+) WITHOUT ROWID
+"""
+
+_UPSERT = """
+INSERT INTO documents (collection, key, data, updated_at) VALUES (?, ?, ?, ?)
+ON CONFLICT (collection, key) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at
+"""
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with prefix."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class SQLiteBackend(StorageBackend):
+    """Document store in a single SQLite database in WAL mode.
+
+    Example:
+        >>> backend = SQLiteBackend(".sapiens/sapiens.db")
+        >>> await backend.put("state", "plan-42", {"status": "pending"})
+        >>> async with backend.lock("state", "plan-42"):
+        ...     doc = await backend.get("state", "plan-42")
+    """
+
+    def __init__(self, path: str | Path, busy_timeout: float = 30.0, lock_timeout: float = 30.0) -> None:
+        """Open (or create) the database.
+
+        Args:
+            path: Database file path
+            busy_timeout: Seconds SQLite waits for another writer's commit
+            lock_timeout: Seconds to wait for a cross-process document lock
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_dir = self.path.with_name(self.path.name + ".locks")
+        self.lock_timeout = lock_timeout
+
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        # One connection shared by worker threads; calls are serialized
+        self._db_lock = asyncio.Lock()
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        async with self._db_lock:
+            return await asyncio.to_thread(func, *args)
+
+    def _write(self, rows: list[tuple[str, str, str, str]]) -> None:
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(_UPSERT, rows)
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _rows(self, collection: str, documents: Mapping[str, Document]) -> list[tuple[str, str, str, str]]:
+        now = datetime.now(UTC).isoformat()
+        return [
+            (collection, key, json.dumps(document, separators=(",", ":")), now) for key, document in documents.items()
+        ]
+
+    def _select(self, columns: str, collection: str, prefix: str) -> list[tuple[Any, ...]]:
+        query = f"SELECT {columns} FROM documents WHERE collection = ?"  # nosec B608 - fixed column lists
+        params: list[str] = [collection]
+        if prefix:
+            query += " AND key >= ? AND key < ?"
+            params += [prefix, _prefix_upper_bound(prefix)]
+        return self._conn.execute(query + " ORDER BY key", params).fetchall()
+
+    async def get(self, collection: str, key: str) -> Document | None:
+        row = await self._run(
+            lambda: self._conn.execute(
+                "SELECT data FROM documents WHERE collection = ? AND key = ?", (collection, key)
+            ).fetchone()
+        )
+        if row is None:
+            return None
+        document: Document = json.loads(row[0])
+        return document
+
+    async def put(self, collection: str, key: str, document: Document) -> None:
+        await self._run(self._write, self._rows(collection, {key: document}))
+
+    async def put_many(self, collection: str, documents: Mapping[str, Document]) -> None:
+        if documents:
+            await self._run(self._write, self._rows(collection, documents))
+
+    async def delete(self, collection: str, key: str) -> bool:
+        cursor = await self._run(
+            self._conn.execute, "DELETE FROM documents WHERE collection = ? AND key = ?", (collection, key)
+        )
+        return bool(cursor.rowcount > 0)
+
+    async def keys(self, collection: str, prefix: str = "") -> list[str]:
+        rows = await self._run(self._select, "key", collection, prefix)
+        return [row[0] for row in rows]
+
+    async def scan(self, collection: str, prefix: str = "") -> list[tuple[str, Document]]:
+        rows = await self._run(self._select, "key, data", collection, prefix)
+        results = []
+        for key, data in rows:
+            try:
+                results.append((key, json.loads(data)))
+            except json.JSONDecodeError as e:
+                log.warning("invalid_document_row", collection=collection, key=key, error=str(e))
+        return results
+
+    @asynccontextmanager
+    async def lock(self, collection: str, key: str) -> AsyncIterator[None]:
+        async with file_lock(lock_path(self.lock_dir, f"{collection}/{key}"), timeout=self.lock_timeout):
+            yield
+
+    async def close(self) -> None:
+        async with self._db_lock:
+            self._conn.close()
@@ -6,6 +6,7 @@ platform, including logging, caching, retries, and API integrations.
 Key Components:
     - logging_config: Structured logging setup with structlog
     - caching: Async caching with TTL support
+    - disk_cache: Persistent SQLite tier for caches shared across processes
     - retry: Retry utilities for transient failures
     - batch_operations: Batch processing for API efficiency
     - connection_pool: HTTP connection pooling
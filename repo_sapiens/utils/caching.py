@@ -6,11 +6,13 @@ in async contexts where traditional synchronous caching solutions
 would block the event loop.
 
 Key Features:
-    - Async-first design with asyncio.Lock for thread-safe access
-    - Configurable TTL for automatic cache expiration
-    - LRU-style eviction when max size is reached
-    - Function decorator for transparent caching
+    - Async-first API whose reads never wait on a lock
+    - Configurable TTL for automatic cache expiration, tracked on a monotonic clock
+    - O(1) least-recently-used eviction when max size is reached
+    - Negative caching: None is a cacheable value, optionally with a shorter TTL
+    - Function decorator with single-flight coalescing of concurrent misses
     - Named cache management for organizing multiple caches
+    - Optional persistent disk tier shared across processes (see disk_cache)
     - Cache statistics (hit rate, size, etc.)
 
 Key Exports:
@@ -19,6 +21,8 @@ Key Exports:
     CacheKeyBuilder: Helper for consistent cache key generation.
     CacheManager: Manager for multiple named caches.
     get_cache: Get a named cache from the global manager.
+    configure_disk_cache: Enable the persistent tier for the global manager.
+    get_disk_cache: The persistent tier, if one has been configured.
 
 Example:
     >>> from repo_sapiens.utils.caching import AsyncCache, cached
@@ -34,44 +38,64 @@ Example:
     ...     return await database.get_user(user_id)
 
 Thread Safety:
-    All cache operations use asyncio.Lock for synchronization, making
-    them safe for concurrent access from multiple async tasks. However,
-    the caches are not designed for multi-process scenarios; use Redis
-    or similar for distributed caching.
+    Every cache operation runs to completion without awaiting, so each one
+    is atomic with respect to other tasks on the same event loop and no
+    lock is needed. The caches are not designed for multi-threaded or
+    multi-process scenarios; use Redis or similar for distributed caching.
 
 Performance Notes:
     - Cache keys are hashed using MD5 (non-cryptographic, for speed)
-    - Eviction is O(n) when cache is full (finds oldest entry)
+    - get, set and eviction are O(1); expired entries are purged from a
+      heap in O(log n) each
     - Consider max_size carefully for memory-constrained environments
 """
 
 import asyncio
 import hashlib
+import heapq
 import json
+import time
+from collections import OrderedDict
 from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
 from functools import wraps
+from pathlib import Path
 from typing import Any, TypeVar
 
 import structlog
 
+from repo_sapiens.utils.disk_cache import DiskCache
+
 log = structlog.get_logger(__name__)
 
 T = TypeVar("T")
 
+# Sentinel distinguishing "not cached" from a cached None
+_MISSING: Any = object()
+
 
 class AsyncCache:
     """Async cache with TTL (time-to-live) support.
 
-    Provides a simple key-value cache with automatic expiration and
-    size limits. All operations are async and use locking for safe
-    concurrent access.
+    Provides a key-value cache with automatic expiration and an LRU size
+    limit. Entries live in an OrderedDict kept in recency order, so hits
+    and evictions are O(1). Expiry deadlines are also pushed onto a
+    min-heap, which lets writes purge expired entries without scanning
+    the whole cache.
+
+    When a DiskCache is attached, misses fall back to it and writes go to
+    both tiers, so entries survive the process. Disk entries are keyed by
+    namespace and a hash of the key (see CacheKeyBuilder).
 
     Attributes:
-        _cache: Internal storage mapping keys to (value, timestamp) tuples.
-        _ttl: Time-to-live as a timedelta.
+        disk: Optional persistent second-level tier.
+        namespace: Namespace for this cache's entries in the disk tier.
+        _cache: Internal storage mapping keys to (value, expires_at) tuples,
+            ordered from least to most recently used.
+        _expiry: Min-heap of (expires_at, key) pairs. Pairs are not removed
+            when a key is overwritten or deleted; stale ones are skipped
+            when popped.
+        _ttl: Default time-to-live in seconds.
         _max_size: Maximum number of entries before eviction.
-        _lock: asyncio.Lock for synchronization.
         _hits: Count of cache hits (successful gets).
         _misses: Count of cache misses (keys not found or expired).
 
@@ -90,7 +114,13 @@ class AsyncCache:
         >>> print(f"Hit rate: {stats['hit_rate']:.2%}")
     """
 
-    def __init__(self, ttl_seconds: int = 300, max_size: int = 1000) -> None:
+    def __init__(
+        self,
+        ttl_seconds: float = 300,
+        max_size: int = 1000,
+        disk: DiskCache | None = None,
+        namespace: str = "",
+    ) -> None:
         """Initialize the async cache.
 
         Args:
@@ -98,7 +128,10 @@ class AsyncCache:
                 Entries older than this are considered expired and will
                 be removed on next access. Default is 300 (5 minutes).
             max_size: Maximum number of entries to store. When exceeded,
-                the oldest entry is evicted to make room. Default is 1000.
+                the least recently used entry is evicted to make room.
+                Default is 1000.
+            disk: Optional persistent tier consulted on in-memory misses.
+            namespace: Namespace for this cache's entries in the disk tier.
 
         Example:
             >>> # Short-lived cache for frequently changing data
@@ -107,24 +140,32 @@ class AsyncCache:
             >>> # Longer-lived cache for stable data
             >>> cache = AsyncCache(ttl_seconds=3600, max_size=10000)
         """
-        self._cache: dict[str, tuple[Any, datetime]] = {}
-        self._ttl = timedelta(seconds=ttl_seconds)
+        self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._expiry: list[tuple[float, str]] = []
+        self._ttl = float(ttl_seconds)
         self._max_size = max_size
-        self._lock = asyncio.Lock()
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
+        self._disk_hits = 0
+        self.disk = disk
+        self.namespace = namespace
 
-    async def get(self, key: str) -> Any | None:
+    async def get(self, key: str, default: Any = None) -> Any:
         """Get a value from the cache.
 
         Retrieves the cached value if it exists and hasn't expired.
-        Expired entries are automatically removed.
+        Expired entries are removed on access. A hit marks the entry as
+        most recently used. On an in-memory miss the disk tier, if any, is
+        consulted and a hit there is promoted into memory.
 
         Args:
             key: The cache key to look up.
+            default: Value returned on a miss. Pass a sentinel to tell a
+                cached None apart from a missing key.
 
         Returns:
-            The cached value if found and not expired, None otherwise.
+            The cached value if found and not expired, default otherwise.
 
         Example:
             >>> await cache.set("user:123", {"name": "Alice"})
@@ -133,53 +174,106 @@ class AsyncCache:
             ...     print(user["name"])
             ... else:
             ...     print("Cache miss, fetch from database")
+        """
+        value = self.lookup(key, _MISSING)
+        if value is _MISSING and self.disk is not None:
+            value = await self.read_through(key)
+        return default if value is _MISSING else value
 
-        Note:
-            A return value of None could mean either the key doesn't
-            exist or it has expired. If you need to cache None values,
-            wrap them in a container object.
+    async def read_through(self, key: str) -> Any:
+        """Load an entry from the disk tier into memory.
+
+        Args:
+            key: The cache key to look up.
+
+        Returns:
+            The value, or the module's missing sentinel if the disk tier is
+            absent or has no live entry.
         """
-        async with self._lock:
-            if key in self._cache:
-                value, timestamp = self._cache[key]
-                if datetime.now(UTC) - timestamp < self._ttl:
-                    self._hits += 1
-                    log.debug("cache_hit", key=key)
-                    return value
-                else:
-                    del self._cache[key]
-                    log.debug("cache_expired", key=key)
-
-            self._misses += 1
-            log.debug("cache_miss", key=key)
-            return None
-
-    async def set(self, key: str, value: Any) -> None:
+        if self.disk is None:
+            return _MISSING
+
+        entry = await self.disk.get(self._disk_key(key))
+        if entry is None:
+            return _MISSING
+
+        value, remaining = entry
+        self.store(key, value, min(remaining, self._ttl))
+        self._disk_hits += 1
+        return value
+
+    def lookup(self, key: str, default: Any = None) -> Any:
+        """Synchronous form of get() for callers outside a coroutine.
+
+        Args:
+            key: The cache key to look up.
+            default: Value returned on a miss.
+
+        Returns:
+            The cached value if found and not expired, default otherwise.
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry[1] > time.monotonic():
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            del self._cache[key]
+
+        self._misses += 1
+        return default
+
+    async def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
         """Set a value in the cache.
 
-        Stores the value with the current timestamp. If the cache is
-        at max capacity, the oldest entry is evicted first.
+        Stores the value with an expiry deadline. If the cache is at max
+        capacity, expired entries are purged first and then the least
+        recently used entries are evicted. The value is also written to the
+        disk tier, if any.
 
         Args:
             key: The cache key.
-            value: The value to cache. Can be any Python object, but
-                be mindful of memory usage for large objects.
+            value: The value to cache. Can be any Python object, including
+                None, but be mindful of memory usage for large objects.
+            ttl_seconds: Lifetime of this entry. Defaults to the cache TTL;
+                useful for caching negative results for a shorter time.
 
         Example:
             >>> await cache.set("user:123", {"name": "Alice", "email": "alice@example.com"})
-            >>> await cache.set("config:theme", "dark")
+            >>> await cache.set("user:404", None, ttl_seconds=30)
 
         Note:
             Setting a key that already exists updates the value and
             resets the TTL timer.
         """
-        async with self._lock:
-            # Evict oldest entries if cache is full
-            if len(self._cache) >= self._max_size:
-                await self._evict_oldest()
+        self.store(key, value, ttl_seconds)
+        if self.disk is not None:
+            ttl = self._ttl if ttl_seconds is None else ttl_seconds
+            await self.disk.set(self._disk_key(key), value, ttl, namespace=self.namespace)
+
+    def store(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """Synchronous form of set() for callers outside a coroutine.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            ttl_seconds: Lifetime of this entry (defaults to the cache TTL).
+        """
+        now = time.monotonic()
+        expires_at = now + (self._ttl if ttl_seconds is None else ttl_seconds)
 
-            self._cache[key] = (value, datetime.now(UTC))
-            log.debug("cache_set", key=key)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self._max_size:
+            self._purge_expired(now)
+            self._evict()
+
+        self._cache[key] = (value, expires_at)
+        heapq.heappush(self._expiry, (expires_at, key))
+
+        # Overwrites leave stale heap pairs behind; rebuild before they dominate
+        if len(self._expiry) > 2 * self._max_size + 64:
+            self._rebuild_expiry()
 
     async def delete(self, key: str) -> bool:
         """Delete a value from the cache.
@@ -200,17 +294,18 @@ class AsyncCache:
             >>> deleted = await cache.delete("user:123")
             >>> print(deleted)  # False (already deleted)
         """
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                log.debug("cache_delete", key=key)
-                return True
-            return False
+        deleted = self._cache.pop(key, _MISSING) is not _MISSING
+        if self.disk is not None:
+            deleted = await self.disk.delete(self._disk_key(key)) or deleted
+        if deleted:
+            log.debug("cache_delete", key=key)
+        return deleted
 
     async def clear(self) -> None:
         """Clear the entire cache.
 
-        Removes all entries and resets statistics. Use with caution
+        Removes all entries, including this namespace's entries in the
+        disk tier, and resets statistics. Use with caution
         in production as this may cause a sudden increase in backend
         load as all data needs to be re-fetched.
 
@@ -219,29 +314,44 @@ class AsyncCache:
             >>> stats = await cache.get_stats()
             >>> print(stats["size"])  # 0
         """
-        async with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            self._hits = 0
-            self._misses = 0
-            log.info("cache_cleared", entries_cleared=count)
+        count = len(self._cache)
+        self._cache.clear()
+        self._expiry.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._disk_hits = 0
+        if self.disk is not None:
+            await self.disk.clear(self.namespace)
+        log.info("cache_cleared", entries_cleared=count)
 
-    async def _evict_oldest(self) -> None:
-        """Evict the oldest cache entry.
+    def _disk_key(self, key: str) -> str:
+        """Content-addressed key for the disk tier."""
+        return CacheKeyBuilder.build_namespaced_key(self.namespace, key)
 
-        Internal method called when the cache reaches max_size.
-        Removes the entry with the oldest timestamp.
+    def _purge_expired(self, now: float) -> None:
+        """Drop every entry whose deadline has passed.
 
-        Note:
-            This method assumes the lock is already held. It should
-            only be called from within other locked methods.
+        Pops the expiry heap until its head is in the future. Pairs whose
+        deadline no longer matches the live entry are stale and ignored.
         """
-        if not self._cache:
-            return
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry)
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] == expires_at:
+                del self._cache[key]
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until there is room for one more."""
+        while self._cache and len(self._cache) >= self._max_size:
+            key, _ = self._cache.popitem(last=False)
+            self._evictions += 1
+            log.debug("cache_evicted", key=key)
 
-        oldest_key = min(self._cache.items(), key=lambda x: x[1][1])[0]
-        del self._cache[oldest_key]
-        log.debug("cache_evicted", key=oldest_key)
+    def _rebuild_expiry(self) -> None:
+        """Rebuild the expiry heap from live entries, discarding stale pairs."""
+        self._expiry = [(expires_at, key) for key, (_, expires_at) in self._cache.items()]
+        heapq.heapify(self._expiry)
 
     async def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -255,6 +365,8 @@ class AsyncCache:
                 - max_size: Maximum allowed entries
                 - hits: Number of successful cache lookups
                 - misses: Number of cache misses (not found or expired)
+                - evictions: Number of entries evicted to make room
+                - disk_hits: Number of in-memory misses served by the disk tier
                 - hit_rate: Ratio of hits to total requests (0.0 to 1.0)
                 - ttl_seconds: Configured TTL in seconds
 
@@ -273,24 +385,45 @@ class AsyncCache:
             "max_size": self._max_size,
             "hits": self._hits,
             "misses": self._misses,
+            "evictions": self._evictions,
+            "disk_hits": self._disk_hits,
             "hit_rate": hit_rate,
-            "ttl_seconds": self._ttl.total_seconds(),
+            "ttl_seconds": self._ttl,
         }
 
 
-def cached(ttl_seconds: int = 300, key_prefix: str = "") -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+def cached(
+    ttl_seconds: float = 300,
+    key_prefix: str = "",
+    max_size: int = 1000,
+    negative_ttl_seconds: float | None = None,
+    persistent: bool = False,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator for caching async function results.
 
     Wraps an async function to automatically cache its results based on
     the function name and arguments. Subsequent calls with the same
     arguments return the cached result without executing the function.
 
+    Concurrent calls that miss on the same key are coalesced: the first
+    caller starts the upstream call and the others await its result, so
+    a burst of identical requests makes a single upstream call. If that
+    call raises, every waiting caller receives the exception and nothing
+    is cached.
+
     Args:
         ttl_seconds: Time-to-live for cached values in seconds.
             Default is 300 (5 minutes).
         key_prefix: Optional prefix for cache keys. Useful for
             namespacing when multiple functions might have similar
             argument patterns.
+        max_size: Maximum number of cached results. Default is 1000.
+        negative_ttl_seconds: Time-to-live for None results. Defaults to
+            ttl_seconds; set it lower so "not found" answers are checked
+            again sooner, or to 0 to not cache them at all.
+        persistent: Also use the global disk tier, if one has been
+            configured with configure_disk_cache(), so results are shared
+            with later processes.
 
     Returns:
         Decorator function that wraps async functions with caching.
@@ -327,9 +460,35 @@ def cached(ttl_seconds: int = 300, key_prefix: str = "") -> Callable[[Callable[.
         Complex objects with changing __str__ representations may cause
         cache misses.
     """
-    cache = AsyncCache(ttl_seconds)
+    cache = AsyncCache(ttl_seconds, max_size)
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        inflight: dict[str, asyncio.Future[Any]] = {}
+        cache.namespace = f"{key_prefix}{func.__module__}.{func.__qualname__}"
+
+        async def load(key: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+            """Read through the disk tier, else call func and cache its result."""
+            if persistent and cache.disk is None:
+                cache.disk = _cache_manager.disk
+            value = await cache.read_through(key)
+            if value is not _MISSING:
+                return value
+
+            result = await func(*args, **kwargs)
+            if result is None:
+                if negative_ttl_seconds != 0:
+                    await cache.set(key, None, negative_ttl_seconds)
+            else:
+                await cache.set(key, result)
+            return result
+
+        def settle(key: str, call: asyncio.Future[Any]) -> None:
+            """Forget a finished upstream call."""
+            inflight.pop(key, None)
+            # Marks a failure as retrieved even if every waiter was cancelled
+            if not call.cancelled():
+                call.exception()
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Create cache key from function name and arguments
@@ -341,14 +500,21 @@ def cached(ttl_seconds: int = 300, key_prefix: str = "") -> Callable[[Callable[.
             key = hashlib.md5(json.dumps(key_data, sort_keys=True).encode(), usedforsecurity=False).hexdigest()
 
             # Try cache first
-            cached_value = await cache.get(key)
-            if cached_value is not None:
+            cached_value = cache.lookup(key, _MISSING)
+            if cached_value is not _MISSING:
                 return cached_value
 
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-            await cache.set(key, result)
-            return result
+            # Join an upstream call already in flight, or start one
+            call = inflight.get(key)
+            if call is None:
+                call = asyncio.ensure_future(load(key, args, kwargs))
+                inflight[key] = call
+                call.add_done_callback(lambda done: settle(key, done))
+            else:
+                log.debug("cache_call_coalesced", key=key)
+
+            # Shield so one caller being cancelled does not cancel the others
+            return await asyncio.shield(call)
 
         # Attach cache instance for management
         wrapper.cache = cache  # type: ignore
@@ -423,6 +589,7 @@ class CacheManager:
     interface.
 
     Attributes:
+        disk: Persistent tier handed to caches created by get_cache().
         _caches: Dictionary mapping cache names to AsyncCache instances.
         _lock: asyncio.Lock for thread-safe cache creation.
 
@@ -451,10 +618,24 @@ class CacheManager:
         Creates an empty manager with no caches. Caches are created
         on-demand via get_cache().
         """
+        self.disk: DiskCache | None = None
         self._caches: dict[str, AsyncCache] = {}
         self._lock = asyncio.Lock()
 
-    async def get_cache(self, name: str, ttl_seconds: int = 300, max_size: int = 1000) -> AsyncCache:
+    def set_disk_tier(self, disk: DiskCache | None) -> None:
+        """Attach a persistent tier to this manager's caches.
+
+        Applies to existing caches as well as ones created later. Each
+        cache uses its name as its disk namespace.
+
+        Args:
+            disk: Disk tier to use, or None to go back to memory only.
+        """
+        self.disk = disk
+        for cache in self._caches.values():
+            cache.disk = disk
+
+    async def get_cache(self, name: str, ttl_seconds: float = 300, max_size: int = 1000) -> AsyncCache:
         """Get or create a named cache.
 
         Returns an existing cache if one with the given name exists,
@@ -483,7 +664,7 @@ class CacheManager:
         """
         async with self._lock:
             if name not in self._caches:
-                self._caches[name] = AsyncCache(ttl_seconds, max_size)
+                self._caches[name] = AsyncCache(ttl_seconds, max_size, disk=self.disk, namespace=name)
                 log.info("cache_created", name=name, ttl=ttl_seconds, max_size=max_size)
 
             return self._caches[name]
@@ -528,7 +709,7 @@ class CacheManager:
 _cache_manager = CacheManager()
 
 
-async def get_cache(name: str, ttl_seconds: int = 300) -> AsyncCache:
+async def get_cache(name: str, ttl_seconds: float = 300) -> AsyncCache:
     """Get a named cache from the global cache manager.
 
     Convenience function for accessing the global CacheManager instance.
@@ -555,3 +736,43 @@ async def get_cache(name: str, ttl_seconds: int = 300) -> AsyncCache:
         CacheManager instead.
     """
     return await _cache_manager.get_cache(name, ttl_seconds)
+
+
+def configure_disk_cache(directory: str | Path, max_entries: int = 10000) -> DiskCache:
+    """Enable the persistent cache tier for the global cache manager.
+
+    Idempotent: calling again with the same directory returns the tier
+    already in use.
+
+    Args:
+        directory: Directory holding the cache database (e.g.
+            "~/.cache/repo-sapiens"). Keep it outside the checked-out
+            repository so a commit cannot plant cache entries.
+        max_entries: Maximum number of entries kept on disk.
+
+    Returns:
+        The DiskCache now attached to the global manager.
+
+    Example:
+        >>> configure_disk_cache("~/.cache/repo-sapiens")
+        >>> cache = await get_cache("issues", ttl_seconds=300)
+        >>> # Misses now fall back to entries written by earlier processes
+    """
+    path = Path(directory).expanduser() / "cache.db"
+    current = _cache_manager.disk
+    if current is not None and current.path == path:
+        return current
+
+    disk = DiskCache(path, max_entries=max_entries)
+    _cache_manager.set_disk_tier(disk)
+    log.info("disk_cache_configured", path=str(path), max_entries=max_entries)
+    return disk
+
+
+def get_disk_cache() -> DiskCache | None:
+    """Return the persistent tier attached by configure_disk_cache().
+
+    Returns:
+        The DiskCache in use, or None when caching is memory only.
+    """
+    return _cache_manager.disk
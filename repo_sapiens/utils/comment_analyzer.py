@@ -22,18 +22,36 @@ Note:
     This module is not thread-safe. Each instance should be used within
     a single async context. The analyzer makes API calls to both the git
     provider (for PR details) and the AI agent (for comment classification).
+    The PR is fetched once per analysis and reviewer checks are memoized
+    per author; comments are classified several to a prompt, with batches
+    running concurrently.
 """
 
+import asyncio
 import json
+import re
 from typing import Any
 
 import structlog
 
+from repo_sapiens.models.domain import PullRequest
 from repo_sapiens.models.review import CommentAnalysis, CommentCategory, ReviewAnalysisResult
 from repo_sapiens.providers.base import AgentProvider, GitProvider
 
 log = structlog.get_logger(__name__)
 
+_CATEGORY_GUIDE = """**Categories**:
+- **simple_fix**: A straightforward code change (typo, formatting, simple refactor, adding comments, etc.)
+- **controversial_fix**: A complex change that affects logic, architecture, or has trade-offs
+- **question**: The reviewer is asking a question about the code
+- **info**: Just an informational comment, no action needed
+- **already_done**: The concern is already addressed in the current code
+- **wont_fix**: Valid comment but we choose not to implement (explain why)
+
+**Guidelines for categorization**:
+- Simple fixes: typos, formatting, add/remove comments, rename variables, add logging, simple refactors
+- Controversial fixes: algorithm changes, architecture changes, security implications, performance trade-offs"""
+
 
 class CommentAnalyzer:
     """Analyzes PR review comments and categorizes them for action.
@@ -53,20 +71,31 @@ class CommentAnalyzer:
     Attributes:
         git: Git provider instance for accessing repository data.
         agent: AI agent provider for comment analysis.
+        batch_size: Maximum comments classified by one LLM call.
+        max_concurrent_batches: Maximum LLM calls in flight at once.
 
     Example:
-        >>> analyzer = CommentAnalyzer(git_provider, agent_provider)
+        >>> analyzer = CommentAnalyzer(git_provider, agent_provider, batch_size=8)
         >>> result = await analyzer.analyze_comments(pr_number=42, comments=comments)
         >>> print(f"Found {len(result.simple_fixes)} simple fixes")
         >>> print(f"Found {len(result.questions)} questions to answer")
     """
 
-    def __init__(self, git: GitProvider, agent: AgentProvider) -> None:
+    def __init__(
+        self,
+        git: GitProvider,
+        agent: AgentProvider,
+        batch_size: int = 8,
+        max_concurrent_batches: int = 3,
+    ) -> None:
         """Initialize the comment analyzer.
 
         Args:
             git: Git provider for accessing repository data (PRs, comments).
             agent: AI agent provider for analyzing and categorizing comments.
+            batch_size: Maximum comments classified by one LLM call. A batch
+                of one uses the single-comment prompt.
+            max_concurrent_batches: Maximum LLM calls in flight at once.
 
         Example:
             >>> from repo_sapiens.providers.gitea import GiteaProvider
@@ -77,6 +106,12 @@ class CommentAnalyzer:
         """
         self.git = git
         self.agent = agent
+        self.batch_size = max(1, batch_size)
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+
+        # Memoized per analysis: PR fetch result (or its error) and reviewer checks
+        self._pull_requests: dict[int, PullRequest | Exception] = {}
+        self._reviewers: dict[tuple[int, str], bool] = {}
 
     async def is_reviewer_or_maintainer(self, username: str, pr_number: int) -> bool:
         """Check if a user has reviewer or maintainer privileges.
@@ -96,18 +131,25 @@ class CommentAnalyzer:
             The current implementation is permissive and returns True for all
             users. TODO: Implement proper permission checking per provider
             (check write access, maintainer lists, CODEOWNERS, etc.).
+            The PR is fetched once and the result is memoized per author
+            until the next analyze_comments() call.
 
         Example:
             >>> is_reviewer = await analyzer.is_reviewer_or_maintainer("alice", 42)
             >>> if is_reviewer:
             ...     print("Alice's feedback should be addressed")
         """
+        key = (pr_number, username)
+        if key in self._reviewers:
+            return self._reviewers[key]
+
         try:
             # Get PR details
-            pr = await self.git.get_pull_request(pr_number)
+            pr = await self._get_pull_request(pr_number)
 
             # Check if user is PR author (they can review their own PR)
             if pr.author == username:
+                self._reviewers[key] = True
                 return True
 
             # Check if user is repository owner/maintainer
@@ -117,12 +159,26 @@ class CommentAnalyzer:
             # For now, we'll be permissive and allow any comment
             # TODO: Implement proper permission checking per provider
 
+            self._reviewers[key] = True
             return True  # Allow all for now
 
         except Exception as e:
             log.warning("reviewer_check_failed", username=username, error=str(e))
+            self._reviewers[key] = False
             return False
 
+    async def _get_pull_request(self, pr_number: int) -> PullRequest:
+        """Fetch a PR once, re-raising the same error for later callers if it failed."""
+        if pr_number not in self._pull_requests:
+            try:
+                self._pull_requests[pr_number] = await self.git.get_pull_request(pr_number)
+            except Exception as e:
+                self._pull_requests[pr_number] = e
+        cached = self._pull_requests[pr_number]
+        if isinstance(cached, Exception):
+            raise cached
+        return cached
+
     async def analyze_comments(
         self,
         pr_number: int,
@@ -132,6 +188,8 @@ class CommentAnalyzer:
 
         Processes a list of comments, filters for reviewer/maintainer comments,
         and uses AI to categorize each comment into actionable categories.
+        Comments are sent to the agent in batches of ``batch_size``, with up
+        to ``max_concurrent_batches`` calls running at once.
 
         Args:
             pr_number: The PR number being analyzed.
@@ -162,6 +220,10 @@ class CommentAnalyzer:
         """
         log.info("analyzing_comments", pr_number=pr_number, total=len(comments))
 
+        # PR details and permissions may have changed since the last analysis
+        self._pull_requests.clear()
+        self._reviewers.clear()
+
         # Filter for reviewer/maintainer comments
         reviewer_comments = []
         for comment in comments:
@@ -176,12 +238,20 @@ class CommentAnalyzer:
             reviewers=len(reviewer_comments),
         )
 
-        # Analyze each comment with AI
-        analyses = []
-        for comment in reviewer_comments:
-            analysis = await self._analyze_single_comment(comment, pr_number)
-            if analysis:
-                analyses.append(analysis)
+        # Classify comments with AI, several per call, batches concurrently
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+        async def classify(batch: list[Any]) -> list[CommentAnalysis | None]:
+            async with semaphore:
+                if len(batch) == 1:
+                    return [await self._analyze_single_comment(batch[0], pr_number)]
+                return await self._analyze_comment_batch(batch, pr_number)
+
+        batches = [
+            reviewer_comments[i : i + self.batch_size] for i in range(0, len(reviewer_comments), self.batch_size)
+        ]
+        batch_results = await asyncio.gather(*(classify(batch) for batch in batches))
+        analyses = [analysis for results in batch_results for analysis in results if analysis]
 
         # Organize by category
         result = ReviewAnalysisResult(
@@ -241,7 +311,6 @@ class CommentAnalyzer:
         comment_id = comment.id if hasattr(comment, "id") else comment.get("id")
         comment_author = comment.author if hasattr(comment, "author") else comment.get("author", "unknown")
         comment_body = comment.body if hasattr(comment, "body") else comment.get("body", "")
-        comment_created = comment.created_at if hasattr(comment, "created_at") else comment.get("created_at", None)
 
         log.debug("analyzing_comment", comment_id=comment_id, author=comment_author)
 
@@ -259,17 +328,7 @@ Analyze this comment and determine:
 2. What action should be taken?
 3. If it's a fix, is it simple or controversial?
 
-**Categories**:
-- **simple_fix**: A straightforward code change (typo, formatting, simple refactor, adding comments, etc.)
-- **controversial_fix**: A complex change that affects logic, architecture, or has trade-offs
-- **question**: The reviewer is asking a question about the code
-- **info**: Just an informational comment, no action needed
-- **already_done**: The concern is already addressed in the current code
-- **wont_fix**: Valid comment but we choose not to implement (explain why)
-
-**Guidelines for categorization**:
-- Simple fixes: typos, formatting, add/remove comments, rename variables, add logging, simple refactors
-- Controversial fixes: algorithm changes, architecture changes, security implications, performance trade-offs
+{_CATEGORY_GUIDE}
 
 **Response Format** (JSON):
 {{
@@ -304,26 +363,132 @@ Respond ONLY with the JSON, no other text.
                 log.error("failed_to_parse_ai_response", comment_id=comment_id)
                 return None
 
-            # Create CommentAnalysis object
-            analysis = CommentAnalysis(
-                comment_id=comment_id,
-                comment_author=comment_author,
-                comment_body=comment_body,
-                comment_created_at=comment_created,
-                category=CommentCategory(analysis_data["category"]),
-                reasoning=analysis_data["reasoning"],
-                proposed_action=analysis_data["proposed_action"],
-                file_path=analysis_data.get("file_path"),
-                line_number=analysis_data.get("line_number"),
-                answer=analysis_data.get("answer"),
-            )
-
-            return analysis
+            return self._build_analysis(comment, analysis_data)
 
         except Exception as e:
             log.error("comment_analysis_exception", comment_id=comment_id, error=str(e), exc_info=True)
             return None
 
+    async def _analyze_comment_batch(
+        self,
+        comments: list[Any],
+        pr_number: int,
+    ) -> list[CommentAnalysis | None]:
+        """Classify several comments with one AI call.
+
+        The agent is asked for a JSON array with one entry per comment,
+        matched back to the comments by ``comment_id``. Comments missing
+        from an otherwise valid response, or the whole batch if the
+        response can't be parsed, are retried one at a time.
+
+        Args:
+            comments: Comment objects or dicts, as for _analyze_single_comment.
+            pr_number: The PR number these comments belong to.
+
+        Returns:
+            One CommentAnalysis (or None if it failed) per comment, in order.
+        """
+        comment_ids = [comment.id if hasattr(comment, "id") else comment.get("id") for comment in comments]
+        log.debug("analyzing_comment_batch", pr_number=pr_number, comment_ids=comment_ids)
+
+        sections = []
+        for comment_id, comment in zip(comment_ids, comments, strict=True):
+            author = comment.author if hasattr(comment, "author") else comment.get("author", "unknown")
+            body = comment.body if hasattr(comment, "body") else comment.get("body", "")
+            sections.append(f"### Comment {comment_id}\n**Author**: {author}\n{body}")
+        comments_text = "\n\n".join(sections)
+
+        prompt = f"""You are analyzing code review comments to determine how to respond to each one.
+
+**PR Number**: #{pr_number}
+
+{comments_text}
+
+**Your Task**:
+For EACH comment above, determine:
+1. What category does it fall into?
+2. What action should be taken?
+3. If it's a fix, is it simple or controversial?
+
+{_CATEGORY_GUIDE}
+
+**Response Format** (JSON array, one object per comment, in the same order):
+[
+    {{
+        "comment_id": "the id from the comment's heading",
+        "category": "simple_fix|controversial_fix|question|info|already_done|wont_fix",
+        "reasoning": "Why you categorized it this way (1-2 sentences)",
+        "proposed_action": "What you plan to do (be specific)",
+        "file_path": "path/to/file.py (if fixing code, otherwise null)",
+        "line_number": 123 (if specific line mentioned, otherwise null),
+        "answer": "Answer to question (if category is question, otherwise null)"
+    }}
+]
+
+Respond ONLY with the JSON array, no other text.
+"""
+
+        try:
+            result = await self.agent.execute_prompt(
+                prompt,
+                context={"pr_number": pr_number, "comment_ids": comment_ids},
+                task_id=f"analyze-comments-{comment_ids[0]}-{comment_ids[-1]}",
+            )
+        except Exception as e:
+            log.error("comment_batch_analysis_exception", comment_ids=comment_ids, error=str(e), exc_info=True)
+            return [None] * len(comments)
+
+        if not result.get("success"):
+            log.error("comment_batch_analysis_failed", comment_ids=comment_ids, error=result.get("error"))
+            return [None] * len(comments)
+
+        entries = self._parse_batch_response(result.get("output", ""))
+        by_id = {str(entry.get("comment_id")): entry for entry in entries or [] if isinstance(entry, dict)}
+
+        analyses: list[CommentAnalysis | None] = []
+        retry: list[int] = []
+        for index, (comment_id, comment) in enumerate(zip(comment_ids, comments, strict=True)):
+            entry = by_id.get(str(comment_id))
+            analysis = None
+            if entry is not None:
+                try:
+                    analysis = self._build_analysis(comment, entry)
+                except (KeyError, ValueError) as e:
+                    log.warning("comment_batch_entry_invalid", comment_id=comment_id, error=str(e))
+            if analysis is None:
+                retry.append(index)
+            analyses.append(analysis)
+
+        if retry:
+            log.info("comment_batch_retrying_individually", pr_number=pr_number, count=len(retry))
+            # Sequentially, so the batch still holds a single concurrency slot
+            for index in retry:
+                analyses[index] = await self._analyze_single_comment(comments[index], pr_number)
+
+        return analyses
+
+    def _build_analysis(self, comment: Any, analysis_data: dict[str, Any]) -> CommentAnalysis:
+        """Create a CommentAnalysis from a comment and the AI's fields for it.
+
+        Raises:
+            KeyError: If a required field is missing.
+            ValueError: If the category is not a CommentCategory value.
+        """
+        return CommentAnalysis(
+            comment_id=comment.id if hasattr(comment, "id") else comment.get("id"),
+            comment_author=comment.author if hasattr(comment, "author") else comment.get("author", "unknown"),
+            comment_body=comment.body if hasattr(comment, "body") else comment.get("body", ""),
+            comment_created_at=(
+                comment.created_at if hasattr(comment, "created_at") else comment.get("created_at", None)
+            ),
+            category=CommentCategory(analysis_data["category"]),
+            reasoning=analysis_data["reasoning"],
+            proposed_action=analysis_data["proposed_action"],
+            file_path=analysis_data.get("file_path"),
+            line_number=analysis_data.get("line_number"),
+            answer=analysis_data.get("answer"),
+        )
+
     def _parse_ai_response(self, output: str) -> dict[str, Any] | None:
         """Parse JSON response from AI agent.
 
@@ -343,8 +508,6 @@ Respond ONLY with the JSON, no other text.
         """
         try:
             # Try to find JSON in output (AI might add text before/after)
-            import re
-
             json_match = re.search(r"\{.*\}", output, re.DOTALL)
             parsed: dict[str, Any]
             if json_match:
@@ -358,3 +521,25 @@ Respond ONLY with the JSON, no other text.
         except json.JSONDecodeError as e:
             log.error("json_parse_failed", error=str(e), output=output[:200])
             return None
+
+    def _parse_batch_response(self, output: str) -> list[Any] | None:
+        """Parse the JSON array returned for a batch of comments.
+
+        Accepts the array on its own, surrounded by text, or wrapped in an
+        object under an ``analyses`` key.
+
+        Args:
+            output: Raw text output from the AI agent.
+
+        Returns:
+            The parsed entries, or None if no array could be parsed.
+        """
+        json_match = re.search(r"\[.*\]", output, re.DOTALL)
+        try:
+            parsed = json.loads(json_match.group(0) if json_match else output)
+        except json.JSONDecodeError as e:
+            log.error("json_parse_failed", error=str(e), output=output[:200])
+            return None
+        if isinstance(parsed, dict):
+            parsed = parsed.get("analyses")
+        return parsed if isinstance(parsed, list) else None
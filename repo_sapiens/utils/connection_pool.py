@@ -1,21 +1,248 @@
 """
 HTTP connection pooling for API requests.
 Improves performance through connection reuse and HTTP/2 multiplexing.
+Repeated GETs are revalidated with ETag / Last-Modified conditional requests.
+Requests are paced by a RateLimitScheduler that learns the server's budget
+from its rate-limit headers. When the persistent cache tier is configured,
+validators and bodies are also kept on disk so a later process can
+revalidate instead of downloading again.
 """
 
 import asyncio
-from collections.abc import AsyncIterator
+import copy
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 import structlog
 
+from repo_sapiens.utils.caching import CacheKeyBuilder, get_disk_cache
+from repo_sapiens.utils.disk_cache import DiskCache
+from repo_sapiens.utils.rate_limit import Priority, RateLimitScheduler, classify_request
+
+try:
+    from repo_sapiens.monitoring.metrics import MetricsCollector
+
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
 log = structlog.get_logger(__name__)
 
+# Persisted validation entries live this long on disk
+DISK_ENTRY_TTL_SECONDS = 86400.0
+
+# Larger bodies are only kept in memory
+MAX_PERSISTED_BODY_BYTES = 1024 * 1024
+
+# Headers describing the original transfer, which no longer apply to a stored body
+_TRANSFER_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+# Validation cache entries keyed by their response object. Cached responses are
+# returned again on 304, so the result parsed from them can be reused too
+# (callers get copies, see parse_response).
+_cache_entries: "weakref.WeakKeyDictionary[httpx.Response, CachedResponse]" = weakref.WeakKeyDictionary()
+
+
+def parse_response[T](response: httpx.Response, parser: Callable[[Any], T]) -> T:
+    """Parse a response's JSON body, reusing the result for revalidated responses.
+
+    When a conditional GET comes back 304 Not Modified, the pool returns the
+    originally cached response object, so the domain objects parsed from it
+    the first time are reused without decoding or parsing again. Every
+    caller gets its own deep copy, so mutating a result (e.g. an Issue's
+    labels) never changes what later callers receive.
+
+    Args:
+        response: Response returned by HTTPConnectionPool
+        parser: Function converting the decoded JSON body to domain objects
+
+    Returns:
+        Parsed domain object(s)
+    """
+    entry = _cache_entries.get(response)
+    if entry is not None and entry.parsed is not None:
+        return copy.deepcopy(entry.parsed)  # type: ignore[no-any-return]
+
+    parsed = parser(response.json())
+    if entry is not None:
+        entry.parsed = parsed
+        return copy.deepcopy(parsed)
+    return parsed
+
+
+def record_revalidation(cache_name: str, hit: bool) -> None:
+    """Report a conditional request outcome (304 = hit) to the metrics collector."""
+    if not METRICS_AVAILABLE:
+        return
+    if hit:
+        MetricsCollector.record_cache_hit(cache_name)
+    else:
+        MetricsCollector.record_cache_miss(cache_name)
+
+
+@dataclass
+class CachedResponse:
+    """Validators and body of a previously fetched GET response."""
+
+    response: httpx.Response
+    etag: str | None = None
+    last_modified: str | None = None
+    parsed: Any = None
+
+
+class ValidationCache:
+    """LRU store of GET responses that carry HTTP cache validators.
+
+    Entries are keyed by path, query params and request headers. Stored
+    validators are sent back as If-None-Match / If-Modified-Since so the
+    server can answer 304 Not Modified instead of resending the body.
+
+    With a disk tier attached, entries are also written to it as JSON and
+    in-memory misses are loaded from it, so revalidation works across
+    processes. Disk keys include ``scope`` (the pool's base URL and
+    credentials), so entries are never shared between servers or tokens.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        cache_name: str = "http_validation",
+        disk: DiskCache | None = None,
+        scope: str = "",
+    ) -> None:
+        self.max_entries = max_entries
+        self.cache_name = cache_name
+        self.disk = disk
+        self.scope = scope
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    @staticmethod
+    def make_key(path: str, params: Any = None, headers: Any = None) -> str:
+        """Build a cache key from the request path, params and headers."""
+        key = path
+        if params:
+            items = params.items() if hasattr(params, "items") else params
+            key += "?" + "&".join(f"{k}={v}" for k, v in sorted((str(k), str(v)) for k, v in items))
+        if headers:
+            key += "|" + "|".join(f"{k.lower()}:{v}" for k, v in sorted(headers.items()))
+        return key
+
+    def conditional_headers(self, key: str) -> dict[str, str]:
+        """Return validator headers for a cached entry (empty if not cached)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return {}
+
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidated(self, key: str) -> httpx.Response | None:
+        """Handle a 304 for key, returning the cached response if present."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        record_revalidation(self.cache_name, hit=True)
+        return entry.response
+
+    def store(self, key: str, response: httpx.Response) -> None:
+        """Store a fresh 200 response if it carries validators."""
+        self.misses += 1
+        record_revalidation(self.cache_name, hit=False)
+
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not isinstance(etag, str) and not isinstance(last_modified, str):
+            # No validators - nothing to revalidate against later
+            self._entries.pop(key, None)
+            return
+
+        self._add(
+            key,
+            CachedResponse(
+                response=response,
+                etag=etag if isinstance(etag, str) else None,
+                last_modified=last_modified if isinstance(last_modified, str) else None,
+            ),
+        )
+
+    def _add(self, key: str, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        _cache_entries[entry.response] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def load(self, key: str) -> None:
+        """Fill an in-memory miss for key from the disk tier, if attached."""
+        if self.disk is None or key in self._entries:
+            return
+
+        stored = await self.disk.get(self._disk_key(key))
+        if stored is None:
+            return
+
+        data = stored[0]
+        try:
+            response = httpx.Response(200, headers=data["headers"], content=data["content"].encode("utf-8"))
+            entry = CachedResponse(response=response, etag=data["etag"], last_modified=data["last_modified"])
+        except (KeyError, TypeError, AttributeError) as e:
+            log.debug("http_validation_entry_unreadable", key=key, error=str(e))
+            return
+        self._add(key, entry)
+
+    async def persist(self, key: str) -> None:
+        """Write the entry for key to the disk tier, if attached."""
+        entry = self._entries.get(key)
+        if self.disk is None or entry is None:
+            return
+
+        body = entry.response.content
+        if len(body) > MAX_PERSISTED_BODY_BYTES:
+            return
+        try:
+            content = body.decode("utf-8")
+        except UnicodeDecodeError:
+            return
+
+        headers = [(k, v) for k, v in entry.response.headers.multi_items() if k.lower() not in _TRANSFER_HEADERS]
+        await self.disk.set(
+            self._disk_key(key),
+            {"etag": entry.etag, "last_modified": entry.last_modified, "headers": headers, "content": content},
+            DISK_ENTRY_TTL_SECONDS,
+            namespace=self.cache_name,
+        )
+
+    def _disk_key(self, key: str) -> str:
+        return CacheKeyBuilder.build_namespaced_key(self.cache_name, self.scope, key)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class HTTPConnectionPool:
-    """HTTP connection pool for API requests."""
+    """HTTP connection pool for API requests.
+
+    Every request method accepts a ``priority`` keyword (a ``Priority``) that
+    overrides the rate-limit priority inferred from the method and path.
+    """
 
     def __init__(
         self,
@@ -24,12 +251,21 @@ class HTTPConnectionPool:
         max_keepalive_connections: int = 5,
         timeout: float = 30.0,
         headers: dict[str, str] | None = None,
+        conditional_requests: bool = True,
+        rate_limit: bool = True,
+        name: str | None = None,
     ) -> None:
         self.base_url = base_url
         self.max_connections = max_connections
         self.max_keepalive_connections = max_keepalive_connections
         self.timeout = timeout
         self.headers = headers or {}
+        self.validation_cache = (
+            ValidationCache(scope=CacheKeyBuilder.build_key(base_url, sorted(self.headers.items())))
+            if conditional_requests
+            else None
+        )
+        self.rate_limiter = RateLimitScheduler(name or base_url) if rate_limit else None
         self._client: httpx.AsyncClient | None = None
         self._lock = asyncio.Lock()
 
@@ -50,6 +286,8 @@ class HTTPConnectionPool:
                     http2=True,  # Enable HTTP/2 for multiplexing
                     headers=self.headers,
                 )
+                if self.validation_cache is not None:
+                    self.validation_cache.disk = get_disk_cache()
 
                 log.info(
                     "connection_pool_initialized",
@@ -63,15 +301,46 @@ class HTTPConnectionPool:
             if self._client:
                 await self._client.aclose()
                 self._client = None
-                log.info("connection_pool_closed", base_url=self.base_url)
+            if self.validation_cache is not None:
+                self.validation_cache.clear()
+            log.info("connection_pool_closed", base_url=self.base_url)
 
     async def get(self, path: str, **kwargs: Any) -> httpx.Response:
-        """Make GET request."""
+        """Make GET request.
+
+        When conditional requests are enabled, a previously seen ETag or
+        Last-Modified value is sent along and a 304 Not Modified answer is
+        turned back into the cached 200 response. Entries persisted by an
+        earlier process are used the same way.
+        """
         if self._client is None:
             await self.initialize()
 
         assert self._client is not None
-        return await self._client.get(path, **kwargs)
+        await self._throttle("GET", path, kwargs)
+        if self.validation_cache is None:
+            return self._observe(await self._client.get(path, **kwargs))
+
+        key = ValidationCache.make_key(path, kwargs.get("params"), kwargs.get("headers"))
+        await self.validation_cache.load(key)
+        validators = self.validation_cache.conditional_headers(key)
+        if validators:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+
+        response = self._observe(await self._client.get(path, **kwargs))
+
+        if response.status_code == 304:
+            cached = self.validation_cache.revalidated(key)
+            if cached is not None:
+                log.debug("http_not_modified", path=path)
+                # Entries loaded from disk were never sent; raise_for_status() needs a request
+                cached.request = response.request
+                return cached
+        elif response.status_code == 200:
+            self.validation_cache.store(key, response)
+            await self.validation_cache.persist(key)
+
+        return response
 
     async def post(self, path: str, **kwargs: Any) -> httpx.Response:
         """Make POST request."""
@@ -79,7 +348,8 @@ class HTTPConnectionPool:
             await self.initialize()
 
         assert self._client is not None
-        return await self._client.post(path, **kwargs)
+        await self._throttle("POST", path, kwargs)
+        return self._observe(await self._client.post(path, **kwargs))
 
     async def put(self, path: str, **kwargs: Any) -> httpx.Response:
         """Make PUT request."""
@@ -87,7 +357,8 @@ class HTTPConnectionPool:
             await self.initialize()
 
         assert self._client is not None
-        return await self._client.put(path, **kwargs)
+        await self._throttle("PUT", path, kwargs)
+        return self._observe(await self._client.put(path, **kwargs))
 
     async def patch(self, path: str, **kwargs: Any) -> httpx.Response:
         """Make PATCH request."""
@@ -95,7 +366,8 @@ class HTTPConnectionPool:
             await self.initialize()
 
         assert self._client is not None
-        return await self._client.patch(path, **kwargs)
+        await self._throttle("PATCH", path, kwargs)
+        return self._observe(await self._client.patch(path, **kwargs))
 
     async def delete(self, path: str, **kwargs: Any) -> httpx.Response:
         """Make DELETE request."""
@@ -103,7 +375,8 @@ class HTTPConnectionPool:
             await self.initialize()
 
         assert self._client is not None
-        return await self._client.delete(path, **kwargs)
+        await self._throttle("DELETE", path, kwargs)
+        return self._observe(await self._client.delete(path, **kwargs))
 
     @asynccontextmanager
     async def request(self, method: str, path: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
@@ -112,8 +385,24 @@ class HTTPConnectionPool:
             await self.initialize()
 
         assert self._client is not None
+        await self._throttle(method, path, kwargs)
         async with self._client.stream(method, path, **kwargs) as response:
-            yield response
+            yield self._observe(response)
+
+    async def _throttle(self, method: str, path: str, kwargs: dict[str, Any]) -> None:
+        """Wait for the rate limiter; pops the ``priority`` keyword from kwargs."""
+        priority: Priority | None = kwargs.pop("priority", None)
+        if self.rate_limiter is None:
+            return
+        if priority is None:
+            priority = classify_request(method, path, kwargs.get("params"))
+        await self.rate_limiter.acquire(priority)
+
+    def _observe(self, response: httpx.Response) -> httpx.Response:
+        """Feed a response's rate-limit headers to the rate limiter."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(response.status_code, response.headers)
+        return response
 
     async def __aenter__(self) -> "HTTPConnectionPool":
         """Async context manager entry."""
@@ -148,6 +437,7 @@ class ConnectionPoolManager:
                     max_connections=max_connections,
                     timeout=timeout,
                     headers=headers,
+                    name=name,
                 )
                 await pool.initialize()
                 self._pools[name] = pool
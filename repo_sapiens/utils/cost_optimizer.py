@@ -1,14 +1,21 @@
 """
 Cost optimization for AI model selection.
 Intelligently selects models based on task complexity to minimize costs.
+
+Given a UsageLedger of measured LLM calls, cost estimates use the
+measured token counts per task instead of token guesses, and
+``actual_costs()`` reports what the recorded calls cost.
 """
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
+if TYPE_CHECKING:
+    from repo_sapiens.monitoring.usage import UsageLedger
+
 log = structlog.get_logger(__name__)
 
 
@@ -35,6 +42,13 @@ MODEL_PRICING: dict[ModelTier, ModelCosts] = {
     ModelTier.ADVANCED: ModelCosts(input_cost=15.00, output_cost=75.00),
 }
 
+# Workflow stages whose LLM calls count toward each part of a cost estimate
+STAGE_GROUPS: dict[str, tuple[str, ...]] = {
+    "planning": ("proposal", "planning", "plan_review"),
+    "implementation": ("task_execution", "implementation", "fix_execution", "pr_fix"),
+    "review": ("code_review", "pr_review", "qa"),
+}
+
 
 @dataclass
 class TaskComplexityFactors:
@@ -78,9 +92,23 @@ class CostOptimizer:
         "logging",
     }
 
-    def __init__(self, enable_optimization: bool = True) -> None:
+    # Measured tasks needed before measurements replace static values
+    MIN_SAMPLES = 3
+
+    def __init__(
+        self,
+        enable_optimization: bool = True,
+        usage: "UsageLedger | None" = None,
+    ) -> None:
+        """Initialize the optimizer.
+
+        Args:
+            enable_optimization: Select models by task complexity (otherwise always BALANCED)
+            usage: Ledger of measured LLM calls to estimate and report costs by
+        """
         self.enable_optimization = enable_optimization
         self.model_costs = MODEL_PRICING
+        self.usage = usage
 
     def select_model_for_task(self, task: Any) -> ModelTier:
         """
@@ -106,6 +134,27 @@ class CostOptimizer:
         else:
             return ModelTier.ADVANCED
 
+    def _measured_tokens(self) -> dict[str, int]:
+        """Mean tokens per planned issue and per task, for the stage groups measured often enough.
+
+        Calls are summed per (issue, task) before averaging, since one
+        stage run can make many calls.
+        """
+        if self.usage is None:
+            return {}
+        tokens: dict[str, int] = {}
+        for group, prefix in (("planning", "planning"), ("implementation", "task"), ("review", "review")):
+            units: dict[Any, list[int]] = {}
+            for stage in STAGE_GROUPS[group]:
+                for key, summary in self.usage.summarize(("issue", "task"), stage=stage).items():
+                    unit = units.setdefault(key, [0, 0])
+                    unit[0] += summary.prompt_tokens
+                    unit[1] += summary.completion_tokens
+            if len(units) >= self.MIN_SAMPLES:
+                tokens[f"{prefix}_input"] = sum(unit[0] for unit in units.values()) // len(units)
+                tokens[f"{prefix}_output"] = sum(unit[1] for unit in units.values()) // len(units)
+        return tokens
+
     def _assess_complexity(self, task: Any) -> float:
         """
         Assess task complexity on 0-1 scale.
@@ -201,7 +250,7 @@ class CostOptimizer:
         """
         costs = {"planning": 0.0, "implementation": 0.0, "review": 0.0, "total": 0.0}
 
-        # Default token estimates if not provided
+        # Default token estimates if not provided, measured where possible
         if estimated_tokens is None:
             estimated_tokens = {
                 "planning_input": 10000,
@@ -210,6 +259,7 @@ class CostOptimizer:
                 "task_output": 10000,
                 "review_input": 15000,
                 "review_output": 3000,
+                **self._measured_tokens(),
             }
 
         # Planning cost (usually balanced model)
@@ -251,6 +301,31 @@ class CostOptimizer:
 
         return costs
 
+    def actual_costs(self, **where: Any) -> dict[str, float]:
+        """Measured cost of the recorded LLM calls, in estimate_cost()'s breakdown.
+
+        Stages outside STAGE_GROUPS only count toward the total.
+
+        Args:
+            **where: Only count calls with these labels, e.g. ``plan="42"`` or ``issue=42``
+
+        Returns:
+            Cost by stage group and total, comparable with estimate_cost()
+
+        Raises:
+            ValueError: If the optimizer has no usage ledger
+        """
+        if self.usage is None:
+            raise ValueError("Actual costs need a usage ledger")
+
+        costs = {"planning": 0.0, "implementation": 0.0, "review": 0.0, "total": 0.0}
+        for stage, summary in self.usage.summarize("stage", **where).items():
+            for group, stages in STAGE_GROUPS.items():
+                if stage in stages:
+                    costs[group] += summary.cost
+            costs["total"] += summary.cost
+        return costs
+
     def get_cost_savings_recommendations(
         self, actual_costs: dict[str, float], estimated_costs: dict[str, float]
     ) -> list[str]:
@@ -0,0 +1,220 @@
+"""
+Persistent second-level cache tier backed by SQLite.
+
+Each CLI invocation is a fresh process, so in-memory caches start cold on
+every run. ``DiskCache`` stores cache entries in a small SQLite database
+(``~/.cache/repo-sapiens/cache.db`` by default) that short-lived processes
+on the same runner share, letting one invocation reuse API results fetched
+by the previous one.
+
+Entries carry a wall-clock expiry so they are comparable across processes,
+and the table is bounded to ``max_entries`` by evicting the least recently
+read rows. The tier is best-effort: database or serialization errors are
+logged and treated as misses, never raised to the caller.
+
+Values are stored as JSON, so only JSON-compatible values (dicts, lists,
+strings, numbers, booleans and None) are persisted. Reading an entry never
+runs code, whoever wrote the database; it still defaults to a location
+outside the checked-out repository, so a commit cannot plant cache entries.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, cast
+
+import structlog
+
+log = structlog.get_logger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        namespace TEXT NOT NULL,
+        value TEXT NOT NULL,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS cache_entries_accessed ON cache_entries (accessed_at)",
+    "CREATE INDEX IF NOT EXISTS cache_entries_namespace ON cache_entries (namespace)",
+)
+
+_UPSERT = """
+INSERT INTO cache_entries (key, namespace, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    namespace = excluded.namespace,
+    value = excluded.value,
+    expires_at = excluded.expires_at,
+    accessed_at = excluded.accessed_at
+"""
+
+# Reads refresh accessed_at at most this often, so hot keys don't write on every hit
+_TOUCH_INTERVAL = 60.0
+
+# Size bound is enforced every this many writes rather than on each one
+_EVICT_EVERY = 64
+
+
+class DiskCache:
+    """Size-bounded SQLite key/value store with per-entry TTLs.
+
+    Example:
+        >>> disk = DiskCache("~/.cache/repo-sapiens/cache.db", max_entries=10000)
+        >>> await disk.set("gitea_labels:3f2a...", {"bug": 7}, ttl_seconds=3600)
+        >>> entry = await disk.get("gitea_labels:3f2a...")
+        >>> if entry is not None:
+        ...     value, remaining_seconds = entry
+    """
+
+    def __init__(self, path: str | Path, max_entries: int = 10000, busy_timeout: float = 5.0) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Database file path
+            max_entries: Maximum rows kept; least recently read rows are evicted first
+            busy_timeout: Seconds SQLite waits for another process's write
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        # One connection shared by worker threads; calls are serialized
+        self._db_lock = threading.Lock()
+        self._writes = 0
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        def locked() -> Any:
+            with self._db_lock:
+                return func(*args)
+
+        try:
+            return await asyncio.to_thread(locked)
+        except sqlite3.Error as e:
+            log.warning("disk_cache_error", path=str(self.path), error=str(e))
+            return None
+
+    async def get(self, key: str) -> tuple[Any, float] | None:
+        """Look up an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, seconds until expiry), or None on a miss
+        """
+        return cast(tuple[Any, float] | None, await self._run(self._get, key))
+
+    def _get(self, key: str) -> tuple[Any, float] | None:
+        row = self._conn.execute(
+            "SELECT value, expires_at, accessed_at FROM cache_entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        data, expires_at, accessed_at = row
+        now = time.time()
+        if expires_at <= now:
+            self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            return None
+
+        try:
+            value = json.loads(data)
+        except ValueError as e:
+            log.warning("disk_cache_entry_unreadable", key=key, error=str(e))
+            self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            return None
+
+        if now - accessed_at > _TOUCH_INTERVAL:
+            self._conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return value, expires_at - now
+
+    async def set(self, key: str, value: Any, ttl_seconds: float, namespace: str = "") -> None:
+        """Store an entry.
+
+        Values that cannot be encoded as JSON are skipped.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Lifetime of the entry
+            namespace: Group the entry belongs to, used by clear()
+        """
+        if ttl_seconds <= 0:
+            return
+        try:
+            data = json.dumps(value, separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            log.debug("disk_cache_value_not_serializable", key=key, error=str(e))
+            return
+        await self._run(self._set, key, namespace, data, ttl_seconds)
+
+    def _set(self, key: str, namespace: str, data: str, ttl_seconds: float) -> None:
+        now = time.time()
+        self._conn.execute(_UPSERT, (key, namespace, data, now + ttl_seconds, now))
+        self._writes += 1
+        if self._writes % _EVICT_EVERY == 0:
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows, then the least recently read rows over the size bound."""
+        self._conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE key IN (SELECT key FROM cache_entries ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+            log.debug("disk_cache_evicted", count=excess)
+
+    async def prune(self) -> None:
+        """Enforce expiry and the size bound immediately."""
+        await self._run(self._evict, time.time())
+
+    async def delete(self, key: str) -> bool:
+        """Delete an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the entry existed
+        """
+        cursor = await self._run(self._conn.execute, "DELETE FROM cache_entries WHERE key = ?", (key,))
+        return cursor is not None and cursor.rowcount > 0
+
+    async def clear(self, namespace: str | None = None) -> None:
+        """Delete every entry, or every entry in one namespace.
+
+        Args:
+            namespace: Namespace to clear (None clears everything)
+        """
+        if namespace is None:
+            await self._run(self._conn.execute, "DELETE FROM cache_entries")
+        else:
+            await self._run(self._conn.execute, "DELETE FROM cache_entries WHERE namespace = ?", (namespace,))
+
+    async def count(self) -> int:
+        """Number of stored entries, including expired ones not yet pruned."""
+        row = await self._run(lambda: self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone())
+        return row[0] if row else 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._db_lock:
+            self._conn.close()
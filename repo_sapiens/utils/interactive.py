@@ -175,17 +175,21 @@ class InteractiveQAHandler:
         # Wait for response
         timeout = datetime.now(UTC) + timedelta(minutes=timeout_minutes)
 
+        # High-water mark: each poll only asks for comments since the newest one seen.
+        # since is inclusive, so comments at that exact time are skipped by ID.
+        since = question_time
+        seen_ids = {question_comment.id}
+
         while datetime.now(UTC) < timeout:
-            # Get all comments since our question
-            comments = await self.git.get_comments(issue_number)
+            comments = await self.git.get_comments(issue_number, since=since)
 
             # Look for responses after our question
             for comment in comments:
-                if (
-                    comment.created_at > question_time
-                    and comment.id != question_comment.id
-                    and not self._is_bot_comment(comment.body)
-                ):
+                if comment.id in seen_ids or comment.created_at <= question_time:
+                    continue
+                seen_ids.add(comment.id)
+                since = max(since, comment.created_at)
+                if not self._is_bot_comment(comment.body):
                     # This is a user response (doesn't start with bot markers)
                     log.info(
                         "user_response_received",
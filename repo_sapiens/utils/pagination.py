@@ -0,0 +1,94 @@
+"""
+Pagination helpers for provider list endpoints.
+
+Streams paginated API results page by page, fetching the next page in the
+background while the caller is still consuming the current one.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import httpx
+import structlog
+
+log = structlog.get_logger(__name__)
+
+# Default page size for list endpoints (Gitea caps at 50, GitLab/GitHub at 100)
+DEFAULT_PAGE_SIZE = 50
+
+
+async def prefetch_pages[T](
+    fetch_page: Callable[[int], Awaitable[T]],
+    next_page: Callable[[int, T], int | None],
+    first_page: int = 1,
+) -> AsyncIterator[T]:
+    """Yield pages in order, prefetching the next page while the caller works.
+
+    As soon as a page arrives its successor (if any) is requested, so the
+    network round trip for page N+1 overlaps with the caller parsing and
+    processing page N.
+
+    Args:
+        fetch_page: Async function returning the page with the given number
+        next_page: Function mapping (page number, page result) to the next
+            page number, or None when the result was the last page
+        first_page: Number of the first page to fetch
+
+    Yields:
+        Page results in page order
+    """
+    page = first_page
+    pending: asyncio.Task[T] | None = asyncio.ensure_future(fetch_page(page))
+
+    try:
+        while pending is not None:
+            result = await pending
+            pending = None
+
+            following = next_page(page, result)
+            if following is not None:
+                page = following
+                pending = asyncio.ensure_future(fetch_page(page))
+
+            yield result
+    finally:
+        # Consumer stopped early (break/exception) - drop the prefetch
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
+def next_page_number(
+    response: httpx.Response,
+    items: list[Any],
+    page: int,
+    per_page: int,
+) -> int | None:
+    """Determine the next page number from a paginated REST response.
+
+    A short page is always the last one. For full pages the standard
+    pagination headers are consulted: GitLab's ``X-Next-Page`` and the RFC 8288
+    ``Link`` header used by Gitea and GitHub. When neither header is present
+    a full page is assumed to have a successor.
+
+    Args:
+        response: HTTP response for the current page
+        items: Items parsed from the current page
+        page: Current page number
+        per_page: Requested page size
+
+    Returns:
+        Next page number, or None if this was the last page
+    """
+    if len(items) < per_page:
+        return None
+
+    next_header = response.headers.get("x-next-page")
+    if isinstance(next_header, str):
+        return int(next_header) if next_header.strip() else None
+
+    link_header = response.headers.get("link")
+    if isinstance(link_header, str):
+        return page + 1 if 'rel="next"' in link_header else None
+
+    return page + 1
@@ -0,0 +1,288 @@
+"""
+Rate-limit-aware request scheduling for git provider APIs.
+
+GitHub and Gitea report the caller's request budget in ``X-RateLimit-*``
+response headers and GitLab in ``RateLimit-*``; all three send
+``Retry-After`` when a request was refused. ``RateLimitScheduler`` learns
+the budget from those headers and hands out permission to send requests
+from a token bucket refilled at ``remaining / seconds until reset``, so the
+rest of the window's budget is spread over the window instead of being
+spent in a burst that ends in 403/429 responses.
+
+Until a server reports a budget the scheduler doesn't throttle at all,
+which keeps self-hosted instances without rate limiting at full speed.
+
+Waiting requests are served by priority. Interactive calls (comments,
+labels, any write) go before ordinary reads, and bulk reads (list pages)
+go last; bulk reads also leave the final ``reserve_fraction`` of the
+budget to the other two so a long listing can't starve the workflow's
+visible actions.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import re
+import time
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Any
+
+import structlog
+
+try:
+    from repo_sapiens.monitoring.metrics import MetricsCollector
+
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+log = structlog.get_logger(__name__)
+
+# Reset headers at least this large are Unix timestamps, smaller ones are delays
+_EPOCH_THRESHOLD = 1_000_000_000
+
+# Pause after a 429 that carries neither Retry-After nor a reset time
+_DEFAULT_RETRY_AFTER = 60.0
+
+# Path segments of the calls a user is waiting to see
+_INTERACTIVE_SEGMENTS = re.compile(r"/(comments|notes|labels)(/|$)")
+
+
+class Priority(IntEnum):
+    """Scheduling priority of a request; lower values are served first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+def classify_request(method: str, path: str, params: Any = None) -> Priority:
+    """Pick a priority for an HTTP request from its method, path and params.
+
+    Args:
+        method: HTTP method
+        path: Request path
+        params: Query parameters, if any
+
+    Returns:
+        INTERACTIVE for writes and comment/label calls, BULK for paginated
+        reads, NORMAL otherwise
+    """
+    if method.upper() != "GET" or _INTERACTIVE_SEGMENTS.search(path):
+        return Priority.INTERACTIVE
+    if params and "page" in params:
+        return Priority.BULK
+    return Priority.NORMAL
+
+
+class RateLimitScheduler:
+    """Token bucket that learns a provider's request budget from its responses.
+
+    Attributes:
+        name: Provider label used in logs and the remaining-budget gauge
+        burst: Most requests sent back to back once a budget is known
+        reserve_fraction: Share of the budget bulk reads leave to other requests
+        limit: Requests allowed per window, as last reported (None until known)
+        remaining: Requests left in the current window (None until known)
+
+    Example:
+        >>> scheduler = RateLimitScheduler("github-api.github.com")
+        >>> await scheduler.acquire(Priority.BULK)
+        >>> response = await client.get("/repos/o/r/issues", params={"page": "3"})
+        >>> scheduler.observe(response.status_code, response.headers)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        burst: int = 10,
+        reserve_fraction: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an unthrottled scheduler.
+
+        Args:
+            name: Provider label used in logs and metrics
+            burst: Most requests sent back to back once a budget is known
+            reserve_fraction: Share of the budget bulk reads leave to other requests
+            clock: Monotonic time source
+            wall_clock: Unix time source, for absolute reset timestamps
+        """
+        self.name = name
+        self.burst = burst
+        self.reserve_fraction = reserve_fraction
+        self.limit: int | None = None
+        self.remaining: int | None = None
+
+        self._clock = clock
+        self._wall_clock = wall_clock
+        # Monotonic time the current window resets (None while no budget is known)
+        self._reset_at: float | None = None
+        self._blocked_until = 0.0
+        self._tokens = float(burst)
+        self._refilled_at = clock()
+        # Heap of (priority, arrival) tickets; the head is served next
+        self._waiters: list[tuple[int, int]] = []
+        self._arrivals = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    async def acquire(self, priority: Priority = Priority.NORMAL) -> None:
+        """Wait until a request of this priority may be sent.
+
+        Args:
+            priority: Scheduling priority of the request
+        """
+        ticket = (int(priority), next(self._arrivals))
+        heapq.heappush(self._waiters, ticket)
+        self._notify()
+        try:
+            while True:
+                granted, delay = self._take(ticket)
+                if granted:
+                    return
+                wakeup = self._wakeup
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), timeout=delay)
+        except BaseException:
+            if ticket in self._waiters:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._notify()
+            raise
+
+    def observe(self, status_code: int, headers: Mapping[str, Any]) -> None:
+        """Learn the budget from a response.
+
+        Args:
+            status_code: HTTP status of the response
+            headers: Response headers (case-insensitive mapping)
+        """
+        limit = _int_header(headers, "x-ratelimit-limit", "ratelimit-limit")
+        remaining = _int_header(headers, "x-ratelimit-remaining", "ratelimit-remaining")
+        reset = _int_header(headers, "x-ratelimit-reset", "ratelimit-reset")
+        if remaining is not None:
+            reset_in = None
+            if reset is not None:
+                reset_in = reset - self._wall_clock() if reset >= _EPOCH_THRESHOLD else float(reset)
+            self._update_budget(remaining, limit, reset_in)
+
+        retry_after = _retry_after(headers, self._wall_clock)
+        exhausted = status_code == 429 or (status_code == 403 and remaining == 0)
+        if retry_after is None and exhausted:
+            now = self._clock()
+            retry_after = self._reset_at - now if self._reset_at is not None else _DEFAULT_RETRY_AFTER
+        if retry_after is not None and status_code >= 400:
+            self._blocked_until = max(self._blocked_until, self._clock() + max(retry_after, 0.0))
+            log.warning("rate_limited", provider=self.name, status=status_code, retry_after=round(retry_after, 1))
+        self._notify()
+
+    def observe_budget(self, remaining: int, limit: int, reset_timestamp: float) -> None:
+        """Learn the budget from values a client library has already parsed.
+
+        Args:
+            remaining: Requests left in the current window
+            limit: Requests allowed per window
+            reset_timestamp: Unix time the window resets
+        """
+        if limit < 0 or remaining < 0:
+            # Not reported yet
+            return
+        self._update_budget(remaining, limit, reset_timestamp - self._wall_clock())
+        self._notify()
+
+    def _update_budget(self, remaining: int, limit: int | None, reset_in: float | None) -> None:
+        now = self._clock()
+        self._refill(now)
+        self.remaining = remaining
+        if limit is not None:
+            self.limit = limit
+        if reset_in is not None:
+            self._reset_at = now + max(reset_in, 0.0)
+        elif self._reset_at is None:
+            # Budget without a reset time: assume GitHub's hourly window
+            self._reset_at = now + 3600.0
+        self._tokens = min(self._tokens, self._capacity())
+
+        if METRICS_AVAILABLE:
+            MetricsCollector.update_rate_limit_remaining(self.name, remaining)
+        log.debug("rate_limit_budget", provider=self.name, remaining=remaining, limit=self.limit)
+
+    def _capacity(self) -> float:
+        if self.remaining is None:
+            return float(self.burst)
+        return float(min(self.burst, self.remaining))
+
+    def _refill(self, now: float) -> None:
+        if self._reset_at is not None and now >= self._reset_at:
+            # The window the budget was learned for is over; unthrottled until told otherwise
+            self.remaining = None
+            self._reset_at = None
+            self._tokens = float(self.burst)
+        elif self._reset_at is not None and self.remaining is not None:
+            rate = self.remaining / max(self._reset_at - now, 1.0)
+            self._tokens = min(self._capacity(), self._tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+
+    def _take(self, ticket: tuple[int, int]) -> tuple[bool, float | None]:
+        """Grant the ticket if it is due.
+
+        Returns:
+            (granted, seconds to wait before re-checking; None to wait until notified)
+        """
+        if self._waiters[0] != ticket:
+            return False, None
+
+        now = self._clock()
+        self._refill(now)
+        if now < self._blocked_until:
+            return False, self._blocked_until - now
+
+        if self._reset_at is not None and self.remaining is not None:
+            reserve = (self.limit or 0) * self.reserve_fraction
+            if self.remaining <= 0 or (ticket[0] == Priority.BULK and self.remaining <= reserve):
+                return False, self._reset_at - now
+            if self._tokens < 1.0:
+                rate = self.remaining / max(self._reset_at - now, 1.0)
+                return False, (1.0 - self._tokens) / rate
+            self._tokens -= 1.0
+            # Local estimate until the response reports the real figure
+            self.remaining -= 1
+
+        heapq.heappop(self._waiters)
+        self._notify()
+        return True, None
+
+    def _notify(self) -> None:
+        """Wake every waiter so the current head can re-check its turn."""
+        self._wakeup.set()
+        self._wakeup = asyncio.Event()
+
+
+def _int_header(headers: Mapping[str, Any], *names: str) -> int | None:
+    for name in names:
+        value = headers.get(name)
+        if isinstance(value, str):
+            try:
+                return int(float(value))
+            except ValueError:
+                continue
+    return None
+
+
+def _retry_after(headers: Mapping[str, Any], wall_clock: Callable[[], float]) -> float | None:
+    """Seconds to wait from a Retry-After header (delay or HTTP date)."""
+    value = headers.get("retry-after")
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - wall_clock()
+    except (TypeError, ValueError):
+        return None
@@ -1,29 +1,67 @@
-"""Webhook server for real-time Gitea event processing."""
+"""Webhook server for real-time Gitea event processing.
 
+Issue events are classified and handed to an in-process work queue, so the
+webhook is acknowledged with 202 immediately while a pool of workers routes
+events through the LabelRouter in the background. The analytics dashboard
+is mounted under ``/dashboard`` so it reports this process's metrics.
+"""
+
+import asyncio
 import re
 
 import structlog
 from fastapi import FastAPI, HTTPException, Request
 
 from repo_sapiens.config.settings import AutomationSettings
+from repo_sapiens.engine.event_classifier import ClassifiedEvent, EventClassifier, EventSource
+from repo_sapiens.engine.event_queue import EventQueue
+from repo_sapiens.engine.label_router import LabelRouter
+from repo_sapiens.engine.orchestrator import WorkflowOrchestrator
+from repo_sapiens.engine.state_manager import StateManager
 from repo_sapiens.exceptions import ConfigurationError, RepoSapiensError
+from repo_sapiens.monitoring.dashboard import app as dashboard_app
+from repo_sapiens.monitoring.dashboard import start_dashboard, stop_dashboard
+from repo_sapiens.monitoring.tracing import configure_from_settings, get_tracer
+from repo_sapiens.monitoring.usage import configure_usage_from_settings
+from repo_sapiens.providers.factory import create_agent_provider, create_git_provider
+from repo_sapiens.storage.factory import create_storage_backend
 
 log = structlog.get_logger(__name__)
 
 app = FastAPI(title="Gitea Automation Webhook Server")
+# Mounted apps' own startup hooks don't run; startup() starts the dashboard
+app.mount("/dashboard", dashboard_app)
 
 # Global state
 settings: AutomationSettings = None
 orchestrator = None
+classifier: EventClassifier | None = None
+event_queue: EventQueue | None = None
+router: LabelRouter | None = None
+_router_lock = asyncio.Lock()
 
 
 @app.on_event("startup")
 async def startup():
     """Initialize on startup."""
-    global settings
+    global settings, classifier, event_queue
     try:
         settings = AutomationSettings.from_yaml("repo_sapiens/config/automation_config.yaml")
-        log.info("webhook_server_started")
+        configure_from_settings(settings.tracing)
+        configure_usage_from_settings(settings.usage)
+
+        webhook_config = settings.automation.webhook
+        classifier = EventClassifier(settings)
+        event_queue = EventQueue(
+            route_event,
+            max_size=webhook_config.queue_size,
+            workers=webhook_config.workers,
+            dedupe_window=webhook_config.dedupe_window_seconds,
+        )
+        await event_queue.start()
+        await start_dashboard(settings)
+
+        log.info("webhook_server_started", workers=webhook_config.workers)
     except ConfigurationError as e:
         log.error("webhook_startup_failed", error=e.message, exc_info=True)
         raise ConfigurationError(e.message) from e
@@ -32,9 +70,82 @@ async def startup():
         raise RuntimeError(f"Webhook startup failed: {e}") from e
 
 
-@app.post("/webhook/gitea")
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop the worker pool and release provider connections."""
+    global event_queue, router, orchestrator
+    if event_queue is not None:
+        await event_queue.stop()
+        event_queue = None
+
+    if orchestrator is not None:
+        await orchestrator.state.close()
+    if router is not None and hasattr(router.git, "disconnect"):
+        await router.git.disconnect()
+    router = None
+    orchestrator = None
+    await stop_dashboard()
+    get_tracer().shutdown()
+
+    log.info("webhook_server_stopped")
+
+
+async def get_router() -> LabelRouter:
+    """Get the shared label router, creating providers on first use.
+
+    Providers are connected lazily so the server can start (and acknowledge
+    webhooks) before the git and agent backends are reachable.
+
+    Returns:
+        Shared LabelRouter instance
+    """
+    global router, orchestrator
+    async with _router_lock:
+        if router is None:
+            git = create_git_provider(settings)
+            await git.connect()
+
+            agent = create_agent_provider(settings)
+            await agent.connect()
+
+            state = StateManager(
+                settings.state_dir,
+                backend=create_storage_backend(settings, settings.state_dir),
+                flush_interval_ms=settings.workflow.state_flush_interval_ms,
+            )
+            orchestrator = WorkflowOrchestrator(settings, git, agent, state)
+            router = LabelRouter(settings, git, orchestrator)
+    return router
+
+
+async def route_event(event: ClassifiedEvent) -> dict:
+    """Route a queued event through the label router.
+
+    Args:
+        event: Classified event taken from the work queue
+
+    Returns:
+        Result dictionary from LabelRouter.route
+    """
+    label_router = await get_router()
+    result = await label_router.route(event)
+
+    log.info(
+        "issue_event_processed",
+        issue=event.issue_number,
+        handler=event.handler,
+        success=result.get("success", False),
+    )
+    return result
+
+
+@app.post("/webhook/gitea", status_code=202)
 async def gitea_webhook(request: Request):
-    """Handle Gitea webhook events."""
+    """Handle Gitea webhook events.
+
+    Events are queued for background processing; the response only confirms
+    that the event was accepted, not that its handler has run.
+    """
     event_type = request.headers.get("X-Gitea-Event")
 
     if not event_type:
@@ -52,8 +163,11 @@ async def gitea_webhook(request: Request):
         else:
             log.warning("unhandled_event_type", event_type=event_type)
 
-        return {"status": "success", "event_type": event_type}
+        return {"status": "accepted", "event_type": event_type}
 
+    except asyncio.QueueFull as e:
+        log.warning("webhook_queue_full", event_type=event_type)
+        raise HTTPException(status_code=503, detail="Event queue is full, retry later") from e
     except RepoSapiensError as e:
         log.error("webhook_processing_failed", error=e.message, exc_info=True)
         raise HTTPException(status_code=422, detail=e.message) from e
@@ -62,20 +176,39 @@ async def gitea_webhook(request: Request):
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
 
-async def handle_issue_event(payload: dict):
-    """Handle issue event from webhook."""
+async def handle_issue_event(payload: dict) -> bool:
+    """Classify an issue event and queue it for routing.
+
+    Args:
+        payload: Gitea issue webhook payload
+
+    Returns:
+        True if the event was queued, False if it was skipped or deduplicated
+
+    Raises:
+        asyncio.QueueFull: If the work queue is at capacity
+    """
     action = payload.get("action")
     issue_data = payload.get("issue", {})
     issue_number = issue_data.get("number")
 
     log.info("issue_event_received", issue=issue_number, action=action)
 
-    # In a full implementation, this would:
-    # 1. Fetch full issue from git provider
-    # 2. Process issue through orchestrator
-    # 3. Update state
+    if classifier is None or event_queue is None:
+        log.warning("webhook_queue_not_ready", issue=issue_number, action=action)
+        return False
+
+    event_name = f"issues.{action}" if action else "issues"
+    classified = classifier.classify(event_name, payload, EventSource.GITEA)
+
+    if not classified.should_process:
+        log.info("issue_event_skipped", issue=issue_number, reason=classified.skip_reason)
+        return False
 
-    log.info("issue_event_processed", issue=issue_number, action=action)
+    queued = event_queue.submit(classified)
+    if queued:
+        log.info("issue_event_queued", issue=issue_number, action=action, depth=event_queue.depth)
+    return queued
 
 
 async def handle_push_event(payload: dict):
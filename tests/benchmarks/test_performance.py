@@ -15,23 +15,50 @@ Target Performance Metrics:
 - State Management: <100ms per operation
 """
 
+import asyncio
 import gc
+import heapq
+import itertools
 import json
+import random
+import re
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 import yaml
+from github import Github  # type: ignore[import-not-found]
+from github.Auth import Token  # type: ignore[import-not-found]
+from github.Requester import Requester  # type: ignore[import-not-found]
+from prometheus_client import CollectorRegistry, Counter, Histogram
 
 # Import modules to benchmark
+from repo_sapiens.agents.tools import ToolRegistry
+from repo_sapiens.agents.workspace_index import WorkspaceIndex
 from repo_sapiens.config.settings import (
     AutomationSettings,
 )
 from repo_sapiens.credentials.environment_backend import EnvironmentBackend
 from repo_sapiens.credentials.keyring_backend import KeyringBackend
 from repo_sapiens.credentials.resolver import CredentialResolver
+from repo_sapiens.engine.parallel_executor import ExecutionTask, ParallelExecutor, TaskScheduler, compute_schedule
 from repo_sapiens.engine.state_manager import StateManager
 from repo_sapiens.git.discovery import GitDiscovery
+from repo_sapiens.monitoring.aggregator import MetricsAggregator
+from repo_sapiens.monitoring.tracing import JSONLSpanExporter, configure_tracing, read_spans, span
+from repo_sapiens.monitoring.usage import (
+    LLMCall,
+    UsageLedger,
+    configure_usage,
+    get_usage_ledger,
+    record_call,
+    usage_scope,
+)
+from repo_sapiens.providers.github_async import GitHubAsyncProvider
+from repo_sapiens.providers.github_rest import GitHubRestProvider
 from repo_sapiens.rendering import SecureTemplateEngine
+from repo_sapiens.utils.caching import AsyncCache, cached
+from repo_sapiens.utils.connection_pool import HTTPConnectionPool
 
 # ============================================================================
 # Configuration Loading Benchmarks
@@ -502,6 +529,568 @@ class TestStateManagementPerformance:
         await benchmark(save_large)
 
 
+# ============================================================================
+# Caching Benchmarks
+# ============================================================================
+
+
+class TestCachePerformance:
+    """Benchmark AsyncCache hot paths on a full cache."""
+
+    CACHE_SIZE = 10_000
+
+    @pytest.fixture
+    def full_cache(self):
+        """Create a cache filled to max_size."""
+        cache = AsyncCache(ttl_seconds=300, max_size=self.CACHE_SIZE)
+        for i in range(self.CACHE_SIZE):
+            cache.store(f"key:{i}", {"value": i})
+        return cache
+
+    def test_cache_hits(self, benchmark, full_cache):
+        """Benchmark 1000 lookups that hit."""
+        keys = [f"key:{i}" for i in range(0, self.CACHE_SIZE, 10)]
+
+        def read_all():
+            return [full_cache.lookup(key) for key in keys]
+
+        result = benchmark(read_all)
+        assert None not in result
+
+    def test_insert_into_full_cache(self, benchmark, full_cache):
+        """Benchmark 1000 inserts that each evict (was O(n) per insert)."""
+        counter = itertools.count(self.CACHE_SIZE)
+
+        def insert_batch():
+            for _ in range(1000):
+                full_cache.store(f"key:{next(counter)}", {"value": 0})
+
+        benchmark(insert_batch)
+        assert len(full_cache._cache) == self.CACHE_SIZE
+
+    def test_cached_decorator_hit(self, benchmark):
+        """Benchmark a decorated coroutine call served from cache."""
+
+        @cached(ttl_seconds=300)
+        async def fetch(issue_number: int) -> dict:
+            return {"number": issue_number}
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(fetch(42))
+            result = benchmark(lambda: loop.run_until_complete(fetch(42)))
+        finally:
+            loop.close()
+
+        assert result == {"number": 42}
+
+
+# ============================================================================
+# Code Search Benchmarks
+# ============================================================================
+
+
+CHECKOUT_PACKAGES = 40
+
+
+@pytest.fixture(scope="module")
+def checkout(tmp_path_factory):
+    """Create 2,000 modules of 200 lines each (~10 MB)."""
+    root = tmp_path_factory.mktemp("checkout")
+    for p in range(CHECKOUT_PACKAGES):
+        package = root / f"pkg{p}"
+        package.mkdir()
+        for m in range(50):
+            body = "\n".join(
+                f"def function_{p}_{m}_{i}(value):  # line {i}\n    return value * {i}" for i in range(100)
+            )
+            (package / f"module{m}.py").write_text(body + "\n")
+    (root / "pkg7" / "module3.py").write_text("def needle_in_haystack():\n    pass\n")
+    return root
+
+
+class TestCodeSearchPerformance:
+    """Benchmark ToolRegistry search tools on a large generated checkout."""
+
+    def test_search_warm_index(self, benchmark, checkout):
+        """Benchmark repeated searches once the index is warm (target: <100ms)."""
+        registry = ToolRegistry(checkout)
+        args = {"pattern": "needle_in_haystack"}
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(registry.execute("search_files", args))
+            result = benchmark(lambda: loop.run_until_complete(registry.execute("search_files", args)))
+        finally:
+            loop.close()
+
+        assert result == "pkg7/module3.py:1:def needle_in_haystack():"
+
+    def test_search_trigram_prefilter(self, benchmark, checkout):
+        """Benchmark a search on a trigram-indexed workspace too large for the content cache."""
+        index = WorkspaceIndex(checkout, max_cached_bytes=1024 * 1024, trigrams=True)
+        list(index.search("needle_in_haystack"))
+
+        result = benchmark(lambda: list(index.search("needle_in_haystack")))
+
+        assert result == [("pkg7/module3.py", 1, "def needle_in_haystack():")]
+
+    def test_find_files_warm_index(self, benchmark, checkout):
+        """Benchmark recursive globbing from the index."""
+        registry = ToolRegistry(checkout)
+        args = {"pattern": "**/module3.py"}
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(registry.execute("find_files", args))
+            result = benchmark(lambda: loop.run_until_complete(registry.execute("find_files", args)))
+        finally:
+            loop.close()
+
+        assert result.count("module3.py") == CHECKOUT_PACKAGES
+
+    def test_grep_subprocess_baseline(self, benchmark, checkout):
+        """Benchmark the grep subprocess search_files used previously, for comparison."""
+        import shutil
+        import subprocess
+
+        if shutil.which("grep") is None:
+            pytest.skip("grep not available")
+
+        def grep():
+            return subprocess.run(
+                ["grep", "-rn", "--include", "*", "needle_in_haystack", str(checkout)],
+                capture_output=True,
+                text=True,
+                check=False,
+            ).stdout
+
+        assert "module3.py" in benchmark(grep)
+
+    def test_read_file_warm_cache(self, benchmark, checkout):
+        """Benchmark re-reading a file the agent already read (cache hit)."""
+        registry = ToolRegistry(checkout)
+        args = {"path": "pkg3/module5.py"}
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(registry.execute("read_file", args))
+            result = benchmark(lambda: loop.run_until_complete(registry.execute("read_file", args)))
+        finally:
+            loop.close()
+
+        assert result.startswith("def function_3_5_0(value):")
+        assert registry.file_cache.stats()["misses"] == 1
+
+    def test_read_file_line_range_large_file(self, benchmark, tmp_path):
+        """Benchmark reading 20 lines from the middle of a 20 MB file."""
+        path = tmp_path / "large.log"
+        path.write_text("".join(f"{i:08d} request handled in 12ms\n" for i in range(600_000)))
+        registry = ToolRegistry(tmp_path)
+        args = {"path": "large.log", "start_line": 300_001, "end_line": 300_020}
+
+        loop = asyncio.new_event_loop()
+        try:
+            result = benchmark(lambda: loop.run_until_complete(registry.execute("read_file", args)))
+        finally:
+            loop.close()
+
+        assert result.startswith("00300000 request")
+        assert result.count("\n") == 19
+
+
+# ============================================================================
+# GitHub Provider Benchmarks
+# ============================================================================
+
+
+GITHUB_API = "https://api.github.com"
+GITHUB_ISSUES = 20
+
+
+def fake_github(method: str, path: str) -> tuple[int, object]:
+    """Answer the GitHub REST calls an issue pass makes, like a tiny GitHub."""
+    repo_url = f"{GITHUB_API}/repos/o/r"
+    user = {"login": "dev", "id": 1, "url": f"{GITHUB_API}/users/dev"}
+    match = re.fullmatch(r"/repos/o/r(?:/issues/(\d+)(/comments)?)?", path)
+    if match is None:
+        return 404, {"message": "Not Found"}
+    number, comments = match.groups()
+    if number is None:
+        return 200, {"id": 1, "name": "r", "full_name": "o/r", "url": repo_url}
+    if comments:
+        comment = {
+            "id": int(number) * 10,
+            "body": "Please also cover the error path.",
+            "user": user,
+            "created_at": "2024-06-16T16:00:00Z",
+            "url": f"{repo_url}/issues/comments/{int(number) * 10}",
+        }
+        return (201, comment) if method == "POST" else (200, [comment])
+    return 200, {
+        "id": 1000 + int(number),
+        "number": int(number),
+        "title": f"Issue {number}",
+        "body": "Details",
+        "state": "open",
+        "labels": [{"name": "needs-planning", "url": f"{repo_url}/labels/needs-planning"}],
+        "created_at": "2024-06-15T10:30:00Z",
+        "updated_at": "2024-06-16T14:45:00Z",
+        "user": user,
+        "url": f"{repo_url}/issues/{number}",
+        "html_url": f"https://github.com/o/r/issues/{number}",
+    }
+
+
+async def process_issues(provider) -> None:
+    """The provider calls one workflow pass makes per issue."""
+    for number in range(1, GITHUB_ISSUES + 1):
+        await provider.get_issue(number)
+        await provider.get_comments(number)
+        await provider.add_comment(number, "Plan ready for review")
+        await provider.update_issue(number, labels=["awaiting-approval"])
+
+
+class TestGitHubProviderPerformance:
+    """Compare requests and time per issue for the httpx and PyGithub GitHub providers."""
+
+    def test_async_provider_process_issues(self, benchmark):
+        """Benchmark 20 issue passes through GitHubAsyncProvider (4 requests per issue)."""
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(f"{request.method} {request.url.path}")
+            status, body = fake_github(request.method, request.url.path)
+            return httpx.Response(status, json=body)
+
+        provider = GitHubAsyncProvider(token="t", owner="o", repo="r", base_url=GITHUB_API)
+        provider._pool = HTTPConnectionPool(base_url=GITHUB_API, conditional_requests=False, rate_limit=False)
+        provider._pool._client = httpx.AsyncClient(base_url=GITHUB_API, transport=httpx.MockTransport(handler))
+
+        loop = asyncio.new_event_loop()
+        try:
+            benchmark(lambda: loop.run_until_complete(process_issues(provider)))
+            requests.clear()
+            loop.run_until_complete(process_issues(provider))
+            loop.run_until_complete(provider._pool.close())
+        finally:
+            loop.close()
+
+        benchmark.extra_info["calls_per_issue"] = len(requests) / GITHUB_ISSUES
+        assert len(requests) == 4 * GITHUB_ISSUES
+
+    def test_pygithub_provider_process_issues(self, benchmark):
+        """Benchmark the same passes through the PyGithub fallback (8 requests per issue)."""
+        requests: list[str] = []
+
+        class FakeResponse:
+            def __init__(self, status: int, body: object) -> None:
+                self.status = status
+                self._body = json.dumps(body)
+
+            def getheaders(self):
+                return {"content-type": "application/json"}.items()
+
+            def read(self) -> str:
+                return self._body
+
+        class FakeConnection:
+            def __init__(self, host, port=None, **kwargs) -> None:
+                self.host = host
+
+            def request(self, verb, url, input=None, headers=None, stream=False) -> None:
+                path = url.split("?")[0]
+                requests.append(f"{verb} {path}")
+                self._response = FakeResponse(*fake_github(verb, path))
+
+            def getresponse(self) -> FakeResponse:
+                return self._response
+
+            def close(self) -> None:
+                pass
+
+        Requester.injectConnectionClasses(FakeConnection, FakeConnection)
+        loop = asyncio.new_event_loop()
+        try:
+            provider = GitHubRestProvider(token="t", owner="o", repo="r", base_url=GITHUB_API)
+            # PyGithub's default write spacing (1s) would dominate; measure the request pattern only
+            provider._client = Github(
+                auth=Token("t"), base_url=GITHUB_API, seconds_between_requests=None, seconds_between_writes=None
+            )
+            provider._repo = provider._client.get_repo("o/r")
+
+            benchmark(lambda: loop.run_until_complete(process_issues(provider)))
+            requests.clear()
+            loop.run_until_complete(process_issues(provider))
+        finally:
+            loop.close()
+            Requester.resetConnectionClasses()
+
+        benchmark.extra_info["calls_per_issue"] = len(requests) / GITHUB_ISSUES
+        assert len(requests) == 8 * GITHUB_ISSUES
+
+
+# ============================================================================
+# Task Scheduling Benchmarks
+# ============================================================================
+
+
+DAG_LAYERS = 50
+DAG_WIDTH = 20
+
+
+def plan_dag(seed: int = 0) -> tuple[dict[str, set[str]], dict[str, float]]:
+    """A 1,000-task plan: 50 layers of 20, each task waiting on up to 3 of the layer before."""
+    rng = random.Random(seed)
+    dependencies: dict[str, set[str]] = {}
+    durations: dict[str, float] = {}
+    for layer in range(DAG_LAYERS):
+        for slot in range(DAG_WIDTH):
+            task_id = f"t{layer}-{slot}"
+            previous = [f"t{layer - 1}-{i}" for i in range(DAG_WIDTH)] if layer else []
+            dependencies[task_id] = set(rng.sample(previous, 3)) if previous else set()
+            durations[task_id] = rng.choice([1.0, 2.0, 5.0, 30.0, 120.0])
+    return dependencies, durations
+
+
+def simulate_makespan(dependencies: dict[str, set[str]], durations: dict[str, float], workers: int, rank) -> float:
+    """Run a plan on simulated workers, starting ready tasks in ascending rank(task_id) order."""
+    dependents: dict[str, list[str]] = {task_id: [] for task_id in dependencies}
+    waiting = {task_id: len(deps) for task_id, deps in dependencies.items()}
+    for task_id, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(task_id)
+
+    ready = [(rank(task_id), task_id) for task_id, count in waiting.items() if count == 0]
+    heapq.heapify(ready)
+    running: list[tuple[float, str]] = []
+    now = 0.0
+    while ready or running:
+        while ready and len(running) < workers:
+            task_id = heapq.heappop(ready)[1]
+            heapq.heappush(running, (now + durations[task_id], task_id))
+        now, task_id = heapq.heappop(running)
+        for child in dependents[task_id]:
+            waiting[child] -= 1
+            if waiting[child] == 0:
+                heapq.heappush(ready, (rank(child), child))
+    return now
+
+
+class TestTaskSchedulingPerformance:
+    """Benchmark duration-weighted critical path scheduling on 1,000-task plans."""
+
+    def test_compute_schedule_1k_tasks(self, benchmark):
+        """Benchmark the CPM forward/backward pass over 1,000 tasks and ~2,900 dependencies."""
+        dependencies, durations = plan_dag()
+
+        schedule = benchmark(compute_schedule, dependencies, durations)
+
+        assert len(schedule.slack) == DAG_LAYERS * DAG_WIDTH
+        assert schedule.critical
+
+    def test_compute_schedule_stacked_diamonds(self, benchmark):
+        """Benchmark 333 stacked diamonds (2^333 root-to-leaf paths; path enumeration never finishes)."""
+        dependencies: dict[str, set[str]] = {"join-0": set()}
+        for level in range(1, 334):
+            dependencies[f"left-{level}"] = {f"join-{level - 1}"}
+            dependencies[f"right-{level}"] = {f"join-{level - 1}"}
+            dependencies[f"join-{level}"] = {f"left-{level}", f"right-{level}"}
+
+        schedule = benchmark(compute_schedule, dependencies, {})
+
+        assert schedule.makespan == 1 + 333 * 2
+
+    def test_optimize_execution_order_1k_tasks(self, benchmark):
+        """Benchmark TaskScheduler.optimize_execution_order with historical durations."""
+        dependencies, durations = plan_dag()
+
+        async def noop() -> None:
+            pass
+
+        scheduler = TaskScheduler(ParallelExecutor(max_workers=8), duration_estimates=durations)
+
+        def optimize():
+            tasks = [ExecutionTask(id=task_id, func=noop, dependencies=deps) for task_id, deps in dependencies.items()]
+            return scheduler.optimize_execution_order(tasks)
+
+        optimized = benchmark(optimize)
+        assert len(optimized) == DAG_LAYERS * DAG_WIDTH
+
+    def test_longest_remaining_path_first_makespan(self, benchmark):
+        """Compare simulated 8-worker makespans: longest remaining path first vs submission order."""
+        dependencies, durations = plan_dag()
+        schedule = compute_schedule(dependencies, durations)
+        position = {task_id: index for index, task_id in enumerate(dependencies)}
+
+        cpm = benchmark(simulate_makespan, dependencies, durations, 8, lambda task_id: -schedule.remaining[task_id])
+        fifo = simulate_makespan(dependencies, durations, 8, position.__getitem__)
+
+        benchmark.extra_info["makespan_cpm"] = cpm
+        benchmark.extra_info["makespan_fifo"] = fifo
+        benchmark.extra_info["makespan_lower_bound"] = schedule.makespan
+        assert schedule.makespan <= cpm < fifo
+
+
+# ============================================================================
+# Dashboard Metrics Benchmarks
+# ============================================================================
+
+
+@pytest.fixture
+def busy_registry():
+    """A registry after a busy day: 20 stages, 5 providers x 20 methods, 10 task types."""
+    registry = CollectorRegistry()
+    workflows = Counter("automation_workflow_executions_total", "", ["stage", "status"], registry=registry)
+    workflow_duration = Histogram(
+        "automation_workflow_duration_seconds",
+        "",
+        ["stage"],
+        buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600),
+        registry=registry,
+    )
+    api_calls = Counter("automation_api_calls_total", "", ["provider", "method", "status"], registry=registry)
+    api_duration = Histogram(
+        "automation_api_call_duration_seconds",
+        "",
+        ["provider", "method"],
+        buckets=(0.1, 0.5, 1, 2, 5, 10, 30),
+        registry=registry,
+    )
+    tasks = Counter("automation_task_executions_total", "", ["task_type", "status"], registry=registry)
+    cache_hits = Counter("automation_cache_hits_total", "", ["cache_name"], registry=registry)
+    rng = random.Random(0)
+    for stage in range(20):
+        workflows.labels(stage=f"stage-{stage}", status="success").inc(rng.randint(10, 500))
+        for _ in range(50):
+            workflow_duration.labels(stage=f"stage-{stage}").observe(rng.uniform(1, 900))
+    for provider in range(5):
+        for method in range(20):
+            api_calls.labels(provider=f"p{provider}", method=f"m{method}", status="success").inc(1000)
+            for _ in range(20):
+                api_duration.labels(provider=f"p{provider}", method=f"m{method}").observe(rng.uniform(0.01, 3))
+    for task_type in range(10):
+        tasks.labels(task_type=f"type-{task_type}", status="success").inc(100)
+    cache_hits.labels(cache_name="http").inc(5000)
+    return registry
+
+
+class TestDashboardMetricsPerformance:
+    """Benchmark the dashboard's aggregation over a populated metrics registry."""
+
+    def test_sample(self, benchmark, busy_registry):
+        """Benchmark one sample of every rolling time series."""
+        aggregator = MetricsAggregator(registry=busy_registry)
+        aggregator.sample()
+
+        benchmark(aggregator.sample)
+        assert aggregator.series["api_calls"].total() == 0.0
+
+    def test_summary(self, benchmark, busy_registry):
+        """Benchmark the summary cards."""
+        aggregator = MetricsAggregator(registry=busy_registry)
+
+        summary = benchmark(aggregator.summary)
+        assert summary["total_workflows"] > 0
+
+    def test_performance_percentiles(self, benchmark, busy_registry):
+        """Benchmark latency percentiles for 100 provider methods."""
+        aggregator = MetricsAggregator(registry=busy_registry)
+
+        result = benchmark(aggregator.performance)
+        assert len(result["api_calls"]["by_method"]) == 100
+
+    def test_timeline_24h(self, benchmark, busy_registry):
+        """Benchmark a full 24-hour hourly timeline from the minute ring."""
+        aggregator = MetricsAggregator(registry=busy_registry)
+        ring = aggregator.series["workflows"]
+        for _ in range(ring.minutes):
+            ring.add(1)
+
+        timeline = benchmark(aggregator.timeseries, "workflows", 60)
+        assert 24 <= len(timeline) <= 25
+
+
+class TestTracingPerformance:
+    """Benchmark the cost of spans around instrumented calls."""
+
+    @staticmethod
+    def issue_run(depth: int = 3, fanout: int = 10) -> None:
+        """Open the spans of one issue: a stage, provider calls and tool calls beneath them."""
+        with span("process_issue", issue=812):
+            with span("ImplementationStage.execute", issue=812):
+                for call in range(fanout):
+                    with span("GitHubAsyncProvider.get_issue", number=call):
+                        for _ in range(depth):
+                            with span("tool.read_file", tool="read_file"):
+                                pass
+
+    def test_disabled(self, benchmark):
+        """Benchmark an issue's spans with tracing disabled."""
+        configure_tracing([])
+
+        benchmark(self.issue_run)
+
+    def test_jsonl(self, benchmark, tmp_path):
+        """Benchmark an issue's 42 spans recorded to the JSONL exporter."""
+        configure_tracing([JSONLSpanExporter(tmp_path)])
+        try:
+            benchmark(self.issue_run)
+        finally:
+            configure_tracing([])
+        assert read_spans(tmp_path)
+
+
+class TestUsageAccountingPerformance:
+    """Benchmark recording and aggregating LLM call usage."""
+
+    @staticmethod
+    def record_one() -> None:
+        """Record one attributed call, as a backend does after each response."""
+        with usage_scope(issue=812, plan="812", task="task-3", stage="implementation"):
+            record_call("qwen3:8b", "ollama", 2.5, prompt_tokens=1200, completion_tokens=300, generation_time=2.0)
+
+    def test_record_call(self, benchmark):
+        """Benchmark recording a call into the in-memory ledger."""
+        previous = get_usage_ledger()
+        configure_usage(UsageLedger())
+        try:
+            benchmark(self.record_one)
+        finally:
+            configure_usage(previous)
+
+    def test_record_call_persisted(self, benchmark, tmp_path):
+        """Benchmark recording a call appended to the daily JSONL file."""
+        previous = get_usage_ledger()
+        configure_usage(UsageLedger(directory=tmp_path))
+        try:
+            benchmark(self.record_one)
+        finally:
+            configure_usage(previous)
+        assert list(tmp_path.glob("*.jsonl"))
+
+    def test_summarize(self, benchmark):
+        """Benchmark aggregating 10,000 calls by plan and stage."""
+        ledger = UsageLedger()
+        stages = ("planning", "implementation", "code_review")
+        ledger.calls.extend(
+            LLMCall(
+                model="qwen3:8b",
+                provider="ollama",
+                plan=str(i % 50),
+                stage=stages[i % 3],
+                prompt_tokens=1000,
+                completion_tokens=200,
+                latency=2.0,
+            )
+            for i in range(10_000)
+        )
+
+        groups = benchmark(ledger.summarize, ("plan", "stage"))
+
+        assert len(groups) == 150
+
+
 # ============================================================================
 # Integration Benchmarks
 # ============================================================================
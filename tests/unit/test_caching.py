@@ -136,6 +136,151 @@ async def test_cached_decorator():
     assert call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used():
+    """Test that a hit protects an entry from eviction."""
+    cache = AsyncCache(ttl_seconds=60, max_size=2)
+
+    await cache.set("key1", "value1")
+    await cache.set("key2", "value2")
+    await cache.get("key1")  # key2 is now least recently used
+    await cache.set("key3", "value3")
+
+    assert await cache.get("key1") == "value1"
+    assert await cache.get("key2") is None
+    assert await cache.get("key3") == "value3"
+    assert (await cache.get_stats())["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_purges_expired_before_evicting():
+    """Test that expired entries make room before live ones are evicted."""
+    cache = AsyncCache(ttl_seconds=60, max_size=2)
+
+    await cache.set("stale", "value", ttl_seconds=0)
+    await cache.set("key1", "value1")
+    await cache.set("key2", "value2")
+
+    assert await cache.get("key1") == "value1"
+    assert await cache.get("key2") == "value2"
+    assert (await cache.get_stats())["evictions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_stores_none():
+    """Test negative caching of None values."""
+    cache = AsyncCache(ttl_seconds=60)
+    missing = object()
+
+    await cache.set("absent", None)
+
+    assert await cache.get("absent", missing) is None
+    assert await cache.get("other", missing) is missing
+
+
+@pytest.mark.asyncio
+async def test_cache_overwrites_keep_expiry_heap_bounded():
+    """Test that repeated overwrites do not grow the expiry heap without bound."""
+    cache = AsyncCache(ttl_seconds=60, max_size=4)
+
+    for i in range(1000):
+        await cache.set("key", i)
+
+    assert await cache.get("key") == 999
+    assert len(cache._expiry) <= 2 * 4 + 64
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_coalesces_concurrent_misses():
+    """Test that concurrent misses for one key make a single upstream call."""
+    call_count = 0
+    release = asyncio.Event()
+
+    @cached(ttl_seconds=60)
+    async def fetch(x: int) -> int:
+        nonlocal call_count
+        call_count += 1
+        await release.wait()
+        return x * 2
+
+    callers = [asyncio.create_task(fetch(5)) for _ in range(10)]
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert await asyncio.gather(*callers) == [10] * 10
+    assert call_count == 1
+    assert await fetch(5) == 10
+    assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_shares_and_forgets_errors():
+    """Test that a failed upstream call reaches every waiter and is not cached."""
+    call_count = 0
+    release = asyncio.Event()
+
+    @cached(ttl_seconds=60)
+    async def fetch(x: int) -> int:
+        nonlocal call_count
+        call_count += 1
+        await release.wait()
+        if call_count == 1:
+            raise ValueError("upstream failed")
+        return x
+
+    callers = [asyncio.create_task(fetch(1)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert await fetch(1) == 1
+    assert call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_cancelled_caller_does_not_cancel_others():
+    """Test that cancelling one waiter leaves the shared call running."""
+    release = asyncio.Event()
+
+    @cached(ttl_seconds=60)
+    async def fetch(x: int) -> int:
+        await release.wait()
+        return x
+
+    first = asyncio.create_task(fetch(7))
+    second = asyncio.create_task(fetch(7))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert await second == 7
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_negative_caching():
+    """Test that None results are cached unless negative caching is disabled."""
+    calls = {"cached": 0, "uncached": 0}
+
+    @cached(ttl_seconds=60)
+    async def lookup(name: str) -> None:
+        calls["cached"] += 1
+        return None
+
+    @cached(ttl_seconds=60, negative_ttl_seconds=0)
+    async def lookup_uncached(name: str) -> None:
+        calls["uncached"] += 1
+        return None
+
+    for _ in range(3):
+        assert await lookup("missing") is None
+        assert await lookup_uncached("missing") is None
+
+    assert calls == {"cached": 1, "uncached": 3}
+
+
 def test_cache_key_builder():
     """Test cache key builder."""
     key1 = CacheKeyBuilder.build_key("part1", "part2", 123)
@@ -0,0 +1,109 @@
+"""Tests for the `sapiens trace` commands."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from repo_sapiens.cli.trace import build_flame, render_flame
+from repo_sapiens.main import cli
+from repo_sapiens.monitoring.tracing import Span
+
+
+def make_span(name, span_id, parent_id, start, end, trace_id="a" * 32, **attributes):
+    return Span(name, trace_id, span_id, parent_id, start, end, attributes)
+
+
+@pytest.fixture
+def issue_trace():
+    """One process_issue trace with repeated provider calls and a slow agent run."""
+    return [
+        make_span("process_issue", "root", None, 0.0, 100.0, issue=812),
+        make_span("ImplementationStage.execute", "stage", "root", 1.0, 99.0, issue=812),
+        make_span("GitHubAsyncProvider.get_issue", "get1", "stage", 1.0, 2.0, number=812),
+        make_span("GitHubAsyncProvider.get_issue", "get2", "stage", 2.0, 3.0, number=812),
+        make_span("ExternalAgentProvider.execute_task", "agent", "stage", 3.0, 98.0),
+        make_span("agent.subprocess", "proc", "agent", 3.5, 97.5, command="claude"),
+        make_span("GitHubAsyncProvider.add_comment", "comment", "stage", 98.0, 98.2),
+    ]
+
+
+@pytest.fixture
+def trace_dir(tmp_path, issue_trace):
+    other = [make_span("process_issue", "r2", None, 200.0, 210.0, trace_id="b" * 32, issue=9)]
+    lines = [json.dumps(s.to_dict()) for s in issue_trace + other]
+    (tmp_path / "2026-10-16.jsonl").write_text("\n".join(lines) + "\n")
+    return tmp_path
+
+
+class TestBuildFlame:
+    """Tests for merging spans into a flame tree."""
+
+    def test_merges_same_named_siblings(self, issue_trace):
+        (root,) = build_flame(issue_trace)
+        (stage,) = root.children
+
+        assert [child.name for child in stage.children] == [
+            "ExternalAgentProvider.execute_task",
+            "GitHubAsyncProvider.get_issue",
+            "GitHubAsyncProvider.add_comment",
+        ]
+        get_issue = stage.children[1]
+        assert get_issue.label == "GitHubAsyncProvider.get_issue ×2"
+        assert get_issue.total == pytest.approx(2.0)
+        assert stage.self_time == pytest.approx(98.0 - 95.0 - 2.0 - 0.2)
+
+    def test_spans_with_missing_parents_become_roots(self, issue_trace):
+        roots = build_flame(issue_trace[2:])
+
+        assert {node.name for node in roots} == {
+            "GitHubAsyncProvider.get_issue",
+            "ExternalAgentProvider.execute_task",
+            "GitHubAsyncProvider.add_comment",
+        }
+
+    def test_render_folds_small_spans(self, issue_trace):
+        lines = render_flame(issue_trace, min_percent=1.0)
+
+        assert "process_issue issue=812" in lines[3]
+        assert any("└── agent.subprocess command=claude" in line for line in lines)
+        assert any("├── GitHubAsyncProvider.get_issue ×2" in line for line in lines)
+        assert "└── … 1 more" in lines[-1]
+        assert " 95.0% " in next(line for line in lines if "execute_task" in line)
+
+
+class TestTraceCommands:
+    """Tests for `sapiens trace list` and `sapiens trace show`."""
+
+    def test_show_latest_trace(self, trace_dir):
+        result = CliRunner().invoke(cli, ["trace", "show", "--directory", str(trace_dir)])
+
+        assert result.exit_code == 0, result.output
+        assert "Trace " + "b" * 32 in result.output
+
+    def test_show_by_issue_and_prefix(self, trace_dir):
+        by_issue = CliRunner().invoke(cli, ["trace", "show", "--issue", "812", "--directory", str(trace_dir)])
+        by_prefix = CliRunner().invoke(cli, ["trace", "show", "aaaa", "--directory", str(trace_dir)])
+
+        assert by_issue.exit_code == 0, by_issue.output
+        assert "agent.subprocess command=claude" in by_issue.output
+        assert by_prefix.output == by_issue.output
+
+    def test_show_unknown_trace(self, trace_dir):
+        result = CliRunner().invoke(cli, ["trace", "show", "ffff", "--directory", str(trace_dir)])
+
+        assert result.exit_code != 0
+        assert "No trace matches 'ffff'" in result.output
+
+    def test_list_newest_first(self, trace_dir):
+        result = CliRunner().invoke(cli, ["trace", "list", "--directory", str(trace_dir)])
+
+        assert result.exit_code == 0, result.output
+        first, second = result.output.strip().splitlines()
+        assert first.startswith("b" * 12) and "issue=9" in first
+        assert second.startswith("a" * 12) and "(7 spans)" in second
+
+    def test_no_traces(self, tmp_path):
+        result = CliRunner().invoke(cli, ["trace", "list", "--directory", str(tmp_path)])
+
+        assert "No traces found" in result.output
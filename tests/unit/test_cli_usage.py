@@ -0,0 +1,64 @@
+"""Tests for the `sapiens usage` command."""
+
+import pytest
+from click.testing import CliRunner
+
+from repo_sapiens.main import cli
+from repo_sapiens.monitoring.usage import LLMCall, UsageLedger
+
+
+@pytest.fixture
+def usage_dir(tmp_path):
+    ledger = UsageLedger(directory=tmp_path)
+    ledger.record(
+        LLMCall(
+            model="claude-sonnet-4.5",
+            provider="openai",
+            issue=812,
+            stage="planning",
+            prompt_tokens=10_000,
+            completion_tokens=2_000,
+            latency=12.0,
+            time_to_first_token=0.8,
+        )
+    )
+    ledger.record(
+        LLMCall(
+            model="qwen3:8b",
+            provider="ollama",
+            issue=9,
+            stage="implementation",
+            prompt_tokens=4_000,
+            completion_tokens=1_000,
+            latency=25.0,
+            generation_time=20.0,
+        )
+    )
+    return tmp_path
+
+
+class TestUsageCommand:
+    """Tests for `sapiens usage`."""
+
+    def test_by_stage(self, usage_dir):
+        result = CliRunner().invoke(cli, ["usage", "--directory", str(usage_dir)])
+
+        assert result.exit_code == 0, result.output
+        header, planning, implementation, total = result.output.strip().splitlines()
+        assert header.split()[:2] == ["stage", "calls"]
+        assert planning.split()[:5] == ["planning", "1", "10,000", "2,000", "$0.0600"]
+        assert implementation.split()[:5] == ["implementation", "1", "4,000", "1,000", "$0.0000"]
+        assert implementation.split()[-1] == "50.0"
+        assert total.split()[:4] == ["total", "2", "14,000", "3,000"]
+
+    def test_filtered_by_issue(self, usage_dir):
+        result = CliRunner().invoke(cli, ["usage", "--by", "model", "--issue", "9", "--directory", str(usage_dir)])
+
+        assert result.exit_code == 0, result.output
+        assert "qwen3:8b" in result.output
+        assert "claude-sonnet-4.5" not in result.output
+
+    def test_no_calls(self, tmp_path):
+        result = CliRunner().invoke(cli, ["usage", "--directory", str(tmp_path)])
+
+        assert "No LLM calls recorded" in result.output
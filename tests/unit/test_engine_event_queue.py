@@ -0,0 +1,99 @@
+"""Tests for repo_sapiens/engine/event_queue.py."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from repo_sapiens.config.triggers import TriggerType
+from repo_sapiens.engine.event_classifier import ClassifiedEvent, EventSource
+from repo_sapiens.engine.event_queue import EventQueue
+
+
+def _event(issue_number: int = 1, label: str = "sapiens/triage", action: str = "labeled") -> ClassifiedEvent:
+    return ClassifiedEvent(
+        trigger_type=TriggerType.LABEL_ADDED,
+        source=EventSource.GITEA,
+        handler="triage",
+        config=None,
+        issue_number=issue_number,
+        pr_number=None,
+        label=label,
+        raw_event={"action": action},
+    )
+
+
+class TestEventQueue:
+    """Tests for EventQueue."""
+
+    @pytest.mark.asyncio
+    async def test_submit_before_start_raises(self):
+        queue = EventQueue(AsyncMock())
+
+        with pytest.raises(RuntimeError, match="start"):
+            queue.submit(_event())
+
+    def test_event_key(self):
+        assert EventQueue.event_key(_event(5, "needs-planning", "labeled")) == (5, "needs-planning", "labeled")
+
+    @pytest.mark.asyncio
+    async def test_distinct_keys_are_not_deduplicated(self):
+        handler = AsyncMock()
+        queue = EventQueue(handler, workers=2)
+        await queue.start()
+
+        assert queue.submit(_event(1))
+        assert queue.submit(_event(2))
+        assert queue.submit(_event(1, action="unlabeled"))
+        await queue.join()
+        await queue.stop()
+
+        assert handler.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_duplicate_accepted_after_window(self):
+        queue = EventQueue(AsyncMock(), dedupe_window=30.0)
+        await queue.start()
+
+        with patch("repo_sapiens.engine.event_queue.time.monotonic", side_effect=[100.0, 110.0, 131.0]):
+            assert queue.submit(_event()) is True
+            assert queue.submit(_event()) is False
+            assert queue.submit(_event()) is True
+
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_workers_run_concurrently(self):
+        running = 0
+        peak = 0
+
+        async def handler(event):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        queue = EventQueue(handler, workers=3)
+        await queue.start()
+        for issue_number in range(6):
+            queue.submit(_event(issue_number))
+        await queue.join()
+        await queue.stop()
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_handler_failure_does_not_stop_worker(self):
+        handler = AsyncMock(side_effect=[RuntimeError("boom"), {"success": True}])
+        queue = EventQueue(handler, workers=1)
+        await queue.start()
+
+        queue.submit(_event(1))
+        queue.submit(_event(2))
+        await queue.join()
+
+        assert handler.await_count == 2
+        assert queue.running
+        await queue.stop()
+        assert not queue.running
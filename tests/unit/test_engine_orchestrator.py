@@ -9,13 +9,14 @@ Tests cover:
 6. Parallel task execution
 """
 
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from repo_sapiens.config.settings import AutomationSettings
-from repo_sapiens.engine.orchestrator import WorkflowOrchestrator
+from repo_sapiens.engine.orchestrator import TaskPoolStats, WorkflowOrchestrator
 from repo_sapiens.engine.state_manager import StateManager
 from repo_sapiens.models.domain import Issue, IssueState, Task
 from repo_sapiens.providers.base import AgentProvider, GitProvider
@@ -42,6 +43,13 @@ def mock_git_provider() -> AsyncMock:
     git.create_pull_request = AsyncMock()
     git.get_file = AsyncMock(return_value="")
     git.commit_file = AsyncMock(return_value="abc123")
+
+    async def iter_issue_pages(labels=None, state="open"):
+        # Serve get_issues() as a single page, like the GitProvider default
+        yield await git.get_issues(labels=labels, state=state)
+
+    git.iter_issue_pages = MagicMock(side_effect=iter_issue_pages)
+    git.issues_oldest_first = False
     return git
 
 
@@ -423,6 +431,183 @@ class TestIssueProcessing:
         # Issues 1 and 3 should still be processed despite issue 2 failing
         assert processed == [1, 3]
 
+    @pytest.mark.asyncio
+    async def test_process_all_issues_streams_pages(
+        self,
+        orchestrator: WorkflowOrchestrator,
+        mock_git_provider: AsyncMock,
+    ):
+        """Test that each page is processed before the next page is requested."""
+        events = []
+
+        async def pages(labels=None, state="open"):
+            events.append("page-1")
+            yield [create_test_issue(number=4), create_test_issue(number=3)]
+            events.append("page-2")
+            yield [create_test_issue(number=2), create_test_issue(number=1)]
+
+        mock_git_provider.iter_issue_pages = MagicMock(side_effect=pages)
+        mock_git_provider.issues_oldest_first = True
+
+        async def track(issue):
+            events.append(issue.number)
+
+        orchestrator.process_issue = track
+
+        await orchestrator.process_all_issues()
+
+        # Pages arrive in API order; each page is routed in ascending order
+        assert events == ["page-1", 3, 4, "page-2", 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_process_all_issues_sorts_across_newest_first_pages(
+        self,
+        orchestrator: WorkflowOrchestrator,
+        mock_git_provider: AsyncMock,
+    ):
+        """Test that pages listed newest first are collected before routing."""
+        events = []
+
+        async def pages(labels=None, state="open"):
+            events.append("page-1")
+            yield [create_test_issue(number=4), create_test_issue(number=3)]
+            events.append("page-2")
+            yield [create_test_issue(number=2), create_test_issue(number=1)]
+
+        mock_git_provider.iter_issue_pages = MagicMock(side_effect=pages)
+
+        async def track(issue):
+            events.append(issue.number)
+
+        orchestrator.process_issue = track
+
+        await orchestrator.process_all_issues()
+
+        assert events == ["page-1", "page-2", 1, 2, 3, 4]
+
+
+class TestConcurrentIssueProcessing:
+    """Tests for bounded-concurrency process_all_issues."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(
+        self,
+        orchestrator: WorkflowOrchestrator,
+        mock_git_provider: AsyncMock,
+    ):
+        """Test that at most max_concurrent_issues issues run at once."""
+        orchestrator.settings.workflow.max_concurrent_issues = 2
+        mock_git_provider.get_issues.return_value = [create_test_issue(number=n) for n in range(1, 6)]
+
+        active = 0
+        peak = 0
+
+        async def slow_process(issue):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        orchestrator.process_issue = slow_process
+
+        await orchestrator.process_all_issues()
+
+        assert peak == 2
+        assert orchestrator.last_cycle_stats.issues_processed == 5
+        assert orchestrator.last_cycle_stats.max_queue_depth == 5
+
+    @pytest.mark.asyncio
+    async def test_plan_tasks_serialized_in_ascending_order(
+        self,
+        orchestrator: WorkflowOrchestrator,
+        mock_git_provider: AsyncMock,
+    ):
+        """Test that issues sharing a plan label never overlap and run in order."""
+        orchestrator.settings.workflow.max_concurrent_issues = 4
+        mock_git_provider.get_issues.return_value = [
+            create_test_issue(number=12, labels=["task", "plan-7"]),
+            create_test_issue(number=10, labels=["task", "plan-7"]),
+            create_test_issue(number=11, labels=["task", "plan-7"]),
+            create_test_issue(number=3, labels=["task", "plan-implementation"]),
+        ]
+
+        running_plan_tasks = 0
+        plan_order = []
+
+        async def track(issue):
+            nonlocal running_plan_tasks
+            if "plan-7" in issue.labels:
+                running_plan_tasks += 1
+                assert running_plan_tasks == 1
+                plan_order.append(issue.number)
+            await asyncio.sleep(0.01)
+            if "plan-7" in issue.labels:
+                running_plan_tasks -= 1
+
+        orchestrator.process_issue = track
+
+        await orchestrator.process_all_issues()
+
+        assert plan_order == [10, 11, 12]
+        assert orchestrator.last_cycle_stats.issues_found == 4
+
+    @pytest.mark.asyncio
+    async def test_playground_stages_never_overlap_across_plans(
+        self,
+        orchestrator: WorkflowOrchestrator,
+        mock_git_provider: AsyncMock,
+    ):
+        """Test that task issues of different plans share the playground one at a time."""
+        orchestrator.settings.workflow.max_concurrent_issues = 4
+        mock_git_provider.get_issues.return_value = [
+            create_test_issue(number=1, labels=["task", "execute", "plan-1"]),
+            create_test_issue(number=2, labels=["task", "execute", "plan-2"]),
+            create_test_issue(number=3, labels=["needs-review"]),
+        ]
+
+        active = 0
+        peak = 0
+
+        async def use_playground(issue):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        orchestrator.stages["task_execution"] = MagicMock(execute=AsyncMock(side_effect=use_playground))
+        orchestrator.stages["pr_review"] = MagicMock(execute=AsyncMock())
+
+        await orchestrator.process_all_issues()
+
+        assert peak == 1
+        assert orchestrator.stages["task_execution"].execute.await_count == 2
+        assert orchestrator.last_cycle_stats.issues_processed == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted(
+        self,
+        orchestrator: WorkflowOrchestrator,
+        mock_git_provider: AsyncMock,
+    ):
+        """Test that a failing issue does not stop the others."""
+        orchestrator.settings.workflow.max_concurrent_issues = 3
+        mock_git_provider.get_issues.return_value = [create_test_issue(number=n) for n in range(1, 4)]
+
+        async def flaky(issue):
+            if issue.number == 2:
+                raise RuntimeError("boom")
+
+        orchestrator.process_issue = flaky
+
+        await orchestrator.process_all_issues()
+
+        stats = orchestrator.last_cycle_stats
+        assert stats.issues_processed == 2
+        assert stats.issues_failed == 1
+        assert stats.throughput >= 0
+
 
 # -----------------------------------------------------------------------------
 # Plan Processing Tests
@@ -735,6 +920,100 @@ class TestParallelTaskExecution:
         # All tasks should have been executed
         assert len(executed) == 3
 
+    @pytest.mark.asyncio
+    async def test_execute_parallel_tasks_refills_slots_without_barrier(
+        self,
+        orchestrator: WorkflowOrchestrator,
+        mock_git_provider: AsyncMock,
+    ):
+        """A slow task must not hold back tasks that become ready while it runs."""
+        tasks = [
+            create_test_task(task_id="slow", issue_id=43, dependencies=[]),
+            create_test_task(task_id="fast", issue_id=44, dependencies=[]),
+            create_test_task(task_id="after-fast", issue_id=45, dependencies=["fast"]),
+        ]
+
+        async def get_issue_by_number(num):
+            return create_test_issue(number=num)
+
+        mock_git_provider.get_issue.side_effect = get_issue_by_number
+        dependent_started = asyncio.Event()
+
+        async def execute(issue):
+            if issue.number == 43:
+                # Only finishes once the dependent of its sibling has started
+                await dependent_started.wait()
+            elif issue.number == 45:
+                dependent_started.set()
+
+        mock_impl_stage = MagicMock()
+        mock_impl_stage.execute = execute
+        mock_review_stage = MagicMock()
+        mock_review_stage.execute = AsyncMock()
+        orchestrator.stages["implementation"] = mock_impl_stage
+        orchestrator.stages["code_review"] = mock_review_stage
+
+        await asyncio.wait_for(orchestrator.execute_parallel_tasks(tasks, "test-plan"), timeout=5)
+
+        stats = orchestrator.last_task_pool_stats
+        assert stats.tasks_completed == 3
+        assert stats.tasks_failed == 0
+        assert len(stats.slot_busy_seconds) == stats.slots == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_parallel_tasks_counts_failures(
+        self,
+        orchestrator: WorkflowOrchestrator,
+        mock_git_provider: AsyncMock,
+    ):
+        """Failed tasks are counted and their dependents never start."""
+        tasks = [
+            create_test_task(task_id="task-1", issue_id=43, dependencies=[]),
+            create_test_task(task_id="task-2", issue_id=44, dependencies=["task-1"]),
+            create_test_task(task_id="task-3", issue_id=45, dependencies=[]),
+        ]
+
+        async def get_issue_by_number(num):
+            return create_test_issue(number=num)
+
+        mock_git_provider.get_issue.side_effect = get_issue_by_number
+        executed = []
+
+        async def execute(issue):
+            executed.append(issue.number)
+            if issue.number == 43:
+                raise RuntimeError("Task 1 failed")
+
+        mock_impl_stage = MagicMock()
+        mock_impl_stage.execute = execute
+        mock_review_stage = MagicMock()
+        mock_review_stage.execute = AsyncMock()
+        orchestrator.stages["implementation"] = mock_impl_stage
+        orchestrator.stages["code_review"] = mock_review_stage
+
+        await orchestrator.execute_parallel_tasks(tasks, "test-plan")
+
+        assert sorted(executed) == [43, 45]
+        stats = orchestrator.last_task_pool_stats
+        assert (stats.tasks_completed, stats.tasks_failed) == (1, 1)
+
+
+class TestTaskPoolStats:
+    """Tests for TaskPoolStats."""
+
+    def test_parallelism_and_slot_utilization(self):
+        stats = TaskPoolStats(slots=3, slot_busy_seconds=[10.0, 5.0, 0.0], duration_seconds=10.0)
+
+        assert stats.parallelism == 1.5
+        assert stats.slot_utilization == [1.0, 0.5, 0.0]
+
+    def test_empty_run(self):
+        stats = TaskPoolStats(slots=2)
+
+        assert stats.slot_busy_seconds == [0.0, 0.0]
+        assert stats.parallelism == 0.0
+        assert stats.slot_utilization == [0.0, 0.0]
+
 
 # -----------------------------------------------------------------------------
 # Single Task Execution Tests
@@ -16,7 +16,7 @@ Each stage is tested for:
 """
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import ANY, AsyncMock
 
 import pytest
 
@@ -171,6 +171,8 @@ def mock_agent_provider():
 def mock_state_manager(tmp_path):
     """Create a mock StateManager."""
     mock = AsyncMock(spec=StateManager)
+    # No comments processed yet
+    mock.get_comment_mark.return_value = None
 
     # Default state for load_state
     mock.load_state.return_value = {
@@ -371,6 +373,49 @@ class TestApprovalStageExecute:
         # Should only get comments, not create anything
         mock_git_provider.get_comments.assert_called_once_with(50)
         mock_git_provider.create_issue.assert_not_called()
+        mock_state_manager.set_comment_mark.assert_awaited_once_with(50, "approval", 1, ANY, "issue")
+
+    @pytest.mark.asyncio
+    async def test_polls_only_comments_after_mark(
+        self,
+        mock_git_provider,
+        mock_agent_provider,
+        mock_state_manager,
+        mock_settings,
+    ):
+        """An approval comment already scanned by an earlier poll is not re-read."""
+        issue = Issue(
+            id=50,
+            number=50,
+            title="[PROPOSAL] Plan for #42: Test",
+            body="Proposal body",
+            state=IssueState.OPEN,
+            labels=["proposal"],
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+            author="testuser",
+            url="https://gitea.test/issues/50",
+        )
+        mark_time = datetime.now(UTC)
+        mock_state_manager.get_comment_mark.return_value = (7, mark_time)
+        # The provider's since filter is inclusive; comment 7 is at the mark
+        mock_git_provider.get_comments.return_value = [
+            Comment(id=7, body="approved", author="reviewer", created_at=mark_time),
+            Comment(id=8, body="Still reading", author="reviewer", created_at=mark_time),
+        ]
+
+        stage = ApprovalStage(
+            git=mock_git_provider,
+            agent=mock_agent_provider,
+            state=mock_state_manager,
+            settings=mock_settings,
+        )
+
+        await stage.execute(issue)
+
+        mock_git_provider.get_comments.assert_called_once_with(50, since=mark_time)
+        mock_git_provider.create_issue.assert_not_called()
+        mock_state_manager.set_comment_mark.assert_awaited_once_with(50, "approval", 8, mark_time, "issue")
 
     @pytest.mark.asyncio
     async def test_approval_via_label(
@@ -415,6 +460,7 @@ Description of task 2
         # Should process approval
         assert mock_git_provider.add_comment.called
         assert mock_git_provider.create_issue.called
+        mock_git_provider.ensure_labels.assert_awaited_once_with(["task", "ready", "plan-42"])
 
     @pytest.mark.asyncio
     async def test_approval_via_comment(
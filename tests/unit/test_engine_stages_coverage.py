@@ -170,6 +170,8 @@ def mock_agent_provider():
 def mock_state_manager(tmp_path):
     """Create a mock StateManager."""
     mock = AsyncMock(spec=StateManager)
+    # No comments processed yet
+    mock.get_comment_mark.return_value = None
 
     mock.load_state.return_value = {
         "plan_id": "42",
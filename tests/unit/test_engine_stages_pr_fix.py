@@ -88,6 +88,8 @@ def mock_agent_provider():
 def mock_state_manager():
     """Create a mock StateManager."""
     mock = AsyncMock(spec=StateManager)
+    # No comments processed yet
+    mock.get_comment_mark.return_value = None
 
     mock.load_state.return_value = {
         "plan_id": "42",
@@ -437,6 +439,76 @@ class TestPRFixStageExecute:
         assert len(update_calls) >= 1
 
 
+class TestIncrementalComments:
+    """Tests for processing only comments newer than the high-water mark."""
+
+    @pytest.mark.asyncio
+    async def test_only_comments_after_mark_are_analyzed(
+        self,
+        mock_git_provider,
+        mock_agent_provider,
+        mock_state_manager,
+        mock_settings,
+        needs_fix_issue,
+        sample_comments,
+    ):
+        """Comments up to the mark are skipped and the mark advances on success."""
+        mark_time = sample_comments[0].created_at
+        mock_state_manager.get_comment_mark.return_value = (100, mark_time)
+        mock_git_provider.get_comments.return_value = sample_comments
+
+        with patch("repo_sapiens.engine.stages.pr_fix.CommentAnalyzer") as mock_analyzer_class:
+            mock_analyzer = AsyncMock()
+            mock_analyzer.analyze_comments.return_value = ReviewAnalysisResult(
+                pr_number=10, total_comments=1, reviewer_comments=1
+            )
+            mock_analyzer_class.return_value = mock_analyzer
+
+            stage = PRFixStage(
+                git=mock_git_provider,
+                agent=mock_agent_provider,
+                state=mock_state_manager,
+                settings=mock_settings,
+            )
+            await stage.execute(needs_fix_issue)
+
+        mock_git_provider.get_comments.assert_awaited_once_with(10, since=mark_time)
+        analyzed = mock_analyzer.analyze_comments.call_args.args[1]
+        assert [c.id for c in analyzed] == [101]
+        mock_state_manager.set_comment_mark.assert_awaited_once_with(
+            10, "pr_fix", 101, sample_comments[1].created_at, "pr"
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_run_keeps_mark(
+        self,
+        mock_git_provider,
+        mock_agent_provider,
+        mock_state_manager,
+        mock_settings,
+        needs_fix_issue,
+        sample_comments,
+    ):
+        """A failed run leaves the mark so its comments are processed again."""
+        mock_git_provider.get_comments.return_value = sample_comments
+
+        with patch("repo_sapiens.engine.stages.pr_fix.CommentAnalyzer") as mock_analyzer_class:
+            mock_analyzer = AsyncMock()
+            mock_analyzer.analyze_comments.side_effect = RuntimeError("agent down")
+            mock_analyzer_class.return_value = mock_analyzer
+
+            stage = PRFixStage(
+                git=mock_git_provider,
+                agent=mock_agent_provider,
+                state=mock_state_manager,
+                settings=mock_settings,
+            )
+            with pytest.raises(RuntimeError):
+                await stage.execute(needs_fix_issue)
+
+        mock_state_manager.set_comment_mark.assert_not_awaited()
+
+
 # ==============================================================================
 # _post_summary_comment Tests
 # ==============================================================================
@@ -2,11 +2,16 @@
 
 import asyncio
 import json
+from datetime import UTC, datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from repo_sapiens.engine.state_index import INDEX_FILENAME, PlanIndex
 from repo_sapiens.engine.state_manager import StateManager
+from repo_sapiens.storage import COMMENT_MARK_COLLECTION, SQLiteBackend
+from repo_sapiens.storage.locking import file_lock
 
 
 class TestStateManagerInit:
@@ -61,20 +66,6 @@ class TestStateManagerLock:
         assert lock1 is not lock2
 
 
-class TestStateManagerPaths:
-    """Tests for path management."""
-
-    def test_get_state_path(self, state_manager: StateManager):
-        """Test state path construction."""
-        path = state_manager._get_state_path("plan-42")
-        assert path == state_manager.state_dir / "plan-42.json"
-
-    def test_get_state_path_special_characters(self, state_manager: StateManager):
-        """Test state path with special characters."""
-        path = state_manager._get_state_path("plan_123-abc")
-        assert path == state_manager.state_dir / "plan_123-abc.json"
-
-
 class TestStateManagerLoadSave:
     """Tests for load and save operations."""
 
@@ -94,7 +85,7 @@ class TestStateManagerLoadSave:
     async def test_load_state_reads_existing_state(self, state_manager: StateManager):
         """Test loading reads existing state file."""
         # Create a state file first
-        state_path = state_manager._get_state_path("existing-plan")
+        state_path = state_manager.state_dir / "existing-plan.json"
         existing_state = {"plan_id": "existing-plan", "status": "in_progress", "custom": "data"}
         state_path.write_text(json.dumps(existing_state))
 
@@ -371,16 +362,287 @@ class TestGetActivePlans:
         assert "pending-plan" in active
 
 
+class TestPlanIndex:
+    """Tests for the plan status index."""
+
+    @pytest.mark.asyncio
+    async def test_list_plans_includes_task_counts(self, state_manager: StateManager):
+        """Index summaries carry status and task counts."""
+        await state_manager.mark_task_status("plan-1", "task-1", "completed")
+        await state_manager.mark_task_status("plan-1", "task-2", "failed")
+        await state_manager.mark_task_status("plan-1", "task-3", "in_progress")
+
+        [summary] = await state_manager.list_plans()
+
+        assert summary["plan_id"] == "plan-1"
+        assert summary["status"] == "pending"
+        assert summary["task_count"] == 3
+        assert summary["tasks_completed"] == 1
+        assert summary["tasks_failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_list_plans_filters_by_status(self, state_manager: StateManager):
+        """Status filter only returns matching plans."""
+        state = await state_manager.load_state("running")
+        state["stages"]["planning"]["status"] = "in_progress"
+        await state_manager.save_state("running", state)
+        await state_manager.load_state("waiting")
+
+        running = await state_manager.list_plans(status="in_progress")
+
+        assert [summary["plan_id"] for summary in running] == ["running"]
+
+    @pytest.mark.asyncio
+    async def test_listing_does_not_open_state_files(self, tmp_path: Path):
+        """A fresh manager lists plans from the index alone."""
+        writer = StateManager(tmp_path)
+        await writer.load_state("plan-1")
+        await writer.load_state("plan-2")
+
+        # Corrupt the state files; only the index may be read
+        for plan_id in ("plan-1", "plan-2"):
+            (tmp_path / f"{plan_id}.json").write_text("not json")
+
+        reader = StateManager(tmp_path)
+
+        assert await reader.get_active_plans() == ["plan-1", "plan-2"]
+
+    @pytest.mark.asyncio
+    async def test_missing_index_is_rebuilt(self, tmp_path: Path):
+        """State directories without an index are scanned once."""
+        writer = StateManager(tmp_path)
+        state = await writer.load_state("done")
+        for stage in state["stages"]:
+            state["stages"][stage]["status"] = "completed"
+        await writer.save_state("done", state)
+        await writer.load_state("open")
+        (tmp_path / INDEX_FILENAME).unlink()
+
+        reader = StateManager(tmp_path)
+
+        assert await reader.get_active_plans() == ["open"]
+        assert (tmp_path / INDEX_FILENAME).exists()
+
+    @pytest.mark.asyncio
+    async def test_sees_updates_from_other_manager(self, tmp_path: Path):
+        """Entries appended by another manager are picked up on refresh."""
+        first = StateManager(tmp_path)
+        second = StateManager(tmp_path)
+        await first.load_state("plan-1")
+        assert await second.get_active_plans() == ["plan-1"]
+
+        state = await first.load_state("plan-1")
+        state["stages"]["planning"]["status"] = "failed"
+        await first.save_state("plan-1", state)
+
+        assert await second.get_active_plans() == []
+
+    @pytest.mark.asyncio
+    async def test_index_is_compacted(self, tmp_path: Path):
+        """Repeated updates do not grow the index without bound."""
+        manager = StateManager(tmp_path)
+        for i in range(300):
+            await manager.mark_task_status("plan-1", f"task-{i}", "completed")
+
+        reader = StateManager(tmp_path)
+        [summary] = await reader.list_plans()
+        lines = (tmp_path / INDEX_FILENAME).read_text().splitlines()
+
+        assert summary["tasks_completed"] == 300
+        assert len(lines) < 100
+
+    @pytest.mark.asyncio
+    async def test_compaction_keeps_lines_appended_by_other_process(self, tmp_path: Path):
+        """A compaction waiting on the file lock re-reads lines appended meanwhile."""
+        path = tmp_path / INDEX_FILENAME
+        entry = {"plan_id": "plan-1", "status": "pending", "updated_at": "", "task_count": 0}
+        path.write_text("".join(json.dumps(entry) + "\n" for _ in range(300)))
+        index = PlanIndex(path)
+
+        async with file_lock(index.lock_path):
+            refresh = asyncio.create_task(index.refresh())
+            await asyncio.sleep(0.05)
+            with path.open("a") as f:
+                f.write(json.dumps({**entry, "plan_id": "plan-2"}) + "\n")
+        await refresh
+
+        reader = PlanIndex(path)
+        await reader.refresh()
+
+        assert len(path.read_text().splitlines()) == 2
+        assert [summary["plan_id"] for summary in reader.entries()] == ["plan-1", "plan-2"]
+
+
+class TestCommentMarks:
+    """Tests for per-issue comment high-water marks."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path: Path):
+        """A mark written by one manager is read back by another."""
+        created_at = datetime(2024, 6, 15, 8, 30, tzinfo=UTC)
+        await StateManager(tmp_path).set_comment_mark(42, "approval", 5002, created_at)
+
+        reader = StateManager(tmp_path)
+
+        assert await reader.get_comment_mark(42, "approval") == (5002, created_at)
+        assert await reader.get_comment_mark(43, "approval") is None
+
+    @pytest.mark.asyncio
+    async def test_marks_are_kept_per_kind_and_stage(self, tmp_path: Path):
+        """An issue and a pull request with the same number, or two stages, don't share a mark."""
+        manager = StateManager(tmp_path)
+        created_at = datetime(2024, 6, 15, tzinfo=UTC)
+
+        await manager.set_comment_mark(7, "pr_fix", 11, created_at, kind="pr")
+
+        assert await manager.get_comment_mark(7, "pr_fix", kind="pr") == (11, created_at)
+        assert await manager.get_comment_mark(7, "pr_fix") is None
+        assert await manager.get_comment_mark(7, "approval", kind="pr") is None
+
+    @pytest.mark.asyncio
+    async def test_marks_are_not_plans(self, tmp_path: Path):
+        """Marks don't show up when the plan index is rebuilt from state files."""
+        manager = StateManager(tmp_path)
+        await manager.load_state("plan-1")
+        await manager.set_comment_mark(42, "approval", 1, datetime(2024, 6, 15, tzinfo=UTC))
+
+        assert await manager.rebuild_index() == 1
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend(self, tmp_path: Path):
+        """Marks are stored in the shared database with a SQLite backend."""
+        backend = SQLiteBackend(tmp_path / "sapiens.db")
+        manager = StateManager(tmp_path / "state", backend=backend)
+        created_at = datetime(2024, 6, 15, tzinfo=UTC)
+
+        await manager.set_comment_mark(42, "approval", 7, created_at)
+
+        assert await backend.keys(COMMENT_MARK_COLLECTION) == ["issue-42-approval"]
+        assert await manager.get_comment_mark(42, "approval") == (7, created_at)
+        assert await manager.rebuild_index() == 0
+        await manager.close()
+
+
+class TestWriteBack:
+    """Tests for write-back (coalesced) mode."""
+
+    @pytest.fixture
+    def write_back_manager(self, tmp_path: Path) -> StateManager:
+        return StateManager(tmp_path, flush_interval_ms=50)
+
+    @pytest.mark.asyncio
+    async def test_load_served_from_memory(self, write_back_manager: StateManager):
+        await write_back_manager.load_state("plan-1")
+
+        with patch.object(write_back_manager.backend, "get", wraps=write_back_manager.backend.get) as get:
+            await write_back_manager.load_state("plan-1")
+            await write_back_manager.mark_task_status("plan-1", "task-1", "completed")
+
+        get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_loaded_state_is_a_copy(self, write_back_manager: StateManager):
+        state = await write_back_manager.load_state("plan-1")
+        state["metadata"]["unsaved"] = True
+
+        reloaded = await write_back_manager.load_state("plan-1")
+
+        assert "unsaved" not in reloaded["metadata"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.needs_real_timing
+    async def test_bursty_updates_coalesced_into_one_write(self, write_back_manager: StateManager):
+        manager = write_back_manager
+        await manager.load_state("plan-1")
+
+        with patch.object(manager.backend, "put_many", wraps=manager.backend.put_many) as put_many:
+            for i in range(20):
+                await manager.mark_task_status("plan-1", f"task-{i}", "in_progress")
+            assert put_many.call_count == 0
+
+            await asyncio.sleep(0.2)
+
+        assert put_many.call_count == 1
+        on_disk = json.loads((manager.state_dir / "plan-1.json").read_text())
+        assert len(on_disk["tasks"]) == 20
+
+    @pytest.mark.asyncio
+    @pytest.mark.needs_real_timing
+    async def test_flush_persists_pending_updates(self, write_back_manager: StateManager, tmp_path: Path):
+        await write_back_manager.mark_task_status("plan-1", "task-1", "completed")
+        await write_back_manager.mark_task_status("plan-2", "task-1", "failed")
+
+        assert await write_back_manager.flush() == 2
+        assert await write_back_manager.flush() == 0
+
+        reader = StateManager(tmp_path)
+        assert (await reader.load_state("plan-1"))["tasks"]["task-1"]["status"] == "completed"
+        assert (await reader.load_state("plan-2"))["tasks"]["task-1"]["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_stage_completion_flushes_plan(self, write_back_manager: StateManager, tmp_path: Path):
+        await write_back_manager.mark_task_status("plan-1", "task-1", "completed")
+        await write_back_manager.mark_stage_complete("plan-1", "planning")
+
+        on_disk = json.loads((tmp_path / "plan-1.json").read_text())
+
+        assert on_disk["stages"]["planning"]["status"] == "completed"
+        assert on_disk["tasks"]["task-1"]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_failed_transaction_leaves_cache_untouched(self, write_back_manager: StateManager):
+        await write_back_manager.load_state("plan-1")
+
+        with pytest.raises(RuntimeError):
+            async with write_back_manager.transaction("plan-1") as state:
+                state["metadata"]["partial"] = True
+                raise RuntimeError("boom")
+
+        assert "partial" not in (await write_back_manager.load_state("plan-1"))["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_flush_waits_for_plan_lock(self, write_back_manager: StateManager, tmp_path: Path):
+        await write_back_manager.mark_task_status("plan-1", "task-1", "completed")
+
+        async with write_back_manager.transaction("plan-1") as state:
+            flush = asyncio.create_task(write_back_manager.flush())
+            await asyncio.sleep(0.01)
+            # The flush can't write while the transaction holds the plan
+            assert not flush.done()
+            state["metadata"]["during"] = True
+
+        assert await flush == 1
+        on_disk = json.loads((tmp_path / "plan-1.json").read_text())
+        assert on_disk["metadata"]["during"] is True
+
+    @pytest.mark.asyncio
+    async def test_flush_is_noop_without_write_back(self, state_manager: StateManager):
+        await state_manager.mark_task_status("plan-1", "task-1", "completed")
+
+        assert await state_manager.flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_and_closes_backend(self, write_back_manager: StateManager, tmp_path: Path):
+        await write_back_manager.mark_task_status("plan-1", "task-1", "completed")
+
+        with patch.object(write_back_manager.backend, "close", wraps=write_back_manager.backend.close) as close:
+            await write_back_manager.close()
+
+        close.assert_awaited_once()
+        on_disk = json.loads((tmp_path / "plan-1.json").read_text())
+        assert on_disk["tasks"]["task-1"]["status"] == "completed"
+
+
 class TestAtomicWrite:
     """Tests for atomic write operations."""
 
     @pytest.mark.asyncio
     async def test_write_uses_tmp_file(self, state_manager: StateManager):
         """Test atomic write uses temporary file."""
-        state_path = state_manager._get_state_path("plan-1")
-        state = {"plan_id": "plan-1", "status": "pending"}
+        state_path = state_manager.state_dir / "plan-1.json"
+        state = await state_manager.load_state("plan-1")
 
-        await state_manager._write_state(state_path, state)
+        await state_manager.save_state("plan-1", state)
 
         # Verify tmp file doesn't exist after write
         tmp_path = state_path.with_suffix(".tmp")
@@ -390,10 +652,11 @@ class TestAtomicWrite:
     @pytest.mark.asyncio
     async def test_write_creates_valid_json(self, state_manager: StateManager):
         """Test write creates valid JSON file."""
-        state_path = state_manager._get_state_path("plan-1")
-        state = {"plan_id": "plan-1", "nested": {"key": "value"}}
+        state_path = state_manager.state_dir / "plan-1.json"
+        state = await state_manager.load_state("plan-1")
+        state["metadata"]["nested"] = {"key": "value"}
 
-        await state_manager._write_state(state_path, state)
+        await state_manager.save_state("plan-1", state)
 
         # Verify JSON is valid
         loaded = json.loads(state_path.read_text())
@@ -406,8 +406,8 @@ class TestTaskScheduler:
         assert len(results) == 2
         assert all(r.success for r in results.values())
 
-    def test_build_dependency_graph(self):
-        """Test dependency graph construction."""
+    def test_optimize_execution_order(self):
+        """Test tasks are ordered by remaining path and critical tasks boosted."""
 
         async def simple_task() -> None:
             pass
@@ -421,14 +421,12 @@ class TestTaskScheduler:
             ExecutionTask(id="c", func=simple_task, dependencies={"a", "b"}),
         ]
 
-        graph = scheduler._build_dependency_graph(tasks)
+        ordered = scheduler.optimize_execution_order(tasks)
 
-        assert "a" in graph
-        assert "b" in graph
-        assert "c" in graph
-        assert "b" in graph["a"]["dependents"]
-        assert "c" in graph["a"]["dependents"]
-        assert "c" in graph["b"]["dependents"]
+        assert [task.id for task in ordered] == ["a", "b", "c"]
+        assert scheduler.last_schedule is not None
+        assert scheduler.last_schedule.critical == {"a", "b", "c"}
+        assert all(task.priority == TaskPriority.NORMAL + 100 for task in tasks)
 
 
 class TestExecutionTaskDataclass:
@@ -267,6 +267,27 @@ class TestGetLearningStats:
         assert stats["success_rate"] == 0.6
 
 
+class TestGetDurationEstimates:
+    """Tests for get_duration_estimates method."""
+
+    @pytest.mark.asyncio
+    async def test_uses_successful_executions_only(self, feedback_loop, feedback_dir):
+        """Should return execution times of successful tasks with a recorded time."""
+        records = [
+            {"task_id": "fast", "success": True, "execution_time": 1.5},
+            {"task_id": "slow", "success": True, "execution_time": 30.0},
+            {"task_id": "broken", "success": False, "execution_time": 2.0},
+            {"task_id": "untimed", "success": True, "execution_time": 0.0},
+            {"task_id": "legacy", "success": True},
+        ]
+        for record in records:
+            (feedback_dir / f"{record['task_id']}.json").write_text(json.dumps(record))
+
+        estimates = await feedback_loop.get_duration_estimates()
+
+        assert estimates == {"fast": 1.5, "slow": 30.0}
+
+
 class TestCleanupOldFeedback:
     """Tests for cleanup_old_feedback method."""
 
@@ -0,0 +1,146 @@
+"""Tests for repo_sapiens/agents/file_cache.py."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from repo_sapiens.agents import file_cache
+from repo_sapiens.agents.file_cache import FileCache
+
+
+@pytest.fixture
+def cache() -> FileCache:
+    return FileCache()
+
+
+def touch_later(path: Path) -> None:
+    """Bump a file's mtime without changing its size."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestReadText:
+    """Tests for FileCache.read_text."""
+
+    def test_second_read_is_a_hit(self, cache: FileCache, tmp_path: Path):
+        path = tmp_path / "a.py"
+        path.write_text("print('a')\n")
+
+        assert cache.read_text(path) == "print('a')\n"
+        with patch("builtins.open", side_effect=AssertionError("read from disk")):
+            assert cache.read_text(path) == "print('a')\n"
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_mtime_change_is_a_miss(self, cache: FileCache, tmp_path: Path):
+        path = tmp_path / "a.py"
+        path.write_text("one")
+        cache.read_text(path)
+
+        path.write_text("two")
+        touch_later(path)
+
+        assert cache.read_text(path) == "two"
+        assert cache.stats()["misses"] == 2
+
+    def test_size_change_is_a_miss(self, cache: FileCache, tmp_path: Path):
+        path = tmp_path / "a.py"
+        path.write_text("one")
+        stat = path.stat()
+        cache.read_text(path)
+
+        # Same mtime, different size
+        path.write_text("three")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert cache.read_text(path) == "three"
+
+    def test_universal_newlines(self, cache: FileCache, tmp_path: Path):
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(b"a\r\nb\rc\n")
+
+        assert cache.read_text(path) == path.read_text() == "a\nb\nc\n"
+
+    def test_invalid_utf8_raises(self, cache: FileCache, tmp_path: Path):
+        path = tmp_path / "binary.bin"
+        path.write_bytes(b"\x00\xff\xfe")
+
+        with pytest.raises(UnicodeDecodeError):
+            cache.read_text(path)
+
+    def test_missing_file_raises(self, cache: FileCache, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            cache.read_text(tmp_path / "missing.txt")
+
+    def test_lru_bound(self, tmp_path: Path):
+        cache = FileCache(max_bytes=10)
+        for name in ("a", "b", "c"):
+            (tmp_path / name).write_text(name * 4)
+            cache.read_text(tmp_path / name)
+
+        cache.reset_stats()
+        cache.read_text(tmp_path / "c")
+        cache.read_text(tmp_path / "a")
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_large_file_prefix_is_mapped_not_cached(self, cache: FileCache, tmp_path: Path):
+        path = tmp_path / "large.txt"
+        path.write_text("é" * 100 + "x" * 50)
+
+        with patch.object(file_cache, "MMAP_THRESHOLD_BYTES", 64):
+            assert cache.read_text(path, limit=10) == "é" * 11
+            assert cache.read_text(path) == "é" * 100 + "x" * 50
+
+        assert cache.stats()["hits"] == 0
+
+
+class TestWriteText:
+    """Tests for FileCache.write_text."""
+
+    def test_read_after_write_is_a_hit(self, cache: FileCache, tmp_path: Path):
+        path = tmp_path / "a.py"
+
+        cache.write_text(path, "written")
+
+        assert path.read_text() == "written"
+        assert cache.read_text(path) == "written"
+        assert cache.stats()["hits"] == 1
+
+    def test_external_change_after_write_is_seen(self, cache: FileCache, tmp_path: Path):
+        path = tmp_path / "a.py"
+        cache.write_text(path, "written")
+
+        path.write_text("changed by a command")
+
+        assert cache.read_text(path) == "changed by a command"
+
+
+class TestReadLines:
+    """Tests for FileCache.read_lines."""
+
+    @pytest.mark.parametrize("threshold", [file_cache.MMAP_THRESHOLD_BYTES, 16])
+    def test_ranges(self, cache: FileCache, tmp_path: Path, threshold: int):
+        path = tmp_path / "lines.txt"
+        path.write_text("".join(f"line {i}\n" for i in range(1, 21)))
+
+        # A small scan chunk puts line boundaries on chunk boundaries
+        with (
+            patch.object(file_cache, "MMAP_THRESHOLD_BYTES", threshold),
+            patch.object(file_cache, "_SCAN_CHUNK_BYTES", 7),
+        ):
+            assert cache.read_lines(path, 3, 5) == ["line 3", "line 4", "line 5"]
+            assert cache.read_lines(path, 19) == ["line 19", "line 20"]
+            assert cache.read_lines(path, 20, 99) == ["line 20"]
+            assert cache.read_lines(path, 21) == []
+
+    def test_large_file_decodes_only_the_range(self, cache: FileCache, tmp_path: Path):
+        path = tmp_path / "large.txt"
+        path.write_bytes(b"ok\nstill ok\n\xff broken\n")
+
+        with patch.object(file_cache, "MMAP_THRESHOLD_BYTES", 8):
+            assert cache.read_lines(path, 1, 2) == ["ok", "still ok"]
+            with pytest.raises(UnicodeDecodeError):
+                cache.read_lines(path, 3)
@@ -112,7 +112,7 @@ class TestAsyncMainFunctions:
         from repo_sapiens.main import _list_active_plans
 
         mock_state = AsyncMock()
-        mock_state.get_active_plans = AsyncMock(return_value=[])
+        mock_state.list_plans = AsyncMock(return_value=[])
 
         with patch("repo_sapiens.main.StateManager", return_value=mock_state):
             await _list_active_plans(mock_settings)
@@ -126,8 +126,26 @@ class TestAsyncMainFunctions:
         from repo_sapiens.main import _list_active_plans
 
         mock_state = AsyncMock()
-        mock_state.get_active_plans = AsyncMock(return_value=["plan-1", "plan-2"])
-        mock_state.load_state = AsyncMock(side_effect=[{"status": "active"}, {"status": "completed"}])
+        mock_state.list_plans = AsyncMock(
+            return_value=[
+                {
+                    "plan_id": "plan-1",
+                    "status": "in_progress",
+                    "updated_at": "2024-01-02T00:00:00+00:00",
+                    "task_count": 3,
+                    "tasks_completed": 1,
+                    "tasks_failed": 0,
+                },
+                {
+                    "plan_id": "plan-2",
+                    "status": "pending",
+                    "updated_at": "2024-01-01T00:00:00+00:00",
+                    "task_count": 2,
+                    "tasks_completed": 0,
+                    "tasks_failed": 1,
+                },
+            ]
+        )
 
         with patch("repo_sapiens.main.StateManager", return_value=mock_state):
             await _list_active_plans(mock_settings)
@@ -13,6 +13,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from click.testing import CliRunner
 
+from repo_sapiens.config.settings import TracingConfig, UsageConfig
 from repo_sapiens.exceptions import ConfigurationError, RepoSapiensError
 from repo_sapiens.main import cli
 
@@ -41,6 +42,8 @@ def mock_settings():
     settings.agent_provider.base_url = "https://api.example.com"
     settings.agent_provider.goose_config = None
     settings.state_dir = "/tmp/state"
+    settings.tracing = TracingConfig(enabled=False)
+    settings.usage = UsageConfig(persist=False)
     return settings
 
 
@@ -610,7 +613,7 @@ class TestAsyncHelperFunctions:
         from repo_sapiens.main import _list_active_plans
 
         mock_state = AsyncMock()
-        mock_state.get_active_plans = AsyncMock(return_value=[])
+        mock_state.list_plans = AsyncMock(return_value=[])
 
         with patch("repo_sapiens.main.StateManager", return_value=mock_state):
             await _list_active_plans(mock_settings)
@@ -624,8 +627,26 @@ class TestAsyncHelperFunctions:
         from repo_sapiens.main import _list_active_plans
 
         mock_state = AsyncMock()
-        mock_state.get_active_plans = AsyncMock(return_value=["plan-1", "plan-2"])
-        mock_state.load_state = AsyncMock(side_effect=[{"status": "active"}, {"status": "completed"}])
+        mock_state.list_plans = AsyncMock(
+            return_value=[
+                {
+                    "plan_id": "plan-1",
+                    "status": "in_progress",
+                    "updated_at": "2024-01-02T00:00:00+00:00",
+                    "task_count": 3,
+                    "tasks_completed": 1,
+                    "tasks_failed": 0,
+                },
+                {
+                    "plan_id": "plan-2",
+                    "status": "pending",
+                    "updated_at": "2024-01-01T00:00:00+00:00",
+                    "task_count": 2,
+                    "tasks_completed": 0,
+                    "tasks_failed": 1,
+                },
+            ]
+        )
 
         with patch("repo_sapiens.main.StateManager", return_value=mock_state):
             await _list_active_plans(mock_settings)
@@ -634,6 +655,8 @@ class TestAsyncHelperFunctions:
         assert "Active Plans" in captured.out
         assert "plan-1" in captured.out
         assert "plan-2" in captured.out
+        assert "1/3 tasks done" in captured.out
+        assert "1 failed" in captured.out
 
     @pytest.mark.asyncio
     async def test_show_plan_status_found(self, mock_settings, capsys):
@@ -0,0 +1,214 @@
+"""Tests for repo_sapiens/monitoring/aggregator.py."""
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+from repo_sapiens.engine.state_manager import StateManager
+from repo_sapiens.monitoring.aggregator import MetricsAggregator, MinuteRing
+
+
+class FakeClock:
+    """Settable Unix time."""
+
+    def __init__(self, now: float = 1_718_553_600.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def registry() -> CollectorRegistry:
+    """A private registry holding the metrics the dashboard reads."""
+    registry = CollectorRegistry()
+    Counter("automation_workflow_executions_total", "", ["stage", "status"], registry=registry)
+    Histogram("automation_workflow_duration_seconds", "", ["stage"], buckets=(1, 5, 10, 30, 60), registry=registry)
+    Gauge("automation_active_workflows", "", registry=registry)
+    Counter("automation_api_calls_total", "", ["provider", "method", "status"], registry=registry)
+    Histogram(
+        "automation_api_call_duration_seconds", "", ["provider", "method"], buckets=(0.1, 0.5, 1, 2), registry=registry
+    )
+    Counter("automation_task_executions_total", "", ["task_type", "status"], registry=registry)
+    Histogram("automation_task_duration_seconds", "", ["task_type"], buckets=(10, 60, 300), registry=registry)
+    Counter("automation_cache_hits_total", "", ["cache_name"], registry=registry)
+    Counter("automation_cache_misses_total", "", ["cache_name"], registry=registry)
+    Counter("automation_token_usage_total", "", ["model", "operation"], registry=registry)
+    Gauge("automation_estimated_cost_dollars", "", ["component"], registry=registry)
+    Counter("automation_llm_tokens_total", "", ["model", "operation", "kind"], registry=registry)
+    Histogram("automation_llm_call_duration_seconds", "", ["model", "operation"], buckets=(1, 5, 30), registry=registry)
+    Histogram("automation_llm_time_to_first_token_seconds", "", ["model"], buckets=(0.5, 1, 5), registry=registry)
+    Histogram("automation_llm_tokens_per_second", "", ["model"], buckets=(10, 40, 160), registry=registry)
+    Counter("automation_llm_cost_dollars_total", "", ["model"], registry=registry)
+    return registry
+
+
+def metric(registry: CollectorRegistry, name: str):
+    """Look up a metric object registered under a name."""
+    return registry._names_to_collectors[name]
+
+
+class TestMinuteRing:
+    """Tests for MinuteRing."""
+
+    def test_totals_within_window(self, clock):
+        ring = MinuteRing(minutes=60, clock=clock)
+        ring.add(2)
+        clock.now += 30 * 60
+        ring.add(3)
+
+        assert ring.total() == 5.0
+        assert ring.total(minutes=10) == 3.0
+
+    def test_old_minutes_expire_and_slots_are_reused(self, clock):
+        ring = MinuteRing(minutes=60, clock=clock)
+        ring.add(7)
+        clock.now += 60 * 60
+
+        assert ring.total() == 0.0
+        ring.add(1)
+        assert ring.total() == 1.0
+        assert len(ring._values) == 60
+
+    def test_series_steps_cover_the_window(self, clock):
+        ring = MinuteRing(minutes=120, clock=clock)
+        ring.add(4)
+        clock.now += 61 * 60
+        ring.add(1)
+
+        points = ring.series(step_minutes=60)
+
+        assert [value for _, value in points] == [0.0, 4.0, 1.0]
+        assert points[-1][0] == (clock.now // 3600) * 3600
+
+
+class TestMetricsAggregator:
+    """Tests for MetricsAggregator views."""
+
+    def test_summary_reads_counters_and_histograms(self, registry):
+        workflows = metric(registry, "automation_workflow_executions")
+        workflows.labels(stage="planning", status="success").inc(3)
+        workflows.labels(stage="merge", status="failed").inc()
+        duration = metric(registry, "automation_workflow_duration_seconds")
+        duration.labels(stage="planning").observe(4)
+        duration.labels(stage="merge").observe(8)
+        metric(registry, "automation_active_workflows").set(2)
+        metric(registry, "automation_cache_hits").labels(cache_name="http").inc(3)
+        metric(registry, "automation_cache_misses").labels(cache_name="http").inc()
+
+        summary = MetricsAggregator(registry=registry).summary()
+
+        assert summary["active_workflows"] == 2
+        assert summary["total_workflows"] == 4
+        assert summary["success_rate"] == 0.75
+        assert summary["avg_duration"] == 6.0
+        assert summary["cache_hit_rate"] == 0.75
+
+    def test_empty_registry(self):
+        aggregator = MetricsAggregator(registry=CollectorRegistry())
+
+        assert aggregator.summary()["success_rate"] == 0.0
+        assert aggregator.performance()["parallel_execution"]["average_concurrency"] == 0.0
+
+    def test_sample_records_increases_per_minute(self, registry, clock):
+        calls = metric(registry, "automation_api_calls")
+        calls.labels(provider="github", method="get_issue", status="success").inc(100)
+        aggregator = MetricsAggregator(registry=registry, window_minutes=60, clock=clock)
+
+        aggregator.sample()
+        calls.labels(provider="github", method="get_issue", status="success").inc(5)
+        calls.labels(provider="github", method="add_comment", status="error").inc()
+        clock.now += 60
+        aggregator.sample()
+
+        assert aggregator.series["api_calls"].total() == 6.0
+        assert aggregator.series["api_errors"].total() == 1.0
+        assert aggregator.timeseries("api_calls", step_minutes=1)[-1]["count"] == 6.0
+
+    def test_latency_percentiles_per_provider_method(self, registry):
+        latency = metric(registry, "automation_api_call_duration_seconds")
+        for seconds in [0.05] * 50 + [0.3] * 40 + [1.5] * 10:
+            latency.labels(provider="github", method="get_issue").observe(seconds)
+        latency.labels(provider="ollama", method="generate").observe(1.8)
+
+        api_calls = MetricsAggregator(registry=registry).performance()["api_calls"]
+
+        assert api_calls["by_method"]["github.get_issue"]["latency_percentiles"] == {
+            "p50": 0.1,
+            "p90": 0.5,
+            "p99": 1.9,
+        }
+        assert api_calls["by_method"]["github.get_issue"]["count"] == 100
+        assert api_calls["by_provider"]["ollama"] == {"count": 1, "avg_duration": 1.8}
+
+    @pytest.mark.asyncio
+    async def test_percentile_past_the_last_bucket(self, registry):
+        metric(registry, "automation_workflow_duration_seconds").labels(stage="implementation").observe(900)
+
+        result = await MetricsAggregator(registry=registry).workflows()
+
+        assert result["latency_percentiles"]["implementation"]["p99"] == 60.0
+        assert result["average_duration"]["implementation"] == 900.0
+
+    @pytest.mark.asyncio
+    async def test_workflows_by_stage_and_plan_status(self, registry, clock, tmp_path):
+        workflows = metric(registry, "automation_workflow_executions")
+        workflows.labels(stage="planning", status="success").inc(2)
+        workflows.labels(stage="planning", status="failed").inc()
+        metric(registry, "automation_workflow_duration_seconds").labels(stage="planning").observe(20)
+
+        state = StateManager(str(tmp_path))
+        await state.mark_stage_complete("plan-1", "planning")
+        await state.mark_task_status("plan-2", "task-1", "in_progress")
+        await state.mark_task_status("plan-2", "task-2", "completed")
+
+        aggregator = MetricsAggregator(registry=registry, state_manager=state, clock=clock)
+        result = await aggregator.workflows(step_minutes=60)
+        tasks = await aggregator.tasks()
+
+        assert result["by_stage"] == {"planning": {"success": 2, "failed": 1}}
+        assert result["average_duration"] == {"planning": 20.0}
+        assert result["latency_percentiles"]["planning"]["p50"] == 20.0
+        assert sum(result["by_status"].values()) == 2
+        assert len(result["timeline"]) == 25
+        assert tasks["in_progress"] == 1
+
+    def test_costs(self, registry):
+        metric(registry, "automation_estimated_cost_dollars").labels(component="planning").set(1.5)
+        tokens = metric(registry, "automation_token_usage")
+        tokens.labels(model="qwen3:8b", operation="planning").inc(1200)
+        tokens.labels(model="qwen3:8b", operation="review").inc(300)
+
+        costs = MetricsAggregator(registry=registry).costs()
+
+        assert costs["total_estimated_cost"] == 1.5
+        assert costs["token_usage"]["total_tokens"] == 1500
+        assert costs["token_usage"]["by_model"] == {"qwen3:8b": 1500}
+
+    def test_costs_per_llm_model(self, registry):
+        tokens = metric(registry, "automation_llm_tokens")
+        tokens.labels(model="gpt-4o", operation="planning", kind="prompt").inc(900)
+        tokens.labels(model="gpt-4o", operation="planning", kind="completion").inc(100)
+        for latency in (2.0, 4.0):
+            metric(registry, "automation_llm_call_duration_seconds").labels(
+                model="gpt-4o", operation="planning"
+            ).observe(latency)
+        metric(registry, "automation_llm_time_to_first_token_seconds").labels(model="gpt-4o").observe(0.8)
+        metric(registry, "automation_llm_tokens_per_second").labels(model="gpt-4o").observe(50.0)
+        metric(registry, "automation_llm_cost_dollars").labels(model="gpt-4o").inc(0.25)
+
+        costs = MetricsAggregator(registry=registry).costs()
+
+        assert costs["by_model"] == {"gpt-4o": 0.25}
+        assert costs["token_usage"]["by_kind"] == {"prompt": 900, "completion": 100}
+        assert costs["llm"]["gpt-4o"]["calls"] == 2
+        assert costs["llm"]["gpt-4o"]["avg_latency"] == 3.0
+        assert costs["llm"]["gpt-4o"]["avg_time_to_first_token"] == 0.8
+        assert costs["llm"]["gpt-4o"]["avg_tokens_per_second"] == 50.0
@@ -87,6 +87,26 @@ class TestDashboardEndpoints:
         assert "by_model" in data
         assert "token_usage" in data
 
+    def test_workflow_metrics_step(self, client):
+        """Should group the timeline into the requested step."""
+        response = client.get("/api/metrics/workflows", params={"step_minutes": 720})
+        assert response.status_code == 200
+        assert 2 <= len(response.json()["timeline"]) <= 3
+
+    def test_timeseries(self, client):
+        """Should return a rolling time series by name."""
+        response = client.get("/api/metrics/timeseries/api_calls", params={"step_minutes": 60})
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["name"] == "api_calls"
+        assert 24 <= len(data["points"]) <= 25
+
+    def test_unknown_timeseries(self, client):
+        """Should return 404 for a series that isn't tracked."""
+        response = client.get("/api/metrics/timeseries/nope")
+        assert response.status_code == 404
+
     def test_health_check(self, client):
         """Should return healthy status."""
         response = client.get("/api/health")
@@ -101,3 +121,29 @@ class TestDashboardEndpoints:
         response = client.get("/metrics")
         assert response.status_code == 200
         assert "text/plain" in response.headers["content-type"]
+
+
+class TestDashboardLifecycle:
+    """Tests for starting and stopping the dashboard."""
+
+    @pytest.mark.asyncio
+    async def test_start_reports_plans_from_state_store(self, tmp_path):
+        """Should read plan statuses from the configured state store."""
+        from unittest.mock import MagicMock
+
+        from repo_sapiens.engine.state_manager import StateManager
+        from repo_sapiens.monitoring.dashboard import aggregator, start_dashboard, stop_dashboard, workflow_metrics
+
+        settings = MagicMock()
+        settings.state_dir = str(tmp_path)
+        settings.workflow.storage_backend = "json"
+        await StateManager(tmp_path).load_state("plan-1")
+
+        await start_dashboard(settings)
+        try:
+            data = await workflow_metrics(step_minutes=60)
+        finally:
+            await stop_dashboard()
+
+        assert data["by_status"] == {"pending": 1}
+        assert aggregator.state_manager is None
@@ -5,6 +5,8 @@ import pytest
 # Skip if prometheus_client not available
 pytest.importorskip("prometheus_client")
 
+from prometheus_client import REGISTRY
+
 from repo_sapiens.monitoring.metrics import (
     MetricsCollector,
     measure_api_call,
@@ -62,6 +64,26 @@ class TestMetricsCollector:
         MetricsCollector.update_estimated_cost(component="planning", cost=5.50)
         MetricsCollector.update_estimated_cost(component="implementation", cost=25.00)
 
+    def test_update_rate_limit_remaining(self):
+        """Should export the remaining rate-limit budget per provider."""
+        MetricsCollector.update_rate_limit_remaining(provider="github-test", remaining=4321)
+
+        assert b'automation_rate_limit_remaining{provider="github-test"} 4321.0' in MetricsCollector.get_metrics()
+
+    def test_record_task_parallelism(self):
+        """Should observe parallelism once and utilization once per slot."""
+
+        def count(name: str) -> float:
+            return REGISTRY.get_sample_value(f"{name}_count") or 0.0
+
+        runs = count("automation_task_parallelism")
+        samples = count("automation_task_slot_utilization_ratio")
+
+        MetricsCollector.record_task_parallelism(parallelism=2.5, slot_utilization=[1.0, 0.9, 0.6])
+
+        assert count("automation_task_parallelism") == runs + 1
+        assert count("automation_task_slot_utilization_ratio") == samples + 3
+
     def test_record_token_usage(self):
         """Should record token usage metric."""
         MetricsCollector.record_token_usage(model="claude-sonnet", operation="planning", tokens=1000)
@@ -0,0 +1,301 @@
+"""Tests for repo_sapiens/monitoring/tracing.py."""
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+import structlog
+
+from repo_sapiens.agents.tools import ToolRegistry
+from repo_sapiens.config.settings import TracingConfig
+from repo_sapiens.engine.stages.base import WorkflowStage
+from repo_sapiens.monitoring.tracing import (
+    JSONLSpanExporter,
+    OpenTelemetryExporter,
+    Span,
+    SpanExporter,
+    configure_from_settings,
+    configure_tracing,
+    current_span,
+    get_tracer,
+    instrument_methods,
+    read_spans,
+    span,
+    traced,
+)
+
+
+class RecordingExporter(SpanExporter):
+    """Keeps every finished span."""
+
+    def __init__(self) -> None:
+        self.started: list[Span] = []
+        self.finished: list[Span] = []
+
+    def on_start(self, span: Span) -> None:
+        self.started.append(span)
+
+    def on_end(self, span: Span) -> None:
+        self.finished.append(span)
+
+
+@pytest.fixture
+def exporter():
+    """Route spans to a recording exporter for the duration of a test."""
+    recorder = RecordingExporter()
+    configure_tracing([recorder])
+    yield recorder
+    configure_tracing([])
+
+
+class TestSpans:
+    """Tests for span nesting and context."""
+
+    def test_disabled_tracing_yields_none(self):
+        assert not get_tracer().enabled
+        with span("anything") as current:
+            assert current is None
+
+    def test_spans_nest_within_one_trace(self, exporter):
+        with span("process_issue", issue=812) as root:
+            with span("ImplementationStage.execute") as stage:
+                assert current_span() is stage
+            with span("GitHubAsyncProvider.get_issue"):
+                pass
+
+        first, second, outer = exporter.finished
+        assert outer is root
+        assert root.parent_id is None
+        assert first.parent_id == second.parent_id == root.span_id
+        assert {first.trace_id, second.trace_id} == {root.trace_id}
+        assert root.attributes == {"issue": 812}
+        assert root.end >= first.end
+        assert current_span() is None
+
+    def test_error_marks_span_and_propagates(self, exporter):
+        with pytest.raises(ValueError), span("merge"):
+            raise ValueError("conflict")
+
+        assert exporter.finished[0].status == "error"
+        assert exporter.finished[0].error == "ValueError: conflict"
+
+    def test_ids_bound_to_structlog_context(self, exporter):
+        with span("process_issue") as root:
+            bound = structlog.contextvars.get_contextvars()
+            assert bound["trace_id"] == root.trace_id
+            assert bound["span_id"] == root.span_id
+            with span("child") as child:
+                assert structlog.contextvars.get_contextvars()["span_id"] == child.span_id
+            assert structlog.contextvars.get_contextvars()["span_id"] == root.span_id
+
+        assert "trace_id" not in structlog.contextvars.get_contextvars()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_keep_their_own_parents(self, exporter):
+        async def task(name: str) -> None:
+            with span(name):
+                await asyncio.sleep(0)
+                with span(f"{name}.step"):
+                    await asyncio.sleep(0)
+
+        with span("process_plan") as root:
+            await asyncio.gather(task("a"), task("b"))
+
+        by_name = {finished.name: finished for finished in exporter.finished}
+        assert by_name["a.step"].parent_id == by_name["a"].span_id
+        assert by_name["b.step"].parent_id == by_name["b"].span_id
+        assert by_name["a"].parent_id == root.span_id
+
+    def test_failing_exporter_does_not_break_the_operation(self, exporter):
+        class Broken(SpanExporter):
+            def on_end(self, span: Span) -> None:
+                raise OSError("disk full")
+
+        get_tracer().exporters.append(Broken())
+        with span("work"):
+            result = 42
+
+        assert result == 42
+        assert exporter.finished[0].name == "work"
+
+
+class TestTraced:
+    """Tests for the traced decorator and instrument_methods."""
+
+    @pytest.mark.asyncio
+    async def test_traced_formats_name_from_attributes(self, exporter):
+        @traced("tool.{tool}", attributes=lambda tool_name, args: {"tool": tool_name})
+        async def execute(tool_name, args):
+            return "ok"
+
+        assert await execute("read_file", {"path": "a.py"}) == "ok"
+        assert exporter.finished[0].name == "tool.read_file"
+        assert exporter.finished[0].attributes == {"tool": "read_file"}
+
+    @pytest.mark.asyncio
+    async def test_instrument_methods_wraps_own_async_methods_once(self, exporter):
+        class Provider:
+            async def get_issue(self, number):
+                return number
+
+            def sync_helper(self):
+                return "sync"
+
+        class Subclass(Provider):
+            pass
+
+        instrument_methods(Provider, ["get_issue", "sync_helper", "missing"], lambda self, number: {"number": number})
+        instrument_methods(Provider, ["get_issue"])
+        instrument_methods(Subclass, ["get_issue"])
+
+        assert await Subclass().get_issue(7) == 7
+        assert Provider().sync_helper() == "sync"
+        assert [(s.name, s.attributes) for s in exporter.finished] == [("Provider.get_issue", {"number": 7})]
+
+    @pytest.mark.asyncio
+    async def test_stage_subclasses_and_tool_calls_are_traced(self, exporter, tmp_path):
+        class ListingStage(WorkflowStage):
+            async def execute(self, issue):
+                await ToolRegistry(tmp_path).execute("list_directory", {"path": "."})
+
+        stage = ListingStage.__new__(ListingStage)
+        with span("process_issue", issue=812) as root:
+            await stage.execute(MagicMock(number=812))
+
+        tool, stage_span, _ = exporter.finished
+        assert (stage_span.name, stage_span.attributes) == ("ListingStage.execute", {"issue": 812})
+        assert (tool.name, tool.parent_id) == ("tool.list_directory", stage_span.span_id)
+        assert stage_span.parent_id == root.span_id
+
+    @pytest.mark.asyncio
+    async def test_attribute_errors_fall_back_to_plain_span(self, exporter):
+        class KeywordStage(WorkflowStage):
+            async def execute(self, pull_request):
+                return pull_request.number
+
+        @traced("tool.{tool}", attributes=lambda tool_name, args: {"name": tool_name})
+        async def execute(tool_name, args):
+            return "ok"
+
+        stage = KeywordStage.__new__(KeywordStage)
+
+        # The stage attributes expect an issue argument; the name has no {tool} key
+        assert await stage.execute(pull_request=MagicMock(number=5)) == 5
+        assert await execute("read_file", {}) == "ok"
+        assert [(s.name, s.attributes) for s in exporter.finished] == [
+            ("KeywordStage.execute", {}),
+            ("tool.{tool}", {}),
+        ]
+
+
+class TestJSONLSpanExporter:
+    """Tests for the local JSONL exporter."""
+
+    def test_trace_written_when_root_ends(self, tmp_path):
+        configure_tracing([JSONLSpanExporter(tmp_path)])
+        try:
+            with span("process_issue", issue=812):
+                with span("GitHubAsyncProvider.get_issue"):
+                    pass
+                assert not list(tmp_path.glob("*.jsonl"))
+        finally:
+            configure_tracing([])
+
+        spans = read_spans(tmp_path)
+        assert [s.name for s in spans] == ["GitHubAsyncProvider.get_issue", "process_issue"]
+        assert spans[1].attributes == {"issue": 812}
+
+    def test_shutdown_flushes_unfinished_traces(self, tmp_path):
+        exporter = JSONLSpanExporter(tmp_path)
+        exporter.on_end(Span("orphan", "t" * 32, "s" * 16, parent_id="p" * 16, start=1.0, end=2.0))
+        assert read_spans(tmp_path) == []
+
+        exporter.shutdown()
+
+        assert read_spans(tmp_path)[0].name == "orphan"
+
+    def test_expired_files_are_pruned(self, tmp_path):
+        old = (datetime.now(UTC) - timedelta(days=10)).date().isoformat()
+        recent = datetime.now(UTC).date().isoformat()
+        (tmp_path / f"{old}.jsonl").write_text("")
+        (tmp_path / f"{recent}.jsonl").write_text("")
+
+        JSONLSpanExporter(tmp_path, retention_days=7)
+
+        assert [path.stem for path in tmp_path.glob("*.jsonl")] == [recent]
+
+    def test_unreadable_lines_are_skipped(self, tmp_path):
+        valid = Span("ok", "t" * 32, "s" * 16, None, start=1.0, end=2.0)
+        (tmp_path / "2026-01-01.jsonl").write_text("not json\n" + json.dumps(valid.to_dict()) + "\n{}\n")
+
+        assert read_spans(tmp_path) == [valid]
+
+
+class TestConfigureFromSettings:
+    """Tests for configure_from_settings."""
+
+    def test_disabled(self, tmp_path):
+        tracer = configure_from_settings(TracingConfig(enabled=False, directory=str(tmp_path)))
+
+        assert not tracer.enabled
+
+    def test_enabled_writes_jsonl(self, tmp_path):
+        tracer = configure_from_settings(TracingConfig(directory=str(tmp_path / "traces"), retention_days=3))
+        try:
+            assert [type(exporter) for exporter in tracer.exporters] == [JSONLSpanExporter]
+            assert tracer.exporters[0].retention_days == 3
+        finally:
+            configure_tracing([])
+
+
+class TestOpenTelemetryExporter:
+    """Tests for mirroring spans into OpenTelemetry."""
+
+    @pytest.fixture
+    def otel(self):
+        return pytest.importorskip("opentelemetry.trace")
+
+    def test_mirrors_nesting_status_and_times(self, otel):
+        class FakeSpan(otel.NonRecordingSpan):
+            def __init__(self, name, context, start_time, attributes):
+                super().__init__(otel.INVALID_SPAN_CONTEXT)
+                self.name = name
+                self.parent = otel.get_current_span(context) if context else None
+                self.start_time = start_time
+                self.attributes = dict(attributes)
+                self.status = None
+                self.end_time = None
+
+            def set_attributes(self, attributes):
+                self.attributes.update(attributes)
+
+            def set_status(self, status):
+                self.status = status
+
+            def end(self, end_time):
+                self.end_time = end_time
+
+        class FakeTracer:
+            def __init__(self):
+                self.spans = []
+
+            def start_span(self, name, context=None, start_time=None, attributes=None):
+                self.spans.append(FakeSpan(name, context, start_time, attributes))
+                return self.spans[-1]
+
+        fake = FakeTracer()
+        configure_tracing([OpenTelemetryExporter(tracer=fake)])
+        try:
+            with span("process_issue", issue=812, labels=["bug"]):
+                with pytest.raises(RuntimeError), span("agent.subprocess", command="claude"):
+                    raise RuntimeError("exit 1")
+        finally:
+            configure_tracing([])
+
+        root, child = fake.spans
+        assert child.parent is root
+        assert root.attributes == {"issue": 812, "labels": "['bug']"}
+        assert child.status.status_code == otel.StatusCode.ERROR
+        assert root.end_time >= child.end_time >= child.start_time >= root.start_time
@@ -0,0 +1,333 @@
+"""Tests for repo_sapiens/monitoring/usage.py."""
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+
+from repo_sapiens.agents.backends import OllamaBackend, OpenAIBackend
+from repo_sapiens.config.settings import ModelPricingConfig, UsageConfig
+from repo_sapiens.monitoring.tracing import SpanExporter, configure_tracing, span
+from repo_sapiens.monitoring.usage import (
+    LLMCall,
+    UsageLedger,
+    configure_usage,
+    configure_usage_from_settings,
+    current_scope,
+    get_usage_ledger,
+    ollama_usage,
+    openai_usage,
+    read_calls,
+    record_call,
+    usage_scope,
+)
+from repo_sapiens.providers.ollama import OllamaProvider
+from repo_sapiens.providers.openai_compatible import OpenAICompatibleProvider
+from repo_sapiens.utils.cost_optimizer import ModelCosts
+
+
+@pytest.fixture
+def ledger():
+    """Record calls into a fresh in-memory ledger for the duration of a test."""
+    previous = get_usage_ledger()
+    yield configure_usage(UsageLedger())
+    configure_usage(previous)
+
+
+def make_call(**fields) -> LLMCall:
+    return LLMCall(**{"model": "qwen3:8b", "provider": "ollama", **fields})
+
+
+def json_client(body: dict) -> httpx.AsyncClient:
+    """A client whose every request returns body as JSON."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=body)))
+
+
+def streaming_client(body: str) -> httpx.AsyncClient:
+    """A client whose every request returns body as a streamed response."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body.encode())))
+
+
+class TestUsageParsers:
+    """Tests for reading usage out of backend responses."""
+
+    def test_ollama_usage(self):
+        usage = ollama_usage(
+            {
+                "prompt_eval_count": 812,
+                "eval_count": 240,
+                "eval_duration": 3_000_000_000,
+                "load_duration": 500_000_000,
+                "prompt_eval_duration": 250_000_000,
+            }
+        )
+
+        assert usage == {
+            "prompt_tokens": 812,
+            "completion_tokens": 240,
+            "generation_time": 3.0,
+            "time_to_first_token": 0.75,
+        }
+
+    def test_ollama_usage_without_statistics(self):
+        assert ollama_usage({"response": "ok"}) == {"prompt_tokens": 0, "completion_tokens": 0}
+
+    def test_openai_usage(self):
+        result = {"usage": {"prompt_tokens": 120, "completion_tokens": 30, "total_tokens": 150}}
+
+        assert openai_usage(result) == {"prompt_tokens": 120, "completion_tokens": 30}
+
+    def test_malformed_usage_counts_as_nothing(self):
+        assert openai_usage({"usage": None}) == {}
+        assert openai_usage({"usage": {"prompt_tokens": "many", "completion_tokens": True}}) == {
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+        }
+
+
+class TestLLMCall:
+    """Tests for LLMCall."""
+
+    def test_tokens_per_second_prefers_generation_time(self):
+        assert make_call(completion_tokens=200, latency=10.0, generation_time=4.0).tokens_per_second == 50.0
+
+    def test_tokens_per_second_from_latency_after_first_token(self):
+        assert make_call(completion_tokens=90, latency=4.0, time_to_first_token=1.0).tokens_per_second == 30.0
+
+    def test_tokens_per_second_unknown_without_completion(self):
+        assert make_call(latency=2.0).tokens_per_second is None
+
+    def test_round_trip(self):
+        call = make_call(prompt_tokens=5, issue=812, stage="planning", time_to_first_token=0.2)
+
+        assert LLMCall.from_dict({**call.to_dict(), "future_field": 1}) == call
+
+
+class TestUsageScope:
+    """Tests for attributing calls with usage_scope."""
+
+    def test_scopes_nest_and_override(self):
+        with usage_scope(issue=812, stage="planning"):
+            with usage_scope(stage="plan_review", task=None):
+                assert current_scope() == {"issue": 812, "stage": "plan_review"}
+            assert current_scope() == {"issue": 812, "stage": "planning"}
+
+        assert current_scope() == {}
+
+    def test_unknown_label_rejected(self):
+        with pytest.raises(ValueError, match="model"), usage_scope(model="gpt-4o"):
+            pass
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_keep_their_own_scope(self, ledger):
+        async def task(task_id: str) -> None:
+            with usage_scope(task=task_id):
+                await asyncio.sleep(0)
+                record_call("qwen3:8b", "ollama", 1.0)
+
+        with usage_scope(plan="42"):
+            await asyncio.gather(task("a"), task("b"))
+
+        assert sorted((call.plan, call.task) for call in ledger.calls) == [("42", "a"), ("42", "b")]
+
+    def test_record_call_sets_span_attributes(self, ledger):
+        finished = []
+
+        class Recorder(SpanExporter):
+            def on_end(self, span):
+                finished.append(span)
+
+        configure_tracing([Recorder()])
+        try:
+            with span("chat"):
+                record_call("qwen3:8b", "ollama", 1.0, prompt_tokens=10, completion_tokens=4)
+        finally:
+            configure_tracing([])
+
+        assert finished[0].attributes == {"prompt_tokens": 10, "completion_tokens": 4}
+
+
+class TestUsageLedger:
+    """Tests for pricing and aggregating calls."""
+
+    def test_prices_known_models_only(self):
+        ledger = UsageLedger(pricing={"gpt-4o": ModelCosts(input_cost=2.5, output_cost=10.0)})
+        priced = make_call(model="gpt-4o", prompt_tokens=1_000_000, completion_tokens=100_000)
+        local = make_call(prompt_tokens=1_000_000)
+
+        ledger.record(priced)
+        ledger.record(local)
+
+        assert priced.cost == pytest.approx(3.5)
+        assert local.cost == 0.0
+
+    def test_summarize_by_stage_and_filter(self):
+        ledger = UsageLedger()
+        ledger.record(make_call(issue=1, stage="planning", prompt_tokens=100, completion_tokens=10, latency=2.0))
+        ledger.record(make_call(issue=1, stage="planning", prompt_tokens=300, completion_tokens=30, latency=4.0))
+        ledger.record(make_call(issue=2, stage="code_review", prompt_tokens=50, time_to_first_token=0.5))
+
+        by_stage = ledger.summarize("stage")
+        issue_two = ledger.summarize(("issue", "stage"), issue=2)
+
+        assert by_stage["planning"].calls == 2
+        assert by_stage["planning"].prompt_tokens == 400
+        assert by_stage["planning"].mean_latency == 3.0
+        assert by_stage["planning"].mean_time_to_first_token is None
+        assert list(issue_two) == [(2, "code_review")]
+        assert issue_two[(2, "code_review")].mean_time_to_first_token == 0.5
+        assert ledger.total().total_tokens == 490
+
+    def test_summary_tokens_per_second_weights_by_generation_time(self):
+        ledger = UsageLedger()
+        ledger.record(make_call(completion_tokens=100, generation_time=1.0))
+        ledger.record(make_call(completion_tokens=100, generation_time=4.0))
+
+        assert ledger.total().tokens_per_second == 40.0
+
+    def test_persists_and_reloads(self, tmp_path):
+        UsageLedger(directory=tmp_path).record(make_call(issue=812, stage="planning", prompt_tokens=900))
+
+        reloaded = UsageLedger(directory=tmp_path)
+
+        assert len(list(tmp_path.glob("*.jsonl"))) == 1
+        assert reloaded.summarize("issue")[812].prompt_tokens == 900
+        assert read_calls(tmp_path) == list(reloaded.calls)
+
+    def test_prunes_expired_files_and_skips_bad_lines(self, tmp_path):
+        old = (datetime.now(UTC) - timedelta(days=40)).date().isoformat()
+        recent = datetime.now(UTC).date().isoformat()
+        (tmp_path / f"{old}.jsonl").write_text(json.dumps(make_call().to_dict()) + "\n")
+        (tmp_path / f"{recent}.jsonl").write_text(
+            "not json\n[]\n42\n" + json.dumps(make_call(stage="qa").to_dict()) + "\n"
+        )
+
+        ledger = UsageLedger(directory=tmp_path, retention_days=30)
+
+        assert [path.stem for path in tmp_path.glob("*.jsonl")] == [recent]
+        assert [call.stage for call in ledger.calls] == ["qa"]
+
+    def test_configure_from_settings_adds_pricing(self, tmp_path):
+        previous = get_usage_ledger()
+        try:
+            ledger = configure_usage_from_settings(
+                UsageConfig(
+                    directory=str(tmp_path),
+                    pricing={"gpt-4o": ModelPricingConfig(input_cost=2.5, output_cost=10.0)},
+                )
+            )
+        finally:
+            configure_usage(previous)
+
+        assert ledger.directory == tmp_path
+        assert ledger.pricing["gpt-4o"] == ModelCosts(input_cost=2.5, output_cost=10.0)
+        assert "claude-sonnet-4.5" in ledger.pricing
+
+    def test_not_persisted_when_disabled(self):
+        previous = get_usage_ledger()
+        try:
+            assert configure_usage_from_settings(UsageConfig(persist=False)).directory is None
+        finally:
+            configure_usage(previous)
+
+
+class TestBackendRecording:
+    """Tests for recording usage of backend and provider calls."""
+
+    @pytest.mark.asyncio
+    async def test_ollama_chat(self, ledger):
+        backend = OllamaBackend()
+        backend._client = json_client(
+            {"message": {"content": "ok"}, "prompt_eval_count": 812, "eval_count": 24, "eval_duration": 400_000_000}
+        )
+
+        with usage_scope(issue=812, stage="implementation"):
+            await backend.chat([{"role": "user", "content": "Hi"}], model="qwen3:8b")
+
+        (call,) = ledger.calls
+        assert (call.model, call.provider, call.issue, call.stage) == ("qwen3:8b", "ollama", 812, "implementation")
+        assert (call.prompt_tokens, call.completion_tokens) == (812, 24)
+        assert call.tokens_per_second == pytest.approx(60.0)
+        assert call.latency > 0
+
+    @pytest.mark.asyncio
+    async def test_ollama_stream_uses_final_statistics(self, ledger):
+        backend = OllamaBackend()
+        backend._client = streaming_client(
+            '{"message": {"content": "Hel"}, "done": false}\n'
+            '{"message": {"content": "lo"}, "done": false}\n'
+            '{"message": {"content": ""}, "done": true, "prompt_eval_count": 50, "eval_count": 2}\n'
+        )
+
+        async for _ in backend.chat_stream([{"role": "user", "content": "Hi"}], model="qwen3:8b"):
+            pass
+
+        (call,) = ledger.calls
+        assert (call.prompt_tokens, call.completion_tokens) == (50, 2)
+        assert call.time_to_first_token is not None
+        assert call.time_to_first_token <= call.latency
+
+    @pytest.mark.asyncio
+    async def test_openai_chat(self, ledger):
+        backend = OpenAIBackend()
+        backend._client = json_client(
+            {"choices": [{"message": {"content": "ok"}}], "usage": {"prompt_tokens": 120, "completion_tokens": 30}}
+        )
+
+        await backend.chat([{"role": "user", "content": "Hi"}], model="gpt-4o")
+
+        (call,) = ledger.calls
+        assert (call.provider, call.prompt_tokens, call.completion_tokens) == ("openai", 120, 30)
+
+    @pytest.mark.asyncio
+    async def test_openai_stream_reads_usage_event(self, ledger):
+        backend = OpenAIBackend()
+        backend._client = streaming_client(
+            'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "lo"}}]}\n\n'
+            'data: {"choices": [], "usage": {"prompt_tokens": 12, "completion_tokens": 2}}\n\n'
+            "data: [DONE]\n\n"
+        )
+
+        chunks = [chunk async for chunk in backend.chat_stream([{"role": "user", "content": "Hi"}], model="gpt-4o")]
+
+        assert chunks[-1].done
+        (call,) = ledger.calls
+        assert (call.prompt_tokens, call.completion_tokens) == (12, 2)
+        assert call.time_to_first_token is not None
+
+    @pytest.mark.asyncio
+    async def test_openai_stream_stopped_early_counts_chunks(self, ledger):
+        backend = OpenAIBackend()
+        backend._client = streaming_client(
+            'data: {"choices": [{"delta": {"content": "a"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "b"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "c"}}]}\n\n'
+        )
+
+        stream = backend.chat_stream([{"role": "user", "content": "Hi"}], model="gpt-4o")
+        await anext(stream)
+        await stream.aclose()
+
+        (call,) = ledger.calls
+        assert (call.prompt_tokens, call.completion_tokens) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_providers(self, ledger):
+        ollama = OllamaProvider()
+        ollama.client = json_client({"response": "done", "prompt_eval_count": 900, "eval_count": 100})
+        copilot = OpenAICompatibleProvider(model="gpt-4o")
+        copilot.usage_provider = "copilot"
+        copilot.client = json_client(
+            {"choices": [{"message": {"content": "done"}}], "usage": {"prompt_tokens": 40, "completion_tokens": 8}}
+        )
+
+        with usage_scope(stage="planning"):
+            await ollama.execute_prompt("Plan it")
+            await copilot.execute_prompt("Plan it")
+
+        by_provider = get_usage_ledger().summarize("provider", stage="planning")
+        assert by_provider["ollama"].prompt_tokens == 900
+        assert by_provider["copilot"].completion_tokens == 8
@@ -10,7 +10,9 @@ from repo_sapiens.engine.parallel_executor import (
     ExecutionTask,
     ParallelExecutor,
     TaskPriority,
+    TaskResult,
     TaskScheduler,
+    compute_schedule,
 )
 
 
@@ -195,3 +197,238 @@ async def test_circular_dependency_detection():
 
     with pytest.raises(RuntimeError, match="deadlock"):
         await executor.execute_tasks(tasks)
+
+
+@pytest.mark.asyncio
+async def test_dependent_starts_while_unrelated_task_still_running():
+    """Test that a finished task's dependents start without waiting for its batch."""
+    executor = ParallelExecutor(max_workers=2)
+    slow_release = asyncio.Event()
+    order: list[str] = []
+
+    async def slow() -> None:
+        await slow_release.wait()
+        order.append("slow")
+
+    async def fast() -> None:
+        order.append("fast")
+
+    async def after_fast() -> None:
+        order.append("after_fast")
+        slow_release.set()
+
+    tasks = [
+        ExecutionTask(id="slow", func=slow),
+        ExecutionTask(id="fast", func=fast),
+        ExecutionTask(id="after_fast", func=after_fast, dependencies={"fast"}),
+    ]
+
+    results = await executor.execute_tasks(tasks)
+
+    assert all(result.success for result in results.values())
+    assert order == ["fast", "after_fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_longest_chain_starts_first_among_equal_priorities():
+    """Test that ready tasks heading longer chains are started first."""
+    executor = ParallelExecutor(max_workers=1)
+    order: list[str] = []
+
+    def recorder(name: str):
+        async def record() -> None:
+            order.append(name)
+
+        return record
+
+    tasks = [
+        ExecutionTask(id="isolated", func=recorder("isolated")),
+        ExecutionTask(id="root", func=recorder("root")),
+        ExecutionTask(id="middle", func=recorder("middle"), dependencies={"root"}),
+        ExecutionTask(id="leaf", func=recorder("leaf"), dependencies={"middle"}),
+    ]
+
+    await executor.execute_tasks(tasks)
+
+    assert order[0] == "root"
+
+
+@pytest.mark.asyncio
+async def test_failure_blocks_transitive_dependents_only():
+    """Test that a failure blocks its whole subtree while independent work completes."""
+    executor = ParallelExecutor(max_workers=2)
+
+    tasks = [
+        ExecutionTask(id="failing", func=failing_task),
+        ExecutionTask(id="child", func=simple_task, args=(1,), dependencies={"failing"}),
+        ExecutionTask(id="grandchild", func=simple_task, args=(2,), dependencies={"child"}),
+        ExecutionTask(id="independent", func=simple_task, args=(3,)),
+        ExecutionTask(id="after_independent", func=simple_task, args=(4,), dependencies={"independent"}),
+    ]
+
+    results = await executor.execute_tasks(tasks)
+
+    assert str(results["child"].error) == "Dependency failure"
+    assert str(results["grandchild"].error) == "Dependency failure"
+    assert results["independent"].success is True
+    assert results["after_independent"].result == 8
+
+
+@pytest.mark.asyncio
+async def test_large_dependency_graph():
+    """Test that a large graph of chained tasks completes."""
+    executor = ParallelExecutor(max_workers=8)
+
+    async def noop(value: int) -> int:
+        return value
+
+    tasks = [
+        ExecutionTask(
+            id=f"task-{i}",
+            func=noop,
+            args=(i,),
+            dependencies={f"task-{i - 1}", f"task-{i - 7}"} if i >= 7 else set(),
+        )
+        for i in range(500)
+    ]
+
+    results = await executor.execute_tasks(tasks)
+
+    assert len(results) == 500
+    assert all(result.success for result in results.values())
+
+
+def test_critical_path_marks_every_task_on_longest_chain():
+    """Test that the critical path covers the longest chain and nothing shorter."""
+    scheduler = TaskScheduler(ParallelExecutor(max_workers=2))
+
+    tasks = [
+        ExecutionTask(id="a", func=simple_task),
+        ExecutionTask(id="b", func=simple_task, dependencies={"a"}),
+        ExecutionTask(id="c", func=simple_task, dependencies={"b"}),
+        ExecutionTask(id="side", func=simple_task, dependencies={"a"}),
+        ExecutionTask(id="isolated", func=simple_task),
+    ]
+
+    scheduler.optimize_execution_order(tasks)
+
+    assert scheduler.last_schedule is not None
+    assert scheduler.last_schedule.critical == {"a", "b", "c"}
+
+
+def test_compute_schedule_weights_paths_by_duration():
+    """Test that a short chain of long tasks beats a long chain of short ones."""
+    dependencies = {
+        "start": set(),
+        "quick-1": {"start"},
+        "quick-2": {"quick-1"},
+        "quick-3": {"quick-2"},
+        "slow": {"start"},
+        "end": {"quick-3", "slow"},
+    }
+    durations = {"start": 1.0, "quick-1": 1.0, "quick-2": 1.0, "quick-3": 1.0, "slow": 10.0, "end": 2.0}
+
+    schedule = compute_schedule(dependencies, durations)
+
+    assert schedule.makespan == 13.0
+    assert schedule.critical == {"start", "slow", "end"}
+    assert schedule.earliest_start["end"] == 11.0
+    assert schedule.latest_start["quick-1"] == 8.0
+    assert schedule.slack["quick-3"] == 7.0
+    assert schedule.remaining["start"] == 13.0
+
+
+def test_compute_schedule_handles_wide_diamonds():
+    """Test that stacked diamonds, exponential in paths, are scheduled in one pass."""
+    dependencies: dict[str, set[str]] = {"join-0": set()}
+    for level in range(1, 60):
+        dependencies[f"left-{level}"] = {f"join-{level - 1}"}
+        dependencies[f"right-{level}"] = {f"join-{level - 1}"}
+        dependencies[f"join-{level}"] = {f"left-{level}", f"right-{level}"}
+
+    schedule = compute_schedule(dependencies, {}, default_duration=1.0)
+
+    assert schedule.makespan == 1 + 59 * 2
+    assert len(schedule.critical) == len(dependencies)
+
+
+def test_compute_schedule_defaults_missing_durations():
+    """Test that unknown tasks use the default duration and unknown dependencies are ignored."""
+    schedule = compute_schedule({"a": {"external"}, "b": {"a"}}, {"a": 3.0}, default_duration=0.5)
+
+    assert schedule.durations == {"a": 3.0, "b": 0.5}
+    assert schedule.makespan == 3.5
+
+
+def test_optimize_execution_order_dispatches_longest_remaining_path_first():
+    """Test that tasks come back ordered by estimated remaining work."""
+    scheduler = TaskScheduler(
+        ParallelExecutor(max_workers=2),
+        duration_estimates={"lint": 1.0, "build": 5.0, "test": 20.0, "docs": 2.0},
+    )
+    tasks = [
+        ExecutionTask(id="lint", func=simple_task),
+        ExecutionTask(id="docs", func=simple_task),
+        ExecutionTask(id="build", func=simple_task),
+        ExecutionTask(id="test", func=simple_task, dependencies={"build"}),
+    ]
+
+    optimized = scheduler.optimize_execution_order(tasks)
+
+    assert [task.id for task in optimized] == ["build", "test", "docs", "lint"]
+    assert scheduler.last_schedule is not None
+    assert scheduler.last_schedule.makespan == 25.0
+    priorities = {task.id: task.priority for task in optimized}
+    assert priorities["build"] == priorities["test"] == TaskPriority.NORMAL + 100
+    assert priorities["lint"] == priorities["docs"] == TaskPriority.NORMAL
+
+
+def test_estimate_durations_sources():
+    """Test metadata overrides, averaged history and the median fallback."""
+    scheduler = TaskScheduler(ParallelExecutor(), duration_estimates={"a": 2.0, "b": 8.0, "c": 30.0})
+    scheduler.record_results(
+        [
+            TaskResult(task_id="a", success=True, execution_time=4.0),
+            TaskResult(task_id="b", success=False, execution_time=100.0),
+        ]
+    )
+    tasks = [
+        ExecutionTask(id="a", func=simple_task),
+        ExecutionTask(id="b", func=simple_task),
+        ExecutionTask(id="new", func=simple_task),
+        ExecutionTask(id="pinned", func=simple_task, metadata={"estimated_duration": 7}),
+    ]
+
+    assert scheduler.estimate_durations(tasks) == {"a": 3.0, "b": 8.0, "new": 8.0, "pinned": 7.0}
+    assert TaskScheduler(ParallelExecutor()).estimate_durations(tasks[:1]) == {"a": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_executor_follows_schedule_among_ready_tasks():
+    """Test that a single worker starts the ready task with the longest remaining path first."""
+    started: list[str] = []
+
+    async def record(name: str) -> None:
+        started.append(name)
+
+    tasks = [
+        ExecutionTask(id="short", func=record, args=("short",)),
+        ExecutionTask(id="long", func=record, args=("long",)),
+    ]
+    schedule = compute_schedule({task.id: task.dependencies for task in tasks}, {"short": 1.0, "long": 9.0})
+
+    results = await ParallelExecutor(max_workers=1).execute_tasks(tasks, schedule=schedule)
+
+    assert all(result.success for result in results.values())
+    assert started == ["long", "short"]
+
+
+@pytest.mark.asyncio
+async def test_execute_with_optimization_records_durations():
+    """Test that observed execution times feed the next run's estimates."""
+    scheduler = TaskScheduler(ParallelExecutor(max_workers=2))
+    tasks = [ExecutionTask(id="task-1", func=simple_task, args=(1,))]
+
+    results = await scheduler.execute_with_optimization(tasks)
+
+    assert scheduler.estimate_durations(tasks) == {"task-1": results["task-1"].execution_time}
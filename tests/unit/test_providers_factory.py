@@ -1,4 +1,6 @@
-"""Tests for repo_sapiens/providers/factory.py - Git provider factory."""
+"""Tests for repo_sapiens/providers/factory.py - Git and agent provider factories."""
+
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import SecretStr
@@ -9,10 +11,13 @@ from repo_sapiens.config.settings import (
     GitProviderConfig,
     RepositoryConfig,
 )
-from repo_sapiens.providers.factory import create_git_provider, detect_provider_from_url
+from repo_sapiens.providers.external_agent import ExternalAgentProvider
+from repo_sapiens.providers.factory import create_agent_provider, create_git_provider, detect_provider_from_url
 from repo_sapiens.providers.gitea_rest import GiteaRestProvider
+from repo_sapiens.providers.github_async import GitHubAsyncProvider
 from repo_sapiens.providers.github_rest import GitHubRestProvider
 from repo_sapiens.providers.gitlab_rest import GitLabRestProvider
+from repo_sapiens.providers.openai_compatible import OpenAICompatibleProvider
 
 
 class TestCreateGitProvider:
@@ -49,7 +54,7 @@ class TestCreateGitProvider:
         assert provider.repo == "test-repo"
 
     def test_create_github_provider(self, tmp_path):
-        """Should create GitHubRestProvider when provider_type is 'github'."""
+        """Should create GitHubAsyncProvider when provider_type is 'github'."""
         settings = AutomationSettings(
             git_provider=GitProviderConfig(
                 provider_type="github",
@@ -72,14 +77,14 @@ class TestCreateGitProvider:
 
         provider = create_git_provider(settings)
 
-        assert isinstance(provider, GitHubRestProvider)
+        assert isinstance(provider, GitHubAsyncProvider)
         assert provider.base_url == "https://api.github.com"
         assert provider.token == "ghp_test123"
         assert provider.owner == "github-user"
         assert provider.repo == "repo-name"
 
     def test_create_github_enterprise_provider(self, tmp_path):
-        """Should create GitHubRestProvider for GitHub Enterprise."""
+        """Should create GitHubAsyncProvider for GitHub Enterprise."""
         settings = AutomationSettings(
             git_provider=GitProviderConfig(
                 provider_type="github",
@@ -102,11 +107,40 @@ class TestCreateGitProvider:
 
         provider = create_git_provider(settings)
 
-        assert isinstance(provider, GitHubRestProvider)
+        assert isinstance(provider, GitHubAsyncProvider)
         assert provider.base_url == "https://github.enterprise.com/api/v3"
         assert provider.owner == "enterprise-org"
         assert provider.repo == "private-repo"
 
+    def test_create_pygithub_provider_fallback(self, tmp_path):
+        """Should create GitHubRestProvider when github_client is 'pygithub'."""
+        settings = AutomationSettings(
+            git_provider=GitProviderConfig(
+                provider_type="github",
+                base_url="https://api.github.com",
+                api_token=SecretStr("ghp_test123"),
+                github_client="pygithub",
+            ),
+            repository=RepositoryConfig(
+                owner="github-user",
+                name="repo-name",
+                default_branch="main",
+            ),
+            agent_provider=AgentProviderConfig(
+                provider_type="claude-local",
+                model="claude-sonnet-4.5",
+                api_key=SecretStr("test-key"),
+                local_mode=True,
+            ),
+            workflow={"state_directory": str(tmp_path / "state")},
+        )
+
+        provider = create_git_provider(settings)
+
+        assert isinstance(provider, GitHubRestProvider)
+        assert provider.base_url == "https://api.github.com"
+        assert provider.token == "ghp_test123"
+
     def test_create_gitlab_provider(self, tmp_path):
         """Should create GitLabRestProvider when provider_type is 'gitlab'."""
         settings = AutomationSettings(
@@ -193,6 +227,32 @@ class TestCreateGitProvider:
         assert provider.owner == "my-org"
         assert provider.repo == "my-special-repo"
 
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_disk_cache_tier_follows_workflow_setting(self, tmp_path, enabled):
+        """Should attach the persistent cache tier only when workflow.disk_cache is set."""
+        settings = AutomationSettings(
+            git_provider=GitProviderConfig(
+                provider_type="gitea",
+                base_url="https://gitea.local",
+                api_token=SecretStr("local-token"),
+            ),
+            repository=RepositoryConfig(owner="my-org", name="my-repo"),
+            agent_provider=AgentProviderConfig(provider_type="claude-local"),
+            workflow={
+                "state_directory": str(tmp_path / "state"),
+                "disk_cache": enabled,
+                "cache_directory": str(tmp_path / "cache"),
+            },
+        )
+
+        with patch("repo_sapiens.providers.factory.configure_disk_cache") as configure:
+            create_git_provider(settings)
+
+        if enabled:
+            configure.assert_called_once_with(str(tmp_path / "cache"), 10000)
+        else:
+            configure.assert_not_called()
+
     def test_provider_extracts_secret_token(self, tmp_path):
         """Should extract secret value from SecretStr."""
         secret_token = SecretStr("super-secret-token-value")
@@ -223,6 +283,47 @@ class TestCreateGitProvider:
         assert provider.token == "super-secret-token-value"
 
 
+def _agent_settings(tmp_path, **agent_provider) -> AutomationSettings:
+    return AutomationSettings(
+        git_provider=GitProviderConfig(
+            provider_type="gitea",
+            base_url="https://gitea.test",
+            api_token=SecretStr("token"),
+        ),
+        repository=RepositoryConfig(owner="test", name="test"),
+        agent_provider=AgentProviderConfig(**agent_provider),
+        workflow={"state_directory": str(tmp_path / "state")},
+    )
+
+
+class TestCreateAgentProvider:
+    """Tests for create_agent_provider function."""
+
+    def test_create_external_agent_without_qa_handler(self, tmp_path):
+        """Should create a non-interactive external agent when no Git provider is given."""
+        provider = create_agent_provider(_agent_settings(tmp_path, provider_type="claude-local"))
+
+        assert isinstance(provider, ExternalAgentProvider)
+        assert provider.qa_handler is None
+
+    def test_create_openai_compatible_with_qa_handler(self, tmp_path):
+        """Should pass the API key and a Q&A handler posting through the Git provider."""
+        git = MagicMock()
+        settings = _agent_settings(
+            tmp_path,
+            provider_type="openai-compatible",
+            base_url="https://openrouter.test/v1",
+            model="gpt-4o",
+            api_key=SecretStr("sk-test"),
+        )
+
+        provider = create_agent_provider(settings, git)
+
+        assert isinstance(provider, OpenAICompatibleProvider)
+        assert provider.api_key == "sk-test"
+        assert provider.qa_handler.git is git
+
+
 class TestDetectProviderFromUrl:
     """Tests for detect_provider_from_url function."""
 
@@ -331,7 +432,7 @@ class TestProviderFactoryIntegration:
         )
 
         provider = create_git_provider(settings)
-        assert isinstance(provider, GitHubRestProvider)
+        assert isinstance(provider, GitHubAsyncProvider)
 
     def test_factory_and_detection_work_together_for_gitea(self, tmp_path):
         """Should create correct provider when detection suggests Gitea."""
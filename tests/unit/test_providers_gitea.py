@@ -6,6 +6,7 @@ branch management, label operations, and error handling scenarios.
 """
 
 import base64
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -14,6 +15,8 @@ import pytest
 from repo_sapiens.models.domain import IssueState
 from repo_sapiens.providers.gitea_rest import GiteaRestProvider
 from repo_sapiens.utils.connection_pool import HTTPConnectionPool
+from repo_sapiens.utils.disk_cache import DiskCache
+from repo_sapiens.utils.pagination import DEFAULT_PAGE_SIZE
 
 # =============================================================================
 # Fixtures
@@ -244,6 +247,51 @@ class TestGiteaRestProviderIssues:
         assert call_args.kwargs["params"]["labels"] == "bug,critical"
         assert call_args.kwargs["params"]["state"] == "all"
 
+    @pytest.mark.asyncio
+    async def test_get_issues_follows_link_header(
+        self,
+        provider: GiteaRestProvider,
+        mock_pool: AsyncMock,
+        sample_issue_data: dict,
+    ) -> None:
+        """Should fetch every page advertised by the Link header."""
+        first = [dict(sample_issue_data, number=n) for n in range(1, DEFAULT_PAGE_SIZE + 1)]
+        second = [dict(sample_issue_data, number=DEFAULT_PAGE_SIZE + 1)]
+        responses = [
+            httpx.Response(200, json=first, headers={"link": '<https://x/issues?page=2>; rel="next"'}),
+            httpx.Response(200, json=second),
+        ]
+        for response in responses:
+            response.request = httpx.Request("GET", "https://gitea.example.com")
+        mock_pool.get = AsyncMock(side_effect=responses)
+        provider._pool = mock_pool
+
+        issues = await provider.get_issues()
+
+        assert [issue.number for issue in issues] == list(range(1, DEFAULT_PAGE_SIZE + 2))
+        pages = [call.kwargs["params"]["page"] for call in mock_pool.get.call_args_list]
+        assert pages == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_iter_issue_pages_yields_per_page(
+        self,
+        provider: GiteaRestProvider,
+        mock_pool: AsyncMock,
+        sample_issue_data: dict,
+    ) -> None:
+        """Should yield one parsed list per API page."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = [sample_issue_data]
+        mock_response.raise_for_status = MagicMock()
+        mock_pool.get = AsyncMock(return_value=mock_response)
+        provider._pool = mock_pool
+
+        pages = [page async for page in provider.iter_issue_pages(labels=["bug"])]
+
+        assert len(pages) == 1
+        assert pages[0][0].number == 42
+        assert mock_pool.get.call_args.kwargs["params"]["limit"] == str(DEFAULT_PAGE_SIZE)
+
     @pytest.mark.asyncio
     async def test_get_issue_by_number(
         self,
@@ -463,6 +511,38 @@ class TestGiteaRestProviderComments:
         assert comments[0].author == "reviewer"
         assert comments[1].author == "maintainer"
 
+    @pytest.mark.asyncio
+    async def test_get_comments_since(
+        self,
+        provider: GiteaRestProvider,
+        mock_pool: AsyncMock,
+    ) -> None:
+        """Should pass since to the API and drop older comments it returns for edits."""
+        edited_old = {
+            "id": 5001,
+            "body": "Edited later",
+            "user": {"login": "reviewer"},
+            "created_at": "2024-06-10T08:00:00Z",
+        }
+        new = {
+            "id": 5002,
+            "body": "New comment",
+            "user": {"login": "maintainer"},
+            "created_at": "2024-06-17T08:00:00Z",
+        }
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = [edited_old, new]
+        mock_response.raise_for_status = MagicMock()
+        mock_pool.get = AsyncMock(return_value=mock_response)
+        provider._pool = mock_pool
+
+        since = datetime(2024, 6, 15, tzinfo=UTC)
+        comments = await provider.get_comments(42, since=since)
+
+        assert [c.id for c in comments] == [5002]
+        assert mock_pool.get.call_args.kwargs["params"] == {"since": since.isoformat()}
+
 
 # =============================================================================
 # File Operations Tests
@@ -858,6 +938,159 @@ class TestGiteaRestProviderLabels:
         assert posted_data["name"] == "new-label"
         assert posted_data["color"] == "ededed"
 
+    @staticmethod
+    def _response(status: int, json_data, headers: dict[str, str] | None = None) -> httpx.Response:
+        response = httpx.Response(status, json=json_data, headers=headers)
+        response.request = httpx.Request("GET", "https://gitea.example.com")
+        return response
+
+    @pytest.mark.asyncio
+    async def test_label_ids_cached_across_issues(
+        self,
+        provider: GiteaRestProvider,
+        mock_pool: AsyncMock,
+        sample_label_data: list[dict],
+        sample_issue_data: dict,
+    ) -> None:
+        """Should list repository labels once for many issue creations."""
+        mock_pool.get = AsyncMock(return_value=self._response(200, sample_label_data))
+        mock_pool.post = AsyncMock(return_value=self._response(201, sample_issue_data))
+        provider._pool = mock_pool
+
+        for i in range(5):
+            await provider.create_issue(f"Task {i}", "body", labels=["bug", "enhancement"])
+
+        assert mock_pool.get.call_count == 1
+        assert mock_pool.post.call_args.kwargs["json"]["labels"] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_setup_automation_labels_warms_cache(
+        self,
+        provider: GiteaRestProvider,
+        mock_pool: AsyncMock,
+        sample_label_data: list[dict],
+    ) -> None:
+        """Should create missing automation labels and reuse the listing afterwards."""
+        mock_pool.get = AsyncMock(return_value=self._response(200, sample_label_data))
+        mock_pool.post = AsyncMock(return_value=self._response(201, {"id": 50, "name": "needs-planning"}))
+        provider._pool = mock_pool
+
+        result = await provider.setup_automation_labels(["bug", "needs-planning"])
+        label_ids = await provider._get_or_create_label_ids(["needs-planning", "documentation"])
+
+        assert result == {"bug": 1, "needs-planning": 50}
+        assert label_ids == [50, 3]
+        assert mock_pool.get.call_count == 1
+        assert mock_pool.post.call_args.kwargs["json"]["color"] == "5319e7"
+
+    @pytest.mark.asyncio
+    async def test_ensure_labels_creates_batch_once(
+        self,
+        provider: GiteaRestProvider,
+        mock_pool: AsyncMock,
+        sample_label_data: list[dict],
+    ) -> None:
+        """Should create each missing label of a batch exactly once."""
+        mock_pool.get = AsyncMock(return_value=self._response(200, sample_label_data))
+        mock_pool.post = AsyncMock(
+            side_effect=[
+                self._response(201, {"id": 10, "name": "task"}),
+                self._response(201, {"id": 11, "name": "plan-7"}),
+            ]
+        )
+        provider._pool = mock_pool
+
+        result = await provider.ensure_labels(["task", "bug", "plan-7", "task", "plan-7"])
+
+        assert result == {"task": 10, "bug": 1, "plan-7": 11}
+        assert [call.kwargs["json"]["name"] for call in mock_pool.post.call_args_list] == ["task", "plan-7"]
+
+    @pytest.mark.asyncio
+    async def test_stale_label_ids_invalidate_cache(
+        self,
+        provider: GiteaRestProvider,
+        mock_pool: AsyncMock,
+        sample_issue_data: dict,
+    ) -> None:
+        """Should reload labels and resend once when Gitea rejects cached IDs."""
+        mock_pool.get = AsyncMock(
+            side_effect=[
+                self._response(200, [{"id": 1, "name": "bug"}]),
+                self._response(200, [{"id": 9, "name": "bug"}]),
+            ]
+        )
+        mock_pool.post = AsyncMock(
+            side_effect=[
+                self._response(422, {"message": "label does not exist"}),
+                self._response(201, sample_issue_data),
+            ]
+        )
+        provider._pool = mock_pool
+
+        issue = await provider.create_issue("Title", "body", labels=["bug"])
+
+        assert issue.number == 42
+        sent = [call.kwargs["json"]["labels"] for call in mock_pool.post.call_args_list]
+        assert sent == [[1], [9]]
+
+    @pytest.mark.asyncio
+    async def test_label_created_concurrently_is_reused(
+        self,
+        provider: GiteaRestProvider,
+        mock_pool: AsyncMock,
+    ) -> None:
+        """Should pick up a label another client created between listing and creating."""
+        mock_pool.get = AsyncMock(
+            side_effect=[self._response(200, []), self._response(200, [{"id": 4, "name": "task"}])]
+        )
+        mock_pool.post = AsyncMock(return_value=self._response(409, {"message": "label already exists"}))
+        provider._pool = mock_pool
+
+        assert await provider._get_or_create_label_ids(["task"]) == [4]
+
+    @pytest.mark.asyncio
+    async def test_label_listing_follows_pagination(
+        self,
+        provider: GiteaRestProvider,
+        mock_pool: AsyncMock,
+    ) -> None:
+        """Should list every page of labels before deciding one is missing."""
+        first = [{"id": n, "name": f"label-{n}"} for n in range(DEFAULT_PAGE_SIZE)]
+        mock_pool.get = AsyncMock(
+            side_effect=[
+                self._response(200, first, headers={"link": '<https://x/labels?page=2>; rel="next"'}),
+                self._response(200, [{"id": 999, "name": "task"}]),
+            ]
+        )
+        provider._pool = mock_pool
+
+        assert await provider._get_or_create_label_ids(["task", "label-0"]) == [999, 0]
+        mock_pool.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_label_ids_shared_through_disk_tier(
+        self,
+        mock_pool: AsyncMock,
+        sample_label_data: list[dict],
+        tmp_path,
+    ) -> None:
+        """Should reuse label IDs a previous process stored, and drop them when stale."""
+        disk = DiskCache(tmp_path / "cache.db")
+        mock_pool.get = AsyncMock(return_value=self._response(200, sample_label_data))
+
+        with patch("repo_sapiens.providers.gitea_rest.get_disk_cache", return_value=disk):
+            first, second = (GiteaRestProvider("https://gitea.example.com", "token", "owner", "repo") for _ in range(2))
+            first._pool = second._pool = mock_pool
+
+            assert await first._get_or_create_label_ids(["bug"]) == [1]
+            assert await second._get_or_create_label_ids(["bug", "documentation"]) == [1, 3]
+            assert mock_pool.get.await_count == 1
+
+            await second.invalidate_label_cache()
+            assert await disk.get(second._label_cache_key) is None
+
+        disk.close()
+
 
 # =============================================================================
 # Model Parsing Tests - Consolidated
@@ -182,6 +182,7 @@ class TestGitHubRestProviderIssues:
         mock_repo.get_issues.assert_called_once()
         call_args = mock_repo.get_issues.call_args
         assert call_args.kwargs["labels"] == ["bug", "high-priority"]
+        assert (call_args.kwargs["sort"], call_args.kwargs["direction"]) == ("created", "asc")
 
     @pytest.mark.asyncio
     @patch("repo_sapiens.providers.github_rest.Github")
@@ -211,6 +212,46 @@ class TestGitHubRestProviderIssues:
         assert issue.number == 123
         assert issue.state == IssueState.CLOSED
 
+    @pytest.mark.asyncio
+    @patch("repo_sapiens.providers.github_rest.Github")
+    async def test_get_issue_revalidates_with_etag(self, mock_github_class, provider, mock_gh_issue):
+        """Should reuse the converted issue when PyGithub's conditional update reports 304."""
+        mock_gh_issue.update = Mock(return_value=False)
+        mock_repo = Mock()
+        mock_repo.get_issue = Mock(return_value=mock_gh_issue)
+        mock_client = Mock()
+        mock_client.get_repo = Mock(return_value=mock_repo)
+        mock_github_class.return_value = mock_client
+
+        await provider.connect()
+        first = await provider.get_issue(42)
+        first.labels.append("mutated")
+        second = await provider.get_issue(42)
+
+        # Revalidated issues are copies, so callers can't change each other's
+        assert second is not first
+        assert "mutated" not in second.labels
+        mock_repo.get_issue.assert_called_once_with(42)
+        mock_gh_issue.update.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("repo_sapiens.providers.github_rest.Github")
+    async def test_get_issue_reconverts_when_modified(self, mock_github_class, provider, mock_gh_issue):
+        """Should convert again when the conditional update returns new data."""
+        mock_gh_issue.update = Mock(return_value=True)
+        mock_repo = Mock()
+        mock_repo.get_issue = Mock(return_value=mock_gh_issue)
+        mock_client = Mock()
+        mock_client.get_repo = Mock(return_value=mock_repo)
+        mock_github_class.return_value = mock_client
+
+        await provider.connect()
+        await provider.get_issue(42)
+        mock_gh_issue.title = "Renamed"
+        issue = await provider.get_issue(42)
+
+        assert issue.title == "Renamed"
+
     @pytest.mark.asyncio
     @patch("repo_sapiens.providers.github_rest.Github")
     async def test_create_issue(self, mock_github_class, provider, mock_gh_issue):
@@ -326,6 +367,50 @@ class TestGitHubRestProviderComments:
         assert comments[0].body == "First"
         assert comments[1].body == "Second"
 
+    @pytest.mark.asyncio
+    @patch("repo_sapiens.providers.github_rest.Github")
+    async def test_calls_report_rate_limit_budget(self, mock_github_class, provider):
+        """Should pass the budget PyGithub parsed to the rate limiter after each call."""
+        mock_issue = Mock()
+        mock_issue.get_comments = Mock(return_value=[])
+        mock_repo = Mock()
+        mock_repo.get_issue = Mock(return_value=mock_issue)
+        mock_client = Mock()
+        mock_client.get_repo = Mock(return_value=mock_repo)
+        mock_client.requester.rate_limiting = (4321, 5000)
+        mock_client.requester.rate_limiting_resettime = int(datetime.now(UTC).timestamp()) + 600
+        mock_github_class.return_value = mock_client
+
+        await provider.connect()
+        await provider.get_comments(42)
+
+        assert provider.rate_limiter.remaining == 4321
+        assert provider.rate_limiter.limit == 5000
+
+    @pytest.mark.asyncio
+    @patch("repo_sapiens.providers.github_rest.Github")
+    async def test_get_comments_since(self, mock_github_class, provider):
+        """Should pass since to PyGithub and drop older comments returned for edits."""
+        since = datetime(2024, 6, 15, tzinfo=UTC)
+        mock_comments = [
+            Mock(id=1, body="Edited", user=Mock(login="user1"), created_at=datetime(2024, 6, 10, tzinfo=UTC)),
+            Mock(id=2, body="New", user=Mock(login="user2"), created_at=datetime(2024, 6, 16, tzinfo=UTC)),
+        ]
+
+        mock_issue = Mock()
+        mock_issue.get_comments = Mock(return_value=mock_comments)
+        mock_repo = Mock()
+        mock_repo.get_issue = Mock(return_value=mock_issue)
+        mock_client = Mock()
+        mock_client.get_repo = Mock(return_value=mock_repo)
+        mock_github_class.return_value = mock_client
+
+        await provider.connect()
+        comments = await provider.get_comments(42, since=since)
+
+        assert [c.id for c in comments] == [2]
+        mock_issue.get_comments.assert_called_once_with(since=since)
+
 
 # =============================================================================
 # Branch Operations Tests
@@ -0,0 +1,469 @@
+"""Tests for repo_sapiens/providers/github_async.py - native async GitHub provider."""
+
+import base64
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from repo_sapiens.models.domain import IssueState
+from repo_sapiens.providers.github_async import DIFF_MEDIA_TYPE, GitHubAsyncProvider
+from repo_sapiens.utils.connection_pool import HTTPConnectionPool
+from repo_sapiens.utils.pagination import DEFAULT_PAGE_SIZE
+
+REPO = "/repos/test-owner/test-repo"
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def respond(status: int = 200, json: Any = None, text: str | None = None, headers: dict | None = None):
+    """Build an httpx.Response bound to a request, so raise_for_status works."""
+    if text is not None:
+        response = httpx.Response(status, text=text, headers=headers)
+    else:
+        response = httpx.Response(status, json=json, headers=headers)
+    response.request = httpx.Request("GET", "https://api.github.com")
+    return response
+
+
+@pytest.fixture
+def provider() -> GitHubAsyncProvider:
+    """Create a GitHubAsyncProvider instance for testing."""
+    return GitHubAsyncProvider(
+        token="ghp_test_token",
+        owner="test-owner",
+        repo="test-repo",
+        base_url="https://api.github.com/",
+    )
+
+
+@pytest.fixture
+def mock_pool(provider: GitHubAsyncProvider) -> AsyncMock:
+    """Attach a mock HTTPConnectionPool to the provider."""
+    pool = AsyncMock(spec=HTTPConnectionPool)
+    provider._pool = pool
+    return pool
+
+
+@pytest.fixture
+def issue_data() -> dict:
+    """Sample issue data as returned by the GitHub API."""
+    return {
+        "id": 1001,
+        "number": 42,
+        "title": "Fix authentication bug",
+        "body": None,
+        "state": "open",
+        "labels": [{"id": 1, "name": "bug"}, {"id": 2, "name": "needs-planning"}],
+        "created_at": "2024-06-15T10:30:00Z",
+        "updated_at": "2024-06-16T14:45:00Z",
+        "user": {"login": "developer123"},
+        "html_url": "https://github.com/test-owner/test-repo/issues/42",
+    }
+
+
+@pytest.fixture
+def comment_data() -> dict:
+    """Sample comment data as returned by the GitHub API."""
+    return {
+        "id": 5001,
+        "body": "Looks good",
+        "user": {"login": "reviewer"},
+        "created_at": "2024-06-16T16:00:00Z",
+    }
+
+
+@pytest.fixture
+def pr_data() -> dict:
+    """Sample pull request data as returned by the GitHub API."""
+    return {
+        "id": 2001,
+        "number": 15,
+        "title": "Fix authentication",
+        "body": "Resolves #42",
+        "state": "open",
+        "head": {"ref": "feature/auth-fix"},
+        "base": {"ref": "main"},
+        "html_url": "https://github.com/test-owner/test-repo/pull/15",
+        "created_at": "2024-06-17T09:00:00Z",
+        "user": {"login": "developer123"},
+    }
+
+
+# =============================================================================
+# Connection Tests
+# =============================================================================
+
+
+class TestConnection:
+    """Tests for connection management."""
+
+    def test_init_strips_trailing_slash(self, provider: GitHubAsyncProvider) -> None:
+        assert provider.base_url == "https://api.github.com"
+        assert provider._pool is None
+
+    def test_pool_requires_connect(self, provider: GitHubAsyncProvider) -> None:
+        with pytest.raises(RuntimeError, match="not connected"):
+            _ = provider.pool
+
+    @pytest.mark.asyncio
+    @patch("repo_sapiens.providers.github_async.get_pool")
+    async def test_connect_uses_shared_pool(self, mock_get_pool: AsyncMock, provider: GitHubAsyncProvider) -> None:
+        pool = AsyncMock(spec=HTTPConnectionPool)
+        pool.get = AsyncMock(return_value=respond(json={"full_name": "test-owner/test-repo"}))
+        mock_get_pool.return_value = pool
+
+        await provider.connect()
+
+        kwargs = mock_get_pool.call_args.kwargs
+        assert kwargs["name"] == "github-https://api.github.com"
+        assert kwargs["base_url"] == "https://api.github.com"
+        assert kwargs["headers"]["Authorization"] == "Bearer ghp_test_token"
+        assert kwargs["headers"]["Accept"] == "application/vnd.github+json"
+        pool.get.assert_awaited_once_with(REPO)
+        assert provider._pool is pool
+
+    @pytest.mark.asyncio
+    @patch("repo_sapiens.providers.github_async.get_pool")
+    async def test_connect_fails_without_repo_access(
+        self, mock_get_pool: AsyncMock, provider: GitHubAsyncProvider
+    ) -> None:
+        pool = AsyncMock(spec=HTTPConnectionPool)
+        pool.get = AsyncMock(return_value=respond(404, json={"message": "Not Found"}))
+        mock_get_pool.return_value = pool
+
+        with pytest.raises(ConnectionError, match="404"):
+            await provider.connect()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_clears_pool(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        await provider.disconnect()
+
+        assert provider._pool is None
+
+
+# =============================================================================
+# Issue Tests
+# =============================================================================
+
+
+class TestIssues:
+    """Tests for issue operations."""
+
+    @pytest.mark.asyncio
+    async def test_get_issues_skips_pull_requests(
+        self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, issue_data: dict
+    ) -> None:
+        pull = dict(issue_data, number=43, pull_request={"url": "https://api.github.com/..."})
+        mock_pool.get = AsyncMock(return_value=respond(json=[issue_data, pull]))
+
+        issues = await provider.get_issues(labels=["bug", "needs-planning"])
+
+        assert [issue.number for issue in issues] == [42]
+        issue = issues[0]
+        assert issue.body == ""
+        assert issue.state == IssueState.OPEN
+        assert issue.labels == ["bug", "needs-planning"]
+        assert issue.created_at == datetime(2024, 6, 15, 10, 30, tzinfo=UTC)
+        params = mock_pool.get.call_args.kwargs["params"]
+        assert params["labels"] == "bug,needs-planning"
+        assert params["per_page"] == str(DEFAULT_PAGE_SIZE)
+        assert (params["sort"], params["direction"]) == ("created", "asc")
+
+    @pytest.mark.asyncio
+    async def test_get_issues_pages_by_raw_item_count(
+        self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, issue_data: dict
+    ) -> None:
+        """A full page that is mostly pull requests still has a successor."""
+        first = [dict(issue_data, number=n, pull_request={}) for n in range(DEFAULT_PAGE_SIZE - 1)]
+        first.append(dict(issue_data, number=100))
+        link = {"link": f'<https://api.github.com{REPO}/issues?page=2>; rel="next"'}
+        mock_pool.get = AsyncMock(side_effect=[respond(json=first, headers=link), respond(json=[issue_data])])
+
+        issues = await provider.get_issues()
+
+        assert [issue.number for issue in issues] == [100, 42]
+        assert [call.kwargs["params"]["page"] for call in mock_pool.get.call_args_list] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_get_issue_maps_ghost_author(
+        self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, issue_data: dict
+    ) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(json=dict(issue_data, user=None, state="closed")))
+
+        issue = await provider.get_issue(42)
+
+        assert issue.author == "unknown"
+        assert issue.state == IssueState.CLOSED
+        mock_pool.get.assert_awaited_once_with(f"{REPO}/issues/42")
+
+    @pytest.mark.asyncio
+    async def test_create_issue_sends_label_names(
+        self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, issue_data: dict
+    ) -> None:
+        mock_pool.post = AsyncMock(return_value=respond(201, json=issue_data))
+
+        issue = await provider.create_issue("Title", "Body", labels=["bug"])
+
+        assert issue.number == 42
+        mock_pool.post.assert_awaited_once_with(
+            f"{REPO}/issues", json={"title": "Title", "body": "Body", "labels": ["bug"]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_issue_is_a_single_request(
+        self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, issue_data: dict
+    ) -> None:
+        mock_pool.patch = AsyncMock(return_value=respond(json=dict(issue_data, state="closed")))
+
+        issue = await provider.update_issue(42, labels=["done"], state="closed")
+
+        assert issue.state == IssueState.CLOSED
+        mock_pool.patch.assert_awaited_once_with(f"{REPO}/issues/42", json={"state": "closed", "labels": ["done"]})
+        mock_pool.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_issue_without_changes_fetches(
+        self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, issue_data: dict
+    ) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(json=issue_data))
+
+        await provider.update_issue(42)
+
+        mock_pool.patch.assert_not_called()
+        mock_pool.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_http_errors_propagate(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(404, json={"message": "Not Found"}))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await provider.get_issue(999)
+
+
+# =============================================================================
+# Comment Tests
+# =============================================================================
+
+
+class TestComments:
+    """Tests for comment operations."""
+
+    @pytest.mark.asyncio
+    async def test_add_comment(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, comment_data: dict) -> None:
+        mock_pool.post = AsyncMock(return_value=respond(201, json=comment_data))
+
+        comment = await provider.add_comment(42, "Looks good")
+
+        assert comment.id == 5001
+        assert comment.author == "reviewer"
+        mock_pool.post.assert_awaited_once_with(f"{REPO}/issues/42/comments", json={"body": "Looks good"})
+
+    @pytest.mark.asyncio
+    async def test_get_comments_follows_pages(
+        self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, comment_data: dict
+    ) -> None:
+        first = [dict(comment_data, id=n) for n in range(DEFAULT_PAGE_SIZE)]
+        mock_pool.get = AsyncMock(side_effect=[respond(json=first), respond(json=[dict(comment_data, id=999)])])
+
+        comments = await provider.get_comments(42)
+
+        assert len(comments) == DEFAULT_PAGE_SIZE + 1
+        assert comments[-1].id == 999
+
+    @pytest.mark.asyncio
+    async def test_get_comments_since_drops_edited_older_comments(
+        self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, comment_data: dict
+    ) -> None:
+        since = datetime(2024, 6, 16, 12, 0, tzinfo=UTC)
+        older = dict(comment_data, id=1, created_at="2024-06-10T00:00:00Z")
+        mock_pool.get = AsyncMock(return_value=respond(json=[older, comment_data]))
+
+        comments = await provider.get_comments(42, since=since)
+
+        assert [c.id for c in comments] == [5001]
+        assert mock_pool.get.call_args.kwargs["params"]["since"] == since.isoformat()
+
+
+# =============================================================================
+# Branch, Diff and File Tests
+# =============================================================================
+
+
+class TestBranches:
+    """Tests for branch operations."""
+
+    @pytest.mark.asyncio
+    async def test_get_branch(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        mock_pool.get = AsyncMock(
+            return_value=respond(json={"name": "main", "commit": {"sha": "abc123"}, "protected": True})
+        )
+
+        branch = await provider.get_branch("main")
+
+        assert branch is not None
+        assert branch.sha == "abc123"
+        assert branch.protected is True
+
+    @pytest.mark.asyncio
+    async def test_get_missing_branch_returns_none(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(404, json={"message": "Branch not found"}))
+
+        assert await provider.get_branch("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_create_branch_from_ref(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(json={"object": {"sha": "base-sha"}}))
+        mock_pool.post = AsyncMock(return_value=respond(201, json={"object": {"sha": "base-sha"}}))
+
+        branch = await provider.create_branch("feature/x", from_branch="main")
+
+        assert (branch.name, branch.sha) == ("feature/x", "base-sha")
+        mock_pool.get.assert_awaited_once_with(f"{REPO}/git/ref/heads/main")
+        mock_pool.post.assert_awaited_once_with(
+            f"{REPO}/git/refs", json={"ref": "refs/heads/feature/x", "sha": "base-sha"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_existing_branch_returns_it(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        mock_pool.get = AsyncMock(
+            side_effect=[
+                respond(json={"object": {"sha": "base-sha"}}),
+                respond(json={"name": "feature/x", "commit": {"sha": "old-sha"}}),
+            ]
+        )
+        mock_pool.post = AsyncMock(return_value=respond(422, json={"message": "Reference already exists"}))
+
+        branch = await provider.create_branch("feature/x")
+
+        assert branch.sha == "old-sha"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("status", "expected"), [(204, True), (422, False), (404, False)])
+    async def test_delete_branch(
+        self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, status: int, expected: bool
+    ) -> None:
+        mock_pool.delete = AsyncMock(return_value=respond(status, text=""))
+
+        assert await provider.delete_branch("feature/x") is expected
+        mock_pool.delete.assert_awaited_once_with(f"{REPO}/git/refs/heads/feature/x")
+
+    @pytest.mark.asyncio
+    async def test_get_diff_requests_diff_media_type(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(text="diff --git a/x b/x\n+new\n"))
+
+        diff = await provider.get_diff("main", "feature/x")
+
+        assert diff.startswith("diff --git a/x b/x")
+        mock_pool.get.assert_awaited_once_with(f"{REPO}/compare/main...feature/x", headers={"Accept": DIFF_MEDIA_TYPE})
+
+    @pytest.mark.asyncio
+    async def test_get_diff_for_pull_request(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(text="diff"))
+
+        await provider.get_diff("main", "feature/x", pr_number=15)
+
+        assert mock_pool.get.call_args.args[0] == f"{REPO}/pulls/15"
+
+    @pytest.mark.asyncio
+    async def test_merge_branches(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        mock_pool.post = AsyncMock(return_value=respond(201, json={"sha": "merge-sha"}))
+
+        await provider.merge_branches("feature/x", "main", "Merge feature/x")
+
+        mock_pool.post.assert_awaited_once_with(
+            f"{REPO}/merges", json={"base": "main", "head": "feature/x", "commit_message": "Merge feature/x"}
+        )
+
+
+class TestFiles:
+    """Tests for file operations."""
+
+    @pytest.mark.asyncio
+    async def test_get_file_decodes_content(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        encoded = base64.b64encode(b"print('hi')\n").decode()
+        mock_pool.get = AsyncMock(return_value=respond(json={"content": encoded, "sha": "blob"}))
+
+        assert await provider.get_file("app.py", ref="dev") == "print('hi')\n"
+        assert mock_pool.get.call_args.kwargs["params"] == {"ref": "dev"}
+
+    @pytest.mark.asyncio
+    async def test_get_file_rejects_directory(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(json=[{"name": "a.py"}]))
+
+        with pytest.raises(ValueError, match="directory"):
+            await provider.get_file("src")
+
+    @pytest.mark.asyncio
+    async def test_commit_file_updates_existing(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(json={"sha": "old-blob", "content": ""}))
+        mock_pool.put = AsyncMock(return_value=respond(json={"commit": {"sha": "commit-sha"}}))
+
+        sha = await provider.commit_file("app.py", "new", "Update app", "feature/x")
+
+        assert sha == "commit-sha"
+        body = mock_pool.put.call_args.kwargs["json"]
+        assert body["sha"] == "old-blob"
+        assert base64.b64decode(body["content"]) == b"new"
+        assert body["branch"] == "feature/x"
+
+    @pytest.mark.asyncio
+    async def test_commit_file_creates_new(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(404, json={"message": "Not Found"}))
+        mock_pool.put = AsyncMock(return_value=respond(201, json={"commit": {"sha": "commit-sha"}}))
+
+        await provider.commit_file("new.py", "x", "Add file", "main")
+
+        assert "sha" not in mock_pool.put.call_args.kwargs["json"]
+
+
+# =============================================================================
+# Pull Request and Label Tests
+# =============================================================================
+
+
+class TestPullRequests:
+    """Tests for pull request operations."""
+
+    @pytest.mark.asyncio
+    async def test_create_pull_request_with_labels(
+        self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, pr_data: dict
+    ) -> None:
+        mock_pool.post = AsyncMock(side_effect=[respond(201, json=pr_data), respond(json=[{"name": "review"}])])
+
+        pr = await provider.create_pull_request("Fix", "Body", head="feature/auth-fix", labels=["review"])
+
+        assert (pr.number, pr.head, pr.base, pr.author) == (15, "feature/auth-fix", "main", "developer123")
+        label_call = mock_pool.post.call_args_list[1]
+        assert label_call.args[0] == f"{REPO}/issues/15/labels"
+        assert label_call.kwargs["json"] == {"labels": ["review"]}
+
+    @pytest.mark.asyncio
+    async def test_get_pull_request(self, provider: GitHubAsyncProvider, mock_pool: AsyncMock, pr_data: dict) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(json=pr_data))
+
+        pr = await provider.get_pull_request(15)
+
+        assert pr.title == "Fix authentication"
+        mock_pool.get.assert_awaited_once_with(f"{REPO}/pulls/15")
+
+
+class TestLabels:
+    """Tests for automation label setup."""
+
+    @pytest.mark.asyncio
+    async def test_setup_automation_labels_creates_missing(
+        self, provider: GitHubAsyncProvider, mock_pool: AsyncMock
+    ) -> None:
+        mock_pool.get = AsyncMock(return_value=respond(json=[{"id": 1, "name": "needs-planning"}]))
+        mock_pool.post = AsyncMock(return_value=respond(201, json={"id": 2, "name": "approved"}))
+
+        result = await provider.setup_automation_labels(["needs-planning", "approved"])
+
+        assert result == {"needs-planning": 1, "approved": 2}
+        mock_pool.post.assert_awaited_once()
+        assert mock_pool.post.call_args.kwargs["json"]["color"] == "0e8a16"
@@ -14,6 +14,7 @@ Key GitLab differences tested:
 """
 
 import base64
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -22,6 +23,7 @@ import pytest
 from repo_sapiens.models.domain import IssueState
 from repo_sapiens.providers.gitlab_rest import GitLabRestProvider
 from repo_sapiens.utils.connection_pool import HTTPConnectionPool
+from repo_sapiens.utils.pagination import DEFAULT_PAGE_SIZE
 
 # =============================================================================
 # Fixtures
@@ -349,6 +351,35 @@ class TestGitLabRestProviderIssues:
         call_args = mock_pool.get.call_args
         assert call_args.kwargs["params"]["labels"] == "bug,critical"
 
+    @pytest.mark.asyncio
+    async def test_get_issues_follows_next_page_header(
+        self,
+        provider: GitLabRestProvider,
+        mock_pool: AsyncMock,
+        sample_issue_data: dict,
+    ) -> None:
+        """Should keep fetching while X-Next-Page points at another page."""
+        first = [dict(sample_issue_data, iid=n) for n in range(1, DEFAULT_PAGE_SIZE + 1)]
+        second = [dict(sample_issue_data, iid=DEFAULT_PAGE_SIZE + 1)]
+        responses = [
+            httpx.Response(200, json=first, headers={"x-next-page": "2"}),
+            httpx.Response(200, json=second, headers={"x-next-page": ""}),
+        ]
+        for response in responses:
+            response.request = httpx.Request("GET", "https://gitlab.example.com")
+        mock_pool.get = AsyncMock(side_effect=responses)
+        provider._pool = mock_pool
+
+        issues = await provider.get_issues()
+
+        assert len(issues) == DEFAULT_PAGE_SIZE + 1
+        assert issues[-1].number == DEFAULT_PAGE_SIZE + 1
+        params = [call.kwargs["params"] for call in mock_pool.get.call_args_list]
+        assert [p["page"] for p in params] == ["1", "2"]
+        assert params[0]["per_page"] == str(DEFAULT_PAGE_SIZE)
+        # Oldest first, so ascending order holds across pages
+        assert (params[0]["order_by"], params[0]["sort"]) == ("created_at", "asc")
+
     @pytest.mark.asyncio
     async def test_get_issue_by_number(
         self,
@@ -610,6 +641,48 @@ class TestGitLabRestProviderComments:
 
         assert len(comments) == 0
 
+    @pytest.mark.asyncio
+    async def test_get_comments_since_stops_paging_at_older_notes(
+        self,
+        provider: GitLabRestProvider,
+        mock_pool: AsyncMock,
+    ) -> None:
+        """Should page newest first and stop once a page reaches back past since."""
+
+        def note(note_id: int, day: int, system: bool = False) -> dict:
+            return {
+                "id": note_id,
+                "body": f"note {note_id}",
+                "author": {"username": "reviewer"},
+                "created_at": f"2024-06-{day:02d}T08:00:00Z",
+                "system": system,
+            }
+
+        pages = {
+            "1": [note(5, 15), note(4, 14, system=True)],
+            "2": [note(3, 13), note(2, 12)],
+            "3": [note(1, 11)],
+        }
+
+        async def get(path: str, params: dict) -> MagicMock:
+            response = MagicMock()
+            response.json.return_value = pages[params["page"]]
+            response.raise_for_status = MagicMock()
+            response.headers = {}
+            return response
+
+        mock_pool.get = AsyncMock(side_effect=get)
+        provider._pool = mock_pool
+
+        with patch("repo_sapiens.providers.gitlab_rest.DEFAULT_PAGE_SIZE", 2):
+            comments = await provider.get_comments(42, since=datetime(2024, 6, 13, tzinfo=UTC))
+
+        assert [c.id for c in comments] == [3, 5]
+        assert mock_pool.get.await_count == 2
+        params = mock_pool.get.call_args.kwargs["params"]
+        assert params["order_by"] == "created_at"
+        assert params["sort"] == "desc"
+
 
 # =============================================================================
 # Merge Request Operations Tests
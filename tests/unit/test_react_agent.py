@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from repo_sapiens.agents.backends import ChatChunk, ChatResponse, ToolCall
 from repo_sapiens.agents.react import ReActAgentProvider, ReActConfig, TrajectoryStep
 from repo_sapiens.agents.tools import ToolRegistry
 from repo_sapiens.models.domain import Task, TaskResult
@@ -1359,39 +1361,12 @@ class TestToolEdgeCases:
         assert "not a directory" in result
 
     @pytest.mark.asyncio
-    async def test_search_files_grep_not_found(self, registry, temp_dir):
-        """Test search_files when grep command not found."""
-        (temp_dir / "file.txt").write_text("content")
-
-        with patch("subprocess.run", side_effect=FileNotFoundError("grep not found")):
-            result = await registry.execute("search_files", {"pattern": "content", "path": "."})
-        assert "grep command not found" in result
-
-    @pytest.mark.asyncio
-    async def test_search_files_timeout(self, registry, temp_dir):
-        """Test search_files timeout."""
-        import subprocess
+    async def test_search_files_invalid_regex_matches_literally(self, registry, temp_dir):
+        """Test search_files falls back to a literal search for invalid regexes."""
+        (temp_dir / "file.txt").write_text("call(foo\nother\n")
 
-        (temp_dir / "file.txt").write_text("content")
-
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("grep", 30)):
-            result = await registry.execute("search_files", {"pattern": "content", "path": "."})
-        assert "timed out" in result.lower()
-
-    @pytest.mark.asyncio
-    async def test_search_files_grep_error(self, registry, temp_dir):
-        """Test search_files when grep returns error."""
-
-        (temp_dir / "file.txt").write_text("content")
-
-        mock_result = MagicMock()
-        mock_result.returncode = 2
-        mock_result.stderr = "grep: invalid option"
-        mock_result.stdout = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            result = await registry.execute("search_files", {"pattern": "content", "path": "."})
-        assert "Error" in result or "invalid option" in result
+        result = await registry.execute("search_files", {"pattern": "call(", "path": "."})
+        assert result == "file.txt:1:call(foo"
 
     @pytest.mark.asyncio
     async def test_search_files_many_results_truncated(self, registry, temp_dir):
@@ -1401,15 +1376,9 @@ class TestToolEdgeCases:
         lines = [f"match line {i}" for i in range(100)]
         (temp_dir / "file.txt").write_text("\n".join(lines))
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stderr = ""
-        # Return more than 50 matches
-        mock_result.stdout = "\n".join([f"file.txt:{i}:match line {i}" for i in range(60)])
-
-        with patch("subprocess.run", return_value=mock_result):
-            result = await registry.execute("search_files", {"pattern": "match", "path": "."})
+        result = await registry.execute("search_files", {"pattern": "match", "path": "."})
         assert "Truncated" in result
+        assert result.count("match line") == 50
 
     @pytest.mark.asyncio
     async def test_find_files_is_file_not_dir(self, registry, temp_dir):
@@ -1621,27 +1590,12 @@ class TestToolsAdditionalCoverage:
             result = await registry.execute("run_command", {"command": "echo test"})
         assert "Error running command" in result
 
-    @pytest.mark.asyncio
-    async def test_search_files_empty_output(self, registry, temp_dir):
-        """Test search_files when grep returns empty output."""
-
-        (temp_dir / "file.txt").write_text("content")
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stderr = ""
-        mock_result.stdout = ""  # Empty output
-
-        with patch("subprocess.run", return_value=mock_result):
-            result = await registry.execute("search_files", {"pattern": "pattern", "path": "."})
-        assert "No matches found" in result
-
     @pytest.mark.asyncio
     async def test_search_files_general_exception(self, registry, temp_dir):
         """Test search_files handles general exceptions."""
         (temp_dir / "file.txt").write_text("content")
 
-        with patch("subprocess.run", side_effect=RuntimeError("Unexpected")):
+        with patch.object(registry.index, "search", side_effect=RuntimeError("Unexpected")):
             result = await registry.execute("search_files", {"pattern": "pattern", "path": "."})
         assert "Error:" in result
 
@@ -1665,7 +1619,7 @@ class TestToolsAdditionalCoverage:
     @pytest.mark.asyncio
     async def test_find_files_general_exception(self, registry, temp_dir):
         """Test find_files handles general exceptions."""
-        with patch.object(Path, "glob", side_effect=RuntimeError("Unexpected")):
+        with patch.object(registry.index, "find", side_effect=RuntimeError("Unexpected")):
             result = await registry.execute("find_files", {"pattern": "*.txt"})
         assert "Error:" in result
 
@@ -1793,3 +1747,386 @@ ACTION_INPUT: {"summary": "Review complete - looks good"}
         # Comments should include the summary from the finish action
         assert "Review passed" in review.comments
         assert review.approved is True  # "approve" in thought
+
+
+class TestStreamingStep:
+    """Tests for streamed generation in _generate_step."""
+
+    @pytest.fixture
+    def agent(self, tmp_path):
+        """Create an agent using text-based tool parsing."""
+        return ReActAgentProvider(
+            working_dir=tmp_path,
+            config=ReActConfig(model="test-model", use_native_tools=False),
+        )
+
+    @staticmethod
+    def stream_of(deltas, seen):
+        """Build a fake chat_stream yielding deltas and recording how far it got."""
+
+        async def chat_stream(**kwargs):
+            try:
+                for delta in deltas:
+                    seen.append(delta)
+                    yield ChatChunk(content=delta)
+                yield ChatChunk(done=True)
+            finally:
+                seen.append("closed")
+
+        return chat_stream
+
+    @pytest.mark.asyncio
+    async def test_stops_after_complete_action_input(self, agent):
+        """Test generation is cut once the ACTION_INPUT object is closed."""
+        seen: list[str] = []
+        deltas = [
+            "THOUGHT: Read it.\nACTION: read_file\nACTION_INPUT: ",
+            '{"path": "a{b}.txt",',
+            ' "opts": {"n": 1}',
+            "}",
+            "\nOBSERVATION: hallucinated",
+        ]
+
+        with patch.object(agent.backend, "chat_stream", self.stream_of(deltas, seen)):
+            result = await agent._generate_step("Test task")
+
+        assert result.endswith('"opts": {"n": 1}}')
+        assert seen == deltas[:4] + ["closed"]
+
+    @pytest.mark.asyncio
+    async def test_reads_whole_stream_without_action_input(self, agent):
+        """Test responses without a complete action are read to the end."""
+        seen: list[str] = []
+        deltas = ["THOUGHT: thinking", " more\nACTION: finish\nACTION_INPUT: {invalid}"]
+
+        with patch.object(agent.backend, "chat_stream", self.stream_of(deltas, seen)):
+            result = await agent._generate_step("Test task")
+
+        assert result == "".join(deltas)
+        assert seen == deltas + ["closed"]
+
+    @pytest.mark.asyncio
+    async def test_stream_disabled_uses_chat(self, agent):
+        """Test stream=False falls back to a single chat request."""
+        agent.config.stream = False
+        response = ChatResponse(content="THOUGHT: x\nACTION: finish\nACTION_INPUT: {}", tool_calls=[], raw={})
+
+        with patch.object(agent.backend, "chat", AsyncMock(return_value=response)) as chat:
+            result = await agent._generate_step("Test task")
+
+        chat.assert_awaited_once()
+        assert result == response.content
+
+
+class TestPromptContext:
+    """Tests for prompt reuse across ReAct iterations."""
+
+    @pytest.fixture
+    def agent(self, tmp_path):
+        """Create an agent using text-based tool parsing without streaming."""
+        return ReActAgentProvider(
+            working_dir=tmp_path,
+            config=ReActConfig(model="test-model", use_native_tools=False, stream=False),
+        )
+
+    @pytest.mark.asyncio
+    async def test_messages_extend_previous_prefix(self, agent, tmp_path):
+        """Test each request repeats the previous request's messages unchanged."""
+        (tmp_path / "a.txt").write_text("hello")
+        replies = iter(
+            [
+                'THOUGHT: read\nACTION: read_file\nACTION_INPUT: {"path": "a.txt"}',
+                "THOUGHT: look\nACTION: list_directory\nACTION_INPUT: {}",
+                'THOUGHT: done\nACTION: finish\nACTION_INPUT: {"answer": "hello"}',
+            ]
+        )
+        requests: list[list[dict]] = []
+
+        async def chat(messages, **kwargs):
+            requests.append(messages)
+            return ChatResponse(content=next(replies), tool_calls=[], raw={})
+
+        task = Task(id="t", prompt_issue_id=0, title="Read", description="Read a.txt")
+        with patch.object(agent.backend, "chat", chat):
+            result = await agent.execute_task(task, {})
+
+        assert result.success is True
+        assert requests[1][:2] == requests[0]
+        assert requests[2][:4] == requests[1]
+
+        trajectory = agent.get_trajectory()
+        assert 0 < trajectory[0].prompt_tokens < trajectory[1].prompt_tokens
+
+    def test_system_prompt_rendered_once(self, agent):
+        """Test tool descriptions are rendered once per system prompt."""
+        with patch.object(agent.tools, "get_tool_descriptions", wraps=agent.tools.get_tool_descriptions) as render:
+            agent._sync_context("Task")
+            agent._sync_context("Task")
+
+        assert render.call_count == 1
+
+
+class TestParallelToolCalls:
+    """Tests for executing several tool calls from one response."""
+
+    @pytest.fixture
+    def registry(self, tmp_path):
+        """Create a ToolRegistry instance."""
+        return ToolRegistry(tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_read_only_calls_overlap(self, registry):
+        """Test read-only tools run concurrently."""
+        started = 0
+        all_started = asyncio.Event()
+
+        async def execute(tool_name, args):
+            nonlocal started
+            started += 1
+            if started == 3:
+                all_started.set()
+            # Deadlocks unless all three calls are in flight together
+            await all_started.wait()
+            return f"{tool_name} {args['path']}"
+
+        calls = [("read_file", {"path": "a"}), ("tree", {"path": "b"}), ("find_files", {"path": "c"})]
+        with patch.object(registry, "execute", execute):
+            results = await asyncio.wait_for(registry.execute_many(calls), timeout=5)
+
+        assert results == ["read_file a", "tree b", "find_files c"]
+
+    @pytest.mark.asyncio
+    async def test_same_path_runs_in_call_order(self, registry):
+        """Test a read waits for an earlier write to the same file."""
+        order: list[str] = []
+        other_done = asyncio.Event()
+
+        async def execute(tool_name, args):
+            if tool_name == "write_file":
+                await other_done.wait()
+            order.append(f"{tool_name} {args['path']}")
+            if args["path"] == "b.txt":
+                other_done.set()
+            return "ok"
+
+        calls = [
+            ("write_file", {"path": "a.txt"}),
+            ("read_file", {"path": "./a.txt"}),
+            ("read_file", {"path": "b.txt"}),
+        ]
+        with patch.object(registry, "execute", execute):
+            await asyncio.wait_for(registry.execute_many(calls), timeout=5)
+
+        assert order == ["read_file b.txt", "write_file a.txt", "read_file ./a.txt"]
+
+    @pytest.mark.asyncio
+    async def test_directory_readers_wait_for_earlier_writes(self, registry):
+        """Test a directory-level reader sees the writes issued before it, and only those."""
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def execute(tool_name, args):
+            if tool_name == "edit_file":
+                await release.wait()
+            order.append(tool_name)
+            if tool_name == "read_file":
+                release.set()
+            return "ok"
+
+        calls = [
+            ("edit_file", {"path": "a.txt"}),
+            ("search_files", {"pattern": "x"}),
+            ("write_file", {"path": "b.txt"}),
+            ("read_file", {"path": "c.txt"}),
+        ]
+        with patch.object(registry, "execute", execute):
+            await asyncio.wait_for(registry.execute_many(calls), timeout=5)
+
+        assert order == ["read_file", "edit_file", "search_files", "write_file"]
+
+    @pytest.mark.asyncio
+    async def test_run_command_is_a_barrier(self, registry):
+        """Test a command waits for every earlier call and every later call waits for it."""
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def execute(tool_name, args):
+            if args.get("path") == "slow":
+                await release.wait()
+            order.append(f"{tool_name} {args.get('path', '')}".strip())
+            if tool_name == "tree":
+                release.set()
+            return "ok"
+
+        calls = [
+            ("search_files", {"path": "slow"}),
+            ("tree", {"path": "fast"}),
+            ("run_command", {"command": "make"}),
+            ("find_files", {"path": "after"}),
+            ("read_file", {"path": "after.txt"}),
+        ]
+        with patch.object(registry, "execute", execute):
+            await asyncio.wait_for(registry.execute_many(calls), timeout=5)
+
+        assert order[:3] == ["tree fast", "search_files slow", "run_command"]
+        assert sorted(order[3:]) == ["find_files after", "read_file after.txt"]
+
+    @pytest.mark.asyncio
+    async def test_command_invalidates_index_when_it_finishes(self, registry, tmp_path):
+        """Test files a command creates are found even if a search ran while it was running."""
+        command = asyncio.create_task(registry.execute("run_command", {"command": "sleep 0.3; echo found > new.txt"}))
+        await asyncio.sleep(0.1)
+        # Re-walks the tree before the command has written its file
+        await registry.execute("search_files", {"pattern": "found"})
+        await command
+
+        result = await registry.execute("search_files", {"pattern": "found"})
+
+        assert "new.txt" in result
+
+    @pytest.mark.asyncio
+    async def test_real_tools(self, registry, tmp_path):
+        """Test real tool execution through execute_many."""
+        (tmp_path / "a.txt").write_text("alpha")
+        (tmp_path / "b.txt").write_text("beta")
+
+        results = await registry.execute_many(
+            [
+                ("read_file", {"path": "a.txt"}),
+                ("read_file", {"path": "b.txt"}),
+                ("write_file", {"path": "c.txt", "content": "gamma"}),
+                ("read_file", {"path": "c.txt"}),
+            ]
+        )
+
+        assert results[:2] == ["alpha", "beta"]
+        assert results[3] == "gamma"
+        assert registry.get_files_written() == ["c.txt"]
+
+    @pytest.mark.asyncio
+    async def test_agent_records_all_calls_in_one_step(self, tmp_path):
+        """Test all native tool calls of a response become one trajectory step."""
+        (tmp_path / "a.txt").write_text("alpha")
+        (tmp_path / "b.txt").write_text("beta")
+        agent = ReActAgentProvider(working_dir=tmp_path, config=ReActConfig(model="test-model", stream=False))
+        responses = iter(
+            [
+                ChatResponse(
+                    content="Read both",
+                    tool_calls=[
+                        ToolCall(id="1", name="read_file", arguments={"path": "a.txt"}),
+                        ToolCall(id="2", name="read_file", arguments={"path": "b.txt"}),
+                        ToolCall(id="3", name="finish", arguments={"answer": "guess"}),
+                    ],
+                    raw={},
+                ),
+                ChatResponse(
+                    content="",
+                    tool_calls=[ToolCall(id="4", name="finish", arguments={"answer": "alpha beta"})],
+                    raw={},
+                ),
+            ]
+        )
+        chat = AsyncMock(side_effect=lambda **kwargs: next(responses))
+
+        task = Task(id="t", prompt_issue_id=0, title="Read", description="Read a.txt and b.txt")
+        with patch.object(agent.backend, "chat", chat):
+            result = await agent.execute_task(task, {})
+
+        assert result.output == "alpha beta"
+        assert chat.await_count == 2
+
+        (step,) = agent.get_trajectory()
+        assert step.action == "read_file"
+        assert step.extra_actions == [("read_file", {"path": "b.txt"}), ("finish", {"answer": "guess"})]
+        assert "[1] read_file: alpha" in step.observation
+        assert "[2] read_file: beta" in step.observation
+        assert "[3] finish: Not finished" in step.observation
+
+        # The next request shows the model every call it made
+        assistant = chat.await_args_list[1].kwargs["messages"][2]["content"]
+        assert assistant.count("ACTION: read_file") == 2
+
+
+class TestFileCache:
+    """Tests for the file tools going through the registry's FileCache."""
+
+    @pytest.fixture
+    def registry(self, tmp_path):
+        return ToolRegistry(tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_read_file_line_range(self, registry, tmp_path):
+        """Test read_file returns only the requested lines."""
+        (tmp_path / "lines.txt").write_text("".join(f"line {i}\n" for i in range(1, 11)))
+
+        result = await registry.execute("read_file", {"path": "lines.txt", "start_line": "4", "end_line": 6})
+
+        assert result == "line 4\nline 5\nline 6"
+
+    @pytest.mark.asyncio
+    async def test_read_file_line_range_errors(self, registry, tmp_path):
+        """Test read_file rejects invalid or out-of-range line numbers."""
+        (tmp_path / "lines.txt").write_text("one\ntwo\n")
+
+        assert "line numbers" in await registry.execute("read_file", {"path": "lines.txt", "start_line": "x"})
+        assert "Invalid line range" in await registry.execute(
+            "read_file", {"path": "lines.txt", "start_line": 2, "end_line": 1}
+        )
+        assert "fewer than 5 lines" in await registry.execute("read_file", {"path": "lines.txt", "start_line": 5})
+
+    @pytest.mark.asyncio
+    async def test_edit_then_read_is_served_from_cache(self, registry, tmp_path):
+        """Test the registry's own writes keep the cache warm."""
+        (tmp_path / "app.py").write_text("x = 1\n")
+
+        await registry.execute("read_file", {"path": "app.py"})
+        await registry.execute("edit_file", {"path": "app.py", "old_text": "x = 1", "new_text": "x = 2"})
+        result = await registry.execute("read_file", {"path": "app.py"})
+
+        assert result == "x = 2\n"
+        assert registry.file_cache.stats() == {"hits": 2, "misses": 1, "hit_rate": 0.667}
+
+    @pytest.mark.asyncio
+    async def test_command_changes_are_seen(self, registry, tmp_path):
+        """Test a file changed by run_command is re-read."""
+        (tmp_path / "a.txt").write_text("before")
+        await registry.execute("read_file", {"path": "a.txt"})
+
+        await registry.execute("run_command", {"command": "echo after-the-command > a.txt"})
+
+        assert await registry.execute("read_file", {"path": "a.txt"}) == "after-the-command\n"
+
+    @pytest.mark.asyncio
+    async def test_edit_file_reports_all_occurrences(self, registry, tmp_path):
+        """Test a non-unique old_text reports the full count."""
+        (tmp_path / "a.txt").write_text("ab ab ab ab")
+
+        result = await registry.execute("edit_file", {"path": "a.txt", "old_text": "ab", "new_text": "c"})
+
+        assert "appears 4 times" in result
+
+    @pytest.mark.asyncio
+    async def test_task_result_reports_hit_rate(self, tmp_path):
+        """Test the cache statistics of a task are reported in TaskResult metadata."""
+        (tmp_path / "a.txt").write_text("alpha")
+        agent = ReActAgentProvider(working_dir=tmp_path, config=ReActConfig(model="test-model", stream=False))
+        responses = iter(
+            [
+                ChatResponse(
+                    content="", tool_calls=[ToolCall(id="1", name="read_file", arguments={"path": "a.txt"})], raw={}
+                ),
+                ChatResponse(
+                    content="", tool_calls=[ToolCall(id="2", name="read_file", arguments={"path": "a.txt"})], raw={}
+                ),
+                ChatResponse(
+                    content="", tool_calls=[ToolCall(id="3", name="finish", arguments={"answer": "alpha"})], raw={}
+                ),
+            ]
+        )
+
+        task = Task(id="t", prompt_issue_id=0, title="Read", description="Read a.txt")
+        with patch.object(agent.backend, "chat", AsyncMock(side_effect=lambda **kwargs: next(responses))):
+            result = await agent.execute_task(task, {})
+
+        assert result.metadata["file_cache"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
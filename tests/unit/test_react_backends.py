@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
 from repo_sapiens.agents.backends import (
+    ChatChunk,
+    ChatResponse,
     LLMBackend,
     OllamaBackend,
     OpenAIBackend,
+    ToolCall,
     create_backend,
 )
 from repo_sapiens.exceptions import AgentError, ProviderConnectionError
@@ -741,6 +746,146 @@ class TestLLMBackendAbstraction:
         assert callable(openai.chat)
 
 
+# =============================================================================
+# TestChatStream
+# =============================================================================
+
+
+def _streaming_client(body: str, captured: dict | None = None) -> httpx.AsyncClient:
+    """Create a client whose every request returns body as a streamed response."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if captured is not None:
+            captured["url"] = str(request.url)
+            captured["json"] = json.loads(request.content)
+        return httpx.Response(200, content=body.encode())
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def _collect(stream: AsyncIterator[ChatChunk]) -> list[ChatChunk]:
+    return [chunk async for chunk in stream]
+
+
+class TestChatStream:
+    """Tests for chat_stream on the concrete backends."""
+
+    @pytest.mark.asyncio
+    async def test_ollama_yields_deltas(self, ollama_backend: OllamaBackend) -> None:
+        """Test Ollama NDJSON lines become content chunks ending with done."""
+        captured: dict = {}
+        ollama_backend._client = _streaming_client(
+            '{"message": {"content": "Hel"}, "done": false}\n'
+            '{"message": {"content": "lo"}, "done": false}\n'
+            '{"message": {"content": ""}, "done": true}\n',
+            captured,
+        )
+
+        chunks = await _collect(ollama_backend.chat_stream([{"role": "user", "content": "Hi"}], model="qwen3"))
+
+        assert captured["url"] == "http://localhost:11434/api/chat"
+        assert captured["json"]["stream"] is True
+        assert "".join(chunk.content for chunk in chunks) == "Hello"
+        assert chunks[-1].done is True
+
+    @pytest.mark.asyncio
+    async def test_ollama_tool_calls(self, ollama_backend: OllamaBackend) -> None:
+        """Test Ollama tool calls are parsed when they arrive."""
+        ollama_backend._client = _streaming_client(
+            '{"message": {"content": "", "tool_calls": [{"function": {"name": "read_file", '
+            '"arguments": {"path": "a.py"}}}]}, "done": false}\n'
+            '{"message": {"content": ""}, "done": true}\n'
+        )
+
+        chunks = await _collect(ollama_backend.chat_stream([], model="qwen3"))
+
+        assert chunks[0].tool_calls == [ToolCall(id="call_0", name="read_file", arguments={"path": "a.py"})]
+
+    @pytest.mark.asyncio
+    async def test_ollama_stream_error(self, ollama_backend: OllamaBackend) -> None:
+        """Test an error object in the stream raises AgentError."""
+        ollama_backend._client = _streaming_client('{"error": "model not found"}\n')
+
+        with pytest.raises(AgentError, match="model not found"):
+            await _collect(ollama_backend.chat_stream([], model="missing"))
+
+    @pytest.mark.asyncio
+    async def test_openai_yields_deltas(self, openai_backend: OpenAIBackend) -> None:
+        """Test OpenAI server-sent events become content chunks."""
+        captured: dict = {}
+        openai_backend._client = _streaming_client(
+            'data: {"choices": [{"delta": {"role": "assistant"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "lo"}, "finish_reason": "stop"}]}\n\n'
+            "data: [DONE]\n\n",
+            captured,
+        )
+
+        chunks = await _collect(openai_backend.chat_stream([{"role": "user", "content": "Hi"}], model="gpt-4"))
+
+        assert captured["url"] == "http://localhost:8000/v1/chat/completions"
+        assert captured["json"]["stream"] is True
+        assert "stream_options" not in captured["json"]
+        assert [chunk.content for chunk in chunks] == ["Hel", "lo", ""]
+        assert chunks[-1].done is True
+        assert chunks[-1].tool_calls == []
+
+    @pytest.mark.asyncio
+    async def test_openai_stream_usage_is_opt_in(self) -> None:
+        """Test stream_options is only sent when the backend asks for usage."""
+        captured: dict = {}
+        backend = create_backend("openai", stream_usage=True)
+        backend._client = _streaming_client("data: [DONE]\n\n", captured)
+
+        await _collect(backend.chat_stream([], model="gpt-4"))
+
+        assert captured["json"]["stream_options"] == {"include_usage": True}
+
+    @pytest.mark.asyncio
+    async def test_openai_assembles_tool_call_fragments(self, openai_backend: OpenAIBackend) -> None:
+        """Test tool call names and argument fragments are joined per index."""
+        openai_backend._client = _streaming_client(
+            'data: {"choices": [{"delta": {"tool_calls": [{"index": 0, "id": "call_a", '
+            '"function": {"name": "read_file", "arguments": "{\\"pa"}}]}}]}\n\n'
+            'data: {"choices": [{"delta": {"tool_calls": [{"index": 1, "id": "call_b", '
+            '"function": {"name": "tree", "arguments": "{}"}}]}}]}\n\n'
+            'data: {"choices": [{"delta": {"tool_calls": [{"index": 0, '
+            '"function": {"arguments": "th\\": \\"a.py\\"}"}}]}}]}\n\n'
+            'data: {"choices": [{"delta": {}, "finish_reason": "tool_calls"}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+
+        chunks = await _collect(openai_backend.chat_stream([], model="gpt-4"))
+
+        assert chunks[-1].tool_calls == [
+            ToolCall(id="call_a", name="read_file", arguments={"path": "a.py"}),
+            ToolCall(id="call_b", name="tree", arguments={}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_openai_stream_error(self, openai_backend: OpenAIBackend) -> None:
+        """Test an error event raises AgentError."""
+        openai_backend._client = _streaming_client('data: {"error": {"message": "Rate limited"}}\n\n')
+
+        with pytest.raises(AgentError, match="Rate limited"):
+            await _collect(openai_backend.chat_stream([], model="gpt-4"))
+
+    @pytest.mark.asyncio
+    async def test_default_implementation_wraps_chat(self) -> None:
+        """Test backends without streaming support yield chat() as one chunk."""
+
+        class NonStreamingBackend(OllamaBackend):
+            chat_stream = LLMBackend.chat_stream
+
+        backend = NonStreamingBackend()
+        response = ChatResponse(content="whole answer", tool_calls=[], raw={})
+
+        with patch.object(backend, "chat", AsyncMock(return_value=response)):
+            chunks = await _collect(backend.chat_stream([], model="qwen3"))
+
+        assert chunks == [ChatChunk(content="whole answer", done=True)]
+
+
 # =============================================================================
 # Additional Edge Case Tests
 # =============================================================================
@@ -0,0 +1,91 @@
+"""Unit tests for the ReAct prompt context."""
+
+from __future__ import annotations
+
+from repo_sapiens.agents.context import ReActContext
+from repo_sapiens.agents.react import TrajectoryStep
+
+
+def make_step(iteration: int, observation: str) -> TrajectoryStep:
+    return TrajectoryStep(
+        iteration=iteration,
+        thought=f"thought {iteration}",
+        action="read_file",
+        action_input={"path": f"file{iteration}.py"},
+        observation=observation,
+    )
+
+
+class TestReActContext:
+    """Tests for ReActContext."""
+
+    def test_initial_messages(self):
+        context = ReActContext("system", "Task: x")
+
+        assert context.messages() == [
+            {"role": "system", "content": "system"},
+            {"role": "user", "content": "Task: x"},
+        ]
+        assert context.step_count == 0
+
+    def test_add_step_renders_turns(self):
+        context = ReActContext("system", "Task: x")
+
+        context.add_step(make_step(1, "contents"))
+
+        assistant, observation = context.messages()[2:]
+        assert assistant == {
+            "role": "assistant",
+            "content": 'THOUGHT: thought 1\nACTION: read_file\nACTION_INPUT: {"path": "file1.py"}',
+        }
+        assert observation["content"] == "OBSERVATION: contents\n\nContinue with the next step."
+
+    def test_prefix_is_stable_within_budget(self):
+        context = ReActContext("system", "Task: x", max_tokens=10_000)
+        context.add_step(make_step(1, "a" * 1000))
+        before = context.messages()
+
+        context.add_step(make_step(2, "b" * 1000))
+
+        assert context.messages()[: len(before)] == before
+
+    def test_prompt_tokens_tracks_size(self):
+        context = ReActContext("s" * 40, "t" * 40)
+        empty = context.prompt_tokens
+
+        context.add_step(make_step(1, "x" * 4000))
+
+        assert empty == 20
+        assert context.prompt_tokens > empty + 1000
+
+    def test_compacts_old_observations_over_budget(self):
+        context = ReActContext("system", "Task: x", max_tokens=1000, keep_recent=1, compacted_observation_chars=100)
+        for i in range(3):
+            context.add_step(make_step(i, str(i) * 2000))
+
+        messages = context.messages()
+
+        old, recent = messages[3]["content"], messages[7]["content"]
+        assert old.startswith("OBSERVATION: " + "0" * 100 + "\n[... 1900 characters")
+        assert old.endswith("Continue with the next step.")
+        assert messages[5]["content"].startswith("OBSERVATION: " + "1" * 100 + "\n[...")
+        assert recent == "OBSERVATION: " + "2" * 2000 + "\n\nContinue with the next step."
+        assert context.prompt_tokens < 1000
+
+    def test_compacted_prefix_stays_stable(self):
+        context = ReActContext("system", "Task: x", max_tokens=1000, keep_recent=1, compacted_observation_chars=100)
+        for i in range(3):
+            context.add_step(make_step(i, str(i) * 2000))
+        compacted = context.messages()
+
+        context.add_step(make_step(3, "short"))
+
+        # Step 2 leaves the recent window; everything before it is unchanged
+        assert context.messages()[:5] == compacted[:5]
+
+    def test_returned_messages_are_copies(self):
+        context = ReActContext("system", "Task: x")
+
+        context.messages()[0]["content"] = "changed"
+
+        assert context.messages()[0]["content"] == "system"
@@ -0,0 +1,241 @@
+"""Tests for repo_sapiens/storage."""
+
+import asyncio
+import json
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from click.testing import CliRunner
+
+from repo_sapiens.cli.migrate import migrate_group
+from repo_sapiens.engine.checkpointing import CheckpointManager
+from repo_sapiens.engine.state_manager import StateManager
+from repo_sapiens.exceptions import StorageError
+from repo_sapiens.learning.feedback_loop import FeedbackLoop
+from repo_sapiens.storage import JSONFileBackend, SQLiteBackend, StorageBackend
+from repo_sapiens.storage.migration import migrate_collection
+
+
+@pytest.fixture(params=["json", "sqlite"])
+async def backend(request, tmp_path: Path):
+    """Each storage backend implementation."""
+    if request.param == "json":
+        backend = JSONFileBackend(tmp_path / "docs")
+    else:
+        backend = SQLiteBackend(tmp_path / "sapiens.db")
+    yield backend
+    await backend.close()
+
+
+class TestStorageBackends:
+    """Behaviour shared by every backend."""
+
+    @pytest.mark.asyncio
+    async def test_get_missing_returns_none(self, backend: StorageBackend):
+        assert await backend.get("state", "missing") is None
+
+    @pytest.mark.asyncio
+    async def test_put_and_get_roundtrip(self, backend: StorageBackend):
+        await backend.put("state", "plan-1", {"status": "pending", "tasks": {"t": {"status": "done"}}})
+
+        assert await backend.get("state", "plan-1") == {"status": "pending", "tasks": {"t": {"status": "done"}}}
+
+    @pytest.mark.asyncio
+    async def test_put_replaces_document(self, backend: StorageBackend):
+        await backend.put("state", "plan-1", {"v": 1})
+        await backend.put("state", "plan-1", {"v": 2})
+
+        assert await backend.get("state", "plan-1") == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_keys_are_sorted_and_prefix_filtered(self, backend: StorageBackend):
+        await backend.put_many(
+            "checkpoints",
+            {"plan-2-a-1": {}, "plan-1-a-2": {}, "plan-1-a-1": {}, "plan-10-a-1": {}},
+        )
+
+        assert await backend.keys("checkpoints", "plan-1-") == ["plan-1-a-1", "plan-1-a-2"]
+        assert len(await backend.keys("checkpoints")) == 4
+
+    @pytest.mark.asyncio
+    async def test_scan_returns_documents(self, backend: StorageBackend):
+        await backend.put_many("feedback", {"b": {"n": 2}, "a": {"n": 1}})
+
+        assert await backend.scan("feedback") == [("a", {"n": 1}), ("b", {"n": 2})]
+
+    @pytest.mark.asyncio
+    async def test_delete(self, backend: StorageBackend):
+        await backend.put("feedback", "task-1", {})
+
+        assert await backend.delete("feedback", "task-1") is True
+        assert await backend.delete("feedback", "task-1") is False
+        assert await backend.get("feedback", "task-1") is None
+
+
+class TestSQLiteBackend:
+    """SQLite-specific behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_uses_wal_and_compact_rows(self, tmp_path: Path):
+        backend = SQLiteBackend(tmp_path / "sapiens.db")
+        await backend.put("state", "plan-1", {"status": "pending"})
+        await backend.close()
+
+        conn = sqlite3.connect(tmp_path / "sapiens.db")
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        data = conn.execute("SELECT data FROM documents WHERE key = 'plan-1'").fetchone()[0]
+        assert data == '{"status":"pending"}'
+        conn.close()
+
+    @pytest.mark.asyncio
+    async def test_collections_are_isolated(self, tmp_path: Path):
+        backend = SQLiteBackend(tmp_path / "sapiens.db")
+        await backend.put("state", "x", {"kind": "state"})
+        await backend.put("feedback", "x", {"kind": "feedback"})
+
+        assert (await backend.get("state", "x"))["kind"] == "state"
+        assert await backend.keys("checkpoints") == []
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_writes_visible_to_other_connection(self, tmp_path: Path):
+        first = SQLiteBackend(tmp_path / "sapiens.db")
+        second = SQLiteBackend(tmp_path / "sapiens.db")
+
+        await first.put("state", "plan-1", {"v": 1})
+
+        assert await second.get("state", "plan-1") == {"v": 1}
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_lock_excludes_other_holders(self, tmp_path: Path):
+        first = SQLiteBackend(tmp_path / "sapiens.db")
+        second = SQLiteBackend(tmp_path / "sapiens.db", lock_timeout=0.05)
+
+        async with first.lock("state", "plan-1"):
+            with pytest.raises(StorageError, match="Timed out"):
+                async with second.lock("state", "plan-1"):
+                    pass
+            # Other documents are not blocked
+            async with second.lock("state", "plan-2"):
+                pass
+
+        async with second.lock("state", "plan-1"):
+            pass
+
+        await first.close()
+        await second.close()
+
+
+class TestManagersOnSQLite:
+    """StateManager, CheckpointManager and FeedbackLoop on the SQLite backend."""
+
+    @pytest.mark.asyncio
+    async def test_state_manager_shares_database(self, tmp_path: Path):
+        db = tmp_path / "sapiens.db"
+        first = StateManager(tmp_path / "state-a", backend=SQLiteBackend(db))
+        second = StateManager(tmp_path / "state-b", backend=SQLiteBackend(db))
+
+        await first.mark_task_status("plan-1", "task-1", "completed")
+        await second.mark_task_status("plan-1", "task-2", "failed")
+
+        state = await first.load_state("plan-1")
+        assert set(state["tasks"]) == {"task-1", "task-2"}
+        assert not list((tmp_path / "state-a").glob("*.json"))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_transactions_across_backends(self, tmp_path: Path):
+        db = tmp_path / "sapiens.db"
+        managers = [StateManager(tmp_path / f"state-{i}", backend=SQLiteBackend(db)) for i in range(3)]
+
+        async def bump(manager: StateManager) -> None:
+            for _ in range(5):
+                async with manager.transaction("plan-1") as state:
+                    counter = state["metadata"].get("counter", 0)
+                    await asyncio.sleep(0.001)
+                    state["metadata"]["counter"] = counter + 1
+
+        await asyncio.gather(*(bump(manager) for manager in managers))
+
+        state = await managers[0].load_state("plan-1")
+        assert state["metadata"]["counter"] == 15
+
+    @pytest.mark.asyncio
+    async def test_checkpoints(self, tmp_path: Path):
+        manager = CheckpointManager(str(tmp_path / "cp"), backend=SQLiteBackend(tmp_path / "sapiens.db"))
+        await manager.backend.put_many(
+            "checkpoints",
+            {
+                "plan-1-planning-100": {"checkpoint_id": "plan-1-planning-100", "stage": "planning"},
+                "plan-1-implementation-200": {"checkpoint_id": "plan-1-implementation-200", "stage": "impl"},
+            },
+        )
+
+        latest = await manager.get_latest_checkpoint("plan-1", "planning")
+        assert latest["checkpoint_id"] == "plan-1-planning-100"
+
+        await manager.delete_checkpoints("plan-1")
+        assert await manager.get_all_checkpoints("plan-1") == []
+
+    @pytest.mark.asyncio
+    async def test_feedback(self, tmp_path: Path):
+        loop = FeedbackLoop(str(tmp_path / "fb"), backend=SQLiteBackend(tmp_path / "sapiens.db"))
+        await loop.record_execution("task-1", "add logging", MagicMock(success=True, execution_time=1.0))
+        await loop.record_execution("task-2", "add tests", MagicMock(success=False, execution_time=1.0))
+
+        stats = await loop.get_learning_stats()
+
+        assert stats["total_executions"] == 2
+        assert stats["successful_executions"] == 1
+
+
+class TestMigration:
+    """Tests for copying data between backends."""
+
+    @pytest.mark.asyncio
+    async def test_migrate_collection(self, tmp_path: Path):
+        source = JSONFileBackend(tmp_path / "state")
+        target = SQLiteBackend(tmp_path / "sapiens.db")
+        await source.put_many("state", {f"plan-{i}": {"plan_id": f"plan-{i}"} for i in range(5)})
+        (tmp_path / "state" / "broken.json").write_text("not json")
+
+        copied = await migrate_collection(source, target, "state", batch_size=2)
+
+        assert copied == 5
+        assert await target.keys("state") == [f"plan-{i}" for i in range(5)]
+        await target.close()
+
+    def test_migrate_storage_command(self, tmp_path: Path):
+        state_dir = tmp_path / "state"
+        state_dir.mkdir()
+        (state_dir / "plan-1.json").write_text(json.dumps({"plan_id": "plan-1", "status": "pending"}))
+        feedback_dir = tmp_path / "feedback"
+        feedback_dir.mkdir()
+        (feedback_dir / "task-1.json").write_text(json.dumps({"task_id": "task-1"}))
+
+        settings = MagicMock()
+        settings.state_dir = state_dir
+        settings.workflow.storage_path = str(tmp_path / "sapiens.db")
+
+        result = CliRunner().invoke(
+            migrate_group,
+            [
+                "storage",
+                "--checkpoint-dir",
+                str(tmp_path / "checkpoints"),
+                "--feedback-dir",
+                str(feedback_dir),
+            ],
+            obj={"settings": settings},
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "state: 1 documents" in result.output
+        assert "feedback: 1 documents" in result.output
+
+        conn = sqlite3.connect(tmp_path / "sapiens.db")
+        assert conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0] == 2
+        conn.close()
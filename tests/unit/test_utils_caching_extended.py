@@ -164,7 +164,7 @@ class TestAsyncCacheExtended:
         cache = AsyncCache(ttl_seconds=60)
 
         # Call private method directly - should not raise
-        await cache._evict_oldest()
+        cache._evict()
 
     @pytest.mark.asyncio
     async def test_get_expired_entry_is_deleted(self):
@@ -1,5 +1,7 @@
 """Tests for repo_sapiens.utils.comment_analyzer module."""
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -485,20 +487,21 @@ class TestAnalyzeComments:
             {"id": 4, "author": "user4", "body": "Refactor the architecture"},
         ]
 
-        responses = [
-            '{"category": "simple_fix", "reasoning": "typo", "proposed_action": "fix"}',
-            (
-                '{"category": "question", "reasoning": "needs answer", '
-                '"proposed_action": "answer", "answer": "It processes data"}'
-            ),
-            '{"category": "info", "reasoning": "praise", "proposed_action": "acknowledge"}',
-            '{"category": "controversial_fix", "reasoning": "big change", "proposed_action": "discuss"}',
-        ]
+        output = """[
+            {"comment_id": 1, "category": "simple_fix", "reasoning": "typo", "proposed_action": "fix"},
+            {"comment_id": 2, "category": "question", "reasoning": "needs answer",
+             "proposed_action": "answer", "answer": "It processes data"},
+            {"comment_id": 3, "category": "info", "reasoning": "praise", "proposed_action": "acknowledge"},
+            {"comment_id": 4, "category": "controversial_fix", "reasoning": "big change", "proposed_action": "discuss"}
+        ]"""
 
-        mock_agent_provider.execute_prompt.side_effect = [{"success": True, "output": r} for r in responses]
+        mock_agent_provider.execute_prompt.return_value = {"success": True, "output": output}
 
         result = await analyzer.analyze_comments(pr_number=42, comments=comments)
 
+        # All four comments fit in one batch
+        mock_agent_provider.execute_prompt.assert_called_once()
+        assert result.questions[0].answer == "It processes data"
         assert result.total_comments == 4
         assert result.reviewer_comments == 4
         assert len(result.simple_fixes) == 1
@@ -519,12 +522,17 @@ class TestAnalyzeComments:
         ]
 
         mock_agent_provider.execute_prompt.side_effect = [
-            {"success": True, "output": '{"category": "info", "reasoning": "ok", "proposed_action": "ack"}'},
-            {"success": False, "error": "Failed"},  # This one fails
+            # The batch response omits comment 2, which is then retried alone and fails
+            {
+                "success": True,
+                "output": '[{"comment_id": 1, "category": "info", "reasoning": "ok", "proposed_action": "ack"}]',
+            },
+            {"success": False, "error": "Failed"},
         ]
 
         result = await analyzer.analyze_comments(pr_number=42, comments=comments)
 
+        assert mock_agent_provider.execute_prompt.call_count == 2
         assert result.total_comments == 2
         assert result.reviewer_comments == 2
         # Only one successful analysis
@@ -584,16 +592,15 @@ class TestAnalyzeComments:
             {"id": 6, "author": "u6", "body": "c6"},
         ]
 
-        responses = [
-            '{"category": "simple_fix", "reasoning": "r", "proposed_action": "a"}',
-            '{"category": "controversial_fix", "reasoning": "r", "proposed_action": "a"}',
-            '{"category": "question", "reasoning": "r", "proposed_action": "a"}',
-            '{"category": "info", "reasoning": "r", "proposed_action": "a"}',
-            '{"category": "already_done", "reasoning": "r", "proposed_action": "a"}',
-            '{"category": "wont_fix", "reasoning": "r", "proposed_action": "a"}',
-        ]
+        categories = ["simple_fix", "controversial_fix", "question", "info", "already_done", "wont_fix"]
+        output = json.dumps(
+            [
+                {"comment_id": i, "category": category, "reasoning": "r", "proposed_action": "a"}
+                for i, category in enumerate(categories, start=1)
+            ]
+        )
 
-        mock_agent_provider.execute_prompt.side_effect = [{"success": True, "output": r} for r in responses]
+        mock_agent_provider.execute_prompt.return_value = {"success": True, "output": output}
 
         result = await analyzer.analyze_comments(pr_number=1, comments=comments)
 
@@ -803,12 +810,161 @@ class TestReviewAnalysisResultHelpers:
             {"id": 2, "author": "u2", "body": "c2"},
         ]
 
-        mock_agent_provider.execute_prompt.side_effect = [
-            {"success": True, "output": '{"category": "simple_fix", "reasoning": "r", "proposed_action": "a"}'},
-            {"success": True, "output": '{"category": "info", "reasoning": "r", "proposed_action": "a"}'},
-        ]
+        mock_agent_provider.execute_prompt.return_value = {
+            "success": True,
+            "output": (
+                '[{"comment_id": 1, "category": "simple_fix", "reasoning": "r", "proposed_action": "a"},'
+                ' {"comment_id": 2, "category": "info", "reasoning": "r", "proposed_action": "a"}]'
+            ),
+        }
 
         result = await analyzer.analyze_comments(pr_number=42, comments=comments)
 
         all_analyses = result.get_all_analyses()
         assert len(all_analyses) == 2
+
+
+# =============================================================================
+# Batching, concurrency and memoization
+# =============================================================================
+
+
+def batch_output(comment_ids, category="info"):
+    """Build a batch response classifying every comment the same way."""
+    return json.dumps(
+        [
+            {"comment_id": comment_id, "category": category, "reasoning": "r", "proposed_action": "a"}
+            for comment_id in comment_ids
+        ]
+    )
+
+
+class TestBatchedAnalysis:
+    """Test batched, concurrent classification and per-analysis memoization."""
+
+    @pytest.mark.asyncio
+    async def test_large_review_fetches_pr_once_and_batches(self, mock_git_provider, mock_agent_provider, mock_pr):
+        """Test 60 comments cost one PR fetch and one LLM call per batch."""
+        mock_git_provider.get_pull_request.return_value = mock_pr
+        comments = [{"id": i, "author": f"user{i % 3}", "body": f"comment {i}"} for i in range(60)]
+
+        async def execute_prompt(prompt, context, task_id):
+            return {"success": True, "output": batch_output(context["comment_ids"])}
+
+        mock_agent_provider.execute_prompt.side_effect = execute_prompt
+        analyzer = CommentAnalyzer(mock_git_provider, mock_agent_provider, batch_size=8)
+
+        result = await analyzer.analyze_comments(pr_number=42, comments=comments)
+
+        assert len(result.info_comments) == 60
+        assert [a.comment_id for a in result.info_comments] == list(range(60))
+        mock_git_provider.get_pull_request.assert_called_once_with(42)
+        assert mock_agent_provider.execute_prompt.call_count == 8
+
+    @pytest.mark.asyncio
+    async def test_batch_prompt_lists_every_comment(self, analyzer, mock_git_provider, mock_agent_provider, mock_pr):
+        """Test the batch prompt contains each comment under its id."""
+        mock_git_provider.get_pull_request.return_value = mock_pr
+        comments = [{"id": 7, "author": "alice", "body": "Rename x"}, {"id": 9, "author": "bob", "body": "Why?"}]
+        mock_agent_provider.execute_prompt.return_value = {"success": True, "output": batch_output([7, 9])}
+
+        await analyzer.analyze_comments(pr_number=42, comments=comments)
+
+        prompt = mock_agent_provider.execute_prompt.call_args[0][0]
+        assert "### Comment 7\n**Author**: alice\nRename x" in prompt
+        assert "### Comment 9\n**Author**: bob\nWhy?" in prompt
+        assert mock_agent_provider.execute_prompt.call_args[1]["context"]["comment_ids"] == [7, 9]
+
+    @pytest.mark.asyncio
+    async def test_batches_run_concurrently_within_limit(self, mock_git_provider, mock_agent_provider, mock_pr):
+        """Test batches overlap, but never more than max_concurrent_batches at once."""
+        mock_git_provider.get_pull_request.return_value = mock_pr
+        comments = [{"id": i, "author": "u", "body": "b"} for i in range(8)]
+        active = 0
+        peak = 0
+        both_started = asyncio.Event()
+
+        async def execute_prompt(prompt, context, task_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            if active == 2:
+                both_started.set()
+            await both_started.wait()
+            active -= 1
+            return {"success": True, "output": batch_output(context["comment_ids"])}
+
+        mock_agent_provider.execute_prompt.side_effect = execute_prompt
+        analyzer = CommentAnalyzer(mock_git_provider, mock_agent_provider, batch_size=2, max_concurrent_batches=2)
+
+        result = await asyncio.wait_for(analyzer.analyze_comments(pr_number=1, comments=comments), timeout=5)
+
+        assert len(result.info_comments) == 8
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_unparseable_batch_retries_individually(
+        self, analyzer, mock_git_provider, mock_agent_provider, mock_pr
+    ):
+        """Test a batch response that isn't a JSON array falls back to one call per comment."""
+        mock_git_provider.get_pull_request.return_value = mock_pr
+        comments = [{"id": 1, "author": "u", "body": "a"}, {"id": 2, "author": "u", "body": "b"}]
+        mock_agent_provider.execute_prompt.side_effect = [
+            {"success": True, "output": "Sorry, I can only do one at a time."},
+            {"success": True, "output": '{"category": "simple_fix", "reasoning": "r", "proposed_action": "a"}'},
+            {"success": True, "output": '{"category": "question", "reasoning": "r", "proposed_action": "a"}'},
+        ]
+
+        with patch("repo_sapiens.utils.comment_analyzer.log"):
+            result = await analyzer.analyze_comments(pr_number=1, comments=comments)
+
+        assert [a.comment_id for a in result.simple_fixes] == [1]
+        assert [a.comment_id for a in result.questions] == [2]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_not_retried(self, analyzer, mock_git_provider, mock_agent_provider, mock_pr):
+        """Test an agent error drops the batch rather than multiplying calls."""
+        mock_git_provider.get_pull_request.return_value = mock_pr
+        comments = [{"id": 1, "author": "u", "body": "a"}, {"id": 2, "author": "u", "body": "b"}]
+        mock_agent_provider.execute_prompt.return_value = {"success": False, "error": "Rate limit exceeded"}
+
+        with patch("repo_sapiens.utils.comment_analyzer.log"):
+            result = await analyzer.analyze_comments(pr_number=1, comments=comments)
+
+        assert result.get_all_analyses() == []
+        mock_agent_provider.execute_prompt.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_pr_fetch_failure_is_memoized(self, analyzer, mock_git_provider, mock_agent_provider):
+        """Test a failing PR fetch is attempted once and filters out every comment."""
+        mock_git_provider.get_pull_request.side_effect = Exception("API error")
+        comments = [{"id": i, "author": f"user{i}", "body": "b"} for i in range(5)]
+
+        with patch("repo_sapiens.utils.comment_analyzer.log"):
+            result = await analyzer.analyze_comments(pr_number=1, comments=comments)
+
+        assert result.reviewer_comments == 0
+        mock_git_provider.get_pull_request.assert_called_once()
+        mock_agent_provider.execute_prompt.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_each_analysis_refetches_pr(self, analyzer, mock_git_provider, mock_agent_provider, mock_pr):
+        """Test memoized PR data does not outlive an analysis."""
+        mock_git_provider.get_pull_request.return_value = mock_pr
+        mock_agent_provider.execute_prompt.return_value = {"success": True, "output": batch_output([1, 2])}
+        comments = [{"id": 1, "author": "u", "body": "a"}, {"id": 2, "author": "u", "body": "b"}]
+
+        await analyzer.analyze_comments(pr_number=1, comments=comments)
+        await analyzer.analyze_comments(pr_number=1, comments=comments)
+
+        assert mock_git_provider.get_pull_request.call_count == 2
+
+    def test_parse_batch_response_variants(self, analyzer):
+        """Test batch responses are accepted bare, with surrounding text or wrapped."""
+        entries = [{"comment_id": 1, "category": "info"}]
+
+        assert analyzer._parse_batch_response(json.dumps(entries)) == entries
+        assert analyzer._parse_batch_response(f"Here you go:\n{json.dumps(entries)}\nDone.") == entries
+        assert analyzer._parse_batch_response(json.dumps({"analyses": entries})) == entries
+        with patch("repo_sapiens.utils.comment_analyzer.log"):
+            assert analyzer._parse_batch_response("no json here") is None
@@ -20,8 +20,12 @@ pytestmark = pytest.mark.skipif(not HAS_H2, reason="h2 package required for http
 from repo_sapiens.utils.connection_pool import (
     ConnectionPoolManager,
     HTTPConnectionPool,
+    ValidationCache,
     get_pool,
+    parse_response,
 )
+from repo_sapiens.utils.disk_cache import DiskCache
+from repo_sapiens.utils.rate_limit import Priority
 
 # =============================================================================
 # Tests for HTTPConnectionPool
@@ -96,6 +100,17 @@ class TestHTTPConnectionPool:
         await pool.close()
         assert pool._client is None
 
+    @pytest.mark.asyncio
+    async def test_close_logs_without_conditional_requests(self):
+        """Test that pools without a validation cache still log their close."""
+        pool = HTTPConnectionPool("https://api.example.com", conditional_requests=False)
+        await pool.initialize()
+
+        with patch("repo_sapiens.utils.connection_pool.log") as log:
+            await pool.close()
+
+        log.info.assert_called_once_with("connection_pool_closed", base_url="https://api.example.com")
+
     @pytest.mark.asyncio
     async def test_close_when_not_initialized(self):
         """Test that close handles uninitialized state gracefully."""
@@ -498,3 +513,243 @@ class TestConnectionPoolEdgeCases:
         assert pool._client is not None
 
         await pool.close()
+
+
+# =============================================================================
+# Tests for conditional requests (ETag / Last-Modified)
+# =============================================================================
+
+
+def _etag_server(seen: list[dict[str, str]], body: list | dict, etag: str = '"v1"'):
+    """Build a MockTransport that answers 304 when If-None-Match matches."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(dict(request.headers))
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return httpx.Response(200, json=body, headers={"etag": etag})
+
+    return httpx.MockTransport(handler)
+
+
+class TestConditionalRequests:
+    """Tests for the ETag validation cache in HTTPConnectionPool."""
+
+    @pytest.mark.asyncio
+    async def test_second_get_sends_if_none_match(self):
+        """Test that a cached ETag is sent back on the next GET."""
+        seen: list[dict[str, str]] = []
+        pool = HTTPConnectionPool("https://api.example.com")
+        pool._client = httpx.AsyncClient(base_url=pool.base_url, transport=_etag_server(seen, {"n": 1}))
+
+        await pool.get("/issues/1")
+        await pool.get("/issues/1")
+
+        assert "if-none-match" not in seen[0]
+        assert seen[1]["if-none-match"] == '"v1"'
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_cached_response(self):
+        """Test that a 304 is turned back into the cached 200 response."""
+        pool = HTTPConnectionPool("https://api.example.com")
+        pool._client = httpx.AsyncClient(base_url=pool.base_url, transport=_etag_server([], {"n": 1}))
+
+        first = await pool.get("/issues/1")
+        second = await pool.get("/issues/1")
+
+        assert second is first
+        assert second.status_code == 200
+        assert second.json() == {"n": 1}
+        assert pool.validation_cache.hits == 1
+        assert pool.validation_cache.misses == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_params_are_part_of_the_key(self):
+        """Test that different query params are cached separately."""
+        seen: list[dict[str, str]] = []
+        pool = HTTPConnectionPool("https://api.example.com")
+        pool._client = httpx.AsyncClient(base_url=pool.base_url, transport=_etag_server(seen, []))
+
+        await pool.get("/issues", params={"page": "1"})
+        await pool.get("/issues", params={"page": "2"})
+
+        assert "if-none-match" not in seen[1]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_parse_response_reuses_parsed_objects(self):
+        """Test that revalidated responses are not parsed a second time."""
+        pool = HTTPConnectionPool("https://api.example.com")
+        pool._client = httpx.AsyncClient(base_url=pool.base_url, transport=_etag_server([], {"n": 1}))
+        parser = MagicMock(side_effect=lambda data: {"labels": ["bug"]})
+
+        first = parse_response(await pool.get("/issues/1"), parser)
+        first["labels"].append("mutated")
+        second = parse_response(await pool.get("/issues/1"), parser)
+
+        # Each caller gets its own copy of the cached result
+        assert second == {"labels": ["bug"]}
+        parser.assert_called_once()
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_disabled_conditional_requests(self):
+        """Test that conditional requests can be turned off."""
+        seen: list[dict[str, str]] = []
+        pool = HTTPConnectionPool("https://api.example.com", conditional_requests=False)
+        pool._client = httpx.AsyncClient(base_url=pool.base_url, transport=_etag_server(seen, {}))
+
+        await pool.get("/issues/1")
+        await pool.get("/issues/1")
+
+        assert pool.validation_cache is None
+        assert "if-none-match" not in seen[1]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_records_cache_metrics(self):
+        """Test that hits and misses are reported to the MetricsCollector."""
+        pool = HTTPConnectionPool("https://api.example.com")
+        pool._client = httpx.AsyncClient(base_url=pool.base_url, transport=_etag_server([], {}))
+
+        with patch("repo_sapiens.utils.connection_pool.MetricsCollector") as collector:
+            await pool.get("/issues/1")
+            await pool.get("/issues/1")
+
+        collector.record_cache_miss.assert_called_once_with("http_validation")
+        collector.record_cache_hit.assert_called_once_with("http_validation")
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_revalidates_entries_persisted_by_another_pool(self, tmp_path):
+        """Test that a new pool revalidates against validators stored on disk."""
+        disk = DiskCache(tmp_path / "cache.db")
+        seen: list[dict[str, str]] = []
+        pools = []
+        for _ in range(2):
+            # Each pool models a separate process sharing the disk tier
+            pool = HTTPConnectionPool("https://api.example.com", headers={"Authorization": "token t"})
+            pool._client = httpx.AsyncClient(base_url=pool.base_url, transport=_etag_server(seen, {"n": 1}))
+            pool.validation_cache.disk = disk
+            pools.append(pool)
+
+        await pools[0].get("/issues/1")
+        response = await pools[1].get("/issues/1")
+
+        assert seen[1]["if-none-match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.json() == {"n": 1}
+        response.raise_for_status()
+        for pool in pools:
+            await pool.close()
+        disk.close()
+
+    @pytest.mark.asyncio
+    async def test_disk_entries_are_scoped_to_credentials(self, tmp_path):
+        """Test that pools with different tokens never share persisted entries."""
+        disk = DiskCache(tmp_path / "cache.db")
+        seen: list[dict[str, str]] = []
+        pools = []
+        for token in ("a", "b"):
+            pool = HTTPConnectionPool("https://api.example.com", headers={"Authorization": f"token {token}"})
+            pool._client = httpx.AsyncClient(base_url=pool.base_url, transport=_etag_server(seen, {"n": 1}))
+            pool.validation_cache.disk = disk
+            pools.append(pool)
+
+        await pools[0].get("/issues/1")
+        await pools[1].get("/issues/1")
+
+        assert "if-none-match" not in seen[1]
+        for pool in pools:
+            await pool.close()
+        disk.close()
+
+
+class TestRateLimiting:
+    """Tests for the rate limiter in HTTPConnectionPool."""
+
+    @pytest.mark.asyncio
+    async def test_learns_budget_from_responses(self):
+        """Test that rate-limit headers reach the pool's scheduler."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(201, json={}, headers={"x-ratelimit-limit": "5000", "x-ratelimit-remaining": "4321"})
+
+        pool = HTTPConnectionPool("https://api.example.com", name="gitea-test")
+        pool._client = httpx.AsyncClient(base_url=pool.base_url, transport=httpx.MockTransport(handler))
+
+        await pool.post("/repos/o/r/issues/1/comments", json={"body": "hi"}, priority=Priority.INTERACTIVE)
+
+        assert pool.rate_limiter.name == "gitea-test"
+        assert pool.rate_limiter.remaining == 4321
+        assert len(seen) == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_requests_use_inferred_priority(self):
+        """Test that requests are classified when no priority is given."""
+        pool = HTTPConnectionPool("https://api.example.com")
+        pool._client = httpx.AsyncClient(
+            base_url=pool.base_url, transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+        )
+
+        with patch.object(pool.rate_limiter, "acquire", new_callable=AsyncMock) as acquire:
+            await pool.get("/repos/o/r/issues", params={"page": "2"})
+            await pool.delete("/repos/o/r/issues/1/labels/3")
+
+        assert [call.args[0] for call in acquire.call_args_list] == [Priority.BULK, Priority.INTERACTIVE]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_disabled_rate_limit(self):
+        """Test that the rate limiter can be turned off."""
+        pool = HTTPConnectionPool("https://api.example.com", rate_limit=False)
+        pool._client = httpx.AsyncClient(
+            base_url=pool.base_url, transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+        )
+
+        response = await pool.get("/version", priority=Priority.NORMAL)
+
+        assert pool.rate_limiter is None
+        assert response.status_code == 200
+        await pool.close()
+
+
+class TestValidationCache:
+    """Tests for ValidationCache."""
+
+    def test_last_modified_only(self):
+        """Test that Last-Modified is used when no ETag is present."""
+        cache = ValidationCache()
+        response = httpx.Response(200, headers={"last-modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        cache.store("k", response)
+
+        assert cache.conditional_headers("k") == {"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}
+
+    def test_response_without_validators_not_stored(self):
+        """Test that responses without validators are not cached."""
+        cache = ValidationCache()
+
+        cache.store("k", httpx.Response(200))
+
+        assert len(cache) == 0
+        assert cache.conditional_headers("k") == {}
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ValidationCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.store(key, httpx.Response(200, headers={"etag": key}))
+
+        assert len(cache) == 2
+        assert cache.conditional_headers("a") == {}
+        assert cache.conditional_headers("c") == {"If-None-Match": "c"}
+
+    def test_make_key_is_order_independent(self):
+        """Test that param order does not affect the key."""
+        assert ValidationCache.make_key("/x", {"a": 1, "b": 2}) == ValidationCache.make_key("/x", {"b": 2, "a": 1})
@@ -1,8 +1,8 @@
 """Extended tests for repo_sapiens/utils/cost_optimizer.py - edge cases and coverage."""
 
-
 import pytest
 
+from repo_sapiens.monitoring.usage import LLMCall, UsageLedger
 from repo_sapiens.utils.cost_optimizer import (
     MODEL_PRICING,
     CostOptimizer,
@@ -283,8 +283,7 @@ class TestCostOptimizerComplexity:
 
         # Task with everything that adds complexity
         task = MockTask(
-            description="Implement distributed authentication with security "
-            "and performance optimization " + "x" * 2500,
+            description="Implement distributed authentication with security and performance optimization " + "x" * 2500,
             dependencies=["d1", "d2", "d3", "d4", "d5", "d6"],
             context={
                 "requires_deep_analysis": True,
@@ -560,3 +559,55 @@ class TestCostOptimizerEdgeCases:
 
         assert costs["implementation"] == 0
         assert costs["review"] == 0
+
+
+# =============================================================================
+# CostOptimizer Tests - Measured Usage
+# =============================================================================
+
+
+class TestCostOptimizerMeasuredUsage:
+    """Tests for estimating and reporting costs by measured usage."""
+
+    @pytest.mark.asyncio
+    async def test_estimate_uses_measured_tokens_per_task(self):
+        ledger = UsageLedger()
+        for task_id in ("1", "2", "3"):
+            # Two calls per implementation run
+            for _ in range(2):
+                ledger.record(
+                    LLMCall(
+                        model="qwen3:8b",
+                        provider="ollama",
+                        task=task_id,
+                        stage="implementation",
+                        prompt_tokens=1_000,
+                        completion_tokens=500,
+                    )
+                )
+
+        class MockPlan:
+            tasks = [MockTask(description="Fix typo")]
+
+        measured = await CostOptimizer(usage=ledger).estimate_cost(MockPlan())
+        static = await CostOptimizer().estimate_cost(MockPlan())
+
+        fast = MODEL_PRICING[ModelTier.FAST]
+        assert measured["implementation"] == pytest.approx((2_000 * fast.input_cost + 1_000 * fast.output_cost) / 1e6)
+        assert measured["planning"] == static["planning"]
+        assert measured["review"] == static["review"]
+
+    def test_actual_costs_by_stage_group(self):
+        ledger = UsageLedger()
+        fast = ModelTier.FAST.value
+        for stage, prompt_tokens in (("planning", 1_000_000), ("implementation", 2_000_000), ("merge", 1_000_000)):
+            ledger.record(LLMCall(model=fast, provider="openai", plan="42", stage=stage, prompt_tokens=prompt_tokens))
+        ledger.record(LLMCall(model=fast, provider="openai", plan="7", stage="qa", prompt_tokens=10))
+
+        costs = CostOptimizer(usage=ledger).actual_costs(plan="42")
+
+        assert costs == pytest.approx({"planning": 0.25, "implementation": 0.5, "review": 0.0, "total": 1.0})
+
+    def test_actual_costs_need_a_ledger(self):
+        with pytest.raises(ValueError, match="usage ledger"):
+            CostOptimizer().actual_costs()
@@ -0,0 +1,176 @@
+"""Tests for repo_sapiens/utils/disk_cache.py and its use as an AsyncCache tier."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from repo_sapiens.utils import caching
+from repo_sapiens.utils.caching import AsyncCache, CacheManager, cached, configure_disk_cache
+from repo_sapiens.utils.disk_cache import DiskCache
+
+
+@pytest.fixture
+def disk(tmp_path: Path):
+    cache = DiskCache(tmp_path / "cache.db", max_entries=5)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def global_disk_tier():
+    """Restore the global manager's disk tier after the test."""
+    previous = caching._cache_manager.disk
+    yield
+    caching._cache_manager.set_disk_tier(previous)
+
+
+class TestDiskCache:
+    """Tests for DiskCache."""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip(self, disk: DiskCache):
+        await disk.set("key", {"labels": [1, 2]}, ttl_seconds=60)
+
+        value, remaining = await disk.get("key")
+
+        assert value == {"labels": [1, 2]}
+        assert 0 < remaining <= 60
+
+    @pytest.mark.asyncio
+    async def test_missing_key(self, disk: DiskCache):
+        assert await disk.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_caches_none(self, disk: DiskCache):
+        await disk.set("absent", None, ttl_seconds=60)
+
+        assert await disk.get("absent") == (None, pytest.approx(60, abs=1))
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_a_miss(self, disk: DiskCache):
+        await disk.set("key", "value", ttl_seconds=10)
+
+        with patch("repo_sapiens.utils.disk_cache.time.time", return_value=10**10):
+            assert await disk.get("key") is None
+        assert await disk.count() == 0
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_is_not_stored(self, disk: DiskCache):
+        await disk.set("key", "value", ttl_seconds=0)
+
+        assert await disk.count() == 0
+
+    @pytest.mark.asyncio
+    async def test_non_json_value_is_skipped(self, disk: DiskCache):
+        await disk.set("key", {1, 2}, ttl_seconds=60)
+
+        assert await disk.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_prune_evicts_least_recently_read(self, disk: DiskCache):
+        clock = iter(range(1000, 2000, 100))
+        with patch("repo_sapiens.utils.disk_cache.time.time", side_effect=lambda: next(clock)):
+            for i in range(7):
+                await disk.set(f"key-{i}", i, ttl_seconds=10**10)
+            # Reading key-0 makes it recently used
+            assert (await disk.get("key-0"))[0] == 0
+            await disk.prune()
+
+        assert await disk.count() == 5
+        assert await disk.get("key-0") is not None
+        assert await disk.get("key-1") is None
+        assert await disk.get("key-2") is None
+
+    @pytest.mark.asyncio
+    async def test_clear_namespace(self, disk: DiskCache):
+        await disk.set("a:1", 1, ttl_seconds=60, namespace="a")
+        await disk.set("b:1", 1, ttl_seconds=60, namespace="b")
+
+        await disk.clear("a")
+
+        assert await disk.get("a:1") is None
+        assert await disk.get("b:1") is not None
+
+    @pytest.mark.asyncio
+    async def test_shared_between_instances(self, tmp_path: Path):
+        writer = DiskCache(tmp_path / "cache.db")
+        reader = DiskCache(tmp_path / "cache.db")
+        try:
+            await writer.set("key", "value", ttl_seconds=60)
+            assert (await reader.get("key"))[0] == "value"
+        finally:
+            writer.close()
+            reader.close()
+
+
+class TestAsyncCacheDiskTier:
+    """Tests for AsyncCache falling back to a DiskCache."""
+
+    @pytest.mark.asyncio
+    async def test_memory_miss_reads_through_and_promotes(self, disk: DiskCache):
+        await AsyncCache(ttl_seconds=60, disk=disk, namespace="labels").set("repo", {"bug": 7})
+
+        # Fresh in-memory cache, as in a new process
+        cache = AsyncCache(ttl_seconds=60, disk=disk, namespace="labels")
+        assert await cache.get("repo") == {"bug": 7}
+
+        with patch.object(disk, "get", wraps=disk.get) as disk_get:
+            assert await cache.get("repo") == {"bug": 7}
+        disk_get.assert_not_called()
+        assert (await cache.get_stats())["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_namespaces_are_isolated(self, disk: DiskCache):
+        await AsyncCache(disk=disk, namespace="labels").set("key", "labels-value")
+
+        assert await AsyncCache(disk=disk, namespace="files").get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_and_clear_reach_disk(self, disk: DiskCache):
+        cache = AsyncCache(disk=disk, namespace="labels")
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+
+        assert await cache.delete("a") is True
+        await cache.clear()
+
+        fresh = AsyncCache(disk=disk, namespace="labels")
+        assert await fresh.get("a") is None
+        assert await fresh.get("b") is None
+
+    @pytest.mark.asyncio
+    async def test_manager_attaches_tier_to_named_caches(self, disk: DiskCache):
+        manager = CacheManager()
+        existing = await manager.get_cache("before")
+
+        manager.set_disk_tier(disk)
+        created = await manager.get_cache("after")
+
+        assert existing.disk is disk
+        assert created.disk is disk
+        assert created.namespace == "after"
+
+    @pytest.mark.asyncio
+    async def test_persistent_decorator_survives_new_process(self, tmp_path: Path, global_disk_tier):
+        configure_disk_cache(tmp_path)
+        calls = 0
+
+        async def fetch_labels(repo: str) -> list[str]:
+            nonlocal calls
+            calls += 1
+            return ["bug"]
+
+        # Two decorations of the same function model two processes
+        assert await cached(ttl_seconds=60, persistent=True)(fetch_labels)("o/r") == ["bug"]
+        assert await cached(ttl_seconds=60, persistent=True)(fetch_labels)("o/r") == ["bug"]
+
+        assert calls == 1
+
+    def test_configure_disk_cache_is_idempotent(self, tmp_path: Path, global_disk_tier):
+        first = configure_disk_cache(tmp_path)
+
+        assert configure_disk_cache(tmp_path) is first
+        assert caching._cache_manager.disk is first
+        assert first.path == tmp_path / "cache.db"
+        assert caching.get_disk_cache() is first
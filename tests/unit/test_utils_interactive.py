@@ -322,6 +322,34 @@ class TestAskUserQuestion:
 
         assert result == "Red"
 
+    @pytest.mark.asyncio
+    async def test_ask_user_question_polls_since_newest_comment(self):
+        """Each poll asks only for comments since the newest one already seen."""
+        mock_git = MagicMock()
+
+        question_time = datetime.now(UTC)
+        question_comment = Comment(id=1, body="Question", author="bot", created_at=question_time)
+        mock_git.add_comment = AsyncMock(return_value=question_comment)
+
+        bot_time = question_time + timedelta(seconds=2)
+        bot_comment = Comment(id=2, body="Builder Update: Processing...", author="bot", created_at=bot_time)
+        user_response = Comment(id=3, body="Red", author="user", created_at=bot_time)
+
+        mock_git.get_comments = AsyncMock(
+            side_effect=[
+                [question_comment, bot_comment],
+                # since is inclusive: the bot comment comes back alongside the answer
+                [bot_comment, user_response],
+            ]
+        )
+
+        handler = InteractiveQAHandler(mock_git, poll_interval=0.01)
+
+        result = await handler.ask_user_question(42, "Color?", timeout_minutes=1)
+
+        assert result == "Red"
+        assert [call.kwargs["since"] for call in mock_git.get_comments.call_args_list] == [question_time, bot_time]
+
     @pytest.mark.asyncio
     async def test_ask_user_question_timeout(self):
         """Should return None on timeout."""
@@ -0,0 +1,108 @@
+"""Tests for repo_sapiens/utils/pagination.py."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from repo_sapiens.utils.pagination import next_page_number, prefetch_pages
+
+
+def _response(headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(200, headers=headers or {})
+
+
+class TestNextPageNumber:
+    """Tests for next_page_number."""
+
+    def test_short_page_is_last(self):
+        assert next_page_number(_response({"x-next-page": "2"}), [1], page=1, per_page=2) is None
+
+    def test_gitlab_next_page_header(self):
+        assert next_page_number(_response({"x-next-page": "3"}), [1, 2], page=2, per_page=2) == 3
+
+    def test_gitlab_empty_next_page_header(self):
+        assert next_page_number(_response({"x-next-page": ""}), [1, 2], page=2, per_page=2) is None
+
+    def test_link_header_with_next(self):
+        link = '<https://gitea.example.com/api/v1/repos/o/r/issues?page=2>; rel="next"'
+        assert next_page_number(_response({"link": link}), [1, 2], page=1, per_page=2) == 2
+
+    def test_link_header_without_next(self):
+        link = '<https://gitea.example.com/api/v1/repos/o/r/issues?page=1>; rel="first"'
+        assert next_page_number(_response({"link": link}), [1, 2], page=3, per_page=2) is None
+
+    def test_full_page_without_headers_assumes_more(self):
+        assert next_page_number(_response(), [1, 2], page=1, per_page=2) == 2
+
+
+class TestPrefetchPages:
+    """Tests for prefetch_pages."""
+
+    @pytest.mark.asyncio
+    async def test_yields_pages_in_order(self):
+        pages = {1: ["a", "b"], 2: ["c", "d"], 3: ["e"]}
+
+        async def fetch(page: int) -> list[str]:
+            return pages[page]
+
+        def following(page: int, result: list[str]) -> int | None:
+            return page + 1 if len(result) == 2 else None
+
+        results = [page async for page in prefetch_pages(fetch, following)]
+
+        assert results == [["a", "b"], ["c", "d"], ["e"]]
+
+    @pytest.mark.asyncio
+    async def test_next_page_requested_before_consumer_resumes(self):
+        requested: list[int] = []
+
+        async def fetch(page: int) -> int:
+            requested.append(page)
+            return page
+
+        def following(page: int, result: int) -> int | None:
+            return page + 1 if page < 3 else None
+
+        async for page in prefetch_pages(fetch, following):
+            # Let the prefetch task start while this page is "being parsed"
+            await asyncio.sleep(0.01)
+            assert page + 1 in requested or page == 3
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_prefetch(self):
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fetch(page: int) -> int:
+            if page == 2:
+                started.set()
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return page
+
+        pager = prefetch_pages(fetch, lambda page, result: page + 1)
+        async for _page in pager:
+            await started.wait()
+            break
+        await pager.aclose()
+        await asyncio.sleep(0.01)
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_propagates(self):
+        async def fetch(page: int) -> int:
+            if page == 2:
+                raise RuntimeError("page 2 failed")
+            return page
+
+        results = []
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            async for page in prefetch_pages(fetch, lambda page, result: page + 1):
+                results.append(page)
+
+        assert results == [1]
@@ -0,0 +1,182 @@
+"""Tests for repo_sapiens/utils/rate_limit.py - rate-limit-aware request scheduling."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from repo_sapiens.utils.rate_limit import Priority, RateLimitScheduler, classify_request
+
+WALL_NOW = 1_700_000_000.0
+
+
+class FakeClock:
+    """Monotonic and wall clocks advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def wall(self) -> float:
+        return WALL_NOW + self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock: FakeClock) -> RateLimitScheduler:
+    return RateLimitScheduler("test", burst=2, clock=clock.monotonic, wall_clock=clock.wall)
+
+
+async def pending(task: asyncio.Task) -> bool:
+    """Let the event loop run briefly and report whether the task is still waiting.
+
+    asyncio.sleep is patched out in tests, so this waits on a real timer.
+    """
+    done, _ = await asyncio.wait({task}, timeout=0.01)
+    return not done
+
+
+class TestClassifyRequest:
+    """Tests for classify_request."""
+
+    @pytest.mark.parametrize(
+        ("method", "path", "params", "expected"),
+        [
+            ("POST", "/repos/o/r/issues/1/comments", None, Priority.INTERACTIVE),
+            ("GET", "/projects/1/issues/4/notes", None, Priority.INTERACTIVE),
+            ("PATCH", "/repos/o/r/issues/1", None, Priority.INTERACTIVE),
+            ("GET", "/repos/o/r/labels", None, Priority.INTERACTIVE),
+            ("GET", "/repos/o/r/issues", {"page": "2"}, Priority.BULK),
+            ("GET", "/repos/o/r/issues/1", None, Priority.NORMAL),
+        ],
+    )
+    def test_priorities(self, method, path, params, expected):
+        assert classify_request(method, path, params) == expected
+
+
+class TestRateLimitScheduler:
+    """Tests for RateLimitScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_unthrottled_until_budget_is_reported(self, scheduler: RateLimitScheduler):
+        for _ in range(50):
+            await scheduler.acquire()
+
+        assert scheduler.remaining is None
+
+    @pytest.mark.asyncio
+    async def test_learns_github_headers(self, scheduler: RateLimitScheduler, clock: FakeClock):
+        headers = {
+            "x-ratelimit-limit": "5000",
+            "x-ratelimit-remaining": "4990",
+            "x-ratelimit-reset": str(int(clock.wall() + 600)),
+        }
+
+        with patch("repo_sapiens.utils.rate_limit.MetricsCollector") as collector:
+            scheduler.observe(200, headers)
+
+        assert (scheduler.limit, scheduler.remaining) == (5000, 4990)
+        collector.update_rate_limit_remaining.assert_called_once_with("test", 4990)
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_waits_for_reset(self, scheduler: RateLimitScheduler, clock: FakeClock):
+        # GitLab style: RateLimit-* headers
+        scheduler.observe(403, {"ratelimit-limit": "600", "ratelimit-remaining": "0", "ratelimit-reset": "30"})
+
+        task = asyncio.create_task(scheduler.acquire())
+        assert await pending(task)
+
+        clock.now += 31
+        scheduler.observe(200, {})
+
+        await asyncio.wait_for(task, 1)
+
+    @pytest.mark.asyncio
+    async def test_retry_after_blocks_every_priority(self, scheduler: RateLimitScheduler, clock: FakeClock):
+        scheduler.observe(429, {"retry-after": "20"})
+
+        task = asyncio.create_task(scheduler.acquire(Priority.INTERACTIVE))
+        assert await pending(task)
+
+        clock.now += 21
+        scheduler.observe(200, {})
+
+        await asyncio.wait_for(task, 1)
+
+    @pytest.mark.asyncio
+    async def test_spreads_remaining_budget_over_window(self, scheduler: RateLimitScheduler, clock: FakeClock):
+        # 100 requests left for 100 seconds: one per second after a burst of 2
+        scheduler.observe(200, {"x-ratelimit-remaining": "100", "x-ratelimit-reset": str(int(clock.wall() + 100))})
+
+        await scheduler.acquire()
+        await scheduler.acquire()
+        task = asyncio.create_task(scheduler.acquire())
+        assert await pending(task)
+
+        clock.now += 1.1
+        scheduler.observe(200, {})
+
+        await asyncio.wait_for(task, 1)
+        assert scheduler.remaining == 97
+
+    @pytest.mark.asyncio
+    async def test_serves_waiters_by_priority(self, scheduler: RateLimitScheduler, clock: FakeClock):
+        scheduler.observe(429, {"retry-after": "5"})
+        order: list[Priority] = []
+
+        async def request(priority: Priority) -> None:
+            await scheduler.acquire(priority)
+            order.append(priority)
+
+        tasks = []
+        for priority in (Priority.BULK, Priority.NORMAL, Priority.INTERACTIVE):
+            tasks.append(asyncio.create_task(request(priority)))
+            assert await pending(tasks[-1])
+
+        clock.now += 6
+        scheduler.observe(200, {})
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+
+        assert order == [Priority.INTERACTIVE, Priority.NORMAL, Priority.BULK]
+
+    @pytest.mark.asyncio
+    async def test_bulk_reads_leave_reserve(self, scheduler: RateLimitScheduler, clock: FakeClock):
+        scheduler.observe(
+            200,
+            {
+                "x-ratelimit-limit": "100",
+                "x-ratelimit-remaining": "5",
+                "x-ratelimit-reset": str(int(clock.wall() + 600)),
+            },
+        )
+
+        bulk = asyncio.create_task(scheduler.acquire(Priority.BULK))
+        assert await pending(bulk)
+
+        await asyncio.wait_for(scheduler.acquire(Priority.INTERACTIVE), 1)
+        assert await pending(bulk)
+        bulk.cancel()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_block_others(self, scheduler: RateLimitScheduler, clock: FakeClock):
+        scheduler.observe(429, {"retry-after": "5"})
+        first = asyncio.create_task(scheduler.acquire(Priority.INTERACTIVE))
+        second = asyncio.create_task(scheduler.acquire(Priority.BULK))
+        assert await pending(first)
+
+        first.cancel()
+        clock.now += 6
+        scheduler.observe(200, {})
+
+        await asyncio.wait_for(second, 1)
+
+    def test_ignores_unparseable_headers(self, scheduler: RateLimitScheduler):
+        scheduler.observe(200, {"x-ratelimit-remaining": "lots", "retry-after": "soon"})
+
+        assert scheduler.remaining is None
@@ -1,6 +1,7 @@
 """Tests for repo_sapiens/webhook_server.py."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -9,6 +10,10 @@ pytest.importorskip("fastapi")
 
 from fastapi.testclient import TestClient
 
+from repo_sapiens.config.settings import AutomationSettings, TracingConfig, UsageConfig
+from repo_sapiens.config.triggers import AutomationConfig, LabelTriggerConfig, WebhookConfig
+from repo_sapiens.engine.event_classifier import EventClassifier
+from repo_sapiens.engine.event_queue import EventQueue
 from repo_sapiens.webhook_server import (
     app,
     extract_plan_id,
@@ -101,9 +106,9 @@ class TestGiteaWebhookEndpoint:
             headers={"X-Gitea-Event": "issues"},
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 202
         data = response.json()
-        assert data["status"] == "success"
+        assert data["status"] == "accepted"
         assert data["event_type"] == "issues"
 
     def test_webhook_push_event(self):
@@ -121,9 +126,9 @@ class TestGiteaWebhookEndpoint:
             headers={"X-Gitea-Event": "push"},
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 202
         data = response.json()
-        assert data["status"] == "success"
+        assert data["status"] == "accepted"
         assert data["event_type"] == "push"
 
     def test_webhook_unhandled_event_type(self):
@@ -138,9 +143,9 @@ class TestGiteaWebhookEndpoint:
             headers={"X-Gitea-Event": "pull_request"},
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 202
         data = response.json()
-        assert data["status"] == "success"
+        assert data["status"] == "accepted"
         assert data["event_type"] == "pull_request"
 
     def test_webhook_repo_sapiens_error(self):
@@ -355,6 +360,136 @@ class TestHandlePushEvent:
         await handle_push_event(payload)
 
 
+@pytest.fixture
+def label_settings():
+    """Settings with a single label trigger configured."""
+    return AutomationSettings(
+        git_provider={
+            "provider_type": "gitea",
+            "base_url": "https://gitea.example.com",
+            "api_token": "test-token",
+        },
+        repository={"owner": "test-owner", "name": "test-repo"},
+        agent_provider={"provider_type": "claude-local", "model": "claude-3-sonnet"},
+        automation=AutomationConfig(
+            label_triggers={
+                "sapiens/triage": LabelTriggerConfig(label_pattern="sapiens/triage", handler="triage"),
+            },
+        ),
+    )
+
+
+@pytest.fixture
+async def wired_queue(label_settings):
+    """Install a classifier and a started queue with a mock handler."""
+    import repo_sapiens.webhook_server as ws
+
+    handler = AsyncMock(return_value={"success": True})
+    queue = EventQueue(handler, max_size=2, workers=1)
+    await queue.start()
+
+    with patch.object(ws, "classifier", EventClassifier(label_settings)), patch.object(ws, "event_queue", queue):
+        yield queue, handler
+
+    await queue.stop()
+
+
+def _labeled_payload(issue_number: int, label: str = "sapiens/triage") -> dict:
+    return {"action": "labeled", "issue": {"number": issue_number}, "label": {"name": label}}
+
+
+class TestIssueEventQueueing:
+    """Tests for routing issue events through the work queue."""
+
+    @pytest.mark.asyncio
+    async def test_labeled_event_is_queued_and_routed(self, wired_queue):
+        queue, handler = wired_queue
+
+        assert await handle_issue_event(_labeled_payload(42)) is True
+        await queue.join()
+
+        event = handler.await_args.args[0]
+        assert event.issue_number == 42
+        assert event.handler == "triage"
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_label_is_not_queued(self, wired_queue):
+        queue, handler = wired_queue
+
+        assert await handle_issue_event(_labeled_payload(42, label="bug")) is False
+        assert queue.depth == 0
+        handler.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_delivery_is_dropped(self, wired_queue):
+        queue, handler = wired_queue
+
+        assert await handle_issue_event(_labeled_payload(42)) is True
+        assert await handle_issue_event(_labeled_payload(42)) is False
+        await queue.join()
+
+        assert handler.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_raises(self, wired_queue):
+        queue, handler = wired_queue
+        release = asyncio.Event()
+
+        async def blocked(event):
+            await release.wait()
+
+        handler.side_effect = blocked
+
+        # One event held by the worker, two filling the queue
+        for issue_number in (1, 2, 3):
+            await handle_issue_event(_labeled_payload(issue_number))
+            await asyncio.sleep(0.01)
+
+        with pytest.raises(asyncio.QueueFull):
+            await handle_issue_event(_labeled_payload(4))
+
+        release.set()
+        await queue.join()
+
+    @pytest.mark.asyncio
+    async def test_response_does_not_wait_for_handler(self, wired_queue):
+        import repo_sapiens.webhook_server as ws
+
+        queue, handler = wired_queue
+        release = asyncio.Event()
+
+        async def blocked(event):
+            await release.wait()
+
+        handler.side_effect = blocked
+
+        request = MagicMock()
+        request.headers = {"X-Gitea-Event": "issues"}
+        request.json = AsyncMock(return_value=_labeled_payload(7))
+
+        response = await asyncio.wait_for(ws.gitea_webhook(request), timeout=1.0)
+
+        assert response == {"status": "accepted", "event_type": "issues"}
+        release.set()
+        await queue.join()
+        handler.assert_awaited_once()
+
+    def test_webhook_returns_503_when_queue_full(self):
+        client = TestClient(app, raise_server_exceptions=False)
+
+        with patch(
+            "repo_sapiens.webhook_server.handle_issue_event",
+            side_effect=asyncio.QueueFull(),
+        ):
+            response = client.post(
+                "/webhook/gitea",
+                json={"action": "labeled", "issue": {"number": 1}},
+                headers={"X-Gitea-Event": "issues"},
+            )
+
+        assert response.status_code == 503
+
+
 class TestStartupEvent:
     """Tests for startup event handler."""
 
@@ -386,12 +521,18 @@ class TestStartupEvent:
             assert "Webhook startup failed" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_startup_success(self):
+    async def test_startup_success(self, tmp_path):
         """Should initialize settings on successful startup."""
         import repo_sapiens.webhook_server as ws
-        from repo_sapiens.webhook_server import startup
+        from repo_sapiens.monitoring.dashboard import aggregator
+        from repo_sapiens.webhook_server import shutdown, startup
 
         mock_settings = MagicMock()
+        mock_settings.state_dir = str(tmp_path / "state")
+        mock_settings.workflow.storage_backend = "json"
+        mock_settings.automation.webhook = WebhookConfig(workers=2)
+        mock_settings.tracing = TracingConfig(enabled=False)
+        mock_settings.usage = UsageConfig(persist=False)
 
         with patch(
             "repo_sapiens.webhook_server.AutomationSettings.from_yaml",
@@ -400,6 +541,13 @@ class TestStartupEvent:
             await startup()
 
             assert ws.settings == mock_settings
+            assert ws.event_queue.running
+            assert ws.event_queue.workers == 2
+            assert aggregator.state_manager.state_dir == tmp_path / "state"
+
+        await shutdown()
+        assert ws.event_queue is None
+        assert aggregator.state_manager is None
 
 
 class TestAppConfiguration:
@@ -415,3 +563,13 @@ class TestAppConfiguration:
 
         assert "/webhook/gitea" in routes
         assert "/health" in routes
+        assert "/dashboard" in routes
+
+    def test_dashboard_is_served(self):
+        """Should serve the analytics dashboard API under /dashboard."""
+        client = TestClient(app)
+
+        response = client.get("/dashboard/api/metrics/summary")
+
+        assert response.status_code == 200
+        assert "success_rate" in response.json()
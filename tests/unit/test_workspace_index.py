@@ -0,0 +1,151 @@
+"""Tests for repo_sapiens/agents/workspace_index.py."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from repo_sapiens.agents.tools import ToolRegistry
+from repo_sapiens.agents.workspace_index import WorkspaceIndex, _required_literals
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "README.md").write_text("# Project\nhandler docs\n")
+    (tmp_path / "src" / "app.py").write_text("import os\n\ndef issue_handler(event):\n    return event\n")
+    (tmp_path / "src" / "pkg" / "util.py").write_text("def helper():\n    pass  # handler handler\n")
+    (tmp_path / ".git" / "config").write_text("handler = hidden\n")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG\x00handler")
+    return tmp_path
+
+
+class TestWorkspaceIndex:
+    """Tests for WorkspaceIndex."""
+
+    def test_files_skip_hidden(self, workspace: Path):
+        index = WorkspaceIndex(workspace)
+
+        assert index.files() == ["README.md", "logo.png", "src/app.py", "src/pkg/util.py"]
+        assert index.files("src/pkg") == ["src/pkg/util.py"]
+
+    @pytest.mark.parametrize(
+        ("pattern", "under", "expected"),
+        [
+            ("*.py", "", []),
+            ("*.py", "src", ["src/app.py"]),
+            ("**/*.py", "", ["src/app.py", "src/pkg/util.py"]),
+            ("src/*/u*.py", "", ["src/pkg/util.py"]),
+            ("*.[mp][dn]*", ".", ["README.md", "logo.png"]),
+        ],
+    )
+    def test_find_follows_glob_semantics(self, workspace: Path, pattern: str, under: str, expected: list[str]):
+        assert WorkspaceIndex(workspace).find(pattern, under) == expected
+
+    def test_search_yields_each_matching_line_once(self, workspace: Path):
+        matches = list(WorkspaceIndex(workspace).search("handler"))
+
+        assert matches == [
+            ("README.md", 2, "handler docs"),
+            ("src/app.py", 3, "def issue_handler(event):"),
+            ("src/pkg/util.py", 2, "    pass  # handler handler"),
+        ]
+
+    def test_search_regex_and_file_pattern(self, workspace: Path):
+        index = WorkspaceIndex(workspace)
+
+        assert list(index.search(r"^def \w+\(", file_pattern="*.py")) == [
+            ("src/app.py", 3, "def issue_handler(event):"),
+            ("src/pkg/util.py", 1, "def helper():"),
+        ]
+        assert list(index.search("handler", under="src/pkg")) == [("src/pkg/util.py", 2, "    pass  # handler handler")]
+
+    def test_search_is_lazy(self, workspace: Path):
+        index = WorkspaceIndex(workspace)
+
+        with patch.object(index, "_read", wraps=index._read) as read:
+            next(index.search("handler"))
+
+        assert read.call_count == 1
+
+    def test_update_picks_up_written_file(self, workspace: Path):
+        index = WorkspaceIndex(workspace)
+        assert list(index.search("added")) == []
+
+        (workspace / "src" / "app.py").write_text("added line\n")
+        (workspace / "new.txt").write_text("added too\n")
+        index.update(["src/app.py", "new.txt"])
+
+        assert [path for path, _, _ in index.search("added")] == ["new.txt", "src/app.py"]
+
+    def test_invalidate_rescans_tree(self, workspace: Path):
+        index = WorkspaceIndex(workspace)
+        index.files()
+
+        (workspace / "README.md").unlink()
+        (workspace / "other.md").write_text("x")
+        assert "README.md" in index.files()
+
+        index.invalidate()
+        assert index.files()[:2] == ["logo.png", "other.md"]
+
+    def test_content_cache_is_bounded(self, workspace: Path):
+        index = WorkspaceIndex(workspace, max_cached_bytes=60)
+
+        list(index.search("handler"))
+
+        assert index._cached_bytes <= 60
+        assert list(index._contents) == ["src/pkg/util.py"]
+
+    def test_trigram_signature_skips_files(self, workspace: Path):
+        index = WorkspaceIndex(workspace, trigrams=True)
+        list(index.search("handler"))
+
+        with patch.object(index, "_read", wraps=index._read) as read:
+            assert list(index.search("issue_handler")) == [("src/app.py", 3, "def issue_handler(event):")]
+
+        read_paths = [call.args[0] for call in read.call_args_list]
+        assert "src/app.py" in read_paths
+        assert "src/pkg/util.py" not in read_paths
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("handler", ["handler"]),
+            (r"def \w+_handler", ["def ", "_handler"]),
+            ("colou?r value", ["colo", "r value"]),
+            (r"foo\.bar", ["foo.bar"]),
+            ("abc(def)?ghi", ["abc", "ghi"]),
+            ("a|bcd", []),
+            ("(?i)handler", []),
+        ],
+    )
+    def test_required_literals(self, pattern: str, expected: list[str]):
+        assert _required_literals(pattern) == expected
+
+
+class TestToolRegistryIndex:
+    """Tests for the index behind ToolRegistry search tools."""
+
+    @pytest.mark.asyncio
+    async def test_search_sees_written_files(self, workspace: Path):
+        registry = ToolRegistry(workspace)
+        assert "No matches" in await registry.execute("search_files", {"pattern": "fresh_token"})
+
+        await registry.execute("write_file", {"path": "src/new.py", "content": "fresh_token = 1\n"})
+
+        assert await registry.execute("search_files", {"pattern": "fresh_token", "path": "src"}) == (
+            "new.py:1:fresh_token = 1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_command_invalidates_index(self, workspace: Path):
+        registry = ToolRegistry(workspace)
+        await registry.execute("find_files", {"pattern": "*.txt"})
+
+        await registry.execute("run_command", {"command": "echo hi > made.txt"})
+
+        assert await registry.execute("find_files", {"pattern": "*.txt"}) == "made.txt"